@@ -102,6 +102,19 @@ async def get_price_coverage() -> Dict[str, Any]:
         session.close()
 
 
+@router.get("/admin/cache/stats")
+async def get_cache_stats() -> Dict[str, Any]:
+    """
+    In-process cache statistics for this worker.
+    
+    Returns:
+        TTL cache sizes plus per-namespace hit/miss/coalescing counters and
+        compute latency for the v2 response caches
+    """
+    from app.utils.cache import get_cache_stats as _get_cache_stats
+    return _get_cache_stats()
+
+
 @router.get("/admin/database/stats")
 async def get_database_stats() -> Dict[str, Any]:
     """
@@ -242,6 +242,7 @@ async def check_alerts(db: Session = Depends(get_db)):
     """
     try:
         from app.api.arbitrage import get_arbitrage_opportunities
+        from app.database.async_db import get_async_db
         from app.services.email_service import send_alert_email
         
         _ensure_alerts_table(db)
@@ -261,7 +262,7 @@ async def check_alerts(db: Session = Depends(get_db)):
                         min_spread=alert.conditions.get('min_spread', 10),
                         min_match_score=alert.conditions.get('min_match_score', 0.5),
                         limit=10,
-                        db=db
+                        db=await get_async_db()
                     )
                     
                     # Check if any opportunities meet the alert criteria
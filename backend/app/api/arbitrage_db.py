@@ -11,15 +11,15 @@ Response: identical schema to /api/arbitrage/opportunities
 """
 
 from fastapi import APIRouter, Query, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import text
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Optional, Tuple
 import time
 import logging
 import math
 from collections import defaultdict
 
-from app.database.session import get_db
+from app.database.async_db import AsyncDB, get_async_db
+from app.services.cpu_pool import get_cpu_pool
+from app.utils.cache import cached_v2
 from app.api.arbitrage import (
     ArbitrageOpportunity,
     ArbitrageStats,
@@ -100,8 +100,8 @@ def _titles_are_semantically_same(title1: str, title2: str) -> bool:
 
     return True
 
-# ── 2-minute in-memory cache ───────────────────────────────────────────────────
-_cache: Dict[str, Any] = {"data": None, "ts": 0.0, "ttl": 120.0}
+# ── 2-minute scan cache (app.utils.cache.cached_v2) ────────────────────────────
+SCAN_CACHE_TTL = 120.0
 
 # ── SQL queries ────────────────────────────────────────────────────────────────
 _POLY_SQL = """
@@ -265,122 +265,135 @@ def _build_opportunity(pm: Dict, km: Dict, sim: float, idx: int) -> Optional[Arb
     )
 
 
-@router.get("/opportunities-db", response_model=ArbitrageResponse)
-def get_arbitrage_opportunities_db(
-    min_spread:      float = Query(0.5,  ge=0.1, le=50.0,  description="Min spread %"),
-    min_match_score: float = Query(0.50, ge=0.1, le=1.0,   description="Min similarity score"),
-    limit:           int   = Query(200,  ge=1,   le=500,   description="Max results"),
-    db: Session = Depends(get_db),
-):
+def _scan_opportunities(poly_markets: List[Dict], kalshi_markets: List[Dict]) -> List[ArbitrageOpportunity]:
     """
-    Pure-DB arbitrage scanner.
-    Queries predictions_silver.markets directly — no live API calls.
-    2-minute in-process cache.
+    Match Polymarket markets to Kalshi markets and build the opportunities.
+    Pure CPU work (runs in the CPU pool, app.services.cpu_pool).
     """
-    t0 = time.time()
-
-    # ── Cache hit ─────────────────────────────────────────────────────────────
-    now = time.time()
-    if _cache["data"] and (now - _cache["ts"]) < _cache["ttl"]:
-        all_opps       = _cache["data"]["all_opps"]
-        markets_scanned = _cache["data"]["markets_scanned"]
-        logger.info("Arbitrage DB: cache hit")
-    else:
-        # ── Fetch from DB ──────────────────────────────────────────────────────
-        poly_rows   = db.execute(text(_POLY_SQL)).fetchall()
-        kalshi_rows = db.execute(text(_KALSHI_SQL)).fetchall()
-        logger.info(f"Arbitrage DB: {len(poly_rows)} poly, {len(kalshi_rows)} kalshi markets")
-
-        def row_to_market(row, platform: str) -> Dict:
-            yp  = float(row.yes_price) if row.yes_price  is not None else None
-            np_ = float(row.no_price)  if row.no_price   is not None else None
-            # Derive yes price from no if needed
-            if yp is None and np_ is not None and 0 < np_ < 1:
-                yp = round(1.0 - np_, 4)
-            return {
-                "platform":  platform,
-                "market_id": str(row.market_id or ""),
-                "title":     str(row.title or ""),
-                "price":     yp,
-                "volume":    float(row.volume or 0),
-            }
-
-        poly_markets   = [row_to_market(r, "poly")   for r in poly_rows]
-        kalshi_markets = [row_to_market(r, "kalshi") for r in kalshi_rows]
-
-        # ── Build Kalshi inverted entity index ────────────────────────────────
-        kalshi_entity_cache: List[set] = []
-        kalshi_index: Dict[str, List[int]] = defaultdict(list)
-        for i, km in enumerate(kalshi_markets):
-            entities = _extract_entities(km["title"])
-            kalshi_entity_cache.append(entities)
-            for e in entities:
-                kalshi_index[e].append(i)
-
-        # ── Match Polymarket → Kalshi ─────────────────────────────────────────
-        matched_kalshi: set = set()
-        all_opps: List[ArbitrageOpportunity] = []
-
-        for pm in poly_markets:
-            if not pm["price"] or pm["price"] <= 0:
+    # ── Build Kalshi inverted entity index ────────────────────────────────
+    kalshi_entity_cache: List[set] = []
+    kalshi_index: Dict[str, List[int]] = defaultdict(list)
+    for i, km in enumerate(kalshi_markets):
+        entities = _extract_entities(km["title"])
+        kalshi_entity_cache.append(entities)
+        for e in entities:
+            kalshi_index[e].append(i)
+
+    # ── Match Polymarket → Kalshi ─────────────────────────────────────────
+    matched_kalshi: set = set()
+    all_opps: List[ArbitrageOpportunity] = []
+
+    for pm in poly_markets:
+        if not pm["price"] or pm["price"] <= 0:
+            continue
+
+        p_entities = _extract_entities(pm["title"])
+        if not p_entities:
+            continue
+
+        # Gather candidate kalshi indices (share ≥1 entity)
+        candidate_counts: Dict[int, int] = {}
+        for e in p_entities:
+            for ki in kalshi_index.get(e, []):
+                if ki not in matched_kalshi:
+                    candidate_counts[ki] = candidate_counts.get(ki, 0) + 1
+
+        if not candidate_counts:
+            continue
+
+        # Score candidates — find best-matching unmatched kalshi market
+        best_sim = 0.0
+        best_ki  = -1
+        for ki in candidate_counts:
+            km = kalshi_markets[ki]
+            if not km["price"] or km["price"] <= 0:
                 continue
+            sim = calculate_similarity(pm["title"], km["title"])
+            if sim > best_sim:
+                best_sim = sim
+                best_ki  = ki
 
-            p_entities = _extract_entities(pm["title"])
-            if not p_entities:
-                continue
+        if best_ki < 0 or best_sim < 0.35:
+            continue
 
-            # Gather candidate kalshi indices (share ≥1 entity)
-            candidate_counts: Dict[int, int] = {}
-            for e in p_entities:
-                for ki in kalshi_index.get(e, []):
-                    if ki not in matched_kalshi:
-                        candidate_counts[ki] = candidate_counts.get(ki, 0) + 1
+        km = kalshi_markets[best_ki]
 
-            if not candidate_counts:
-                continue
+        # ── Semantic validation: catch false positives ────────────────────
+        if not _titles_are_semantically_same(pm["title"], km["title"]):
+            logger.debug(
+                f"Arb rejected (semantic mismatch): "
+                f"'{pm['title'][:50]}' ↔ '{km['title'][:50]}'"
+            )
+            continue
 
-            # Score candidates — find best-matching unmatched kalshi market
-            best_sim = 0.0
-            best_ki  = -1
-            for ki in candidate_counts:
-                km = kalshi_markets[ki]
-                if not km["price"] or km["price"] <= 0:
-                    continue
-                sim = calculate_similarity(pm["title"], km["title"])
-                if sim > best_sim:
-                    best_sim = sim
-                    best_ki  = ki
-
-            if best_ki < 0 or best_sim < 0.35:
-                continue
+        matched_kalshi.add(best_ki)
 
-            km = kalshi_markets[best_ki]
+        opp = _build_opportunity(pm, km, best_sim, len(all_opps))
+        if opp:
+            all_opps.append(opp)
 
-            # ── Semantic validation: catch false positives ────────────────────
-            if not _titles_are_semantically_same(pm["title"], km["title"]):
-                logger.debug(
-                    f"Arb rejected (semantic mismatch): "
-                    f"'{pm['title'][:50]}' ↔ '{km['title'][:50]}'"
-                )
-                continue
+    # Sort: confidence first, then spread desc
+    _conf_order = {"high": 0, "medium": 1, "low": 2}
+    all_opps.sort(key=lambda x: (_conf_order.get(x.confidence, 3), -x.spread_percent))
+
+    return all_opps
 
-            matched_kalshi.add(best_ki)
 
-            opp = _build_opportunity(pm, km, best_sim, len(all_opps))
-            if opp:
-                all_opps.append(opp)
+@cached_v2(
+    "arbitrage_db", ttl=SCAN_CACHE_TTL, shared=True, topics=("markets",),
+    decode=lambda raw: ([ArbitrageOpportunity.model_validate(o) for o in raw[0]], raw[1]),
+)
+async def _load_opportunities(db: AsyncDB) -> Tuple[List[ArbitrageOpportunity], int]:
+    """Fetch both venues and match them. Returns (opportunities, markets scanned)."""
+    t0 = time.time()
+
+    # ── Fetch from DB ──────────────────────────────────────────────────────
+    poly_rows   = await db.fetch(_POLY_SQL)
+    kalshi_rows = await db.fetch(_KALSHI_SQL)
+    logger.info(f"Arbitrage DB: {len(poly_rows)} poly, {len(kalshi_rows)} kalshi markets")
+
+    def row_to_market(row, platform: str) -> Dict:
+        yp  = float(row.yes_price) if row.yes_price  is not None else None
+        np_ = float(row.no_price)  if row.no_price   is not None else None
+        # Derive yes price from no if needed
+        if yp is None and np_ is not None and 0 < np_ < 1:
+            yp = round(1.0 - np_, 4)
+        return {
+            "platform":  platform,
+            "market_id": str(row.market_id or ""),
+            "title":     str(row.title or ""),
+            "price":     yp,
+            "volume":    float(row.volume or 0),
+        }
+
+    poly_markets   = [row_to_market(r, "poly")   for r in poly_rows]
+    kalshi_markets = [row_to_market(r, "kalshi") for r in kalshi_rows]
+
+    all_opps = await get_cpu_pool().run(_scan_opportunities, poly_markets, kalshi_markets)
+
+    markets_scanned = len(poly_markets) + len(kalshi_markets)
+    logger.info(
+        f"Arbitrage DB: matched {len(all_opps)} opportunities "
+        f"from {markets_scanned} markets in {time.time()-t0:.2f}s"
+    )
+    return all_opps, markets_scanned
 
-        # Sort: confidence first, then spread desc
-        _conf_order = {"high": 0, "medium": 1, "low": 2}
-        all_opps.sort(key=lambda x: (_conf_order.get(x.confidence, 3), -x.spread_percent))
 
-        markets_scanned = len(poly_markets) + len(kalshi_markets)
-        _cache["data"] = {"all_opps": all_opps, "markets_scanned": markets_scanned}
-        _cache["ts"]   = time.time()
-        logger.info(
-            f"Arbitrage DB: matched {len(all_opps)} opportunities "
-            f"from {markets_scanned} markets in {time.time()-t0:.2f}s"
-        )
+@router.get("/opportunities-db", response_model=ArbitrageResponse)
+async def get_arbitrage_opportunities_db(
+    min_spread:      float = Query(0.5,  ge=0.1, le=50.0,  description="Min spread %"),
+    min_match_score: float = Query(0.50, ge=0.1, le=1.0,   description="Min similarity score"),
+    limit:           int   = Query(200,  ge=1,   le=500,   description="Max results"),
+    db: AsyncDB = Depends(get_async_db),
+):
+    """
+    Pure-DB arbitrage scanner.
+    Queries predictions_silver.markets directly — no live API calls.
+    2-minute in-process cache; concurrent misses share one scan.
+    """
+    t0 = time.time()
+
+    all_opps, markets_scanned = await _load_opportunities(db)
 
     # ── Filter per-request ────────────────────────────────────────────────────
     filtered = [
@@ -1,62 +1,50 @@
 """
-Cross-Venue endpoint - Hybrid live+DB approach.
-  Kalshi:     live service cache (5-min fresh) → groups by event_ticker, live YES prices
-  Polymarket: live Dome API markets fetch (5-min TTL) → groups by event_slug, live YES prices
-Falls back to DB for both platforms when live cache is unavailable.
+Cross-Venue endpoint - persisted match graph + live prices.
+  Matching:   data pipeline → predictions_gold.cross_venue_event_pairs (migration 020),
+              assigned one-to-one per request (cached 2 min)
+  Kalshi:     live service cache (5-min fresh) YES prices by market ticker
+  Polymarket: live Dome API markets fetch (5-min TTL) YES prices by market title
+Falls back to DB prices for both platforms when live caches are unavailable.
 """
 from fastapi import APIRouter, Query, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import text
 from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, NamedTuple, Optional
 import time
 import logging
 import calendar
-import threading
 from datetime import datetime
 
 import httpx
 
-from app.database.session import get_db
+from app.database.async_db import AsyncDB, get_async_db
+from app.services.shared_cache import get_shared_cache
+from app.utils.cache import AsyncCache, cached_v2
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 # ── Polymarket live markets cache (separate from cross-venue result cache) ────
-_poly_live: Dict[str, Any] = {
-    "data": None,   # Dict[event_slug, List[raw_market_dict]]
-    "ts": 0.0,
-    "ttl": 300.0,   # 5 min — same as Kalshi service TTL
-    "loading": False,
-}
-
-def _get_poly_live() -> Optional[Dict[str, List[Dict]]]:
-    """Return live Polymarket per-market cache if fresh, else None."""
-    now = time.time()
-    if _poly_live["data"] and (now - _poly_live["ts"]) < _poly_live["ttl"]:
-        return _poly_live["data"]
-    return None
-
-def _refresh_poly_live_bg():
-    """Background thread: fetch all Polymarket open markets from Dome API."""
-    if _poly_live["loading"]:
-        return
-    _poly_live["loading"] = True
-    try:
-        from app.config import settings
-        api_key = getattr(settings, "DOME_API_KEY", "") or ""
-        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
-        base = "https://api.domeapi.io"
-        markets_by_slug: Dict[str, List[Dict]] = {}
-        limit = 100
-        offset = 0
-        max_markets = 3000  # cap to avoid too-long fetch
+# 5 min fresh — same as Kalshi service TTL; up to 5 min more served stale
+# while one background fetch replaces it
+_poly_live = AsyncCache("cross_venue_poly_live", ttl=300.0, stale_ttl=300.0, maxsize=1, shared=True)
+
+
+async def _fetch_poly_live() -> Dict[str, List[Dict]]:
+    """Fetch all Polymarket open markets from Dome API, grouped by event slug."""
+    from app.config import settings
+    api_key = getattr(settings, "DOME_API_KEY", "") or ""
+    headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+    base = "https://api.domeapi.io"
+    markets_by_slug: Dict[str, List[Dict]] = {}
+    limit = 100
+    offset = 0
+    max_markets = 3000  # cap to avoid too-long fetch
+    async with httpx.AsyncClient(timeout=20.0) as client:
         while offset < max_markets:
-            resp = httpx.get(
+            resp = await client.get(
                 f"{base}/v1/polymarket/markets",
                 params={"limit": limit, "offset": offset, "status": "open", "min_volume": 1000},
                 headers=headers,
-                timeout=20.0,
             )
             resp.raise_for_status()
             batch = resp.json().get("markets", [])
@@ -70,51 +58,30 @@ def _refresh_poly_live_bg():
             offset += limit
             if len(batch) < limit:
                 break
-        total_mkts = sum(len(v) for v in markets_by_slug.values())
-        logger.info(f"Cross-venue: Poly live cache: {len(markets_by_slug)} events, {total_mkts} markets")
-        _poly_live["data"] = markets_by_slug
-        _poly_live["ts"] = time.time()
-    except Exception as e:
-        logger.warning(f"Cross-venue: Poly live fetch failed, using DB: {e}")
-    finally:
-        _poly_live["loading"] = False
-
-def _ensure_poly_live():
-    """Trigger background refresh if cache is stale."""
-    if not _poly_live["data"] or (time.time() - _poly_live["ts"]) >= _poly_live["ttl"]:
-        t = threading.Thread(target=_refresh_poly_live_bg, daemon=True)
-        t.start()
-
-
-# ── tiny in-memory cache (2 min TTL) ──────────────────────────────────────────
-_cache: Dict[str, Any] = {"data": None, "ts": 0.0, "ttl": 120.0}
-
-
-def _bust_cache() -> None:
-    """Force re-matching on next request (call after config changes)."""
-    _cache["data"] = None
-    _cache["ts"] = 0.0
-
-STOP_WORDS = {
-    "will", "the", "a", "an", "be", "is", "are", "was", "were", "have",
-    "has", "had", "do", "does", "did", "for", "of", "to", "in", "on",
-    "at", "by", "from", "with", "this", "that", "it", "its", "what",
-    "who", "how", "when", "where", "which", "than", "and", "or", "not",
-    "before", "after", "during", "over", "above", "below", "between",
-    "win", "won", "lose", "lost", "get", "got", "make", "made",
-}
-
-def _tokens(text_: str) -> set:
-    """Extract meaningful word tokens for similarity."""
-    words = text_.lower().replace("?", "").replace(",", "").split()
-    return {w for w in words if len(w) >= 4 and w not in STOP_WORDS}
-
-def _jaccard(a: set, b: set) -> float:
-    if not a or not b:
-        return 0.0
-    inter = len(a & b)
-    union = len(a | b)
-    return inter / union if union else 0.0
+    total_mkts = sum(len(v) for v in markets_by_slug.values())
+    logger.info(f"Cross-venue: Poly live cache: {len(markets_by_slug)} events, {total_mkts} markets")
+    return markets_by_slug
+
+
+def _get_poly_live() -> Optional[Dict[str, List[Dict]]]:
+    """
+    Live Polymarket per-market cache, or None until the first fetch lands
+    (callers fall back to DB prices). Never waits: a missing or stale
+    cache is refreshed in the background.
+    """
+    return _poly_live.get_nowait("markets", _fetch_poly_live)
+
+
+# ── assignment cache (2 min TTL) ─────────────────────────────────────────────
+ASSIGNMENT_CACHE_TTL = 120.0
+
+
+async def _bust_cache() -> None:
+    """Force re-assignment on next request, on every worker (call after config changes)."""
+    _load_matches.cache.invalidate()
+    shared = get_shared_cache()
+    if shared is not None:
+        await shared.bump(_load_matches.cache.namespace)
 
 def _slug_to_title(slug: str) -> str:
     if not slug:
@@ -192,305 +159,222 @@ class DbCrossVenueResponse(BaseModel):
     stats: DbCrossVenueStats
 
 
-# ── SQL to pull grouped events ─────────────────────────────────────────────────
-_POLY_SQL = """
+# ── SQL ────────────────────────────────────────────────────────────────────────
+# Candidate event pairs from the pipeline's match graph (migration 020), with
+# both sides' current rollups from event_groups (migration 019). Ordered so
+# each Polymarket event's candidates are contiguous, best first.
+_PAIRS_SQL = """
 SELECT
-    extra_data->>'event_slug'                                                        AS event_id,
-    (array_agg(title         ORDER BY COALESCE(volume_total,0) DESC NULLS LAST))[1] AS title,
-    (array_agg(image_url     ORDER BY COALESCE(volume_total,0) DESC NULLS LAST))[1] AS image_url,
-    (array_agg(category_name ORDER BY COALESCE(volume_total,0) DESC NULLS LAST))[1] AS category,
-    SUM(COALESCE(volume_total, 0))   AS total_volume,
-    COUNT(*)                          AS market_count,
-    MIN(end_date)                     AS earliest_end,
-    json_agg(json_build_object(
-        'market_id',  source_market_id,
-        'title',      title,
-        'yes_price',  yes_price,
-        'no_price',   no_price,
-        'volume',     COALESCE(volume_total, 0)
-    ) ORDER BY COALESCE(volume_total,0) DESC NULLS LAST) AS markets
-FROM predictions_silver.markets
-WHERE is_active = TRUE
-  AND source = 'polymarket'
-  AND extra_data->>'event_slug' IS NOT NULL
-GROUP BY extra_data->>'event_slug'
-ORDER BY total_volume DESC NULLS LAST
-LIMIT 200
+    p.poly_event_id,
+    p.kalshi_event_id,
+    p.similarity,
+    pe.total_volume  AS poly_volume,
+    pe.market_count  AS poly_market_count,
+    pe.category      AS poly_category,
+    pe.rep_image     AS poly_image,
+    ke.rep_title     AS kalshi_title,
+    ke.total_volume  AS kalshi_volume,
+    ke.market_count  AS kalshi_market_count,
+    ke.category      AS kalshi_category
+FROM predictions_gold.cross_venue_event_pairs p
+JOIN predictions_gold.event_groups pe
+  ON pe.event_id = p.poly_event_id AND pe.platform = 'polymarket'
+JOIN predictions_gold.event_groups ke
+  ON ke.event_id = p.kalshi_event_id AND ke.platform = 'kalshi'
+WHERE pe.is_active AND ke.is_active
+ORDER BY pe.total_volume DESC NULLS LAST, p.poly_event_id, p.similarity DESC, p.kalshi_event_id
 """
 
-_KALSHI_SQL = """
+# Top markets (by volume) of the events on the page, with current prices
+_EVENT_MARKETS_SQL = """
 SELECT
-    extra_data->>'event_ticker'                                                      AS event_id,
-    (array_agg(title         ORDER BY COALESCE(volume_total,0) DESC NULLS LAST))[1] AS title,
-    NULL::text                                                                        AS image_url,
-    (array_agg(category_name ORDER BY COALESCE(volume_total,0) DESC NULLS LAST))[1] AS category,
-    SUM(COALESCE(volume_total, 0))   AS total_volume,
-    COUNT(*)                          AS market_count,
-    MIN(end_date)                     AS earliest_end,
-    json_agg(json_build_object(
-        'market_id',  source_market_id,
-        'title',      title,
-        'yes_price',  yes_price,
-        'no_price',   no_price,
-        'volume',     COALESCE(volume_total, 0)
-    ) ORDER BY COALESCE(volume_total,0) DESC NULLS LAST) AS markets
-FROM predictions_silver.markets
-WHERE is_active = TRUE
-  AND source = 'kalshi'
-  AND extra_data->>'event_ticker' IS NOT NULL
-GROUP BY extra_data->>'event_ticker'
-ORDER BY total_volume DESC NULLS LAST
-LIMIT 300
+    e.platform,
+    e.event_id,
+    m.source_market_id              AS market_id,
+    m.title,
+    m.yes_price,
+    m.no_price,
+    COALESCE(m.volume_total, 0)     AS volume,
+    m.end_date
+FROM unnest(:event_ids::text[], :platforms::text[]) AS e(event_id, platform)
+CROSS JOIN LATERAL (
+    SELECT source_market_id, title, yes_price, no_price, volume_total, end_date
+    FROM predictions_silver.markets
+    WHERE predictions_silver.market_event_id(source, source_market_id, slug, extra_data) = e.event_id
+      AND source = e.platform
+      AND is_active = TRUE
+    ORDER BY COALESCE(volume_total, 0) DESC NULLS LAST
+    LIMIT 20
+) m
 """
 
 
-def _titles_are_semantically_compatible(poly_title: str, kalshi_title: str) -> bool:
+class _Match(NamedTuple):
+    """One assigned Polymarket <-> Kalshi event pair (no market details)."""
+    poly_event_id: str
+    kalshi_event_id: str
+    similarity: float
+    poly_title: str
+    kalshi_title: str
+    poly_volume: float
+    kalshi_volume: float
+    poly_market_count: int
+    kalshi_market_count: int
+    poly_category: Optional[str]
+    kalshi_category: Optional[str]
+    poly_image: Optional[str]
+
+    @property
+    def canonical_title(self) -> str:
+        return self.poly_title if len(self.poly_title) >= len(self.kalshi_title) else self.kalshi_title
+
+    @property
+    def total_volume(self) -> float:
+        return self.poly_volume + self.kalshi_volume
+
+
+def _assign_pairs(rows) -> List[_Match]:
     """
-    Reject matches that look similar on tokens but are semantically different.
-    Returns True if the two titles are plausibly about the same event.
+    One-to-one assignment of candidate pairs: Polymarket events in volume
+    order each take their most similar Kalshi event not already taken.
     """
-    import re
-    pt = poly_title.lower()
-    kt = kalshi_title.lower()
-
-    # ── Dollar amount mismatch ──────────────────────────────────────────────
-    poly_dollars = set(re.findall(r'\$[\d,]+(?:k|m|b)?', pt))
-    kalshi_dollars = set(re.findall(r'\$[\d,]+(?:k|m|b)?', kt))
-    if poly_dollars and kalshi_dollars and not poly_dollars.intersection(kalshi_dollars):
-        return False
-
-    # ── Sport mismatch (NBA ≠ NFL, baseball ≠ hockey, etc.) ─────────────────
-    SPORT_GROUPS = {
-        'nba': 'basketball', 'basketball': 'basketball', 'pro basketball': 'basketball',
-        'nfl': 'football', 'football': 'football',
-        'mlb': 'baseball', 'baseball': 'baseball',
-        'nhl': 'hockey', 'hockey': 'hockey',
-        'soccer': 'soccer', 'mls': 'soccer', 'premier league': 'soccer',
-        'la liga': 'soccer', 'ligue': 'soccer', 'champions league': 'soccer',
-        'serie a': 'soccer',
-    }
-    def _sport(text):
-        found = set()
-        for key, grp in SPORT_GROUPS.items():
-            if key in text:
-                found.add(grp)
-        return found
-    ps, ks = _sport(pt), _sport(kt)
-    if ps and ks and not ps.intersection(ks):
-        return False
-
-    # ── Different award shows ───────────────────────────────────────────────
-    AWARDS = ['oscar', 'grammy', 'emmy', 'golden globe', 'critics choice',
-              'bafta', 'tony', 'cannes', 'sundance']
-    pa = {a for a in AWARDS if a in pt}
-    ka = {a for a in AWARDS if a in kt}
-    if pa and ka and not pa.intersection(ka):
-        return False
-
-    # ── Different central banks ─────────────────────────────────────────────
-    BANKS = ['federal reserve', 'fed ', ' fed', 'bank of canada', 'bank of england',
-             'ecb', 'boj', 'bank of japan', 'rba', 'reserve bank']
-    pb = {b for b in BANKS if b in pt}
-    kb = {b for b in BANKS if b in kt}
-    if pb and kb and not pb.intersection(kb):
-        return False
-
-    # ── Different cities for same event type ────────────────────────────────
-    CITIES = ['paris', 'london', 'los angeles', 'new york', 'berlin', 'tokyo',
-              'rome', 'madrid', 'sydney', 'chicago', 'houston', 'miami']
-    if any(c in pt for c in CITIES) and any(c in kt for c in CITIES):
-        pc = {c for c in CITIES if c in pt}
-        kc = {c for c in CITIES if c in kt}
-        # Only reject if both have cities AND they differ AND similar event type
-        if pc and kc and not pc.intersection(kc):
-            # Check if same event type
-            event_types = ['election', 'mayoral', 'mayor', 'governor', 'race']
-            if any(e in pt for e in event_types) and any(e in kt for e in event_types):
-                return False
-
-    # ── Completely different subjects ───────────────────────────────────────
-    # Crypto vs non-crypto
-    CRYPTO = {'bitcoin', 'btc', 'ethereum', 'eth', 'solana', 'sol', 'crypto'}
-    pc = {c for c in CRYPTO if c in pt}
-    kc = {c for c in CRYPTO if c in kt}
-    if pc and not kc and ('price' in pt or 'hit' in pt):
-        # Poly is about crypto price, Kalshi is NOT about crypto at all
-        if 'price' not in kt and 'hit' not in kt and not kc:
-            return False
-    if kc and not pc and ('price' in kt or 'hit' in kt):
-        if 'price' not in pt and 'hit' not in pt and not pc:
-            return False
-
-    # ── Year mismatch (strict: 2025 vs 2027 = reject, but 2025-26 ≈ 2026 = ok)
-    combined_pt = re.sub(r'(\d{4})-(\d{2})\b', lambda m: f"{m.group(1)} 20{m.group(2)}", pt)
-    combined_kt = re.sub(r'(\d{4})-(\d{2})\b', lambda m: f"{m.group(1)} 20{m.group(2)}", kt)
-    py = set(re.findall(r'20[2-3]\d', combined_pt))
-    ky = set(re.findall(r'20[2-3]\d', combined_kt))
-    if py and ky and not py.intersection(ky):
-        # Allow adjacent-year flexibility for season-spanning events (e.g. 2025 vs 2026)
-        close_enough = any(abs(int(a) - int(b)) <= 1 for a in py for b in ky)
-        if not close_enough:
-            return False
-
-    # ── NBA game-specific vs general event ──────────────────────────────────
-    # e.g. "NBA Uta Mem 2026 02 20" (specific game) should not match random Kalshi props
-    nba_game_re = re.compile(r'nba\s+[a-z]{3}\s+[a-z]{3}\s+\d{4}', re.IGNORECASE)
-    if nba_game_re.search(pt) and not nba_game_re.search(kt):
-        # Poly is a specific NBA game, Kalshi must also reference that game
-        return False
-    if nba_game_re.search(kt) and not nba_game_re.search(pt):
-        return False
-
-    return True
-
-
-def _build_kalshi_from_live() -> Optional[List[tuple]]:
+    matches: List[_Match] = []
+    taken_kalshi: set = set()
+    assigned_poly: set = set()
+    for r in rows:
+        if r.poly_event_id in assigned_poly or r.kalshi_event_id in taken_kalshi:
+            continue
+        assigned_poly.add(r.poly_event_id)
+        taken_kalshi.add(r.kalshi_event_id)
+        matches.append(_Match(
+            poly_event_id=r.poly_event_id,
+            kalshi_event_id=r.kalshi_event_id,
+            similarity=float(r.similarity),
+            poly_title=_slug_to_title(r.poly_event_id),
+            kalshi_title=r.kalshi_title or r.kalshi_event_id,
+            poly_volume=float(r.poly_volume or 0),
+            kalshi_volume=float(r.kalshi_volume or 0),
+            poly_market_count=int(r.poly_market_count or 1),
+            kalshi_market_count=int(r.kalshi_market_count or 1),
+            poly_category=(r.poly_category or "").strip() or None,
+            kalshi_category=(r.kalshi_category or "").strip() or None,
+            poly_image=r.poly_image,
+        ))
+    matches.sort(key=lambda m: m.total_volume, reverse=True)
+    return matches
+
+
+def _kalshi_yes_price(m: Dict[str, Any]) -> Optional[float]:
+    """YES price from a raw Kalshi market (mirrors the Kalshi service's price logic)."""
+    yes_bid  = m.get("yes_bid")
+    yes_ask  = m.get("yes_ask")
+    last_prc = m.get("last_price")
+    yes_p    = m.get("yes_price")   # some API versions return direct price
+    if yes_bid is not None and yes_ask is not None:
+        return ((yes_bid + yes_ask) / 2.0) / 100.0
+    if yes_ask is not None:
+        return yes_ask / 100.0
+    if yes_bid is not None:
+        return yes_bid / 100.0
+    if last_prc is not None:
+        return last_prc / 100.0
+    if yes_p is not None:
+        # Direct yes_price field — scale depends on API version
+        return yes_p if yes_p <= 1.0 else yes_p / 100.0
+    return None
+
+
+def _kalshi_live_prices() -> Dict[str, float]:
     """
-    Build Kalshi (DbPlatformEvent, tokens) tuples directly from the Kalshi
-    service's in-memory market cache (refreshed every 5 minutes).
-    Returns None if the live cache is empty or unavailable, so callers can
-    fall back to the DB query.
+    market_ticker -> live YES price from the Kalshi service's in-memory
+    market cache (refreshed every 5 minutes); empty if the cache is cold.
     """
     try:
         from app.services.kalshi_service import get_kalshi_client
-        client = get_kalshi_client()
-        # The full-fetch cache key populated on startup / background refresh
-        raw_markets = client._cache.get("kalshi_markets_open_full")
-        if not raw_markets:
-            return None
-
-        # Group individual markets by event_ticker
-        groups: Dict[str, List[Dict[str, Any]]] = {}
+        raw_markets = get_kalshi_client()._cache.get("kalshi_markets_open_full") or []
+        prices = {}
         for m in raw_markets:
-            ticker = (m.get("event_ticker") or "").upper()
-            if not ticker:
-                continue
-            groups.setdefault(ticker, []).append(m)
-
-        result: List[tuple] = []
-        for ticker, raw_list in groups.items():
-            # Sort by volume descending (highest-volume market first)
-            raw_list.sort(key=lambda m: m.get("volume", 0) or 0, reverse=True)
-
-            markets: List[DbMarket] = []
-            total_volume = 0.0
-            for m in raw_list[:20]:
-                title = m.get("title", "")
-                # Replicate Kalshi service price logic
-                yes_bid  = m.get("yes_bid")
-                yes_ask  = m.get("yes_ask")
-                last_prc = m.get("last_price")
-                yes_p    = m.get("yes_price")   # some API versions return direct price
-                if yes_bid is not None and yes_ask is not None:
-                    yes_price = ((yes_bid + yes_ask) / 2.0) / 100.0
-                elif yes_ask is not None:
-                    yes_price = yes_ask / 100.0
-                elif yes_bid is not None:
-                    yes_price = yes_bid / 100.0
-                elif last_prc is not None:
-                    yes_price = last_prc / 100.0
-                elif yes_p is not None:
-                    # Direct yes_price field — scale depends on API version
-                    yes_price = yes_p if yes_p <= 1.0 else yes_p / 100.0
-                else:
-                    yes_price = None
-                no_price = (1.0 - yes_price) if yes_price is not None else None
-                vol = float(m.get("volume", 0) or 0)
-                total_volume += vol
-                mkt_ticker = m.get("market_ticker", "")
-                markets.append(DbMarket(
-                    market_id=mkt_ticker,
-                    title=title,
-                    yes_price=yes_price,
-                    no_price=no_price,
-                    volume=vol,
-                    url=f"https://kalshi.com/markets/{mkt_ticker.lower()}",
-                ))
-
-            if not markets:
-                continue
-
-            # Tokens: all market titles (no event-level ticker text needed
-            # because market titles already contain the full question text)
-            all_text = " ".join(m.title for m in markets)
-            tokens = _tokens(all_text)
-
-            ev = DbPlatformEvent(
-                event_id=ticker,
-                title=raw_list[0].get("title", ticker),
-                url=f"https://kalshi.com/markets/{ticker.lower()}",
-                total_volume=total_volume,
-                market_count=len(markets),
-                end_date=None,
-                category=None,
-                image_url=None,
-                markets=markets,
-            )
-            result.append((ev, tokens))
-
-        result.sort(key=lambda x: x[0].total_volume, reverse=True)
-        # Log top prices for debugging
-        sample = [(ev.event_id, ev.markets[0].yes_price if ev.markets else None) for ev, _ in result[:5]]
-        logger.info(f"Cross-venue: built {len(result)} Kalshi events from LIVE cache. Top5: {sample}")
-        return result
+            ticker = m.get("market_ticker")
+            price = _kalshi_yes_price(m)
+            if ticker and price is not None:
+                prices[ticker] = price
+        return prices
     except Exception as e:
-        logger.warning(f"Cross-venue: live Kalshi cache unavailable, falling back to DB: {e}")
-        return None
-
-
-def _build_platform_event(row, platform: str) -> tuple:
-    """Returns (DbPlatformEvent, title_tokens_set)."""
-    eid = row.event_id or ""
-    title = _slug_to_title(eid) if platform == "polymarket" else (row.title or eid)
-
-    import json as _json
-    raw_markets = row.markets if isinstance(row.markets, list) else _json.loads(row.markets or "[]")
-
-    # Generate tokens from event title + ALL market titles.
-    # This is critical for Kalshi: event tickers like "kxfedchairnom" produce a
-    # top-market title of "Kevin Warsh" (tokens: {kevin,warsh}) which never
-    # matches Polymarket's slug "who-will-trump-nominate-as-fed-chair" (tokens:
-    # {trump,nominate,chair}).  By including all nominee market titles we get
-    # overlapping tokens (e.g. "Donald Trump" nominee → {trump}) that allow the
-    # correct Kalshi event to score above wrong question-format events.
-    all_text = title + " " + " ".join(m.get("title", "") for m in raw_markets[:20])
-    tokens = _tokens(all_text)
+        logger.warning(f"Cross-venue: live Kalshi cache unavailable, using DB prices: {e}")
+        return {}
+
+
+def _poly_live_prices(event_id: str, live_poly: Optional[Dict[str, List[Dict]]]) -> Dict[str, float]:
+    """Lowercased market title -> live YES price for one Polymarket event."""
+    prices: Dict[str, float] = {}
+    for lm in (live_poly or {}).get(event_id, []):
+        slug = (lm.get("slug") or lm.get("question") or lm.get("title") or "").lower()
+        if not slug:
+            continue
+        # Try outcomes (Poly v2) or direct yes_price
+        yp = None
+        for o in lm.get("outcomes", []):
+            if o.get("id") == "0" or str(o.get("name", "")).lower() == "yes":
+                yp = o.get("price")
+                break
+        if yp is None:
+            yp = lm.get("yes_price")
+        if yp is not None:
+            prices[slug] = float(yp)
+    return prices
+
+
+def _platform_event(
+    platform: str,
+    event_id: str,
+    title: str,
+    total_volume: float,
+    market_count: int,
+    category: Optional[str],
+    image_url: Optional[str],
+    market_rows: list,
+    live_prices: Dict[str, float],
+) -> DbPlatformEvent:
+    """Build one side of a match; live_prices (title or ticker keyed) override DB prices."""
     markets = []
-    for m in raw_markets[:20]:   # cap per event
-        yp = float(m["yes_price"]) if m.get("yes_price") is not None else None
-        np_ = float(m["no_price"]) if m.get("no_price") is not None else None
-        mid = m.get("market_id", "")
+    for m in market_rows:
+        mid = m.market_id or ""
         if platform == "polymarket":
-            url = f"https://polymarket.com/event/{eid}"
-        elif platform == "kalshi":
+            url = f"https://polymarket.com/event/{event_id}"
+            live = live_prices.get((m.title or "").lower())
+        else:
             url = f"https://kalshi.com/markets/{mid.lower()}"
+            live = live_prices.get(mid)
+        yp = live if live is not None else (float(m.yes_price) if m.yes_price is not None else None)
+        if live is not None:
+            np_ = 1.0 - live
         else:
-            url = ""
+            np_ = float(m.no_price) if m.no_price is not None else None
         markets.append(DbMarket(
             market_id=mid,
-            title=m.get("title", ""),
+            title=m.title or "",
             yes_price=yp,
             no_price=np_,
-            volume=float(m.get("volume", 0)),
+            volume=float(m.volume or 0),
             url=url,
         ))
 
+    end_dates = [m.end_date for m in market_rows if m.end_date is not None]
     ev_url = (
-        f"https://polymarket.com/event/{eid}" if platform == "polymarket"
-        else f"https://kalshi.com/markets/{eid.lower()}"
+        f"https://polymarket.com/event/{event_id}" if platform == "polymarket"
+        else f"https://kalshi.com/markets/{event_id.lower()}"
     )
-    ev = DbPlatformEvent(
-        event_id=eid,
+    return DbPlatformEvent(
+        event_id=event_id,
         title=title,
         url=ev_url,
-        total_volume=float(row.total_volume or 0),
-        market_count=int(row.market_count or 1),
-        end_date=_dt_to_ts(row.earliest_end),
-        category=(row.category or "").strip() or None,
-        image_url=row.image_url,
+        total_volume=total_volume,
+        market_count=market_count,
+        end_date=_dt_to_ts(min(end_dates)) if end_dates else None,
+        category=category,
+        image_url=image_url,
         markets=markets,
     )
-    return ev, tokens
 
 
 def _price_spread(poly_mkts: List[DbMarket], kalshi_mkts: List[DbMarket]) -> Optional[float]:
@@ -504,181 +388,123 @@ def _price_spread(poly_mkts: List[DbMarket], kalshi_mkts: List[DbMarket]) -> Opt
     return round(abs(avg_poly - avg_kalshi), 4)
 
 
+@cached_v2(
+    "cross_venue_db", ttl=ASSIGNMENT_CACHE_TTL, shared=True, topics=("cross_venue",),
+    decode=lambda raw: [_Match(**m) for m in raw],
+)
+async def _load_matches(db: AsyncDB) -> List[_Match]:
+    """Candidate pairs from the match graph, assigned one-to-one."""
+    t0 = time.time()
+    rows = await db.fetch(_PAIRS_SQL)
+    all_matches = _assign_pairs(rows)
+    logger.info(
+        f"Cross-venue DB: assigned {len(all_matches)} of {len(rows)} candidate pairs "
+        f"in {time.time()-t0:.3f}s"
+    )
+    return all_matches
+
+
 @router.get("/cross-venue-events-db/refresh")
-def bust_cross_venue_cache():
+async def bust_cross_venue_cache():
     """Force rebuild of the cross-venue cache on next request."""
-    _bust_cache()
+    await _bust_cache()
     return {"status": "ok", "message": "Cross-venue cache cleared — next request will rebuild"}
 
 
 @router.get("/cross-venue-events-db", response_model=DbCrossVenueResponse)
-def get_cross_venue_events_db(
+async def get_cross_venue_events_db(
     min_similarity: float = Query(0.25, ge=0.10, le=1.0),
     min_volume: float = Query(0, ge=0),
     limit: int = Query(60, ge=5, le=200),
     search: Optional[str] = Query(None),
     force: bool = Query(False, description="Force cache rebuild"),
-    db: Session = Depends(get_db),
+    db: AsyncDB = Depends(get_async_db),
 ):
     """
-    Pure DB cross-venue matching. No live API calls.
-    Groups silver.markets by event_slug / event_ticker, matches by keyword Jaccard similarity.
+    Cross-venue event matches from the pipeline's match graph.
+    The data pipeline stores candidate Polymarket/Kalshi event pairs
+    (predictions_gold.cross_venue_event_pairs); a request assigns them
+    one-to-one and joins current markets and prices for the page.
     """
     t0 = time.time()
 
-    # Kick off background Polymarket live fetch (non-blocking)
-    _ensure_poly_live()
-
-    # ── Serve from cache ──────────────────────────────────────────────────────
-    now = time.time()
-    if not force and _cache["data"] and (now - _cache["ts"]) < _cache["ttl"]:
-        logger.info("Cross-venue DB: cache hit")
-        all_matches: List[DbCrossVenueEvent] = _cache["data"]
-    else:
-        # ── Fetch from DB ─────────────────────────────────────────────────────
-        poly_rows  = db.execute(text(_POLY_SQL)).fetchall()
-        kalshi_rows = db.execute(text(_KALSHI_SQL)).fetchall()
-        logger.info(f"Cross-venue DB: {len(poly_rows)} poly events, {len(kalshi_rows)} kalshi events")
-
-        # ── Build structures ──────────────────────────────────────────────────
-        live_poly = _get_poly_live()  # May be None on first request (populates in background)
-
-        def _build_poly_event(r) -> tuple:
-            """Build Polymarket event, overlaying live per-market prices when available."""
-            ev, tokens = _build_platform_event(r, "polymarket")
-            if live_poly and ev.event_id in live_poly:
-                live_mkts = live_poly[ev.event_id]
-                # Build a lookup: lowercased title → live price
-                live_by_slug: Dict[str, float] = {}
-                for lm in live_mkts:
-                    slug = (lm.get("slug") or lm.get("question") or lm.get("title") or "").lower()
-                    if slug:
-                        # Try outcomes (Poly v2) or direct yes_price
-                        outcomes = lm.get("outcomes", [])
-                        yp = None
-                        for o in outcomes:
-                            if o.get("id") == "0" or str(o.get("name", "")).lower() == "yes":
-                                yp = o.get("price")
-                                break
-                        if yp is None:
-                            yp = lm.get("yes_price")
-                        if yp is not None:
-                            live_by_slug[slug] = float(yp)
-                # Patch each DB market with live price
-                for m in ev.markets:
-                    key = m.title.lower()
-                    if key in live_by_slug:
-                        m.yes_price = live_by_slug[key]
-                        m.no_price = 1.0 - m.yes_price
-            return ev, tokens
-
-        poly_events: List[tuple] = [_build_poly_event(r) for r in poly_rows]
-
-        # Prefer live Kalshi service cache (5-min fresh) over stale DB rows
-        kalshi_events: List[tuple] = (
-            _build_kalshi_from_live()
-            or [_build_platform_event(r, "kalshi") for r in kalshi_rows]
-        )
-
-        # ── Match ─────────────────────────────────────────────────────────────
-        # Index kalshi by each of its tokens for fast lookup
-        from collections import defaultdict
-        kalshi_index: Dict[str, List[int]] = defaultdict(list)
-        for i, (_, ktokens) in enumerate(kalshi_events):
-            for t in ktokens:
-                kalshi_index[t].append(i)
-
-        matched_kalshi: set = set()
-        all_matches = []
-
-        for pe, ptokens in poly_events:
-            # Candidate kalshi events
-            candidate_idx: Dict[int, int] = {}
-            for tok in ptokens:
-                for ki in kalshi_index.get(tok, []):
-                    if ki not in matched_kalshi:
-                        candidate_idx[ki] = candidate_idx.get(ki, 0) + 1
-
-            # Score candidates (only those with >=2 shared tokens are worth checking)
-            best_sim = 0.0
-            best_ki  = -1
-            for ki, shared in candidate_idx.items():
-                if shared < 2:
-                    continue
-                ke, ktokens_ = kalshi_events[ki]
-                sim = _jaccard(ptokens, ktokens_)
-                if sim > best_sim:
-                    # Semantic validation: reject obviously wrong matches
-                    ke_check = kalshi_events[ki][0]
-                    if not _titles_are_semantically_compatible(pe.title, ke_check.title):
-                        continue
-                    best_sim = sim
-                    best_ki  = ki
-
-            if best_ki < 0 or best_sim < 0.20:
-                continue
-
-            ke, _ = kalshi_events[best_ki]
-            matched_kalshi.add(best_ki)
-
-            confidence = "high" if best_sim >= 0.50 else "medium" if best_sim >= 0.30 else "low"
-
-            total_vol = pe.total_volume + ke.total_volume
-            vol_diff  = abs(pe.total_volume - ke.total_volume)
-            vol_ratio = (
-                max(pe.total_volume, ke.total_volume) /
-                max(min(pe.total_volume, ke.total_volume), 1)
-            )
-            mkts_diff = abs(pe.market_count - ke.market_count)
-
-            end_match = False
-            if pe.end_date and ke.end_date:
-                end_match = abs(pe.end_date - ke.end_date) < 30 * 86400
-
-            canonical = pe.title if len(pe.title) >= len(ke.title) else ke.title
-
-            all_matches.append(DbCrossVenueEvent(
-                canonical_title=canonical,
-                similarity_score=round(best_sim, 3),
-                match_confidence=confidence,
-                polymarket=pe,
-                kalshi=ke,
-                total_volume=total_vol,
-                volume_difference=vol_diff,
-                volume_ratio=round(vol_ratio, 2),
-                market_count_diff=mkts_diff,
-                end_date_match=end_match,
-                price_spread=_price_spread(pe.markets, ke.markets),
-            ))
-
-        # Sort by total_volume desc
-        all_matches.sort(key=lambda x: x.total_volume, reverse=True)
-        _cache["data"] = all_matches
-        _cache["ts"]   = time.time()
-        logger.info(f"Cross-venue DB: matched {len(all_matches)} events in {time.time()-t0:.2f}s")
+    # ── Assignment (cached) ───────────────────────────────────────────────────
+    if force:
+        await _bust_cache()
+    all_matches = await _load_matches(db)
 
     # ── Filter ────────────────────────────────────────────────────────────────
-    filtered = [
-        e for e in all_matches
-        if e.similarity_score >= min_similarity
-        and e.total_volume >= min_volume
+    needle = search.lower() if search else None
+    page = [
+        m for m in all_matches
+        if m.similarity >= min_similarity
+        and m.total_volume >= min_volume
         and (
-            not search
-            or search.lower() in e.canonical_title.lower()
-            or search.lower() in e.polymarket.title.lower()
-            or search.lower() in e.kalshi.title.lower()
-            or (e.polymarket.category or "").lower().find(search.lower()) >= 0
+            not needle
+            or needle in m.canonical_title.lower()
+            or needle in m.poly_title.lower()
+            or needle in m.kalshi_title.lower()
+            or needle in (m.poly_category or "").lower()
         )
     ][:limit]
 
+    # ── Markets and prices for the page only ─────────────────────────────────
+    by_event: Dict[tuple, list] = {}
+    if page:
+        market_rows = await db.fetch(
+            _EVENT_MARKETS_SQL,
+            {
+                "event_ids": [m.poly_event_id for m in page] + [m.kalshi_event_id for m in page],
+                "platforms": ["polymarket"] * len(page) + ["kalshi"] * len(page),
+            },
+        )
+        for r in market_rows:
+            by_event.setdefault((r.platform, r.event_id), []).append(r)
+
+    live_poly = _get_poly_live()  # May be None on first request (populates in background)
+    live_kalshi = _kalshi_live_prices() if page else {}
+
+    events: List[DbCrossVenueEvent] = []
+    for m in page:
+        pe = _platform_event(
+            "polymarket", m.poly_event_id, m.poly_title, m.poly_volume, m.poly_market_count,
+            m.poly_category, m.poly_image, by_event.get(("polymarket", m.poly_event_id), []),
+            _poly_live_prices(m.poly_event_id, live_poly),
+        )
+        ke = _platform_event(
+            "kalshi", m.kalshi_event_id, m.kalshi_title, m.kalshi_volume, m.kalshi_market_count,
+            m.kalshi_category, None, by_event.get(("kalshi", m.kalshi_event_id), []),
+            live_kalshi,
+        )
+
+        end_match = False
+        if pe.end_date and ke.end_date:
+            end_match = abs(pe.end_date - ke.end_date) < 30 * 86400
+
+        events.append(DbCrossVenueEvent(
+            canonical_title=m.canonical_title,
+            similarity_score=round(m.similarity, 3),
+            match_confidence="high" if m.similarity >= 0.50 else "medium" if m.similarity >= 0.30 else "low",
+            polymarket=pe,
+            kalshi=ke,
+            total_volume=m.total_volume,
+            volume_difference=abs(pe.total_volume - ke.total_volume),
+            volume_ratio=round(
+                max(pe.total_volume, ke.total_volume) / max(min(pe.total_volume, ke.total_volume), 1), 2
+            ),
+            market_count_diff=abs(pe.market_count - ke.market_count),
+            end_date_match=end_match,
+            price_spread=_price_spread(pe.markets, ke.markets),
+        ))
+
     stats = DbCrossVenueStats(
-        total_matches=len(filtered),
-        high_confidence=sum(1 for e in filtered if e.match_confidence == "high"),
-        medium_confidence=sum(1 for e in filtered if e.match_confidence == "medium"),
-        avg_similarity=round(sum(e.similarity_score for e in filtered) / len(filtered), 3) if filtered else 0,
-        total_volume=sum(e.total_volume for e in filtered),
+        total_matches=len(events),
+        high_confidence=sum(1 for e in events if e.match_confidence == "high"),
+        medium_confidence=sum(1 for e in events if e.match_confidence == "medium"),
+        avg_similarity=round(sum(e.similarity_score for e in events) / len(events), 3) if events else 0,
+        total_volume=sum(e.total_volume for e in events),
         polymarket_events=len(all_matches),
-        kalshi_events=len([e for e in all_matches]),
+        kalshi_events=len(all_matches),
         query_ms=int((time.time() - t0) * 1000),
     )
-    return DbCrossVenueResponse(events=filtered, stats=stats)
+    return DbCrossVenueResponse(events=events, stats=stats)
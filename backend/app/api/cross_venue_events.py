@@ -18,6 +18,7 @@ from collections import defaultdict
 
 from app.database.session import get_db
 from app.api.arbitrage import calculate_similarity, _extract_entities
+from app.services.cpu_pool import get_cpu_pool
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -86,56 +87,12 @@ class CrossVenueEventsResponse(BaseModel):
     stats: CrossVenueEventsStats
 
 
-@router.get("/cross-venue-events", response_model=CrossVenueEventsResponse)
-async def get_cross_venue_events(
-    min_similarity: float = Query(default=0.65, ge=0.4, le=1.0, description="Minimum similarity score"),
-    min_volume: float = Query(default=5000, ge=0, description="Minimum total volume ($)"),
-    limit: int = Query(default=50, ge=5, le=200, description="Max number of event matches"),
-    db: Session = Depends(get_db)
-):
+def _match_events(poly_events: List[Dict], kalshi_events: List[Dict], min_similarity: float) -> List[CrossVenueEvent]:
     """
-    Get matched EVENTS across Polymarket and Kalshi with individual market prices.
+    Best Kalshi event per Polymarket event by title similarity, highest
+    combined volume first. Pure CPU work (runs in the CPU pool,
+    app.services.cpu_pool).
     """
-    start_time = time.time()
-    
-    # Check cache
-    now = time.time()
-    if _cross_venue_events_cache["data"] and (now - _cross_venue_events_cache["timestamp"]) < _cross_venue_events_cache["ttl"]:
-        logger.info("Cross-venue events: serving from cache")
-        cached_data = _cross_venue_events_cache["data"]
-        cached_events = cached_data["events"]
-        # Re-filter
-        filtered = [e for e in cached_events if e.similarity_score >= min_similarity and e.total_volume >= min_volume][:limit]
-        stats = CrossVenueEventsStats(
-            total_event_matches=len(filtered),
-            high_confidence_matches=sum(1 for e in filtered if e.match_confidence == "high"),
-            avg_similarity=round(sum(e.similarity_score for e in filtered) / len(filtered), 3) if filtered else 0,
-            total_combined_volume=sum(e.total_volume for e in filtered),
-            polymarket_events_scanned=cached_data["poly_count"],
-            kalshi_events_scanned=cached_data["kalshi_count"],
-            scan_time=round(time.time() - start_time, 2)
-        )
-        return CrossVenueEventsResponse(events=filtered, stats=stats)
-    
-    # Fetch events from both platforms
-    logger.info("Cross-venue events: fetching events from Polymarket and Kalshi...")
-    poly_events, kalshi_events = await asyncio.gather(
-        fetch_polymarket_events_with_markets(),
-        fetch_kalshi_events_with_markets(),
-        return_exceptions=True
-    )
-    
-    if isinstance(poly_events, Exception):
-        logger.error(f"Polymarket events fetch failed: {poly_events}")
-        poly_events = []
-    if isinstance(kalshi_events, Exception):
-        logger.error(f"Kalshi events fetch failed: {kalshi_events}")
-        kalshi_events = []
-    
-    poly_count = len(poly_events)
-    kalshi_count = len(kalshi_events)
-    logger.info(f"Fetched {poly_count} Polymarket events, {kalshi_count} Kalshi events")
-    
     # Build index for Kalshi events - index by multiple entities
     kalshi_index = defaultdict(list)
     for ke in kalshi_events:
@@ -250,6 +207,61 @@ async def get_cross_venue_events(
     
     # Sort by total volume (highest first)
     matches.sort(key=lambda m: m.total_volume, reverse=True)
+    return matches
+
+
+@router.get("/cross-venue-events", response_model=CrossVenueEventsResponse)
+async def get_cross_venue_events(
+    min_similarity: float = Query(default=0.65, ge=0.4, le=1.0, description="Minimum similarity score"),
+    min_volume: float = Query(default=5000, ge=0, description="Minimum total volume ($)"),
+    limit: int = Query(default=50, ge=5, le=200, description="Max number of event matches"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get matched EVENTS across Polymarket and Kalshi with individual market prices.
+    """
+    start_time = time.time()
+    
+    # Check cache
+    now = time.time()
+    if _cross_venue_events_cache["data"] and (now - _cross_venue_events_cache["timestamp"]) < _cross_venue_events_cache["ttl"]:
+        logger.info("Cross-venue events: serving from cache")
+        cached_data = _cross_venue_events_cache["data"]
+        cached_events = cached_data["events"]
+        # Re-filter
+        filtered = [e for e in cached_events if e.similarity_score >= min_similarity and e.total_volume >= min_volume][:limit]
+        stats = CrossVenueEventsStats(
+            total_event_matches=len(filtered),
+            high_confidence_matches=sum(1 for e in filtered if e.match_confidence == "high"),
+            avg_similarity=round(sum(e.similarity_score for e in filtered) / len(filtered), 3) if filtered else 0,
+            total_combined_volume=sum(e.total_volume for e in filtered),
+            polymarket_events_scanned=cached_data["poly_count"],
+            kalshi_events_scanned=cached_data["kalshi_count"],
+            scan_time=round(time.time() - start_time, 2)
+        )
+        return CrossVenueEventsResponse(events=filtered, stats=stats)
+    
+    # Fetch events from both platforms
+    logger.info("Cross-venue events: fetching events from Polymarket and Kalshi...")
+    poly_events, kalshi_events = await asyncio.gather(
+        fetch_polymarket_events_with_markets(),
+        fetch_kalshi_events_with_markets(),
+        return_exceptions=True
+    )
+    
+    if isinstance(poly_events, Exception):
+        logger.error(f"Polymarket events fetch failed: {poly_events}")
+        poly_events = []
+    if isinstance(kalshi_events, Exception):
+        logger.error(f"Kalshi events fetch failed: {kalshi_events}")
+        kalshi_events = []
+    
+    poly_count = len(poly_events)
+    kalshi_count = len(kalshi_events)
+    logger.info(f"Fetched {poly_count} Polymarket events, {kalshi_count} Kalshi events")
+    
+    # Match events off the event loop
+    matches = await get_cpu_pool().run(_match_events, poly_events, kalshi_events, min_similarity)
     
     # Cache all matches
     _cross_venue_events_cache["data"] = {
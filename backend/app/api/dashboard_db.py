@@ -4,23 +4,12 @@ Fetches data from predictions_gold schema instead of API calls
 """
 
 from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, func, text
 from typing import Dict, List, Any
 import logging
 from datetime import datetime, timedelta, timezone
 import asyncio
 
-from app.database.session import get_db
-from app.models.gold_layer import (
-    MarketMetricsSummary,
-    TopMarketsSnapshot,
-    CategoryDistribution,
-    VolumeTrends,
-    HighVolumeActivity,
-    PlatformComparison,
-    TrendingCategories,
-)
+from app.database.async_db import AsyncDB, get_async_db
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -50,20 +39,17 @@ async def get_cached_platform_stats():
     async def fetch_polymarket():
         try:
             # Polymarket from database
-            from app.database.session import get_db
-            db = next(get_db())
-            try:
-                comparison = db.query(PlatformComparison).filter(
-                    PlatformComparison.platform == "polymarket"
-                ).first()
-                if comparison:
-                    return {
-                        "platform": "polymarket",
-                        "total_markets": comparison.total_markets,
-                        "open_markets": comparison.active_markets,
-                    }
-            finally:
-                db.close()
+            db = await get_async_db()
+            comparison = await db.fetchrow(
+                "SELECT total_markets, active_markets FROM predictions_gold.platform_comparison"
+                " WHERE platform = 'polymarket' LIMIT 1"
+            )
+            if comparison:
+                return {
+                    "platform": "polymarket",
+                    "total_markets": comparison.total_markets,
+                    "open_markets": comparison.active_markets,
+                }
         except Exception as e:
             logger.warning(f"Could not fetch Polymarket stats: {e}")
         return {"platform": "polymarket", "total_markets": 16000, "open_markets": 11000}
@@ -127,16 +113,17 @@ async def get_cached_platform_stats():
 
 
 @router.get("/market-metrics")
-async def get_market_metrics(db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def get_market_metrics(db: AsyncDB = Depends(get_async_db)) -> Dict[str, Any]:
     """
     Get overall market metrics (dashboard header cards)
     Updates every 5 minutes
     """
     try:
         # Get latest snapshot
-        metrics = db.query(MarketMetricsSummary).order_by(
-            desc(MarketMetricsSummary.snapshot_timestamp)
-        ).first()
+        metrics = await db.fetchrow(
+            "SELECT * FROM predictions_gold.market_metrics_summary"
+            " ORDER BY snapshot_timestamp DESC LIMIT 1"
+        )
         
         if not metrics:
             raise HTTPException(status_code=404, detail="No market metrics available")
@@ -174,27 +161,20 @@ async def get_market_metrics(db: Session = Depends(get_db)) -> Dict[str, Any]:
 @router.get("/top-markets")
 async def get_top_markets(
     limit: int = 10,
-    db: Session = Depends(get_db)
+    db: AsyncDB = Depends(get_async_db)
 ) -> List[Dict[str, Any]]:
     """
     Get top markets by volume (ranked 1-10)
     Updates every 5 minutes
     """
     try:
-        # Get latest snapshot timestamp
-        latest_timestamp = db.query(
-            func.max(TopMarketsSnapshot.snapshot_timestamp)
-        ).scalar()
-        
-        if not latest_timestamp:
-            return []
-        
-        # Get top markets from latest snapshot
-        markets = db.query(TopMarketsSnapshot).filter(
-            TopMarketsSnapshot.snapshot_timestamp == latest_timestamp
-        ).order_by(
-            TopMarketsSnapshot.rank
-        ).limit(limit).all()
+        # Top markets from the latest snapshot
+        markets = await db.fetch(
+            "SELECT * FROM predictions_gold.top_markets_snapshot"
+            " WHERE snapshot_timestamp = (SELECT MAX(snapshot_timestamp) FROM predictions_gold.top_markets_snapshot)"
+            " ORDER BY rank LIMIT :limit",
+            {"limit": limit},
+        )
         
         return [
             {
@@ -219,25 +199,18 @@ async def get_top_markets(
 
 
 @router.get("/category-distribution")
-async def get_category_distribution(db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
+async def get_category_distribution(db: AsyncDB = Depends(get_async_db)) -> List[Dict[str, Any]]:
     """
     Get category distribution for pie chart
     Updates every 15 minutes
     """
     try:
-        # Get latest snapshot
-        latest_timestamp = db.query(
-            func.max(CategoryDistribution.snapshot_timestamp)
-        ).scalar()
-        
-        if not latest_timestamp:
-            return []
-        
-        categories = db.query(CategoryDistribution).filter(
-            CategoryDistribution.snapshot_timestamp == latest_timestamp
-        ).order_by(
-            desc(CategoryDistribution.percentage)
-        ).all()
+        # Latest snapshot
+        categories = await db.fetch(
+            "SELECT * FROM predictions_gold.category_distribution"
+            " WHERE snapshot_timestamp = (SELECT MAX(snapshot_timestamp) FROM predictions_gold.category_distribution)"
+            " ORDER BY percentage DESC"
+        )
         
         return [
             {
@@ -263,25 +236,19 @@ async def get_category_distribution(db: Session = Depends(get_db)) -> List[Dict[
 async def get_volume_trends(
     days: int = 7,
     limit: int = 20,
-    db: Session = Depends(get_db)
+    db: AsyncDB = Depends(get_async_db)
 ) -> List[Dict[str, Any]]:
     """
     Get volume trends - top markets by volume trend
     """
     try:
-        # Get latest snapshot
-        latest_timestamp = db.query(
-            func.max(VolumeTrends.snapshot_timestamp)
-        ).scalar()
-        
-        if not latest_timestamp:
-            return []
-        
-        trends = db.query(VolumeTrends).filter(
-            VolumeTrends.snapshot_timestamp == latest_timestamp
-        ).order_by(
-            desc(VolumeTrends.rank_by_trend)
-        ).limit(limit).all()
+        # Latest snapshot
+        trends = await db.fetch(
+            "SELECT * FROM predictions_gold.volume_trends"
+            " WHERE snapshot_timestamp = (SELECT MAX(snapshot_timestamp) FROM predictions_gold.volume_trends)"
+            " ORDER BY rank_by_trend DESC LIMIT :limit",
+            {"limit": limit},
+        )
         
         return [
             {
@@ -310,16 +277,18 @@ async def get_volume_trends(
 @router.get("/activity-feed")
 async def get_activity_feed(
     limit: int = 50,
-    db: Session = Depends(get_db)
+    db: AsyncDB = Depends(get_async_db)
 ) -> List[Dict[str, Any]]:
     """
     Get recent high-volume activity
     Updates every 5 minutes
     """
     try:
-        activities = db.query(HighVolumeActivity).order_by(
-            desc(HighVolumeActivity.detected_at)
-        ).limit(limit).all()
+        activities = await db.fetch(
+            "SELECT * FROM predictions_gold.high_volume_activity"
+            " ORDER BY detected_at DESC LIMIT :limit",
+            {"limit": limit},
+        )
         
         return [
             {
@@ -350,25 +319,18 @@ async def get_activity_feed(
 
 
 @router.get("/platform-comparison")
-async def get_platform_comparison(db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
+async def get_platform_comparison(db: AsyncDB = Depends(get_async_db)) -> List[Dict[str, Any]]:
     """
     Get platform comparison metrics
     Updates every 15 minutes
     """
     try:
-        # Get latest snapshot
-        latest_timestamp = db.query(
-            func.max(PlatformComparison.snapshot_timestamp)
-        ).scalar()
-        
-        if not latest_timestamp:
-            return []
-        
-        platforms = db.query(PlatformComparison).filter(
-            PlatformComparison.snapshot_timestamp == latest_timestamp
-        ).order_by(
-            PlatformComparison.display_order
-        ).all()
+        # Latest snapshot
+        platforms = await db.fetch(
+            "SELECT * FROM predictions_gold.platform_comparison"
+            " WHERE snapshot_timestamp = (SELECT MAX(snapshot_timestamp) FROM predictions_gold.platform_comparison)"
+            " ORDER BY display_order"
+        )
         
         return [
             {
@@ -398,26 +360,20 @@ async def get_platform_comparison(db: Session = Depends(get_db)) -> List[Dict[st
 @router.get("/trending-categories")
 async def get_trending_categories(
     limit: int = 8,
-    db: Session = Depends(get_db)
+    db: AsyncDB = Depends(get_async_db)
 ) -> List[Dict[str, Any]]:
     """
     Get trending categories (top 8 by trend score)
     Updates every 15 minutes
     """
     try:
-        # Get latest snapshot
-        latest_timestamp = db.query(
-            func.max(TrendingCategories.snapshot_timestamp)
-        ).scalar()
-        
-        if not latest_timestamp:
-            return []
-        
-        categories = db.query(TrendingCategories).filter(
-            TrendingCategories.snapshot_timestamp == latest_timestamp
-        ).order_by(
-            TrendingCategories.rank
-        ).limit(limit).all()
+        # Latest snapshot
+        categories = await db.fetch(
+            "SELECT * FROM predictions_gold.trending_categories"
+            " WHERE snapshot_timestamp = (SELECT MAX(snapshot_timestamp) FROM predictions_gold.trending_categories)"
+            " ORDER BY rank LIMIT :limit",
+            {"limit": limit},
+        )
         
         return [
             {
@@ -442,7 +398,7 @@ async def get_trending_categories(
 @router.get("/stats")
 async def get_dashboard_stats(
     limit: int = 50,
-    db: Session = Depends(get_db)
+    db: AsyncDB = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """
     Get all dashboard stats in one call (for backward compatibility)
@@ -470,13 +426,13 @@ async def get_dashboard_stats(
 
 
 @router.get("/data-freshness")
-async def get_data_freshness(db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def get_data_freshness(db: AsyncDB = Depends(get_async_db)) -> Dict[str, Any]:
     """
     Get the last update times for all data sources.
     Returns when each platform's data was last refreshed in the database.
     """
     try:
-        result = db.execute(text("""
+        result = await db.fetch("""
             SELECT 
                 cache_key, 
                 platform, 
@@ -486,7 +442,7 @@ async def get_data_freshness(db: Session = Depends(get_db)) -> Dict[str, Any]:
             FROM production_cache 
             WHERE cache_key LIKE '%_events'
             ORDER BY updated_at DESC
-        """)).fetchall()
+        """)
         
         platforms = {}
         latest_update = None
@@ -16,11 +16,15 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
 import logging
 import asyncio
+import functools
 import httpx
 import os
 from dotenv import load_dotenv
 from collections import defaultdict
 
+from app.services.cpu_pool import get_cpu_pool
+from app.services.fetch_engine import get_fetch_engine
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
@@ -43,6 +47,26 @@ def get_headers():
 # Trade & Orderbook Fetching
 # ============================================================================
 
+async def _get_market_trades(client: httpx.AsyncClient, market_slug: str, start_time: int) -> tuple:
+    """Polymarket trades since start_time (unix seconds); raises on failure."""
+    response = await client.get(
+        f"{DOME_API_BASE}/v1/polymarket/orders",
+        params={
+            "market_slug": market_slug,
+            "start_time": start_time,
+            "limit": 500,
+        },
+        headers=get_headers(),
+        timeout=15.0
+    )
+    response.raise_for_status()
+    data = response.json()
+    trades = data.get("orders", [])
+    # pagination.total gives the real count (not capped by limit)
+    total_count = data.get("pagination", {}).get("total", len(trades))
+    return trades, total_count
+
+
 async def fetch_market_trades(client: httpx.AsyncClient, market_slug: str, hours: int = 24) -> tuple:
     """Fetch trades for a single market from Dome API.
     
@@ -52,52 +76,41 @@ async def fetch_market_trades(client: httpx.AsyncClient, market_slug: str, hours
     """
     try:
         start_time = int((datetime.utcnow() - timedelta(hours=hours)).timestamp())
-        
-        response = await client.get(
-            f"{DOME_API_BASE}/v1/polymarket/orders",
-            params={
-                "market_slug": market_slug,
-                "start_time": start_time,
-                "limit": 500,
-            },
-            headers=get_headers(),
-            timeout=15.0
-        )
-        response.raise_for_status()
-        data = response.json()
-        trades = data.get("orders", [])
-        # pagination.total gives the real count (not capped by limit)
-        total_count = data.get("pagination", {}).get("total", len(trades))
-        return trades, total_count
+        return await _get_market_trades(client, market_slug, start_time)
     except Exception as e:
         logger.warning(f"Failed to fetch trades for {market_slug}: {e}")
         return [], 0
 
 
+async def _get_market_orderbook(client: httpx.AsyncClient, token_id: str) -> Dict:
+    """Latest Polymarket orderbook snapshot for a token; raises on failure."""
+    # Get orderbook snapshots (last hour)
+    end_time = int(datetime.utcnow().timestamp() * 1000)
+    start_time = end_time - (60 * 60 * 1000)  # 1 hour in ms
+    
+    response = await client.get(
+        f"{DOME_API_BASE}/v1/polymarket/orderbooks",
+        params={
+            "token_id": token_id,
+            "start_time": start_time,
+            "end_time": end_time,
+            "limit": 1,  # Just latest
+        },
+        headers=get_headers(),
+        timeout=15.0
+    )
+    response.raise_for_status()
+    data = response.json()
+    snapshots = data.get("snapshots", [])
+    if snapshots:
+        return snapshots[-1]  # Most recent
+    return {}
+
+
 async def fetch_market_orderbook(client: httpx.AsyncClient, token_id: str) -> Dict:
     """Fetch current orderbook for a token from Dome API."""
     try:
-        # Get orderbook snapshots (last hour)
-        end_time = int(datetime.utcnow().timestamp() * 1000)
-        start_time = end_time - (60 * 60 * 1000)  # 1 hour in ms
-        
-        response = await client.get(
-            f"{DOME_API_BASE}/v1/polymarket/orderbooks",
-            params={
-                "token_id": token_id,
-                "start_time": start_time,
-                "end_time": end_time,
-                "limit": 1,  # Just latest
-            },
-            headers=get_headers(),
-            timeout=15.0
-        )
-        response.raise_for_status()
-        data = response.json()
-        snapshots = data.get("snapshots", [])
-        if snapshots:
-            return snapshots[-1]  # Most recent
-        return {}
+        return await _get_market_orderbook(client, token_id)
     except Exception as e:
         logger.warning(f"Failed to fetch orderbook for {token_id[:20]}...: {e}")
         return {}
@@ -136,6 +149,57 @@ async def fetch_market_price_history(client: httpx.AsyncClient, token_id: str, h
 # Kalshi-Specific Fetching (via Dome API)
 # ============================================================================
 
+async def _get_kalshi_market_trades(client: httpx.AsyncClient, market_ticker: str, start_time: int) -> tuple:
+    """Kalshi trades since start_time (unix seconds), normalized; raises on failure."""
+    response = await client.get(
+        f"{DOME_API_BASE}/v1/kalshi/trades",
+        params={
+            "ticker": market_ticker,
+            "start_time": start_time,
+            "limit": 500,
+        },
+        headers=get_headers(),
+        timeout=15.0
+    )
+    response.raise_for_status()
+    data = response.json()
+    trades = data.get("trades", [])
+    total_count = data.get("pagination", {}).get("total", len(trades))
+
+    # Normalize Kalshi trade format to match Polymarket structure
+    normalized = []
+    for t in trades:
+        # Kalshi returns yes_price/no_price in cents (0-100)
+        yes_price = float(t.get("yes_price_dollars", 0) or t.get("yes_price", 0) / 100)
+        no_price = float(t.get("no_price_dollars", 0) or t.get("no_price", 0) / 100)
+        count = int(t.get("count", 1))
+        taker_side = t.get("taker_side", "yes").upper()
+
+        # Determine trade side (BUY = buying YES, SELL = buying NO)
+        if taker_side.lower() == "yes":
+            side = "BUY"
+            price = yes_price
+        else:
+            side = "SELL"
+            price = no_price
+
+        # Calculate value (count * price in dollars)
+        value = count * price
+
+        normalized.append({
+            "trade_id": t.get("trade_id"),
+            "market_ticker": market_ticker,
+            "side": side,
+            "price": price,
+            "shares_normalized": count,
+            "quantity": count,
+            "timestamp": t.get("created_time"),
+            "value": value,
+        })
+
+    return normalized, total_count
+
+
 async def fetch_kalshi_market_trades(client: httpx.AsyncClient, market_ticker: str, hours: int = 24) -> tuple:
     """Fetch trades for a single Kalshi market from Dome API.
     
@@ -145,113 +209,71 @@ async def fetch_kalshi_market_trades(client: httpx.AsyncClient, market_ticker: s
     """
     try:
         start_time = int((datetime.utcnow() - timedelta(hours=hours)).timestamp())
-        
-        response = await client.get(
-            f"{DOME_API_BASE}/v1/kalshi/trades",
-            params={
-                "ticker": market_ticker,
-                "start_time": start_time,
-                "limit": 500,
-            },
-            headers=get_headers(),
-            timeout=15.0
-        )
-        response.raise_for_status()
-        data = response.json()
-        trades = data.get("trades", [])
-        total_count = data.get("pagination", {}).get("total", len(trades))
-        
-        # Normalize Kalshi trade format to match Polymarket structure
-        normalized = []
-        for t in trades:
-            # Kalshi returns yes_price/no_price in cents (0-100)
-            yes_price = float(t.get("yes_price_dollars", 0) or t.get("yes_price", 0) / 100)
-            no_price = float(t.get("no_price_dollars", 0) or t.get("no_price", 0) / 100)
-            count = int(t.get("count", 1))
-            taker_side = t.get("taker_side", "yes").upper()
-            
-            # Determine trade side (BUY = buying YES, SELL = buying NO)
-            if taker_side.lower() == "yes":
-                side = "BUY"
-                price = yes_price
-            else:
-                side = "SELL"
-                price = no_price
-            
-            # Calculate value (count * price in dollars)
-            value = count * price
-            
-            normalized.append({
-                "trade_id": t.get("trade_id"),
-                "market_ticker": market_ticker,
-                "side": side,
-                "price": price,
-                "shares_normalized": count,
-                "quantity": count,
-                "timestamp": t.get("created_time"),
-                "value": value,
-            })
-        
-        return normalized, total_count
+        return await _get_kalshi_market_trades(client, market_ticker, start_time)
     except Exception as e:
         logger.warning(f"Failed to fetch Kalshi trades for {market_ticker}: {e}")
         return [], 0
 
 
+async def _get_kalshi_market_orderbook(client: httpx.AsyncClient, market_ticker: str) -> Dict:
+    """Latest Kalshi orderbook, normalized to bids/asks; raises on failure."""
+    # Get latest orderbook snapshot (no time params = latest)
+    response = await client.get(
+        f"{DOME_API_BASE}/v1/kalshi/orderbooks",
+        params={
+            "ticker": market_ticker,
+            "limit": 1,  # Just latest
+        },
+        headers=get_headers(),
+        timeout=15.0
+    )
+    response.raise_for_status()
+    data = response.json()
+    snapshots = data.get("snapshots", [])
+
+    if snapshots:
+        snapshot = snapshots[-1]
+        orderbook = snapshot.get("orderbook", {})
+
+        # Normalize to standard format with bids/asks
+        # Kalshi returns: yes (bids for YES), no (bids for NO)
+        # yes_dollars/no_dollars are in decimal format
+        yes_bids = orderbook.get("yes_dollars", []) or orderbook.get("yes", [])
+        no_bids = orderbook.get("no_dollars", []) or orderbook.get("no", [])
+
+        # Convert to standard bid/ask format
+        # YES bids are our "bids" (buying YES)
+        # NO bids are effectively "asks" for YES (price of NO = 1 - price of YES)
+        bids = []
+        asks = []
+
+        for level in yes_bids:
+            if isinstance(level, list) and len(level) >= 2:
+                price = float(level[0]) if isinstance(level[0], (int, float)) else float(level[0])
+                size = float(level[1])
+                # Convert cents to decimal if needed
+                if price > 1:
+                    price = price / 100
+                bids.append({"price": price, "size": size})
+
+        for level in no_bids:
+            if isinstance(level, list) and len(level) >= 2:
+                price = float(level[0]) if isinstance(level[0], (int, float)) else float(level[0])
+                size = float(level[1])
+                # Convert cents to decimal if needed
+                if price > 1:
+                    price = price / 100
+                # NO bids at price X means YES asks at price (1 - X)
+                asks.append({"price": 1 - price, "size": size})
+
+        return {"bids": bids, "asks": asks}
+    return {}
+
+
 async def fetch_kalshi_market_orderbook(client: httpx.AsyncClient, market_ticker: str) -> Dict:
     """Fetch current orderbook for a Kalshi market from Dome API."""
     try:
-        # Get latest orderbook snapshot (no time params = latest)
-        response = await client.get(
-            f"{DOME_API_BASE}/v1/kalshi/orderbooks",
-            params={
-                "ticker": market_ticker,
-                "limit": 1,  # Just latest
-            },
-            headers=get_headers(),
-            timeout=15.0
-        )
-        response.raise_for_status()
-        data = response.json()
-        snapshots = data.get("snapshots", [])
-        
-        if snapshots:
-            snapshot = snapshots[-1]
-            orderbook = snapshot.get("orderbook", {})
-            
-            # Normalize to standard format with bids/asks
-            # Kalshi returns: yes (bids for YES), no (bids for NO)
-            # yes_dollars/no_dollars are in decimal format
-            yes_bids = orderbook.get("yes_dollars", []) or orderbook.get("yes", [])
-            no_bids = orderbook.get("no_dollars", []) or orderbook.get("no", [])
-            
-            # Convert to standard bid/ask format
-            # YES bids are our "bids" (buying YES)
-            # NO bids are effectively "asks" for YES (price of NO = 1 - price of YES)
-            bids = []
-            asks = []
-            
-            for level in yes_bids:
-                if isinstance(level, list) and len(level) >= 2:
-                    price = float(level[0]) if isinstance(level[0], (int, float)) else float(level[0])
-                    size = float(level[1])
-                    # Convert cents to decimal if needed
-                    if price > 1:
-                        price = price / 100
-                    bids.append({"price": price, "size": size})
-            
-            for level in no_bids:
-                if isinstance(level, list) and len(level) >= 2:
-                    price = float(level[0]) if isinstance(level[0], (int, float)) else float(level[0])
-                    size = float(level[1])
-                    # Convert cents to decimal if needed
-                    if price > 1:
-                        price = price / 100
-                    # NO bids at price X means YES asks at price (1 - X)
-                    asks.append({"price": 1 - price, "size": size})
-            
-            return {"bids": bids, "asks": asks}
-        return {}
+        return await _get_kalshi_market_orderbook(client, market_ticker)
     except Exception as e:
         logger.warning(f"Failed to fetch Kalshi orderbook for {market_ticker}: {e}")
         return {}
@@ -900,6 +922,35 @@ def _get_consensus(signals: List[str]) -> str:
     return "neutral"
 
 
+# ============================================================================
+# Batched Metrics (CPU pool)
+# ============================================================================
+
+def _market_metrics(trades: List[Dict], total_count: int, orderbook: Dict, advanced: bool = True) -> Dict:
+    """Per-market trade, orderbook and price-change metrics."""
+    metrics = {
+        "trades": calculate_trade_metrics(trades, api_total_count=total_count),
+        "orderbook": calculate_orderbook_metrics(orderbook),
+        "price_change_1h": calculate_price_change(trades, hours=1),
+    }
+    if advanced:
+        metrics["advanced_trade_signals"] = calculate_advanced_trade_signals(trades)
+        metrics["advanced_ob_signals"] = calculate_advanced_orderbook_signals(orderbook)
+    return metrics
+
+
+def _compute_event_metrics(markets: List[tuple], all_total_count: int) -> tuple:
+    """
+    Metrics for every market of an event plus the event-wide trade
+    metrics, in one call. markets is [(trades, total_count, orderbook)];
+    returns (per-market metrics, event trade metrics). Runs in the CPU
+    pool (app.services.cpu_pool), so the metric loops stay off the event loop.
+    """
+    per_market = [_market_metrics(trades, total_count, orderbook) for trades, total_count, orderbook in markets]
+    all_trades = [t for trades, _, _ in markets for t in trades]
+    return per_market, calculate_trade_metrics(all_trades, api_total_count=all_total_count)
+
+
 # ============================================================================
 # Main Endpoint
 # ============================================================================
@@ -939,7 +990,7 @@ async def get_event_intelligence(
     
     logger.info(f"🔍 Fetching event intelligence for {platform}/{event_id}")
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with get_fetch_engine().session() as client:
         
         # ================================================================
         # KALSHI PATH
@@ -1010,43 +1061,51 @@ async def get_event_intelligence(
             
             logger.info(f"📊 Analyzing {len(top_markets_list)} top Kalshi markets out of {len(markets)}")
             
-            # Fetch trades for top markets in parallel
+            # Fetch trades and orderbooks for top markets through the shared
+            # engine (per-host limit, per-market caches, incremental trades)
+            engine = get_fetch_engine()
             trade_tasks = [
-                fetch_kalshi_market_trades(client, m.get("market_ticker", ""), hours)
+                engine.trades(
+                    "kalshi", m.get("market_ticker", ""), hours,
+                    functools.partial(_get_kalshi_market_trades, client, m.get("market_ticker", "")),
+                )
                 for m in top_markets_list
             ]
-            all_trades_lists = await asyncio.gather(*trade_tasks)
-            
-            # Fetch orderbooks for top markets
             orderbook_tasks = [
-                fetch_kalshi_market_orderbook(client, m.get("market_ticker", ""))
+                engine.orderbook(
+                    "kalshi", m.get("market_ticker", ""),
+                    functools.partial(_get_kalshi_market_orderbook, client, m.get("market_ticker", "")),
+                )
                 for m in top_markets_list
             ]
-            all_orderbooks = await asyncio.gather(*orderbook_tasks, return_exceptions=True)
+            all_trades_lists, all_orderbooks = await asyncio.gather(
+                asyncio.gather(*trade_tasks), asyncio.gather(*orderbook_tasks)
+            )
             
             # Compute per-market intelligence (same logic as Polymarket)
             all_trades = []
             all_total_count = 0
-            market_intelligence = []
+            market_inputs = []
             
             for i, m in enumerate(top_markets_list):
                 trades_result = all_trades_lists[i] if i < len(all_trades_lists) else ([], 0)
                 trades, total_count = trades_result if isinstance(trades_result, tuple) else (trades_result, len(trades_result) if isinstance(trades_result, list) else 0)
                 orderbook = all_orderbooks[i] if i < len(all_orderbooks) and not isinstance(all_orderbooks[i], Exception) else {}
                 
-                # Add market context to trades
-                for t in trades:
-                    t["market_slug"] = m.get("market_ticker")
-                    t["title"] = m.get("title", "")
-                    all_trades.append(t)
+                # Add market context to copies: the fetch cache shares trade dicts
+                # across requests
+                trades = [{**t, "market_slug": m.get("market_ticker"), "title": m.get("title", "")} for t in trades]
+                all_trades.extend(trades)
                 all_total_count += total_count
-                
-                trade_metrics = calculate_trade_metrics(trades, api_total_count=total_count)
-                ob_metrics = calculate_orderbook_metrics(orderbook)
-                price_change = calculate_price_change(trades, hours=1)
-                advanced_trade_signals = calculate_advanced_trade_signals(trades)
-                advanced_ob_signals = calculate_advanced_orderbook_signals(orderbook)
-                
+                market_inputs.append((trades, total_count, orderbook))
+            
+            # Per-market and event-wide metrics in the CPU pool
+            per_market_metrics, event_trade_metrics = await get_cpu_pool().run(
+                _compute_event_metrics, market_inputs, all_total_count
+            )
+            
+            market_intelligence = []
+            for m, metrics in zip(top_markets_list, per_market_metrics):
                 # Get current price from market data
                 last_price = m.get("last_price", 0)
                 if last_price > 1:
@@ -1059,16 +1118,9 @@ async def get_event_intelligence(
                     "volume_24h": m.get("volume_24h", 0),
                     "token_id": m.get("market_ticker"),  # Use ticker as ID for Kalshi
                     "last_price": last_price,
-                    "trades": trade_metrics,
-                    "orderbook": ob_metrics,
-                    "price_change_1h": price_change,
-                    "advanced_trade_signals": advanced_trade_signals,
-                    "advanced_ob_signals": advanced_ob_signals,
+                    **metrics,
                 })
             
-            # Compute event-wide metrics
-            event_trade_metrics = calculate_trade_metrics(all_trades, api_total_count=all_total_count)
-            
             # Calculate average trades per hour for heat comparison
             avg_trades_per_hour = event_trade_metrics["trades_per_hour"] / len(top_markets_list) if top_markets_list else 0
             
@@ -1349,64 +1401,68 @@ async def get_event_intelligence(
         
         logger.info(f"📊 Analyzing {len(top_markets_list)} top markets out of {len(markets)}")
         
-        # Step 2: Fetch trades for top markets in parallel
+        # Steps 2-3: Fetch trades and orderbooks for top markets through the
+        # shared engine (per-host limit, per-market caches, incremental trades)
+        engine = get_fetch_engine()
         trade_tasks = [
-            fetch_market_trades(client, m.get("market_slug", ""), hours)
+            engine.trades(
+                "polymarket", m.get("market_slug", ""), hours,
+                functools.partial(_get_market_trades, client, m.get("market_slug", "")),
+            )
             for m in top_markets_list
         ]
-        all_trades_lists = await asyncio.gather(*trade_tasks)
         
-        # Step 3: Fetch orderbooks for top markets
+        async def _no_orderbook() -> Dict:
+            return {}
+        
         orderbook_tasks = []
         for m in top_markets_list:
             token_id = m.get("side_a", {}).get("id")
             if token_id:
-                orderbook_tasks.append(fetch_market_orderbook(client, token_id))
+                orderbook_tasks.append(
+                    engine.orderbook("polymarket", token_id, functools.partial(_get_market_orderbook, client, token_id))
+                )
             else:
-                orderbook_tasks.append(asyncio.coroutine(lambda: {})())
+                orderbook_tasks.append(_no_orderbook())
         
-        all_orderbooks = await asyncio.gather(*orderbook_tasks, return_exceptions=True)
+        all_trades_lists, all_orderbooks = await asyncio.gather(
+            asyncio.gather(*trade_tasks), asyncio.gather(*orderbook_tasks)
+        )
         
         # Step 4: Compute per-market intelligence
         all_trades = []
         all_total_count = 0
-        market_intelligence = []
+        market_inputs = []
         
         for i, m in enumerate(top_markets_list):
             trades_result = all_trades_lists[i] if i < len(all_trades_lists) else ([], 0)
             trades, total_count = trades_result if isinstance(trades_result, tuple) else (trades_result, len(trades_result) if isinstance(trades_result, list) else 0)
             orderbook = all_orderbooks[i] if i < len(all_orderbooks) and not isinstance(all_orderbooks[i], Exception) else {}
             
-            # Add market context to trades
-            for t in trades:
-                t["market_slug"] = m.get("market_slug")
-                t["title"] = m.get("title", "")
-                all_trades.append(t)
+            # Add market context to copies: the fetch cache shares trade dicts
+            # across requests
+            trades = [{**t, "market_slug": m.get("market_slug"), "title": m.get("title", "")} for t in trades]
+            all_trades.extend(trades)
             all_total_count += total_count
-            
-            trade_metrics = calculate_trade_metrics(trades, api_total_count=total_count)
-            ob_metrics = calculate_orderbook_metrics(orderbook)
-            price_change = calculate_price_change(trades, hours=1)
-            advanced_trade_signals = calculate_advanced_trade_signals(trades)
-            advanced_ob_signals = calculate_advanced_orderbook_signals(orderbook)
-            
+            market_inputs.append((trades, total_count, orderbook))
+        
+        # Step 5: Per-market and event-wide metrics in the CPU pool
+        per_market_metrics, event_trade_metrics = await get_cpu_pool().run(
+            _compute_event_metrics, market_inputs, all_total_count
+        )
+        
+        market_intelligence = []
+        for m, metrics in zip(top_markets_list, per_market_metrics):
             market_intelligence.append({
                 "market_slug": m.get("market_slug"),
                 "title": m.get("title"),
                 "volume_total": m.get("volume_total", 0),
                 "volume_1_week": m.get("volume_1_week", 0),
                 "token_id": m.get("side_a", {}).get("id"),
-                "trades": trade_metrics,
-                "orderbook": ob_metrics,
-                "price_change_1h": price_change,
-                "advanced_trade_signals": advanced_trade_signals,
-                "advanced_ob_signals": advanced_ob_signals,
+                **metrics,
                 # Signals will be computed after we have event-wide averages
             })
         
-        # Step 5: Compute event-wide metrics
-        event_trade_metrics = calculate_trade_metrics(all_trades, api_total_count=all_total_count)
-        
         # Calculate average trades per hour for heat comparison
         avg_trades_per_hour = event_trade_metrics["trades_per_hour"] / len(top_markets_list) if top_markets_list else 0
         
@@ -1699,7 +1755,7 @@ async def get_market_detail_intelligence(
     if not is_polymarket and not is_kalshi:
         return {"status": "limited", "message": f"Not available for {platform}"}
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with get_fetch_engine().session() as client:
         
         # ================================================================
         # KALSHI PATH
@@ -1722,18 +1778,24 @@ async def get_market_detail_intelligence(
             
             market = markets[0]
             
-            # Fetch trades
-            trades, total_count = await fetch_kalshi_market_trades(client, market_ticker, hours)
-            
-            # Fetch orderbook
-            orderbook = await fetch_kalshi_market_orderbook(client, market_ticker)
+            # Fetch trades and orderbook (shared with the event view's caches)
+            engine = get_fetch_engine()
+            trades, total_count = await engine.trades(
+                "kalshi", market_ticker, hours,
+                functools.partial(_get_kalshi_market_trades, client, market_ticker),
+            )
+            orderbook = await engine.orderbook(
+                "kalshi", market_ticker,
+                functools.partial(_get_kalshi_market_orderbook, client, market_ticker),
+            )
             
             # Fetch price history
             price_history = await fetch_kalshi_market_price_history(client, market_ticker, hours)
             
-            trade_metrics = calculate_trade_metrics(trades, api_total_count=total_count)
-            ob_metrics = calculate_orderbook_metrics(orderbook)
-            price_change = calculate_price_change(trades, hours=1)
+            metrics = await get_cpu_pool().run(_market_metrics, trades, total_count, orderbook, advanced=False)
+            trade_metrics = metrics["trades"]
+            ob_metrics = metrics["orderbook"]
+            price_change = metrics["price_change_1h"]
             
             # Get current price
             last_price = market.get("last_price", 0)
@@ -1784,18 +1846,23 @@ async def get_market_detail_intelligence(
         market = markets[0]
         token_id = market.get("side_a", {}).get("id")
         
-        # Fetch trades
-        trades, total_count = await fetch_market_trades(client, market_slug, hours)
-        
-        # Fetch orderbook
-        orderbook = await fetch_market_orderbook(client, token_id) if token_id else {}
+        # Fetch trades and orderbook (shared with the event view's caches)
+        engine = get_fetch_engine()
+        trades, total_count = await engine.trades(
+            "polymarket", market_slug, hours,
+            functools.partial(_get_market_trades, client, market_slug),
+        )
+        orderbook = await engine.orderbook(
+            "polymarket", token_id, functools.partial(_get_market_orderbook, client, token_id)
+        ) if token_id else {}
         
         # Fetch price history (sample every 30 mins)
         price_history = await fetch_market_price_history(client, token_id, hours) if token_id else []
         
-        trade_metrics = calculate_trade_metrics(trades, api_total_count=total_count)
-        ob_metrics = calculate_orderbook_metrics(orderbook)
-        price_change = calculate_price_change(trades, hours=1)
+        metrics = await get_cpu_pool().run(_market_metrics, trades, total_count, orderbook, advanced=False)
+        trade_metrics = metrics["trades"]
+        ob_metrics = metrics["orderbook"]
+        price_change = metrics["price_change_1h"]
         
         return {
             "status": "ok",
@@ -1,6 +1,7 @@
 """
-Events API - Database-backed (silver layer)
-Groups prediction markets from predictions_silver.markets into logical events.
+Events API - Database-backed (silver layer, gold event groups)
+Groups prediction markets from predictions_silver.markets into logical events;
+the /events listing reads the pipeline-maintained predictions_gold.event_groups.
 No live API calls, no in-memory cache.
 
 Event grouping rules (mirroring unified_markets.py):
@@ -10,17 +11,18 @@ Event grouping rules (mirroring unified_markets.py):
   opiniontrade -> source_market_id
 """
 from fastapi import APIRouter, HTTPException, Depends, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import text
 from typing import Dict, Any
 import logging
 
-from app.database.session import get_db
+from app.database.async_db import AsyncDB, get_async_db
+from app.services.search_index import get_search_index
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# SQL CASE expression that derives a stable event-group ID per market row
+# SQL CASE expression that derives a stable event-group ID per market row.
+# Keep in sync with predictions_silver.market_event_id() (data-pipeline
+# migration 019), which builds predictions_gold.event_groups for list_events.
 _EVENT_ID_EXPR = (
     "CASE"
     " WHEN source = 'polymarket'    THEN COALESCE(extra_data->>'event_slug', source_market_id)"
@@ -58,10 +60,10 @@ def stop_merged_events_refresh():
 
 
 @router.get("/events/stats")
-async def get_events_stats(db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def get_events_stats(db: AsyncDB = Depends(get_async_db)) -> Dict[str, Any]:
     """Aggregate event/market counts directly from predictions_silver.markets."""
     try:
-        result = db.execute(text(
+        result = await db.fetchrow(
             "WITH ev AS ("
             "  SELECT"
             f"    ({_EVENT_ID_EXPR}) AS event_id,"
@@ -83,7 +85,7 @@ async def get_events_stats(db: Session = Depends(get_db)) -> Dict[str, Any]:
             "  COUNT(*) FILTER (WHERE platform = 'limitless')                         AS lim_mkt,"
             "  COUNT(*) FILTER (WHERE platform = 'opiniontrade')                      AS ot_mkt"
             " FROM ev"
-        )).fetchone()
+        )
 
         total      = int(result.total_events or 0)
         total_mkts = int(result.total_markets or 0)
@@ -122,7 +124,7 @@ async def get_events_stats(db: Session = Depends(get_db)) -> Dict[str, Any]:
 @router.get("/events/categories")
 async def get_event_categories(
     platform: str = Query("all"),
-    db: Session = Depends(get_db),
+    db: AsyncDB = Depends(get_async_db),
 ) -> Dict[str, Any]:
     """Get available categories from predictions_silver.markets."""
     try:
@@ -137,12 +139,13 @@ async def get_event_categories(
             params["platform"] = platform
 
         where = "WHERE " + " AND ".join(conds)
-        rows = db.execute(text(
+        rows = await db.fetch(
             f"SELECT category_name AS category, COUNT(*) AS cnt"
             f" FROM predictions_silver.markets"
             f" {where}"
-            f" GROUP BY category_name ORDER BY cnt DESC"
-        ), params).fetchall()
+            f" GROUP BY category_name ORDER BY cnt DESC",
+            params,
+        )
 
         categories = [
             {
@@ -167,29 +170,44 @@ async def list_events(
     page_size:int = Query(100, ge=1, le=1000),
     status:   str = Query("all"),
     sort_by:  str = Query("volume"),
-    db: Session = Depends(get_db),
+    db: AsyncDB = Depends(get_async_db),
 ) -> Dict[str, Any]:
     """
-    List events derived from predictions_silver.markets.
-    Markets grouped by (derived_event_id, platform). Pure DB, no cache.
+    List events from predictions_gold.event_groups (migration 019).
+    One row per (derived_event_id, platform), maintained by the pipeline's
+    hot aggregation cycle; page, totals and platform counts come back from
+    a single query. Pure DB, no cache.
+
+    Filters match an event when any of its markets matches (category,
+    status, title/slug search); rollups always cover the whole event.
     """
     try:
         offset = (page - 1) * page_size
         params: Dict[str, Any] = {"limit": page_size, "offset": offset}
 
-        conds = ["(is_active = true OR status IN ('active','open'))"]
+        conds = []
         if platform != "all":
-            conds.append("source = :platform"); params["platform"] = platform
+            conds.append("platform = :platform"); params["platform"] = platform
         if category != "all":
-            conds.append("category_name = :category"); params["category"] = category
-        if search:
-            conds.append("(LOWER(title) LIKE :search OR LOWER(slug) LIKE :search)")
+            conds.append(":category = ANY(categories)"); params["category"] = category
+        # Search resolves through the in-process index once it is built;
+        # substring match on search_text until then
+        index = get_search_index() if search else None
+        if index is not None:
+            keys = index.match_keys(search, kind="event")
+            conds.append(
+                "(event_id, platform) IN "
+                "(SELECT * FROM unnest(:search_ids::text[], :search_platforms::text[]))"
+            )
+            params["search_ids"] = [key[2] for key in keys]
+            params["search_platforms"] = [key[1] for key in keys]
+        elif search:
+            conds.append("search_text LIKE :search")
             params["search"] = f"%{search.lower()}%"
         if status not in ("all", "open"):
-            conds.append("status = :status"); params["status"] = status
+            conds.append(":status = ANY(statuses)"); params["status"] = status
 
-        where = "WHERE " + " AND ".join(conds)
-        count_params = {k: v for k, v in params.items() if k not in ("limit", "offset")}
+        where = ("WHERE " + " AND ".join(conds)) if conds else ""
 
         sort_map = {
             "volume":     "total_volume DESC NULLS LAST",
@@ -199,79 +217,61 @@ async def list_events(
         }
         order_by = sort_map.get(sort_by, "total_volume DESC NULLS LAST")
 
-        # Build event-group CTE using string concat (no f-string multiline)
-        eid = _EVENT_ID_EXPR
-        raw_cte = (
-            "WITH raw AS ("
+        # Totals ride along on every page row (or on a single all-NULL row
+        # when the page is empty); the page itself walks the sort index
+        rows = await db.fetch(
+            "WITH stats AS ("
             "  SELECT"
-            f"   ({eid}) AS event_id,"
-            "    source AS platform,"
-            "    title, category_name, tags, status, yes_price,"
-            "    volume_total, volume_24h, volume_7d, liquidity,"
-            "    end_date, image_url, source_url, source_market_id,"
-            "    ROW_NUMBER() OVER ("
-            f"     PARTITION BY ({eid}), source"
-            "      ORDER BY COALESCE(volume_total, 0) DESC"
-            "    ) AS rn"
-            "  FROM predictions_silver.markets"
+            "    COUNT(*) AS agg_events,"
+            "    COALESCE(SUM(market_count), 0) AS agg_markets,"
+            "    COALESCE(SUM(total_volume), 0) AS agg_volume,"
+            "    COALESCE(SUM(volume_24h),   0) AS agg_volume_24h,"
+            "    COALESCE(SUM(volume_1_week),0) AS agg_volume_1_week,"
+            "    COALESCE(AVG(total_volume), 0) AS agg_avg_vol,"
+            "    COUNT(*) FILTER (WHERE platform='polymarket')   AS poly_events,"
+            "    COUNT(*) FILTER (WHERE platform='kalshi')       AS kal_events,"
+            "    COUNT(*) FILTER (WHERE platform='limitless')    AS lim_events,"
+            "    COUNT(*) FILTER (WHERE platform='opiniontrade') AS ot_events,"
+            "    COALESCE(SUM(market_count) FILTER (WHERE platform='polymarket'), 0) AS poly_mkt,"
+            "    COALESCE(SUM(total_volume) FILTER (WHERE platform='polymarket'), 0) AS poly_vol,"
+            "    COALESCE(SUM(market_count) FILTER (WHERE platform='kalshi'),     0) AS kal_mkt,"
+            "    COALESCE(SUM(total_volume) FILTER (WHERE platform='kalshi'),     0) AS kal_vol,"
+            "    COALESCE(SUM(market_count) FILTER (WHERE platform='limitless'),  0) AS lim_mkt,"
+            "    COALESCE(SUM(total_volume) FILTER (WHERE platform='limitless'),  0) AS lim_vol,"
+            "    COALESCE(SUM(market_count) FILTER (WHERE platform='opiniontrade'),0) AS ot_mkt,"
+            "    COALESCE(SUM(total_volume) FILTER (WHERE platform='opiniontrade'),0) AS ot_vol"
+            "  FROM predictions_gold.event_groups"
             f" {where}"
-            "),"
-            "events AS ("
-            "  SELECT"
-            "    event_id, platform,"
-            "    MAX(title)      FILTER (WHERE rn = 1) AS rep_title,"
-            "    MAX(image_url)  FILTER (WHERE rn = 1) AS rep_image,"
-            "    MAX(source_url) FILTER (WHERE rn = 1) AS rep_url,"
-            "    MAX(yes_price)  FILTER (WHERE rn = 1) AS rep_yes_price,"
-            "    MODE() WITHIN GROUP (ORDER BY category_name)  AS category,"
-            "    COUNT(*)                                       AS market_count,"
-            "    COALESCE(SUM(volume_total), 0)                 AS total_volume,"
-            "    COALESCE(SUM(volume_24h),   0)                 AS volume_24h,"
-            "    COALESCE(SUM(volume_7d),    0)                 AS volume_1_week,"
-            "    COALESCE(SUM(liquidity),    0)                 AS total_liquidity,"
-            "    MAX(end_date)                                  AS max_end_date,"
-            "    BOOL_OR(status = 'active' OR status = 'open')  AS is_active"
-            "  FROM raw GROUP BY event_id, platform"
             ")"
+            " SELECT s.*, p.* FROM stats s"
+            " LEFT JOIN LATERAL ("
+            "   SELECT event_id, platform, rep_title, rep_image, rep_url, rep_yes_price,"
+            "          category, market_count, total_volume, volume_24h, volume_1_week,"
+            "          total_liquidity, max_end_date, is_active"
+            "   FROM predictions_gold.event_groups"
+            f"  {where}"
+            f"  ORDER BY {order_by} LIMIT :limit OFFSET :offset"
+            " ) p ON TRUE",
+            params,
         )
 
-        total = db.execute(
-            text(raw_cte + " SELECT COUNT(*) FROM events"), count_params
-        ).scalar() or 0
-
-        pcnt_rows = db.execute(
-            text(raw_cte + " SELECT platform, COUNT(*) AS cnt FROM events GROUP BY platform"),
-            count_params,
-        ).fetchall()
-        platform_counts_map = {r.platform: r.cnt for r in pcnt_rows}
-
-        agg = db.execute(text(
-            raw_cte +
-            " SELECT"
-            "  COUNT(*) AS total_events,"
-            "  COALESCE(SUM(market_count), 0) AS total_markets,"
-            "  COALESCE(SUM(total_volume), 0) AS total_volume,"
-            "  COALESCE(SUM(volume_24h),   0) AS volume_24h,"
-            "  COALESCE(SUM(volume_1_week),0) AS volume_1_week,"
-            "  COALESCE(AVG(total_volume), 0) AS avg_vol,"
-            "  COALESCE(SUM(market_count) FILTER (WHERE platform='polymarket'), 0) AS poly_mkt,"
-            "  COALESCE(SUM(total_volume) FILTER (WHERE platform='polymarket'), 0) AS poly_vol,"
-            "  COALESCE(SUM(market_count) FILTER (WHERE platform='kalshi'),     0) AS kal_mkt,"
-            "  COALESCE(SUM(total_volume) FILTER (WHERE platform='kalshi'),     0) AS kal_vol,"
-            "  COALESCE(SUM(market_count) FILTER (WHERE platform='limitless'),  0) AS lim_mkt,"
-            "  COALESCE(SUM(total_volume) FILTER (WHERE platform='limitless'),  0) AS lim_vol,"
-            "  COALESCE(SUM(market_count) FILTER (WHERE platform='opiniontrade'),0) AS ot_mkt,"
-            "  COALESCE(SUM(total_volume) FILTER (WHERE platform='opiniontrade'),0) AS ot_vol"
-            " FROM events"
-        ), count_params).fetchone()
+        agg = rows[0]
+        total = int(agg.agg_events or 0)
+        platform_counts_map = {
+            "polymarket":   int(agg.poly_events or 0),
+            "kalshi":       int(agg.kal_events  or 0),
+            "limitless":    int(agg.lim_events  or 0),
+            "opiniontrade": int(agg.ot_events   or 0),
+        }
+        rows = [r for r in rows if r.event_id is not None]
 
         aggregate_metrics = {
-            "total_events":          int(agg.total_events   or 0),
-            "total_markets":         int(agg.total_markets  or 0),
-            "total_volume":          float(agg.total_volume or 0),
-            "volume_24h":            float(agg.volume_24h   or 0),
-            "volume_1_week":         float(agg.volume_1_week or 0),
-            "avg_volume_per_event":  float(agg.avg_vol      or 0),
+            "total_events":          total,
+            "total_markets":         int(agg.agg_markets     or 0),
+            "total_volume":          float(agg.agg_volume    or 0),
+            "volume_24h":            float(agg.agg_volume_24h or 0),
+            "volume_1_week":         float(agg.agg_volume_1_week or 0),
+            "avg_volume_per_event":  float(agg.agg_avg_vol   or 0),
             "avg_markets_per_event": 0,
             "polymarket_markets":    int(agg.poly_mkt or 0),
             "polymarket_volume":     float(agg.poly_vol or 0),
@@ -283,11 +283,6 @@ async def list_events(
             "opiniontrade_volume":   float(agg.ot_vol  or 0),
         }
 
-        rows = db.execute(text(
-            raw_cte +
-            f" SELECT * FROM events ORDER BY {order_by} LIMIT :limit OFFSET :offset"
-        ), params).fetchall()
-
         db_events = []
         for e in rows:
             title_str = e.rep_title or slug_to_title(e.event_id)
@@ -343,7 +338,7 @@ async def list_events(
 async def get_event_analytics(
     platform: str,
     event_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncDB = Depends(get_async_db),
 ) -> Dict[str, Any]:
     """Get analytics for an event from predictions_silver.markets."""
     try:
@@ -354,7 +349,7 @@ async def get_event_analytics(
         }
         platform = platform_map.get(platform.lower(), platform)
 
-        result = db.execute(text(
+        result = await db.fetchrow(
             "SELECT COUNT(*) AS market_count,"
             " SUM(volume_total) AS total_volume,"
             " SUM(volume_24h)   AS volume_24h,"
@@ -362,8 +357,9 @@ async def get_event_analytics(
             " MAX(volume_24h)   AS max_market_volume"
             " FROM predictions_silver.markets"
             " WHERE source = :platform"
-            f" AND ({_EVENT_ID_EXPR}) = :event_id"
-        ), {"platform": platform, "event_id": event_id}).fetchone()
+            f" AND ({_EVENT_ID_EXPR}) = :event_id",
+            {"platform": platform, "event_id": event_id},
+        )
 
         if not result or result.market_count == 0:
             raise HTTPException(status_code=404, detail="Event not found")
@@ -390,7 +386,7 @@ async def get_event_details(
     platform:      str,
     event_id:      str,
     force_refresh: bool = False,
-    db: Session = Depends(get_db),
+    db: AsyncDB = Depends(get_async_db),
 ) -> Dict[str, Any]:
     """Get a single event with all its markets from predictions_silver.markets."""
     try:
@@ -401,7 +397,7 @@ async def get_event_details(
         }
         platform = platform_map.get(platform.lower(), platform)
 
-        mkt_rows = db.execute(text(
+        mkt_rows = await db.fetch(
             "SELECT id, source_market_id, slug, title, question, description,"
             "       yes_price, no_price, volume_24h, volume_total, volume_7d,"
             "       liquidity, trade_count_24h, unique_traders,"
@@ -409,8 +405,9 @@ async def get_event_details(
             " FROM predictions_silver.markets"
             " WHERE source = :platform"
             f" AND ({_EVENT_ID_EXPR}) = :event_id"
-            " ORDER BY COALESCE(volume_total, 0) DESC NULLS LAST LIMIT 200"
-        ), {"platform": platform, "event_id": event_id}).fetchall()
+            " ORDER BY COALESCE(volume_total, 0) DESC NULLS LAST LIMIT 200",
+            {"platform": platform, "event_id": event_id},
+        )
 
         if not mkt_rows:
             raise HTTPException(status_code=404, detail="Event not found")
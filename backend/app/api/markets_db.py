@@ -4,31 +4,24 @@ Fetches data from predictions_gold and predictions_silver schemas
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, func, text
 from typing import Dict, List, Any, Optional
 import logging
-from datetime import datetime, timedelta
-
-from app.database.session import get_db
-from app.models.gold_layer import (
-    MarketDetailCache,
-    MarketPriceHistory,
-    MarketTradeActivity,
-    MarketOrderbookDepth,
-    RelatedMarkets,
-    MarketStatistics,
-    MarketSearchCache,
-    FilterAggregates,
-    WatchlistPopularMarkets,
-    RecentlyResolvedMarkets,
-    CategoryBreakdownByPlatform,
-)
+from uuid import UUID
+
+from app.database.async_db import AsyncDB, get_async_db
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _as_uuid(market_id: str) -> Optional[UUID]:
+    """Parse a gold market_id; None for source IDs that are not UUIDs."""
+    try:
+        return UUID(market_id)
+    except ValueError:
+        return None
+
+
 # ============================================
 # MARKET DETAIL PAGE ENDPOINTS
 # ============================================
@@ -36,20 +29,20 @@ router = APIRouter()
 @router.get("/{market_id}/details")
 async def get_market_details(
     market_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncDB = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """
     Get full market details (cached)
     Updates every 15 minutes
     """
     try:
-        # Try to find by UUID first, then by source_market_id
-        market = db.query(MarketDetailCache).filter(
-            (MarketDetailCache.market_id == market_id) |
-            (MarketDetailCache.source_market_id == market_id)
-        ).order_by(
-            desc(MarketDetailCache.cached_at)
-        ).first()
+        # Match by UUID or by source_market_id
+        market = await db.fetchrow(
+            "SELECT * FROM predictions_gold.market_detail_cache"
+            " WHERE market_id = :market_uuid OR source_market_id = :market_id"
+            " ORDER BY cached_at DESC LIMIT 1",
+            {"market_uuid": _as_uuid(market_id), "market_id": market_id},
+        )
         
         if not market:
             raise HTTPException(status_code=404, detail=f"Market {market_id} not found")
@@ -80,26 +73,88 @@ async def get_market_details(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Chart interval -> (rollup tier read, candle width in seconds). Tiers are
+# maintained by the pipeline (predictions_silver.prices_1m/1h/1d, migration 021)
+_PRICE_ROLLUPS = {
+    "5m": ("1m", 300),
+    "15m": ("1m", 900),
+    "1h": ("1h", 3600),
+    "4h": ("1h", 14400),
+    "1d": ("1d", 86400),
+}
+
+_ROLLUP_CANDLES_SQL = """
+    WITH p AS (
+        SELECT
+            source,
+            to_timestamp(floor(extract(epoch FROM bucket_start) / :step::int) * :step::int) AS period_start,
+            (array_agg(open_price ORDER BY bucket_start))[1] AS open_price,
+            MAX(high_price) AS high_price,
+            MIN(low_price) AS low_price,
+            (array_agg(close_price ORDER BY bucket_start DESC))[1] AS close_price
+        FROM predictions_silver.prices_{tier}
+        WHERE source_market_id = :market_id
+          AND bucket_start >= NOW() - make_interval(days => :days)
+        GROUP BY 1, 2
+    ), t AS (
+        SELECT
+            source,
+            to_timestamp(floor(extract(epoch FROM bucket_start) / :step::int) * :step::int) AS period_start,
+            SUM(volume) AS volume,
+            SUM(trade_count) AS trade_count
+        FROM predictions_silver.trades_{tier}
+        WHERE source_market_id = :market_id
+          AND bucket_start >= NOW() - make_interval(days => :days)
+        GROUP BY 1, 2
+    )
+    SELECT
+        p.period_start,
+        p.period_start + make_interval(secs => :step::int) AS period_end,
+        p.open_price, p.high_price, p.low_price, p.close_price,
+        t.volume,
+        t.trade_count
+    FROM p
+    LEFT JOIN t USING (source, period_start)
+    ORDER BY p.period_start
+"""
+
+
 @router.get("/{market_id}/price-history")
 async def get_price_history(
     market_id: str,
     interval: str = Query("1h", description="Time interval: 5m, 15m, 1h, 4h, 1d"),
     days: int = Query(7, description="Number of days to look back"),
-    db: Session = Depends(get_db)
+    db: AsyncDB = Depends(get_async_db)
 ) -> List[Dict[str, Any]]:
     """
     Get price history for charts (OHLC candles)
     Updates in real-time
+    
+    Candles come from the silver rollup tiers (a 30-day chart reads a few
+    hundred rows); gold market_price_history is the fallback for markets
+    not rolled up yet.
     """
     try:
-        cutoff = datetime.utcnow() - timedelta(days=days)
-        
-        prices = db.query(MarketPriceHistory).filter(
-            MarketPriceHistory.source_market_id == market_id,
-            MarketPriceHistory.period_start >= cutoff
-        ).order_by(
-            MarketPriceHistory.period_start
-        ).all()
+        prices = []
+        if interval in _PRICE_ROLLUPS:
+            tier, step = _PRICE_ROLLUPS[interval]
+            try:
+                prices = await db.fetch(
+                    _ROLLUP_CANDLES_SQL.format(tier=tier),
+                    {"market_id": market_id, "days": days, "step": step},
+                )
+            except Exception as e:
+                # Rollup tables missing (migration 021 not applied)
+                logger.warning(f"Price rollups unavailable, using gold history: {e}")
+        
+        if not prices:
+            prices = await db.fetch(
+                "SELECT * FROM predictions_gold.market_price_history"
+                " WHERE source_market_id = :market_id"
+                " AND period_start >= NOW() - make_interval(days => :days)"
+                " ORDER BY period_start",
+                {"market_id": market_id, "days": days},
+            )
         
         return [
             {
@@ -109,7 +164,7 @@ async def get_price_history(
                 "high": float(p.high_price or 0),
                 "low": float(p.low_price or 0),
                 "close": float(p.close_price or 0),
-                "volume": float(p.volume_period or 0),
+                "volume": float(p.volume or 0),
                 "trade_count": p.trade_count or 0,
             }
             for p in prices
@@ -124,21 +179,20 @@ async def get_price_history(
 async def get_volume_history(
     market_id: str,
     hours: int = Query(24, description="Number of hours to look back"),
-    db: Session = Depends(get_db)
+    db: AsyncDB = Depends(get_async_db)
 ) -> List[Dict[str, Any]]:
     """
     Get volume history for charts (hourly bars)
     Updates in real-time
     """
     try:
-        cutoff = datetime.utcnow() - timedelta(hours=hours)
-        
-        volumes = db.query(MarketTradeActivity).filter(
-            MarketTradeActivity.source_market_id == market_id,
-            MarketTradeActivity.hour_start >= cutoff
-        ).order_by(
-            MarketTradeActivity.hour_start
-        ).all()
+        volumes = await db.fetch(
+            "SELECT * FROM predictions_gold.market_trade_activity"
+            " WHERE source_market_id = :market_id"
+            " AND hour_start >= NOW() - make_interval(hours => :hours)"
+            " ORDER BY hour_start",
+            {"market_id": market_id, "hours": hours},
+        )
         
         return [
             {
@@ -162,14 +216,14 @@ async def get_volume_history(
 async def get_recent_trades(
     market_id: str,
     limit: int = Query(50, description="Number of trades to return"),
-    db: Session = Depends(get_db)
+    db: AsyncDB = Depends(get_async_db)
 ) -> List[Dict[str, Any]]:
     """
     Get recent trades for a market (real-time from silver layer)
     """
     try:
         # Query trades from silver layer
-        result = db.execute(text("""
+        trades = await db.fetch("""
             SELECT 
                 traded_at,
                 quantity,
@@ -181,9 +235,7 @@ async def get_recent_trades(
             WHERE source_market_id = :market_id
             ORDER BY traded_at DESC
             LIMIT :limit
-        """), {"market_id": market_id, "limit": limit})
-        
-        trades = result.fetchall()
+        """, {"market_id": market_id, "limit": limit})
         
         return [
             {
@@ -205,18 +257,22 @@ async def get_recent_trades(
 @router.get("/{market_id}/orderbook")
 async def get_orderbook(
     market_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncDB = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """
     Get orderbook depth for visualization
     Updates in real-time
     """
     try:
-        orderbook = db.query(MarketOrderbookDepth).filter(
-            MarketOrderbookDepth.market_id == market_id
-        ).order_by(
-            desc(MarketOrderbookDepth.snapshot_at)
-        ).first()
+        orderbook = None
+        market_uuid = _as_uuid(market_id)
+        if market_uuid:
+            orderbook = await db.fetchrow(
+                "SELECT * FROM predictions_gold.market_orderbook_depth"
+                " WHERE market_id = :market_uuid"
+                " ORDER BY snapshot_at DESC LIMIT 1",
+                {"market_uuid": market_uuid},
+            )
         
         if not orderbook:
             return {
@@ -250,29 +306,22 @@ async def get_orderbook(
 async def get_similar_markets(
     market_id: str,
     limit: int = Query(10, description="Number of similar markets to return"),
-    db: Session = Depends(get_db)
+    db: AsyncDB = Depends(get_async_db)
 ) -> List[Dict[str, Any]]:
     """
     Get similar/related markets
     Updates every 15 minutes
     """
     try:
-        # Get latest snapshot
-        latest_snapshot = db.query(
-            func.max(RelatedMarkets.snapshot_at)
-        ).filter(
-            RelatedMarkets.source_market_id == market_id
-        ).scalar()
-        
-        if not latest_snapshot:
-            return []
-        
-        similar = db.query(RelatedMarkets).filter(
-            RelatedMarkets.source_market_id == market_id,
-            RelatedMarkets.snapshot_at == latest_snapshot
-        ).order_by(
-            RelatedMarkets.rank
-        ).limit(limit).all()
+        # Latest snapshot for this market
+        similar = await db.fetch(
+            "SELECT * FROM predictions_gold.related_markets"
+            " WHERE source_market_id = :market_id"
+            " AND snapshot_at = (SELECT MAX(snapshot_at) FROM predictions_gold.related_markets"
+            "                    WHERE source_market_id = :market_id)"
+            " ORDER BY rank LIMIT :limit",
+            {"market_id": market_id, "limit": limit},
+        )
         
         return [
             {
@@ -294,18 +343,22 @@ async def get_similar_markets(
 @router.get("/{market_id}/statistics")
 async def get_market_statistics(
     market_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncDB = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """
     Get market statistics (aggregated metrics)
     Updates every 15 minutes
     """
     try:
-        stats = db.query(MarketStatistics).filter(
-            MarketStatistics.market_id == market_id
-        ).order_by(
-            desc(MarketStatistics.computed_at)
-        ).first()
+        stats = None
+        market_uuid = _as_uuid(market_id)
+        if market_uuid:
+            stats = await db.fetchrow(
+                "SELECT * FROM predictions_gold.market_statistics"
+                " WHERE market_id = :market_uuid"
+                " ORDER BY computed_at DESC LIMIT 1",
+                {"market_uuid": market_uuid},
+            )
         
         if not stats:
             return {
@@ -349,34 +402,31 @@ async def search_markets(
     limit: int = Query(20, description="Number of results"),
     source: Optional[str] = Query(None, description="Filter by platform"),
     category: Optional[str] = Query(None, description="Filter by category"),
-    db: Session = Depends(get_db)
+    db: AsyncDB = Depends(get_async_db)
 ) -> List[Dict[str, Any]]:
     """
     Full-text search across markets
     Updates every 15 minutes
     """
     try:
-        # Build base query
-        query = db.query(MarketSearchCache)
-        
-        # Add full-text search if search_vector exists
-        # Fallback to LIKE if tsvector not available
-        search_query = f"%{q}%"
-        query = query.filter(
-            (MarketSearchCache.question.ilike(search_query)) |
-            (MarketSearchCache.description.ilike(search_query))
+        # LIKE match (search_vector is not populated everywhere)
+        params: Dict[str, Any] = {"search": f"%{q}%", "limit": limit}
+        query = (
+            "SELECT * FROM predictions_gold.market_search_cache"
+            " WHERE (question ILIKE :search OR description ILIKE :search)"
         )
         
         # Apply filters
         if source:
-            query = query.filter(MarketSearchCache.source == source.lower())
+            query += " AND source = :source"
+            params["source"] = source.lower()
         if category:
-            query = query.filter(MarketSearchCache.category_name == category)
+            query += " AND category_name = :category"
+            params["category"] = category
         
         # Order by popularity and limit
-        results = query.order_by(
-            desc(MarketSearchCache.popularity_score)
-        ).limit(limit).all()
+        query += " ORDER BY popularity_score DESC LIMIT :limit"
+        results = await db.fetch(query, params)
         
         return [
             {
@@ -398,26 +448,18 @@ async def search_markets(
 
 
 @router.get("/filters")
-async def get_filter_aggregates(db: Session = Depends(get_db)) -> Dict[str, List[Dict[str, Any]]]:
+async def get_filter_aggregates(db: AsyncDB = Depends(get_async_db)) -> Dict[str, List[Dict[str, Any]]]:
     """
     Get pre-computed filter counts for sidebar
     Updates every 5 minutes
     """
     try:
-        # Get latest snapshot
-        latest_snapshot = db.query(
-            func.max(FilterAggregates.snapshot_at)
-        ).scalar()
-        
-        if not latest_snapshot:
-            return {"categories": [], "platforms": [], "statuses": [], "volumes": []}
-        
-        filters = db.query(FilterAggregates).filter(
-            FilterAggregates.snapshot_at == latest_snapshot
-        ).order_by(
-            FilterAggregates.filter_type,
-            FilterAggregates.sort_order
-        ).all()
+        # Latest snapshot
+        filters = await db.fetch(
+            "SELECT * FROM predictions_gold.filter_aggregates"
+            " WHERE snapshot_at = (SELECT MAX(snapshot_at) FROM predictions_gold.filter_aggregates)"
+            " ORDER BY filter_type, sort_order"
+        )
         
         # Group by filter type
         result = {
@@ -455,26 +497,20 @@ async def get_filter_aggregates(db: Session = Depends(get_db)) -> Dict[str, List
 @router.get("/popular")
 async def get_popular_markets(
     limit: int = Query(50, description="Number of markets to return"),
-    db: Session = Depends(get_db)
+    db: AsyncDB = Depends(get_async_db)
 ) -> List[Dict[str, Any]]:
     """
     Get most popular markets by watchlist adds and views
     Updates every 15 minutes
     """
     try:
-        # Get latest snapshot
-        latest_snapshot = db.query(
-            func.max(WatchlistPopularMarkets.snapshot_at)
-        ).scalar()
-        
-        if not latest_snapshot:
-            return []
-        
-        markets = db.query(WatchlistPopularMarkets).filter(
-            WatchlistPopularMarkets.snapshot_at == latest_snapshot
-        ).order_by(
-            WatchlistPopularMarkets.popularity_rank
-        ).limit(limit).all()
+        # Latest snapshot
+        markets = await db.fetch(
+            "SELECT * FROM predictions_gold.watchlist_popular_markets"
+            " WHERE snapshot_at = (SELECT MAX(snapshot_at) FROM predictions_gold.watchlist_popular_markets)"
+            " ORDER BY popularity_rank LIMIT :limit",
+            {"limit": limit},
+        )
         
         return [
             {
@@ -497,26 +533,20 @@ async def get_popular_markets(
 @router.get("/recently-resolved")
 async def get_recently_resolved(
     limit: int = Query(20, description="Number of markets to return"),
-    db: Session = Depends(get_db)
+    db: AsyncDB = Depends(get_async_db)
 ) -> List[Dict[str, Any]]:
     """
     Get recently resolved markets with outcomes
     Updates every 15 minutes
     """
     try:
-        # Get latest snapshot
-        latest_snapshot = db.query(
-            func.max(RecentlyResolvedMarkets.snapshot_at)
-        ).scalar()
-        
-        if not latest_snapshot:
-            return []
-        
-        markets = db.query(RecentlyResolvedMarkets).filter(
-            RecentlyResolvedMarkets.snapshot_at == latest_snapshot
-        ).order_by(
-            desc(RecentlyResolvedMarkets.resolved_at)
-        ).limit(limit).all()
+        # Latest snapshot
+        markets = await db.fetch(
+            "SELECT * FROM predictions_gold.recently_resolved_markets"
+            " WHERE snapshot_at = (SELECT MAX(snapshot_at) FROM predictions_gold.recently_resolved_markets)"
+            " ORDER BY resolved_at DESC LIMIT :limit",
+            {"limit": limit},
+        )
         
         return [
             {
@@ -537,26 +567,18 @@ async def get_recently_resolved(
 
 
 @router.get("/category-breakdown")
-async def get_category_breakdown(db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
+async def get_category_breakdown(db: AsyncDB = Depends(get_async_db)) -> List[Dict[str, Any]]:
     """
     Get 2D category x platform breakdown matrix
     Updates every 15 minutes
     """
     try:
-        # Get latest snapshot
-        latest_snapshot = db.query(
-            func.max(CategoryBreakdownByPlatform.snapshot_at)
-        ).scalar()
-        
-        if not latest_snapshot:
-            return []
-        
-        breakdown = db.query(CategoryBreakdownByPlatform).filter(
-            CategoryBreakdownByPlatform.snapshot_at == latest_snapshot
-        ).order_by(
-            CategoryBreakdownByPlatform.source,
-            desc(CategoryBreakdownByPlatform.total_volume_24h)
-        ).all()
+        # Latest snapshot
+        breakdown = await db.fetch(
+            "SELECT * FROM predictions_gold.category_breakdown_by_platform"
+            " WHERE snapshot_at = (SELECT MAX(snapshot_at) FROM predictions_gold.category_breakdown_by_platform)"
+            " ORDER BY source, total_volume_24h DESC"
+        )
         
         return [
             {
@@ -587,7 +609,7 @@ async def list_markets(
     status: Optional[str] = Query(None, description="Filter by status (open/closed)"),
     sort_by: str = Query("volume_24h", description="Sort field"),
     sort_order: str = Query("desc", description="Sort order (asc/desc)"),
-    db: Session = Depends(get_db)
+    db: AsyncDB = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """
     List all markets with filtering and pagination
@@ -632,19 +654,19 @@ async def list_markets(
         base_query += f" ORDER BY {sort_column} {sort_dir} NULLS LAST"
         base_query += " LIMIT :limit OFFSET :offset"
         
-        result = db.execute(text(base_query), params)
-        markets = result.fetchall()
+        markets = await db.fetch(base_query, params)
         
-        # Get total count
+        # Get total count (same filters, without paging)
         count_query = "SELECT COUNT(*) FROM predictions_silver.markets WHERE 1=1"
         if source:
-            count_query += f" AND source = '{source.lower()}'"
+            count_query += " AND source = :source"
         if category:
-            count_query += f" AND category = '{category}'"
+            count_query += " AND category = :category"
         if status:
-            count_query += f" AND status = '{status}'"
+            count_query += " AND status = :status"
+        count_params = {k: v for k, v in params.items() if k not in ("limit", "offset")}
         
-        total = db.execute(text(count_query)).scalar()
+        total = await db.fetchval(count_query, count_params)
         
         return {
             "markets": [
@@ -0,0 +1,134 @@
+"""
+Realtime price stream - push instead of polling.
+
+Clients subscribe to markets, events and/or platforms and receive changed
+prices as they are written by the pipeline (see app.services.price_stream):
+
+    GET /stream/prices?markets=KXBTC-25,0xabc&events=fed-decision&platforms=kalshi
+        Server-Sent Events; one "data:" line per coalesced batch, a comment
+        line every PRICE_STREAM_HEARTBEAT_SECONDS while idle
+
+    WS  /stream/prices/ws
+        Same messages as text frames; the client changes topics at any time:
+        {"action": "subscribe" | "unsubscribe",
+         "markets": [...], "events": [...], "platforms": [...]}
+        and gets {"type": "subscribed", "topics": <count>} back
+
+Initial prices come from the REST endpoints; the stream only carries
+changes.
+"""
+import asyncio
+import logging
+from typing import Optional
+
+import orjson
+from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from app.config import settings
+from app.services.price_stream import StreamFull, get_price_hub, parse_topics
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/stream", tags=["Realtime Price Stream"])
+
+
+def _split(value: Optional[str]) -> list:
+    return value.split(",") if value else []
+
+
+def _as_list(value) -> list:
+    if not value:
+        return []
+    return [value] if isinstance(value, str) else list(value)
+
+
+@router.get("/prices")
+async def stream_prices(
+    markets: Optional[str] = Query(None, description="Comma-separated source market ids"),
+    events: Optional[str] = Query(None, description="Comma-separated event ids"),
+    platforms: Optional[str] = Query(None, description="Comma-separated platforms"),
+):
+    """Server-Sent Events stream of price changes for the given topics."""
+    topics = parse_topics(_split(markets), _split(events), _split(platforms))
+    if not topics:
+        raise HTTPException(status_code=400, detail="Subscribe to at least one market, event or platform")
+
+    hub = get_price_hub()
+    try:
+        sub = hub.subscribe(topics)
+    except StreamFull:
+        raise HTTPException(status_code=503, detail="Too many stream subscribers", headers={"Retry-After": "10"})
+
+    async def events_stream():
+        try:
+            yield b"retry: 3000\n" + b'data: {"type":"subscribed","topics":' + str(len(sub.topics)).encode() + b"}\n\n"
+            while True:
+                message = await sub.next_message(settings.PRICE_STREAM_HEARTBEAT_SECONDS, hub.coalesce)
+                if message is None:
+                    yield b": ping\n\n"
+                else:
+                    yield b"data: " + message + b"\n\n"
+        finally:
+            hub.unsubscribe(sub)
+
+    return StreamingResponse(
+        events_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
+@router.websocket("/prices/ws")
+async def stream_prices_ws(websocket: WebSocket):
+    """WebSocket stream of price changes; topics are managed by client messages."""
+    hub = get_price_hub()
+    try:
+        sub = hub.subscribe()
+    except StreamFull:
+        await websocket.close(code=1013)  # Try again later
+        return
+    await websocket.accept()
+
+    async def receive_commands():
+        while True:
+            try:
+                command = orjson.loads(await websocket.receive_text())
+                topics = parse_topics(*(
+                    _as_list(command.get(kind)) for kind in ("markets", "events", "platforms")
+                ))
+                if command.get("action") == "unsubscribe":
+                    count = hub.remove_topics(sub, topics)
+                else:
+                    count = hub.add_topics(sub, topics)
+                reply = {"type": "subscribed", "topics": count}
+            except (orjson.JSONDecodeError, AttributeError, TypeError) as e:
+                reply = {"type": "error", "message": f"Bad command: {e}"}
+            await websocket.send_text(orjson.dumps(reply).decode())
+
+    async def send_updates():
+        while True:
+            message = await sub.next_message(settings.PRICE_STREAM_HEARTBEAT_SECONDS, hub.coalesce)
+            await websocket.send_text('{"type":"ping"}' if message is None else message.decode())
+
+    tasks = [asyncio.create_task(receive_commands()), asyncio.create_task(send_updates())]
+    try:
+        # Either side ending (disconnect, send failure) closes the stream
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task.exception() and not isinstance(task.exception(), WebSocketDisconnect):
+                logger.debug(f"Price stream websocket closed: {task.exception()}")
+    finally:
+        for task in tasks:
+            task.cancel()
+        hub.unsubscribe(sub)
+
+
+@router.get("/stats")
+async def stream_stats():
+    """Subscriber, topic and fan-out counters of this worker's price hub."""
+    return get_price_hub().stats()
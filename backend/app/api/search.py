@@ -0,0 +1,48 @@
+"""
+Search API endpoint - in-process index
+Ranked keystroke search over markets and events, served from
+app.services.search_index without touching Postgres
+"""
+
+from fastapi import APIRouter, HTTPException, Query
+from typing import Dict, Any, Optional
+import logging
+import time
+
+from app.services.search_index import get_search_service
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+@router.get("")
+async def search(
+    q: str = Query("", description="Search text; the last word may be partial"),
+    kind: str = Query("all", description="all, market or event"),
+    platform: Optional[str] = Query(None, description="polymarket, kalshi, limitless, opiniontrade"),
+    category: Optional[str] = Query(None, description="Category or tag"),
+    limit: int = Query(20, ge=1, le=100),
+) -> Dict[str, Any]:
+    """
+    Ranked search across market and event titles, slugs, tags and categories.
+    Matches whole words, prefixes and near-misses (typos).
+    """
+    service = get_search_service()
+    if not service.ready:
+        raise HTTPException(status_code=503, detail="Search index is warming up")
+
+    start = time.perf_counter()
+    results, total = service.index.search(
+        q,
+        kind=None if kind == "all" else kind,
+        platform=platform,
+        category=category,
+        limit=limit,
+    )
+    return {
+        "results": results,
+        "total": total,
+        "query": q,
+        "took_ms": round((time.perf_counter() - start) * 1000, 2),
+        "index_age_s": round(time.time() - service.built_at, 1),
+    }
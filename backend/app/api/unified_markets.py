@@ -19,6 +19,9 @@ from app.services.kalshi_service import get_kalshi_client
 from app.services.limitless_service import get_limitless_client
 from app.services.opiniontrade_service import get_opiniontrade_client
 from app.services.production_cache_service import get_production_cache
+from app.services.market_snapshot import MarketSnapshot
+from app.services.search_index import get_search_index
+from app.utils.cache import AsyncCache
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -34,14 +37,18 @@ DOME_API_MAX_LIMIT = 100
 # Caches the full normalized markets list from ALL platforms
 # Avoids re-fetching 4 APIs on every Screener page load
 # =============================================================================
-_unified_cache: Dict[str, Any] = {
-    "markets": None,         # List[UnifiedMarket]
-    "platform_counts": None, # Dict[str, int]
-    "timestamp": 0,
-    "is_refreshing": False,
-}
 UNIFIED_CACHE_TTL = 300      # 5 minutes - fresh
 UNIFIED_CACHE_STALE_TTL = 3600  # 1 hour - serve stale while refreshing
+# One entry: the MarketSnapshot (markets + platform counts) of the full set,
+# shared across workers as its market list (columns are rebuilt on load)
+_unified_cache = AsyncCache(
+    "unified_markets", ttl=UNIFIED_CACHE_TTL, stale_ttl=UNIFIED_CACHE_STALE_TTL, maxsize=1,
+    shared=True, topics=("markets",),
+    encode=lambda snapshot: {"markets": snapshot.markets, "platform_counts": snapshot.platform_counts},
+    decode=lambda raw: MarketSnapshot(
+        [UnifiedMarket.model_validate(m) for m in raw["markets"]], raw["platform_counts"]
+    ),
+)
 
 # Platform-specific minimum volume floors (adjusted for performance)
 # 50K provides good balance of quality markets and coverage
@@ -511,27 +518,19 @@ def normalize_opiniontrade(market: Dict[str, Any]) -> UnifiedMarket:
     )
 
 
-def filter_by_category(markets: List[UnifiedMarket], category: str) -> List[UnifiedMarket]:
-    """Filter markets by category"""
-    # 'all' and 'trending' return all markets (trending just means sorted by volume)
-    if category in ["all", "trending"]:
-        return markets
-    
-    category_map = {
-        "politics": "Politics",
-        "crypto": "Crypto",
-        "sports": "Sports",
-        "entertainment": "Entertainment",
-        "economy": "Economy",
-        "weather": "Weather",
-        "other": "Other",
-    }
-    
-    target_category = category_map.get(category.lower(), "")
-    if not target_category:
-        return markets
-    
-    return [m for m in markets if m.category == target_category]
+# Silver source -> UnifiedMarket.platform
+UNIFIED_PLATFORM_KEYS = {"polymarket": "poly"}
+
+# CategoryType value -> UnifiedMarket.category
+CATEGORY_NAMES = {
+    "politics": "Politics",
+    "crypto": "Crypto",
+    "sports": "Sports",
+    "entertainment": "Entertainment",
+    "economy": "Economy",
+    "weather": "Weather",
+    "other": "Other",
+}
 
 
 # =============================================================================
@@ -627,6 +626,13 @@ async def fetch_all_from_silver_db(search=None, min_volume=None) -> tuple:
     import calendar
     from app.database.session import SessionLocal
 
+    # Resolve the search through the in-process index when it is built;
+    # ILIKE over silver titles is the fallback while it warms up
+    index = get_search_index() if search else None
+    search_keys = index.match_keys(search, kind="market") if index is not None else None
+    if search_keys is not None and not search_keys:
+        return [], {"poly": 0, "kalshi": 0, "limitless": 0, "opiniontrade": 0}
+
     def _run_query():
         session = SessionLocal()
         try:
@@ -635,7 +641,10 @@ async def fetch_all_from_silver_db(search=None, min_volume=None) -> tuple:
             if min_volume:
                 where_parts.append("s.volume_total >= :min_vol")
                 params["min_vol"] = float(min_volume)
-            if search:
+            if search_keys is not None:
+                where_parts.append("s.source_market_id = ANY(:search_ids)")
+                params["search_ids"] = list({key[2] for key in search_keys})
+            elif search:
                 where_parts.append("s.title ILIKE :search")
                 params["search"] = f"%{search}%"
             where_sql = " AND ".join(where_parts)
@@ -675,6 +684,8 @@ async def fetch_all_from_silver_db(search=None, min_volume=None) -> tuple:
     platform_counts = {"poly": 0, "kalshi": 0, "limitless": 0, "opiniontrade": 0}
 
     for row in rows:
+        if search_keys is not None and ("market", row.source, row.source_market_id) not in search_keys:
+            continue
         source = row.source
         extra = dict(row.extra_data) if row.extra_data else {}
         yes_p = float(row.yes_price) if row.yes_price is not None else None
@@ -886,24 +897,24 @@ async def _fetch_all_unified_markets(search=None, min_volume=None):
     return all_markets, platform_counts
 
 
+async def _build_unified_snapshot() -> MarketSnapshot:
+    """Fetch every platform and build the snapshot requests are served from."""
+    start = time.time()
+    markets, counts = await _fetch_all_unified_markets()
+    # Build fully, then the cache swaps the reference: requests see the old
+    # snapshot or the new one, never a partial build
+    snapshot = MarketSnapshot(markets, counts)
+    elapsed = (time.time() - start) * 1000
+    logger.info(f"Unified cache refreshed: {len(markets)} markets in {elapsed:.0f}ms")
+    return snapshot
+
+
 async def _refresh_unified_cache():
-    """Background task: refresh the unified cache without blocking requests."""
-    if _unified_cache["is_refreshing"]:
-        return
-    _unified_cache["is_refreshing"] = True
+    """Rebuild the unified snapshot (joins a refresh that is already running)."""
     try:
-        logger.info("Background refresh of unified markets cache starting...")
-        start = time.time()
-        markets, counts = await _fetch_all_unified_markets()
-        _unified_cache["markets"] = markets
-        _unified_cache["platform_counts"] = counts
-        _unified_cache["timestamp"] = time.time()
-        elapsed = (time.time() - start) * 1000
-        logger.info(f"Unified cache refreshed: {len(markets)} markets in {elapsed:.0f}ms")
+        await _unified_cache.refresh("snapshot", _build_unified_snapshot)
     except Exception as e:
-        logger.error(f"Background unified cache refresh failed: {e}")
-    finally:
-        _unified_cache["is_refreshing"] = False
+        logger.error(f"Unified cache refresh failed: {e}")
 
 
 async def warm_unified_markets_cache():
@@ -935,87 +946,41 @@ async def get_unified_markets(
     """
     start_time = time.time()
     
-    all_markets: List[UnifiedMarket] = []
-    platform_counts = {
-        "poly": 0,
-        "kalshi": 0,
-        "limitless": 0,
-        "opiniontrade": 0,
-    }
-    
     try:
-        # Try to use cached data for unfiltered requests (most common case)
-        cache_age = time.time() - _unified_cache["timestamp"] if _unified_cache["timestamp"] else float('inf')
-        cache_usable = (
-            _unified_cache["markets"] is not None 
-            and cache_age < UNIFIED_CACHE_TTL + UNIFIED_CACHE_STALE_TTL
-        )
+        # Every request is served from the full snapshot: fresh for 5 minutes,
+        # then served stale while one background refresh rebuilds it; a cold
+        # cache is built once however many requests are waiting on it
+        snapshot: MarketSnapshot = await _unified_cache.get_or_compute("snapshot", _build_unified_snapshot)
         
-        if cache_usable:
-            # Use cached markets
-            all_markets = list(_unified_cache["markets"])
-            platform_counts = dict(_unified_cache["platform_counts"] or {})
-            
-            # If stale, trigger background refresh
-            if cache_age > UNIFIED_CACHE_TTL and not _unified_cache["is_refreshing"]:
-                logger.info(f"Unified cache stale ({cache_age:.0f}s), triggering background refresh")
-                asyncio.create_task(_refresh_unified_cache())
-            
-            cache_status = "fresh" if cache_age <= UNIFIED_CACHE_TTL else "stale"
-            logger.debug(f"Unified cache hit ({cache_status}, {cache_age:.0f}s old, {len(all_markets)} markets)")
-        else:
-            # No cache or fully expired — fetch live
-            logger.info("Unified cache miss — fetching all platforms live...")
-            all_markets, platform_counts = await _fetch_all_unified_markets(search, min_volume)
-            
-            # Update cache (only if no search/filter so it's a clean full set)
-            if not search and not min_volume:
-                _unified_cache["markets"] = list(all_markets)
-                _unified_cache["platform_counts"] = dict(platform_counts)
-                _unified_cache["timestamp"] = time.time()
-        
-        # Filter by platform (if not 'all')
-        if platform != PlatformType.ALL:
-            platform_key = platform.value
-            all_markets = [m for m in all_markets if m.platform == platform_key]
+        platform_counts = snapshot.platform_counts
         
-        # Apply category filter
+        # 'all' and 'trending' don't filter (trending just means sorted by volume)
+        category_name = None
         if category != CategoryType.ALL and category != CategoryType.TRENDING:
-            all_markets = filter_by_category(all_markets, category.value)
+            category_name = CATEGORY_NAMES[category.value]
         
-        # Apply volume filter
-        if min_volume:
-            all_markets = [m for m in all_markets if m.volume_total_usd >= min_volume]
+        # Search goes through the in-process index when it is built (word,
+        # prefix and typo matches); plain substring matching until then
+        search_keys = None
+        index = get_search_index() if search else None
+        if index is not None:
+            search_keys = [
+                (UNIFIED_PLATFORM_KEYS.get(source, source), market_id)
+                for _, source, market_id in index.match_keys(search, kind="market")
+            ]
         
-        # Apply search filter
-        if search:
-            search_lower = search.lower()
-            all_markets = [m for m in all_markets if search_lower in m.title.lower()]
-        
-        # Sort all markets
-        if sort == "volume_24h_desc":
-            all_markets.sort(key=lambda m: m.volume_24h_usd or 0, reverse=True)
-        elif sort == "volume_asc":
-            all_markets.sort(key=lambda m: m.volume_total_usd, reverse=False)
-        elif sort == "price_desc":
-            all_markets.sort(key=lambda m: m.last_price or 0, reverse=True)
-        elif sort == "price_asc":
-            all_markets.sort(key=lambda m: m.last_price or 0, reverse=False)
-        elif sort == "ending_soon":
-            all_markets.sort(key=lambda m: m.end_time or 9999999999)
-        elif sort == "newest":
-            all_markets.sort(key=lambda m: m.end_time or 0, reverse=True)
-        elif sort == "change_desc":
-            all_markets.sort(key=lambda m: abs(m.price_change_pct_24h or 0), reverse=True)
-        elif sort == "ann_roi_desc":
-            all_markets.sort(key=lambda m: m.ann_roi or 0, reverse=True)
-        else:  # volume_desc (default)
-            all_markets.sort(key=lambda m: m.volume_total_usd, reverse=True)
-        
-        # Paginate
-        total_count = len(all_markets)
+        # Filter, sort and paginate against the presorted snapshot
         offset = (page - 1) * page_size
-        paginated_markets = all_markets[offset:offset + page_size]
+        paginated_markets, total_count = snapshot.query(
+            platform=platform.value if platform != PlatformType.ALL else None,
+            category=category_name,
+            min_volume=min_volume,
+            search=search if search_keys is None else None,
+            keys=search_keys,
+            sort=sort,
+            offset=offset,
+            limit=page_size,
+        )
         total_pages = (total_count + page_size - 1) // page_size if total_count else 0
         
         # Enrich Polymarket markets with live prices (only for current page, ~25 markets max)
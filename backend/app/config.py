@@ -42,6 +42,47 @@ class Settings(BaseSettings):
     DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
     DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
     DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+    # Async (asyncpg) pool used by DB-backed routers via app.database.async_db
+    DB_ASYNC_POOL_MIN_SIZE: int = int(os.getenv("DB_ASYNC_POOL_MIN_SIZE", "2"))
+    DB_ASYNC_POOL_MAX_SIZE: int = int(os.getenv("DB_ASYNC_POOL_MAX_SIZE", "20"))
+    DB_STATEMENT_CACHE_SIZE: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "256"))
+    
+    # In-process market/event search index (app.services.search_index)
+    SEARCH_INDEX_ENABLED: bool = os.getenv("SEARCH_INDEX_ENABLED", "true").lower() == "true"
+    SEARCH_INDEX_POLL_SECONDS: float = float(os.getenv("SEARCH_INDEX_POLL_SECONDS", "5"))
+    SEARCH_INDEX_REBUILD_SECONDS: int = int(os.getenv("SEARCH_INDEX_REBUILD_SECONDS", "1800"))
+    SEARCH_INDEX_SYNC_BATCH: int = int(os.getenv("SEARCH_INDEX_SYNC_BATCH", "5000"))
+
+    # Process pool for CPU-bound handler work (app.services.cpu_pool), per
+    # gunicorn worker; 0 workers runs the same calls in a thread instead
+    CPU_POOL_WORKERS: int = int(os.getenv("CPU_POOL_WORKERS", "1"))
+    CPU_POOL_MAX_QUEUE: int = int(os.getenv("CPU_POOL_MAX_QUEUE", "16"))
+
+    # Cross-worker cache tier (app.services.shared_cache): "redis://...",
+    # "memory://" (in-process fake) or empty to keep caches per process
+    SHARED_CACHE_URL: str = os.getenv("SHARED_CACHE_URL", "")
+    SHARED_CACHE_LOCK_SECONDS: float = float(os.getenv("SHARED_CACHE_LOCK_SECONDS", "30"))
+
+    # Upstream (Dome) fetch engine for event intelligence (app.services.fetch_engine)
+    FETCH_MAX_CONNECTIONS: int = int(os.getenv("FETCH_MAX_CONNECTIONS", "32"))
+    FETCH_MAX_PER_HOST: int = int(os.getenv("FETCH_MAX_PER_HOST", "8"))
+    FETCH_TRADES_TTL: float = float(os.getenv("FETCH_TRADES_TTL", "15"))
+    FETCH_ORDERBOOK_TTL: float = float(os.getenv("FETCH_ORDERBOOK_TTL", "5"))
+    FETCH_FULL_REFRESH_SECONDS: float = float(os.getenv("FETCH_FULL_REFRESH_SECONDS", "600"))
+
+    # Realtime price push (app.services.price_stream), fed by the pipeline's
+    # NOTIFY on changed prices; per worker
+    PRICE_STREAM_ENABLED: bool = os.getenv("PRICE_STREAM_ENABLED", "true").lower() == "true"
+    PRICE_STREAM_COALESCE_MS: float = float(os.getenv("PRICE_STREAM_COALESCE_MS", "250"))
+    PRICE_STREAM_HEARTBEAT_SECONDS: float = float(os.getenv("PRICE_STREAM_HEARTBEAT_SECONDS", "15"))
+    PRICE_STREAM_MAX_SUBSCRIBERS: int = int(os.getenv("PRICE_STREAM_MAX_SUBSCRIBERS", "10000"))
+    PRICE_STREAM_MAX_TOPICS: int = int(os.getenv("PRICE_STREAM_MAX_TOPICS", "500"))
+
+    # Trader stats refresh (app.services.trader_tracker): wallets fetched at
+    # once, wallets per COPY/merge batch, trades pulled per wallet per sync
+    TRADER_REFRESH_CONCURRENCY: int = int(os.getenv("TRADER_REFRESH_CONCURRENCY", "8"))
+    TRADER_REFRESH_BATCH: int = int(os.getenv("TRADER_REFRESH_BATCH", "500"))
+    TRADER_SYNC_MAX_TRADES: int = int(os.getenv("TRADER_SYNC_MAX_TRADES", "5000"))
     
     # Anthropic Claude (Main AI)
     ANTHROPIC_API_KEY: str = os.getenv("ANTHROPIC_API_KEY", "")
@@ -0,0 +1,111 @@
+"""
+Async query layer for FastAPI endpoints.
+
+Handlers are `async def`, so running a blocking SQLAlchemy Session inside
+them stalls the event loop for the whole query - one slow gold query holds
+up every in-flight request on the worker. AsyncDB runs SQL on the shared
+asyncpg pool from session.get_async_pool() instead:
+
+- Queries keep SQLAlchemy text() style :name parameters. Each distinct query
+  text is compiled once to asyncpg's $n form, so the SQL sent is stable and
+  asyncpg's per-connection prepared statement cache skips parse/plan on
+  repeat calls.
+- Rows are asyncpg Records that also allow attribute access (row.title),
+  like the SQLAlchemy Rows the routers were written against.
+
+Usage:
+    @router.get("/things")
+    async def list_things(db: AsyncDB = Depends(get_async_db)):
+        rows = await db.fetch("SELECT * FROM t WHERE kind = :kind", {"kind": "x"})
+"""
+import json
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import asyncpg
+
+from app.database.session import get_async_pool
+
+# :name, but not the second colon of a ::cast
+_PARAM_RE = re.compile(r"(?<![:\w]):([A-Za-z_]\w*)")
+
+
+class Row(asyncpg.Record):
+    """asyncpg Record with SQLAlchemy Row-style attribute access."""
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+async def init_connection(conn: asyncpg.Connection) -> None:
+    """Decode json/jsonb to Python objects, matching the SQLAlchemy Session."""
+    for typename in ("json", "jsonb"):
+        await conn.set_type_codec(
+            typename, encoder=json.dumps, decoder=json.loads, schema="pg_catalog"
+        )
+
+
+@lru_cache(maxsize=1024)
+def compile_query(sql: str) -> Tuple[str, Tuple[str, ...]]:
+    """Rewrite :name parameters to $n. Returns (sql, parameter names in $ order)."""
+    names: List[str] = []
+
+    def _sub(match: "re.Match[str]") -> str:
+        name = match.group(1)
+        if name not in names:
+            names.append(name)
+        return f"${names.index(name) + 1}"
+
+    return _PARAM_RE.sub(_sub, sql), tuple(names)
+
+
+def _bind(sql: str, params: Optional[Dict[str, Any]]) -> Tuple[str, list]:
+    compiled, names = compile_query(sql)
+    params = params or {}
+    try:
+        return compiled, [params[name] for name in names]
+    except KeyError as e:
+        raise ValueError(f"Missing query parameter: {e.args[0]}") from None
+
+
+class AsyncDB:
+    """Thin async facade over the asyncpg pool; one pooled connection per call."""
+
+    def __init__(self, pool: asyncpg.Pool):
+        self.pool = pool
+
+    async def fetch(
+        self, sql: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None
+    ) -> List[Row]:
+        query, args = _bind(sql, params)
+        return await self.pool.fetch(query, *args, timeout=timeout)
+
+    async def fetchrow(
+        self, sql: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None
+    ) -> Optional[Row]:
+        query, args = _bind(sql, params)
+        return await self.pool.fetchrow(query, *args, timeout=timeout)
+
+    async def fetchval(
+        self, sql: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None
+    ) -> Any:
+        query, args = _bind(sql, params)
+        return await self.pool.fetchval(query, *args, timeout=timeout)
+
+    async def execute(
+        self, sql: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None
+    ) -> str:
+        query, args = _bind(sql, params)
+        return await self.pool.execute(query, *args, timeout=timeout)
+
+
+async def get_async_db() -> AsyncDB:
+    """
+    Database dependency for async FastAPI handlers
+    Connections are borrowed per query, so nothing needs closing afterwards
+    """
+    return AsyncDB(await get_async_pool())
@@ -0,0 +1,130 @@
+"""
+Shared process pool for CPU-bound request work.
+
+Title matching (calculate_similarity over thousands of candidate pairs)
+and the trade/orderbook metric loops in event_intelligence are pure
+Python. Run inside an async handler they hold the event loop, so one
+arbitrage scan stalls every other request on the worker for seconds;
+a thread does not help because the GIL is held the whole time.
+
+CpuPool runs such functions in worker processes instead:
+
+- Workers use the spawn start method (never fork a process that owns
+  asyncpg connections and running threads) and are warmed at startup:
+  the initializer imports the matching and metrics modules, so the alias,
+  stop-word and template tables and compiled regexes are built once per
+  worker, not on the first request
+- At most CPU_POOL_WORKERS calls run at once; up to CPU_POOL_MAX_QUEUE
+  more wait their turn, and calls beyond that raise CpuPoolBusy (served
+  as 503 with Retry-After) instead of piling up behind a slow scan
+- A worker that dies (OOM kill) breaks the executor; it is replaced and
+  the call retried once
+
+Submitted functions and their arguments must be picklable: module-level
+functions over plain data or pydantic models.
+
+Usage:
+    from app.services.cpu_pool import get_cpu_pool
+    opps = await get_cpu_pool().run(_scan_opportunities, poly_markets, kalshi_markets)
+"""
+import asyncio
+import functools
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional, ParamSpec, TypeVar
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class CpuPoolBusy(RuntimeError):
+    """More CPU work queued than CPU_POOL_MAX_QUEUE allows."""
+
+
+def _warm_worker() -> None:
+    """Worker initializer: build the lookup tables before the first task."""
+    from app.api.arbitrage import calculate_similarity
+    import app.api.arbitrage_db  # noqa: F401
+    import app.api.cross_venue_events  # noqa: F401
+    import app.api.event_intelligence  # noqa: F401
+
+    calculate_similarity("Will Bitcoin reach $100,000?", "Bitcoin above 100000?")
+
+
+def _ping() -> None:
+    pass
+
+
+class CpuPool:
+    """Bounded async front end over a ProcessPoolExecutor."""
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots = asyncio.Semaphore(max(workers, 1))
+        self._admitted = 0  # running + waiting
+
+    @property
+    def pending(self) -> int:
+        return self._admitted
+
+    def start(self) -> None:
+        """Create the executor and spawn (warm) every worker."""
+        if self.workers <= 0 or self._executor is not None:
+            return
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_worker,
+        )
+        # Workers are spawned on demand; concurrent no-ops start all of them now
+        for _ in range(self.workers):
+            self._executor.submit(_ping)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def run(self, fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """Run fn(*args, **kwargs) in a worker process and return its result."""
+        if self._admitted >= max(self.workers, 1) + self.max_queue:
+            raise CpuPoolBusy(f"{self._admitted} CPU tasks pending")
+        call = functools.partial(fn, *args, **kwargs)
+        self._admitted += 1
+        try:
+            async with self._slots:
+                if self.workers <= 0:
+                    return await asyncio.to_thread(call)
+                self.start()
+                executor = self._executor
+                loop = asyncio.get_running_loop()
+                try:
+                    return await loop.run_in_executor(executor, call)
+                except BrokenProcessPool:
+                    # Concurrent callers see the same break; only the first replaces it
+                    if self._executor is executor:
+                        logger.warning(f"CPU pool broken while running {fn.__name__}; restarting it")
+                        self.shutdown()
+                        self.start()
+                    return await loop.run_in_executor(self._executor, call)
+        finally:
+            self._admitted -= 1
+
+
+_cpu_pool: Optional[CpuPool] = None
+
+
+def get_cpu_pool() -> CpuPool:
+    """Process-wide CPU pool (one per gunicorn worker, started in the lifespan)."""
+    global _cpu_pool
+    if _cpu_pool is None:
+        _cpu_pool = CpuPool(settings.CPU_POOL_WORKERS, settings.CPU_POOL_MAX_QUEUE)
+    return _cpu_pool
@@ -0,0 +1,250 @@
+"""
+Shared upstream fetch engine for per-market trades and orderbooks.
+
+Event intelligence fans out to Dome for every one of up to 50 markets on
+every request. With a client per request, unbounded gathers and no reuse,
+two users opening the same hot event double the upstream load. The engine
+is shared by all requests in a worker:
+
+- One pooled httpx client (keep-alive across requests); every request
+  through it takes a per-host slot, so at most FETCH_MAX_PER_HOST calls
+  hit one upstream host at once however many events are being opened
+- Orderbooks are cached per market for FETCH_ORDERBOOK_TTL seconds
+- Trades are kept per (market, window) and cached for FETCH_TRADES_TTL
+  seconds. A refresh asks only for trades since the newest one held,
+  merges them (deduplicated) and drops those that left the window; the
+  full window is refetched every FETCH_FULL_REFRESH_SECONDS, or when the
+  incremental page was truncated
+- Both caches are AsyncCache namespaces, so concurrent requests for the
+  same market share one in-flight fetch and show up in /admin/cache/stats
+
+For markets with more trades in the window than one page returns, the
+total count is carried forward (previous total + new - expired) between
+full refreshes, so it is approximate until the next one.
+
+Fetch functions are passed in by the caller and must raise on failure
+(failures are not cached):
+    trades_fetch(start_time: int) -> (trades, total_count)
+    orderbook_fetch() -> orderbook dict
+
+Usage:
+    engine = get_fetch_engine()
+    async with engine.session() as client:
+        trades, total = await engine.trades(
+            "kalshi", ticker, hours, functools.partial(_get_kalshi_market_trades, client, ticker)
+        )
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import httpx
+
+from app.config import settings
+from app.utils.cache import AsyncCache
+
+logger = logging.getLogger(__name__)
+
+TradesFetch = Callable[[int], Awaitable[Tuple[List[Dict], int]]]
+OrderbookFetch = Callable[[], Awaitable[Dict]]
+
+
+def trade_epoch(trade: Dict) -> Optional[float]:
+    """Trade timestamp as epoch seconds (unix s/ms or ISO string), or None."""
+    ts = trade.get("timestamp")
+    try:
+        if isinstance(ts, str):
+            return datetime.fromisoformat(ts.replace("Z", "+00:00")).timestamp()
+        if ts:
+            ts = float(ts)
+            return ts / 1000 if ts > 1e12 else ts
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+def _trade_key(trade: Dict) -> Tuple:
+    ident = trade.get("trade_id") or trade.get("order_hash") or trade.get("tx_hash")
+    return (
+        ident,
+        trade.get("timestamp"),
+        trade.get("side"),
+        trade.get("price"),
+        trade.get("shares_normalized") or trade.get("shares") or trade.get("quantity"),
+    )
+
+
+@dataclass
+class _TradeWindow:
+    """Trades of one market inside the requested window, newest first."""
+
+    trades: List[Dict]
+    total: int
+    newest: float
+    full_at: float = field(default_factory=time.monotonic)
+    keys: Set[Tuple] = field(default_factory=set)
+
+    @classmethod
+    def full(cls, trades: List[Dict], total: int, cutoff: float) -> "_TradeWindow":
+        trades = sorted(trades, key=lambda t: trade_epoch(t) or 0.0, reverse=True)
+        epochs = [e for e in map(trade_epoch, trades) if e is not None]
+        return cls(
+            trades=trades,
+            total=max(total, len(trades)),
+            newest=max(epochs, default=cutoff),
+            keys={_trade_key(t) for t in trades},
+        )
+
+    def merge(self, new: List[Dict], cutoff: float) -> None:
+        added = []
+        for trade in new:
+            key = _trade_key(trade)
+            if key not in self.keys:
+                self.keys.add(key)
+                added.append(trade)
+        added.sort(key=lambda t: trade_epoch(t) or 0.0, reverse=True)
+
+        kept = []
+        expired = 0
+        for trade in self.trades:
+            epoch = trade_epoch(trade)
+            if epoch is not None and epoch < cutoff:
+                self.keys.discard(_trade_key(trade))
+                expired += 1
+            else:
+                kept.append(trade)
+
+        self.trades = added + kept
+        self.total = max(self.total + len(added) - expired, len(self.trades))
+        epochs = [e for e in map(trade_epoch, added) if e is not None]
+        self.newest = max([self.newest, *epochs])
+
+
+class FetchEngine:
+    """Pooled, per-host bounded client plus per-market trade/orderbook caches."""
+
+    def __init__(
+        self,
+        max_connections: int,
+        max_per_host: int,
+        trades_ttl: float,
+        orderbook_ttl: float,
+        full_refresh_seconds: float,
+        max_markets: int = 2000,
+    ):
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.full_refresh_seconds = full_refresh_seconds
+        self.max_markets = max_markets
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._windows: "OrderedDict[Tuple, _TradeWindow]" = OrderedDict()
+        self._trades = AsyncCache("fetch_trades", ttl=trades_ttl, maxsize=max_markets)
+        self._orderbooks = AsyncCache("fetch_orderbooks", ttl=orderbook_ttl, maxsize=max_markets)
+
+    # ── client ────────────────────────────────────────────────────────────
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._client
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        host = httpx.URL(url).host
+        slots = self._host_slots.get(host)
+        if slots is None:
+            slots = self._host_slots[host] = asyncio.Semaphore(self.max_per_host)
+        async with slots:
+            return await self.client.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator["FetchEngine"]:
+        """
+        Drop-in for `async with httpx.AsyncClient() as client`: yields the
+        engine (get/post go through the shared pool) and closes nothing.
+        """
+        yield self
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    # ── cached fetches ────────────────────────────────────────────────────
+
+    async def trades(self, source: str, market_id: str, hours: int, fetch: TradesFetch) -> Tuple[List[Dict], int]:
+        """(trades newest first, total count) for the last `hours`; never raises."""
+        key = (source, market_id, hours)
+        try:
+            trades, total = await self._trades.get_or_compute(key, lambda: self._refresh_window(key, hours, fetch))
+        except Exception as e:
+            logger.warning(f"Failed to fetch trades for {source}/{market_id}: {e}")
+            window = self._windows.get(key)
+            if window is None:
+                return [], 0
+            trades, total = window.trades, window.total
+        return list(trades), total
+
+    async def orderbook(self, source: str, market_id: str, fetch: OrderbookFetch) -> Dict:
+        """Latest orderbook for the market, or {} on failure; never raises."""
+        try:
+            return await self._orderbooks.get_or_compute((source, market_id), fetch)
+        except Exception as e:
+            logger.warning(f"Failed to fetch orderbook for {source}/{market_id}: {e}")
+            return {}
+
+    async def _refresh_window(self, key: Tuple, hours: int, fetch: TradesFetch) -> Tuple[List[Dict], int]:
+        cutoff = time.time() - hours * 3600
+        window = self._windows.get(key)
+
+        if window is not None and time.monotonic() - window.full_at < self.full_refresh_seconds:
+            # Overlap by one second; the overlap is deduplicated by merge()
+            new, new_total = await fetch(int(window.newest))
+            if new_total <= len(new):
+                window.merge(new, cutoff)
+                self._windows.move_to_end(key)
+                return window.trades, window.total
+            # More new trades than one page: there would be a gap, start over
+
+        trades, total = await fetch(int(cutoff))
+        window = _TradeWindow.full(trades, total, cutoff)
+        self._windows[key] = window
+        self._windows.move_to_end(key)
+        while len(self._windows) > self.max_markets:
+            self._windows.popitem(last=False)
+        return window.trades, window.total
+
+
+_fetch_engine: Optional[FetchEngine] = None
+
+
+def get_fetch_engine() -> FetchEngine:
+    """Process-wide fetch engine (client closed in the lifespan)."""
+    global _fetch_engine
+    if _fetch_engine is None:
+        _fetch_engine = FetchEngine(
+            max_connections=settings.FETCH_MAX_CONNECTIONS,
+            max_per_host=settings.FETCH_MAX_PER_HOST,
+            trades_ttl=settings.FETCH_TRADES_TTL,
+            orderbook_ttl=settings.FETCH_ORDERBOOK_TTL,
+            full_refresh_seconds=settings.FETCH_FULL_REFRESH_SECONDS,
+        )
+    return _fetch_engine
@@ -0,0 +1,149 @@
+"""
+Columnar snapshot of the unified markets list.
+
+/unified/markets used to copy the cached list of UnifiedMarket objects on
+every request, filter it with list comprehensions, re-sort all of it and
+slice one page. MarketSnapshot does that work once per cache refresh:
+
+- numeric sort columns are NumPy arrays, and every supported sort order is
+  stored as a presorted index permutation
+- platform and category are boolean masks (one per value)
+- the market objects themselves stay in a list and are only gathered for
+  the requested page
+
+An unfiltered page is a slice of a permutation plus a gather of page_size
+objects. Platform/category filtered permutations are derived on first use
+and memoized on the snapshot; search and min_volume filters are applied to
+the permutation with vectorized masks.
+
+Snapshots are immutable once built: a refresh builds a new one and swaps
+the reference.
+"""
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SORT = "volume_desc"
+_END_TIME_UNKNOWN = 9999999999
+
+
+class MarketSnapshot:
+    """Immutable columnar view over a list of UnifiedMarket objects."""
+
+    def __init__(self, markets: List[Any], platform_counts: Dict[str, int]):
+        start = time.time()
+        self.markets = list(markets)
+        self.platform_counts = dict(platform_counts)
+        self.built_at = time.time()
+
+        n = len(self.markets)
+        volume_total = np.fromiter((m.volume_total_usd or 0 for m in self.markets), np.float64, n)
+        volume_24h = np.fromiter((m.volume_24h_usd or 0 for m in self.markets), np.float64, n)
+        last_price = np.fromiter((m.last_price or 0 for m in self.markets), np.float64, n)
+        end_time = np.fromiter((m.end_time or 0 for m in self.markets), np.float64, n)
+        change = np.fromiter((abs(m.price_change_pct_24h or 0) for m in self.markets), np.float64, n)
+        ann_roi = np.fromiter((m.ann_roi or 0 for m in self.markets), np.float64, n)
+        ending = np.where(end_time == 0, _END_TIME_UNKNOWN, end_time)
+
+        self._volume_total = volume_total
+        self._titles = np.array([(m.title or "").lower() for m in self.markets], dtype=str)
+
+        # Stable sorts, so ties keep the cached (pipeline) order exactly as
+        # list.sort(..., reverse=True) did
+        self._orders: Dict[str, np.ndarray] = {
+            "volume_desc": _descending(volume_total),
+            "volume_asc": _ascending(volume_total),
+            "volume_24h_desc": _descending(volume_24h),
+            "price_desc": _descending(last_price),
+            "price_asc": _ascending(last_price),
+            "ending_soon": _ascending(ending),
+            "newest": _descending(end_time),
+            "change_desc": _descending(change),
+            "ann_roi_desc": _descending(ann_roi),
+        }
+
+        self._positions = {(m.platform, m.id): i for i, m in enumerate(self.markets)}
+        self._platform_masks = _masks([m.platform for m in self.markets])
+        self._category_masks = _masks([m.category for m in self.markets])
+
+        # (platform, category, sort) -> permutation restricted to that subset
+        self._filtered: Dict[Tuple[Optional[str], Optional[str], str], np.ndarray] = {}
+
+        logger.debug(f"Market snapshot built: {n} markets in {(time.time() - start) * 1000:.1f}ms")
+
+    def __len__(self) -> int:
+        return len(self.markets)
+
+    def _order(self, platform: Optional[str], category: Optional[str], sort: str) -> np.ndarray:
+        if sort not in self._orders:
+            sort = DEFAULT_SORT
+        order = self._orders[sort]
+        if platform is None and category is None:
+            return order
+
+        key = (platform, category, sort)
+        cached = self._filtered.get(key)
+        if cached is None:
+            mask = np.ones(len(self.markets), dtype=bool)
+            if platform is not None:
+                mask &= self._platform_masks.get(platform, False)
+            if category is not None:
+                mask &= self._category_masks.get(category, False)
+            cached = order[mask[order]]
+            self._filtered[key] = cached
+        return cached
+
+    def query(
+        self,
+        platform: Optional[str] = None,
+        category: Optional[str] = None,
+        min_volume: Optional[float] = None,
+        search: Optional[str] = None,
+        keys: Optional[Iterable[Tuple[str, str]]] = None,
+        sort: str = DEFAULT_SORT,
+        offset: int = 0,
+        limit: int = 10,
+    ) -> Tuple[List[Any], int]:
+        """
+        Return (page of markets, total matching) for the given filters.
+        platform/category are exact UnifiedMarket field values; None means any.
+        search is a title substring; keys restricts to (platform, id) pairs,
+        e.g. search index matches.
+        """
+        order = self._order(platform, category, sort)
+
+        if min_volume or search or keys is not None:
+            keep = np.ones(len(order), dtype=bool)
+            if min_volume:
+                keep &= self._volume_total[order] >= min_volume
+            if search:
+                keep &= np.char.find(self._titles[order], search.lower()) >= 0
+            if keys is not None:
+                wanted = np.zeros(len(self.markets), dtype=bool)
+                positions = [self._positions[k] for k in keys if k in self._positions]
+                wanted[positions] = True
+                keep &= wanted[order]
+            order = order[keep]
+
+        page = order[offset:offset + limit]
+        return [self.markets[i] for i in page], len(order)
+
+
+def _descending(values: np.ndarray) -> np.ndarray:
+    return np.argsort(-values, kind="stable")
+
+
+def _ascending(values: np.ndarray) -> np.ndarray:
+    return np.argsort(values, kind="stable")
+
+
+def _masks(values: List[str]) -> Dict[str, np.ndarray]:
+    """One boolean mask per distinct value."""
+    if not values:
+        return {}
+    uniques, codes = np.unique(np.array(values, dtype=object), return_inverse=True)
+    return {value: codes == i for i, value in enumerate(uniques)}
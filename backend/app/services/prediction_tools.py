@@ -28,52 +28,34 @@ class PredictionInternalTools:
     ) -> Dict[str, Any]:
         """
         Search for prediction market events across all platforms.
-        Uses our merged events cache for instant results.
+        Uses the in-process search index for instant, ranked results.
         
         Args:
-            query: Search text (matches event titles)
+            query: Search text (matches event titles, slugs, tags and market titles)
             platform: Filter by platform (all, polymarket, kalshi, limitless, opiniontrade)
             category: Filter by category (all, politics, sports, crypto, etc.)
             limit: Max results (default 20)
         """
         start = time.time()
         try:
-            from app.api.events_db import _get_merged_cache, _build_merged_events_cache
-            
-            cached = _get_merged_cache()
-            if cached is None:
-                return {"error": "Cache warming up", "events": [], "total": 0}
-            
-            events = cached["events"]
-            
-            # Apply platform filter
-            if platform != "all":
-                events = [e for e in events if e.get("platform") == platform]
-            
-            # Apply category filter
-            if category != "all":
-                cat_lower = category.lower()
-                events = [
-                    e for e in events
-                    if cat_lower in (e.get("category") or "").lower()
-                    or cat_lower in str(e.get("tags") or []).lower()
-                ]
-            
-            # Apply search filter
-            if query:
-                q_lower = query.lower()
-                events = [
-                    e for e in events
-                    if q_lower in (e.get("title") or "").lower()
-                    or q_lower in (e.get("event_id") or "").lower()
-                ]
-            
-            total = len(events)
-            results = events[:limit]
+            from app.services.search_index import get_search_index
+            
+            index = get_search_index()
+            if index is None:
+                return {"error": "Search index warming up", "events": [], "total": 0}
+            
+            results, total = index.search(
+                query,
+                kind="event",
+                platform=None if platform == "all" else platform,
+                category=None if category == "all" else category,
+                limit=limit,
+            )
             
             # Simplify event data for Claude (reduce token usage)
             simplified = []
             for e in results:
+                yes_price = e.get("yes_price")
                 simplified.append({
                     "title": e.get("title", ""),
                     "platform": e.get("platform", ""),
@@ -81,8 +63,8 @@ class PredictionInternalTools:
                     "status": e.get("status", ""),
                     "market_count": e.get("market_count", 1),
                     "total_volume": round(e.get("total_volume", 0) or 0, 2),
-                    "yes_price": e.get("yes_price"),
-                    "no_price": e.get("no_price"),
+                    "yes_price": yes_price,
+                    "no_price": round(1 - yes_price, 4) if yes_price is not None else None,
                     "event_id": e.get("event_id", ""),
                     "end_date": e.get("end_date", ""),
                     "volume_24h": round(e.get("volume_24h", 0) or 0, 2),
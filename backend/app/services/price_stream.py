@@ -0,0 +1,319 @@
+"""
+Realtime price fan-out to SSE / WebSocket clients.
+
+The frontend and the keeper bot used to poll full lists (opportunities,
+unified markets) every few seconds to notice a handful of price moves.
+The data pipeline now announces every batch of changed market prices with
+Postgres NOTIFY (data-pipeline predictions_ingest/price_events.py), and
+each API worker multiplexes them to its connected clients:
+
+- One LISTEN connection per worker (not from the query pool), reconnected
+  with backoff; PriceHub.publish is the same entry point for a local broker
+- Clients subscribe to topics: ("market", source_market_id),
+  ("event", event_id) and ("platform", source); an update reaches every
+  subscriber of any of its three topics
+- Each update is JSON-encoded once and each topic's slice of a batch is
+  joined once, so subscribers of the same topic share the encoded bytes
+- Bursts are coalesced per subscriber: updates arriving within
+  PRICE_STREAM_COALESCE_MS go out as one message, latest price per market;
+  a slow client never queues more than the markets it follows
+- A subscriber costs a topic set, a list of pending chunks and an Event;
+  there is no task per subscriber beyond the request handling it
+
+Message to clients (SSE data / WebSocket text):
+    {"type": "prices", "updates": [{"platform": "kalshi", "market_id": "...",
+      "event_id": "...", "yes_price": 0.52, "no_price": 0.48, "ts": 1767225600.1}]}
+
+Load test: scripts/load_test_price_stream.py.
+"""
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import orjson
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Shared with the data pipeline
+PRICE_CHANNEL = "cg_prices"
+
+TOPIC_KINDS = ("market", "event", "platform")
+Topic = Tuple[str, str]
+
+# Pending chunks per subscriber before they are merged into one
+_MAX_PENDING_CHUNKS = 32
+_LISTEN_HEALTH_SECONDS = 30
+_LISTEN_MAX_BACKOFF = 60
+
+
+class StreamFull(RuntimeError):
+    """More subscribers than PRICE_STREAM_MAX_SUBSCRIBERS."""
+
+
+class _Chunk:
+    """One topic's updates from one batch: keys and pre-encoded items."""
+
+    __slots__ = ("keys", "items", "_joined")
+
+    def __init__(self):
+        self.keys: List[Tuple[str, str]] = []
+        self.items: List[bytes] = []
+        self._joined: Optional[bytes] = None
+
+    def joined(self) -> bytes:
+        if self._joined is None:
+            self._joined = b",".join(self.items)
+        return self._joined
+
+
+def _merge(chunks: List[_Chunk]) -> _Chunk:
+    """Latest item per market across chunks, in arrival order."""
+    latest: Dict[Tuple[str, str], bytes] = {}
+    for chunk in chunks:
+        latest.update(zip(chunk.keys, chunk.items))
+    merged = _Chunk()
+    merged.keys = list(latest)
+    merged.items = list(latest.values())
+    return merged
+
+
+class Subscriber:
+    """One client connection's topics and its not yet sent updates."""
+
+    __slots__ = ("topics", "_chunks", "_wake", "messages", "updates")
+
+    def __init__(self):
+        self.topics: Set[Topic] = set()
+        self._chunks: List[_Chunk] = []
+        self._wake = asyncio.Event()
+        self.messages = 0
+        self.updates = 0
+
+    def _offer(self, chunk: _Chunk) -> None:
+        self._chunks.append(chunk)
+        if len(self._chunks) > _MAX_PENDING_CHUNKS:
+            self._chunks = [_merge(self._chunks)]
+        self._wake.set()
+
+    async def next_message(self, timeout: float, coalesce: float) -> Optional[bytes]:
+        """
+        Wait up to timeout for updates, then give them `coalesce` seconds
+        to accumulate. Returns the encoded message, or None on timeout
+        (time for a heartbeat).
+        """
+        if not self._chunks:
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        if coalesce > 0:
+            await asyncio.sleep(coalesce)
+
+        chunks, self._chunks = self._chunks, []
+        self._wake.clear()
+        if not chunks:
+            return None
+        chunk = chunks[0] if len(chunks) == 1 else _merge(chunks)
+        self.messages += 1
+        self.updates += len(chunk.items)
+        return b'{"type":"prices","updates":[' + chunk.joined() + b"]}"
+
+
+def parse_topics(
+    markets: Iterable[str] = (), events: Iterable[str] = (), platforms: Iterable[str] = ()
+) -> Set[Topic]:
+    topics: Set[Topic] = set()
+    for kind, values in (("market", markets), ("event", events), ("platform", platforms)):
+        topics.update((kind, v.strip()) for v in values if v and v.strip())
+    return topics
+
+
+class PriceHub:
+    """Topic index of subscribers, the NOTIFY listener and fan-out."""
+
+    def __init__(
+        self,
+        coalesce_ms: float,
+        max_subscribers: int,
+        max_topics: int,
+    ):
+        self.coalesce = coalesce_ms / 1000
+        self.max_subscribers = max_subscribers
+        self.max_topics = max_topics
+        self._subscribers: Set[Subscriber] = set()
+        self._by_topic: Dict[Topic, Set[Subscriber]] = defaultdict(set)
+        self._task: Optional[asyncio.Task] = None
+        self.listening = False
+        self.batches = 0
+        self.updates = 0
+        self.deliveries = 0
+        self.last_batch_at: Optional[float] = None
+
+    # ── subscriptions ─────────────────────────────────────────────────────
+
+    def subscribe(self, topics: Set[Topic] = frozenset()) -> Subscriber:
+        if len(self._subscribers) >= self.max_subscribers:
+            raise StreamFull(f"{len(self._subscribers)} price stream subscribers")
+        sub = Subscriber()
+        self._subscribers.add(sub)
+        self.add_topics(sub, topics)
+        return sub
+
+    def add_topics(self, sub: Subscriber, topics: Set[Topic]) -> int:
+        """Add topics (up to PRICE_STREAM_MAX_TOPICS per subscriber); returns the total."""
+        for topic in topics:
+            if len(sub.topics) >= self.max_topics:
+                break
+            if topic[0] in TOPIC_KINDS and topic not in sub.topics:
+                sub.topics.add(topic)
+                self._by_topic[topic].add(sub)
+        return len(sub.topics)
+
+    def remove_topics(self, sub: Subscriber, topics: Set[Topic]) -> int:
+        for topic in topics & sub.topics:
+            sub.topics.discard(topic)
+            subs = self._by_topic.get(topic)
+            if subs is not None:
+                subs.discard(sub)
+                if not subs:
+                    del self._by_topic[topic]
+        return len(sub.topics)
+
+    def unsubscribe(self, sub: Subscriber) -> None:
+        self.remove_topics(sub, set(sub.topics))
+        self._subscribers.discard(sub)
+
+    # ── fan-out ───────────────────────────────────────────────────────────
+
+    def publish(self, source: str, changes: Iterable[tuple], ts: Optional[float] = None) -> int:
+        """
+        Fan a batch of (market_id, event_id, yes_price, no_price) changes out
+        to subscribers. Returns the number of subscribers woken.
+        """
+        ts = time.time() if ts is None else ts
+        by_topic = self._by_topic
+        chunks: Dict[Topic, _Chunk] = {}
+        count = 0
+        for market_id, event_id, yes_price, no_price in changes:
+            count += 1
+            topics = [("market", market_id), ("platform", source)]
+            if event_id:
+                topics.append(("event", event_id))
+            item = None
+            for topic in topics:
+                if topic not in by_topic:
+                    continue
+                if item is None:
+                    item = orjson.dumps({
+                        "platform": source,
+                        "market_id": market_id,
+                        "event_id": event_id,
+                        "yes_price": yes_price,
+                        "no_price": no_price,
+                        "ts": ts,
+                    })
+                chunk = chunks.get(topic)
+                if chunk is None:
+                    chunk = chunks[topic] = _Chunk()
+                chunk.keys.append((source, market_id))
+                chunk.items.append(item)
+
+        woken: Set[Subscriber] = set()
+        for topic, chunk in chunks.items():
+            for sub in by_topic.get(topic, ()):
+                sub._offer(chunk)
+                woken.add(sub)
+                self.deliveries += len(chunk.items)
+
+        self.batches += 1
+        self.updates += count
+        self.last_batch_at = time.time()
+        return len(woken)
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        try:
+            batch = orjson.loads(payload)
+            self.publish(batch["s"], batch["m"], batch.get("t"))
+        except Exception as e:
+            logger.warning(f"Bad price notification ignored: {e}")
+
+    # ── listener ──────────────────────────────────────────────────────────
+
+    async def _connect(self):
+        import asyncpg
+        from app.database.session import asyncpg_dsn
+
+        return await asyncpg.connect(asyncpg_dsn(), ssl="require")
+
+    async def _listen(self) -> None:
+        backoff = 1.0
+        while True:
+            conn = None
+            try:
+                conn = await self._connect()
+                await conn.add_listener(PRICE_CHANNEL, self._on_notify)
+                self.listening = True
+                backoff = 1.0
+                logger.info(f"Price stream listening on '{PRICE_CHANNEL}'")
+                # Notifications arrive via the callback; this only detects a dead link
+                while True:
+                    await asyncio.sleep(_LISTEN_HEALTH_SECONDS)
+                    await conn.execute("SELECT 1")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Price stream listener lost, retrying in {backoff:.0f}s: {e}")
+            finally:
+                self.listening = False
+                if conn is not None:
+                    try:
+                        await asyncio.wait_for(conn.close(), 5)
+                    except Exception:
+                        conn.terminate()
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, _LISTEN_MAX_BACKOFF)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict:
+        return {
+            "listening": self.listening,
+            "subscribers": len(self._subscribers),
+            "topics": len(self._by_topic),
+            "batches": self.batches,
+            "updates": self.updates,
+            "deliveries": self.deliveries,
+            "last_batch_age_s": round(time.time() - self.last_batch_at, 1) if self.last_batch_at else None,
+            "coalesce_ms": self.coalesce * 1000,
+        }
+
+
+_price_hub: Optional[PriceHub] = None
+
+
+def get_price_hub() -> PriceHub:
+    """Process-wide price hub (listener started in the lifespan)."""
+    global _price_hub
+    if _price_hub is None:
+        _price_hub = PriceHub(
+            coalesce_ms=settings.PRICE_STREAM_COALESCE_MS,
+            max_subscribers=settings.PRICE_STREAM_MAX_SUBSCRIBERS,
+            max_topics=settings.PRICE_STREAM_MAX_TOPICS,
+        )
+    return _price_hub
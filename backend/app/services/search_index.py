@@ -0,0 +1,646 @@
+"""
+In-process search index for markets and events.
+
+Search used to be a substring scan everywhere: ILIKE on silver markets,
+LIKE on gold event groups, list comprehensions over cached lists. This
+module keeps one inverted index in memory, shared by the REST endpoints
+and the chat tools, so keystroke search never touches Postgres:
+
+- Documents: active silver markets and gold event groups, indexed on
+  title, slug, tags and category (events also on member market titles)
+- Tokens map to postings {doc: field weight}; the sorted vocabulary
+  answers prefix lookups (the term being typed), and a trigram map over
+  the vocabulary answers fuzzy lookups (typos)
+- Ranking: sum over query terms of field weight x match quality x IDF,
+  nudged by log volume so popular markets win ties
+
+SearchIndexService keeps it current: a full build on startup and every
+SEARCH_INDEX_REBUILD_SECONDS (built in a worker thread, then swapped in),
+and in between incremental updates from predictions_gold.market_change_log
+(migration 018) and event_groups.updated_at (migration 019).
+"""
+import asyncio
+import bisect
+import heapq
+import logging
+import math
+import re
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Field weights: a title hit outranks a slug hit, and so on
+TITLE_WEIGHT = 3.0
+SLUG_WEIGHT = 2.0
+TAG_WEIGHT = 1.5
+CATEGORY_WEIGHT = 1.0
+MEMBER_WEIGHT = 0.75  # event member market titles
+
+# Match quality multipliers
+PREFIX_QUALITY = 0.7
+FUZZY_QUALITY = 0.5
+
+MIN_PREFIX_LENGTH = 2
+MAX_PREFIX_EXPANSION = 50  # vocabulary tokens tried per prefix, most frequent first
+SHORT_PREFIX_LENGTH = 4  # shorter prefixes ("ma", "fed") match many weak tokens...
+MAX_SHORT_PREFIX_EXPANSION = 10  # ...so fewer of them are tried
+MAX_FUZZY_EXPANSION = 20
+MIN_FUZZY_SIMILARITY = 0.4
+MAX_SCORED_CANDIDATES = 200
+COMMON_TERM_FRACTION = 0.3  # terms in more docs than this rank but don't filter
+PRESORT_MIN_DOCS = 500  # bulk loads presort impact order for tokens this common
+
+DocKey = Tuple[str, str, str]  # (kind, platform, id)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercase alphanumeric runs; slugs and tickers split on punctuation."""
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+def _trigrams(token: str) -> Set[str]:
+    padded = f" {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass
+class SearchDoc:
+    """One searchable market or event."""
+    kind: str       # "market" or "event"
+    platform: str   # silver source: polymarket, kalshi, limitless, opiniontrade
+    id: str         # source_market_id or event_id
+    title: str
+    slug: str = ""
+    tags: List[str] = field(default_factory=list)
+    category: str = ""
+    members: str = ""  # event only: member market titles/slugs
+    volume: float = 0.0
+    payload: Dict[str, Any] = field(default_factory=dict)  # returned with results
+
+    @property
+    def key(self) -> DocKey:
+        return (self.kind, self.platform, self.id)
+
+    def weighted_tokens(self) -> Dict[str, float]:
+        weights: Dict[str, float] = {}
+        for text, weight in (
+            (self.members, MEMBER_WEIGHT),
+            (self.category, CATEGORY_WEIGHT),
+            (" ".join(self.tags), TAG_WEIGHT),
+            (self.slug, SLUG_WEIGHT),
+            (self.title, TITLE_WEIGHT),
+        ):
+            for token in tokenize(text):
+                if weight > weights.get(token, 0.0):
+                    weights[token] = weight
+        return weights
+
+    def labels(self) -> Set[str]:
+        """Lowercased category and tags, for category filters."""
+        return {s.lower() for s in [self.category, *self.tags] if s}
+
+    def to_result(self, score: float) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "platform": self.platform,
+            "id": self.id,
+            "title": self.title,
+            "score": round(score, 3),
+            **self.payload,
+        }
+
+
+class SearchIndex:
+    """
+    Inverted index with prefix and trigram lookup.
+
+    Not thread-safe: mutate it from the event loop only (a full rebuild
+    builds a separate instance off-loop and swaps it in).
+    """
+
+    def __init__(self, docs: Iterable[SearchDoc] = ()):
+        self._docs: Dict[int, SearchDoc] = {}
+        self._ids: Dict[DocKey, int] = {}
+        self._doc_tokens: Dict[int, Tuple[str, ...]] = {}
+        self._boost: Dict[int, float] = {}  # log-volume popularity multiplier
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._impact: Dict[str, _ImpactOrder] = {}  # built on first use (bulk loads presort big tokens)
+        self._vocab: List[str] = []  # sorted, for prefix ranges
+        self._trigrams: Dict[str, Set[str]] = defaultdict(set)
+        # ("kind", value) / ("platform", value) / ("label", lowercased category or tag)
+        self._facets: Dict[Tuple[str, str], Set[int]] = defaultdict(set)
+        self._by_volume: List[Tuple[float, int]] = []  # sorted (-volume, doc_id)
+        self._next_id = 0
+        # Bulk load: last doc per key wins, volume order sorted once
+        for doc in {doc.key: doc for doc in docs}.values():
+            self._by_volume.append((-doc.volume, self._add(doc)))
+        self._by_volume.sort()
+        for token, postings in self._postings.items():
+            if len(postings) >= PRESORT_MIN_DOCS:
+                self._impact_order(token)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, key: DocKey) -> bool:
+        return key in self._ids
+
+    def get(self, key: DocKey) -> Optional[SearchDoc]:
+        doc_id = self._ids.get(key)
+        return self._docs.get(doc_id) if doc_id is not None else None
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def _doc_facets(self, doc: SearchDoc) -> List[Tuple[str, str]]:
+        return [("kind", doc.kind), ("platform", doc.platform), *(("label", l) for l in doc.labels())]
+
+    def upsert(self, doc: SearchDoc) -> None:
+        self.remove(doc.key)
+        doc_id = self._add(doc)
+        bisect.insort(self._by_volume, (-doc.volume, doc_id))
+
+    def _add(self, doc: SearchDoc) -> int:
+        """Index a doc; the caller places it in _by_volume."""
+        doc_id = self._next_id
+        self._next_id += 1
+        weights = doc.weighted_tokens()
+
+        self._docs[doc_id] = doc
+        self._ids[doc.key] = doc_id
+        self._doc_tokens[doc_id] = tuple(weights)
+        self._boost[doc_id] = 1 + 0.05 * math.log10(1 + max(doc.volume, 0.0))
+        for facet in self._doc_facets(doc):
+            self._facets[facet].add(doc_id)
+        for token, weight in weights.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                bisect.insort(self._vocab, token)
+                for gram in _trigrams(token):
+                    self._trigrams[gram].add(token)
+            postings[doc_id] = weight
+            order = self._impact.get(token)
+            if order is not None:
+                bisect.insort(order.pending, (-weight * self._boost[doc_id], doc_id))
+        return doc_id
+
+    def remove(self, key: DocKey) -> bool:
+        doc_id = self._ids.pop(key, None)
+        if doc_id is None:
+            return False
+        doc = self._docs.pop(doc_id)
+        del self._boost[doc_id]
+        for facet in self._doc_facets(doc):
+            members = self._facets[facet]
+            members.discard(doc_id)
+            if not members:
+                del self._facets[facet]
+        for token in self._doc_tokens.pop(doc_id):
+            postings = self._postings[token]
+            del postings[doc_id]
+            order = self._impact.get(token)
+            if order is not None:
+                order.stale += 1
+            if not postings:
+                del self._postings[token]
+                self._impact.pop(token, None)
+                del self._vocab[bisect.bisect_left(self._vocab, token)]
+                for gram in _trigrams(token):
+                    grams = self._trigrams[gram]
+                    grams.discard(token)
+                    if not grams:
+                        del self._trigrams[gram]
+        del self._by_volume[bisect.bisect_left(self._by_volume, (-doc.volume, doc_id))]
+        return True
+
+    # -------------------------------------------------------------------------
+    # Lookup
+    # -------------------------------------------------------------------------
+
+    def _expand_prefix(self, term: str) -> List[str]:
+        lo = bisect.bisect_left(self._vocab, term)
+        hi = bisect.bisect_left(self._vocab, term + "\uffff")
+        tokens = [t for t in self._vocab[lo:hi] if t != term]
+        limit = MAX_SHORT_PREFIX_EXPANSION if len(term) < SHORT_PREFIX_LENGTH else MAX_PREFIX_EXPANSION
+        if len(tokens) > limit:
+            tokens = heapq.nlargest(limit, tokens, key=lambda t: len(self._postings[t]))
+        return tokens
+
+    def _expand_fuzzy(self, term: str) -> List[Tuple[str, float]]:
+        grams = _trigrams(term)
+        shared: Dict[str, int] = defaultdict(int)
+        for gram in grams:
+            for token in self._trigrams.get(gram, ()):
+                shared[token] += 1
+        scored = []
+        for token, n in shared.items():
+            sim = n / (len(grams) + len(token) - n)  # a padded token has len(token) trigrams
+            if sim >= MIN_FUZZY_SIMILARITY:
+                scored.append((token, sim))
+        return heapq.nlargest(MAX_FUZZY_EXPANSION, scored, key=lambda x: x[1])
+
+    def _expansions(self, term: str) -> Dict[str, float]:
+        """
+        Vocabulary tokens a query term matches, with their score factor
+        (match quality x IDF): exact and prefix matches, or fuzzy ones when
+        there are neither.
+        """
+        quality: Dict[str, float] = {}
+        if term in self._postings:
+            quality[term] = 1.0
+        if len(term) >= MIN_PREFIX_LENGTH:
+            for token in self._expand_prefix(term):
+                quality[token] = PREFIX_QUALITY * (0.5 + 0.5 * len(term) / len(token))
+        if not quality and len(term) >= 3:
+            for token, sim in self._expand_fuzzy(term):
+                quality[token] = FUZZY_QUALITY * sim
+        n = len(self._docs)
+        return {t: q * math.log(1 + n / len(self._postings[t])) for t, q in quality.items()}
+
+    def _term_df(self, expansion: Dict[str, float]) -> int:
+        return sum(len(self._postings[t]) for t in expansion)
+
+    def _term_docs(self, expansion: Dict[str, float]) -> Set[int]:
+        if len(expansion) == 1:
+            return self._postings[next(iter(expansion))].keys()  # read-only view, no copy
+        return set().union(*(self._postings[t].keys() for t in expansion))
+
+    def _restrict(self, candidates: Set[int], expansion: Dict[str, float]) -> Set[int]:
+        """candidates that also match this term (set ops iterate the smaller side)."""
+        return set().union(*(self._postings[t].keys() & candidates for t in expansion))
+
+    def _scores(self, expansions: List[Dict[str, float]], pool: Set[int]) -> Dict[int, float]:
+        """Sum over terms of each pool doc's best token match (set ops pick the docs)."""
+        scores = dict.fromkeys(pool, 0.0)
+        for expansion in expansions:
+            best: Dict[int, float] = {}
+            for token, factor in expansion.items():
+                postings = self._postings[token]
+                for d in postings.keys() & pool:
+                    score = postings[d] * factor
+                    if score > best.get(d, 0.0):
+                        best[d] = score
+            for d, score in best.items():
+                scores[d] += score
+        return scores
+
+    def _impact_order(self, token: str) -> "_ImpactOrder":
+        order = self._impact.get(token)
+        if order is None or order.needs_rebuild():
+            boost = self._boost
+            order = _ImpactOrder(sorted(
+                (-weight * boost[d], d) for d, weight in self._postings[token].items()
+            ))
+            self._impact[token] = order
+        return order
+
+    def _ranked(self, expansion: Dict[str, float]) -> Iterator[int]:
+        """Docs matching one term, best single-term score first (may repeat a doc)."""
+        streams = []
+        for token, factor in expansion.items():
+            order = self._impact_order(token)
+            postings = self._postings[token]
+            merged = heapq.merge(order.base, order.pending) if order.pending else order.base
+            if len(expansion) == 1:
+                # One token (exact or long prefix): its order is the ranking
+                return (d for _, d in merged if d in postings)
+            streams.append(
+                (impact * factor, d)
+                for impact, d in merged
+                if d in postings  # skip removed docs; ids are never reused
+            )
+        return (d for _, d in heapq.merge(*streams))
+
+    def _filter_sets(
+        self, kind: Optional[str], platform: Optional[str], category: Optional[str]
+    ) -> List[Set[int]]:
+        wanted = [("kind", kind), ("platform", platform), ("label", category.lower() if category else None)]
+        return [self._facets.get(facet, set()) for facet in wanted if facet[1]]
+
+    def _match(
+        self,
+        query: str,
+        kind: Optional[str],
+        platform: Optional[str],
+        category: Optional[str],
+    ) -> Tuple[List[Dict[str, float]], Set[int]]:
+        """(per-term expansions, matching doc ids). Set work only; no scoring."""
+        expansions = [e for e in map(self._expansions, dict.fromkeys(tokenize(query))) if e]
+        if not expansions:
+            return [], set()
+
+        # Every term must match, most selective first. Terms matching nothing
+        # are ignored, and near-universal ones ("will", "the") only score.
+        # If no doc has them all, accept any, so long chat-style queries
+        # still answer - scoring ranks docs with more terms first
+        expansions.sort(key=self._term_df)
+        common = COMMON_TERM_FRACTION * len(self._docs)
+        required = [e for e in expansions[1:] if self._term_df(e) <= common]
+        candidates = self._term_docs(expansions[0])
+        for expansion in required:
+            candidates = self._restrict(candidates, expansion)
+            if not candidates:
+                candidates = set().union(*map(self._term_docs, [expansions[0], *required]))
+                break
+
+        for allowed in self._filter_sets(kind, platform, category):
+            candidates &= allowed
+        return expansions, candidates
+
+    def search(
+        self,
+        query: str,
+        kind: Optional[str] = None,
+        platform: Optional[str] = None,
+        category: Optional[str] = None,
+        limit: int = 20,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Ranked results. Returns (top `limit` results, total matches).
+        An empty query lists the filtered docs by volume.
+        """
+        if not tokenize(query):
+            filters = self._filter_sets(kind, platform, category)
+            allowed = set.intersection(*filters) if filters else None
+            total = len(allowed) if allowed is not None else len(self._docs)
+            page = self._top_by_volume(allowed, limit)
+            return [self._docs[d].to_result(0.0) for d in page], total
+
+        expansions, candidates = self._match(query, kind, platform, category)
+        pool = candidates
+        if len(candidates) > MAX_SCORED_CANDIDATES:
+            # Broad query: only score the matches ranked highest by the most
+            # selective term (exact for single-term queries, which most
+            # keystroke queries are)
+            pool = set()
+            for d in self._ranked(expansions[0]):
+                if d in candidates:
+                    pool.add(d)
+                    if len(pool) >= MAX_SCORED_CANDIDATES:
+                        break
+        boost = self._boost
+        scored = ((score * boost[d], d) for d, score in self._scores(expansions, pool).items())
+        top = heapq.nlargest(limit, scored)
+        return [self._docs[d].to_result(score) for score, d in top], len(candidates)
+
+    def match_keys(
+        self,
+        query: str,
+        kind: Optional[str] = None,
+        platform: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> Set[DocKey]:
+        """Every matching doc key, unranked (for filtering a listing by search)."""
+        _, candidates = self._match(query, kind, platform, category)
+        return {self._docs[d].key for d in candidates}
+
+    def _top_by_volume(self, allowed: Optional[Set[int]], limit: int) -> List[int]:
+        if allowed is None:
+            return [doc_id for _, doc_id in self._by_volume[:limit]]
+        if len(allowed) * 8 < len(self._docs):
+            # Sparse: cheaper to rank the set than to walk the global order
+            docs = self._docs
+            return heapq.nsmallest(limit, allowed, key=lambda d: (-docs[d].volume, d))
+        top: List[int] = []
+        for _, doc_id in self._by_volume:
+            if doc_id in allowed:
+                top.append(doc_id)
+                if len(top) >= limit:
+                    break
+        return top
+
+
+class _ImpactOrder:
+    """
+    A token's postings sorted by (-weight * boost, doc_id). Upserts land in
+    a small sorted pending list and removals are skipped at read time, so
+    a busy token is only re-sorted once enough of it has changed.
+    """
+    __slots__ = ("base", "pending", "stale")
+
+    def __init__(self, base: List[Tuple[float, int]]):
+        self.base = base
+        self.pending: List[Tuple[float, int]] = []
+        self.stale = 0
+
+    def needs_rebuild(self) -> bool:
+        return (len(self.pending) + self.stale) * 4 > len(self.base) + 64
+
+
+# =============================================================================
+# DB sync
+# =============================================================================
+
+_MARKETS_SQL = """
+    SELECT source, source_market_id, slug, title, tags, category_name, status,
+           yes_price, volume_total, volume_24h, end_date, image_url, source_url
+    FROM predictions_silver.markets
+    WHERE (is_active = true OR status IN ('active', 'open'))
+"""
+_MARKETS_SCOPE = """
+    AND (source, source_market_id) IN (SELECT * FROM unnest(:sources::text[], :market_ids::text[]))
+"""
+
+_EVENTS_SQL = """
+    SELECT event_id, platform, rep_title, rep_image, rep_url, rep_yes_price,
+           category, categories, search_text, market_count, total_volume,
+           volume_24h, max_end_date, is_active, updated_at
+    FROM predictions_gold.event_groups
+"""
+
+# event_groups rows are stamped with the pipeline transaction's NOW(), which
+# can commit after a later poll; re-read this much behind the watermark
+_EVENT_WATERMARK_OVERLAP_SECONDS = 300
+
+
+def _epoch(value) -> Optional[int]:
+    return int(value.timestamp()) if value else None
+
+
+def market_doc(row) -> SearchDoc:
+    volume = float(row.volume_total or 0)
+    return SearchDoc(
+        kind="market",
+        platform=row.source,
+        id=row.source_market_id,
+        title=row.title or "",
+        slug=row.slug or "",
+        tags=list(row.tags or []),
+        category=row.category_name or "",
+        volume=volume,
+        payload={
+            "slug": row.slug,
+            "category": row.category_name,
+            "status": row.status,
+            "yes_price": float(row.yes_price) if row.yes_price is not None else None,
+            "volume_total": volume,
+            "volume_24h": float(row.volume_24h or 0),
+            "end_date": _epoch(row.end_date),
+            "image_url": row.image_url,
+            "source_url": row.source_url,
+        },
+    )
+
+
+def event_doc(row) -> SearchDoc:
+    volume = float(row.total_volume or 0)
+    categories = [c for c in (row.categories or []) if c]
+    return SearchDoc(
+        kind="event",
+        platform=row.platform,
+        id=row.event_id,
+        title=row.rep_title or row.event_id.replace("-", " "),
+        slug=row.event_id,
+        tags=categories,
+        category=row.category or "",
+        members=row.search_text or "",
+        volume=volume,
+        payload={
+            "event_id": row.event_id,
+            "category": row.category,
+            "status": "active" if row.is_active else "closed",
+            "market_count": int(row.market_count or 0),
+            "total_volume": volume,
+            "volume_24h": float(row.volume_24h or 0),
+            "yes_price": float(row.rep_yes_price) if row.rep_yes_price is not None else None,
+            "end_date": _epoch(row.max_end_date),
+            "image": row.rep_image,
+            "url": row.rep_url,
+        },
+    )
+
+
+class SearchIndexService:
+    """Owns the shared SearchIndex and keeps it in sync with the database."""
+
+    def __init__(self):
+        self.index: Optional[SearchIndex] = None
+        self.built_at: float = 0.0
+        self._change_seq = 0
+        self._events_watermark = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.index is not None
+
+    async def rebuild(self) -> None:
+        """Load everything and swap in a freshly built index."""
+        from app.database.async_db import get_async_db
+
+        start = time.time()
+        db = await get_async_db()
+        # Cursors first: changes landing during the load are replayed by the
+        # next sync instead of being lost
+        change_seq = await db.fetchval(
+            "SELECT COALESCE(MAX(change_seq), 0) FROM predictions_gold.market_change_log"
+        )
+        market_rows = await db.fetch(_MARKETS_SQL)
+        event_rows = await db.fetch(_EVENTS_SQL)
+
+        def _build() -> SearchIndex:
+            return SearchIndex([*map(market_doc, market_rows), *map(event_doc, event_rows)])
+
+        # Tokenizing tens of thousands of titles is CPU work; keep it off the loop
+        self.index = await asyncio.to_thread(_build)
+        self.built_at = time.time()
+        self._change_seq = change_seq
+        self._events_watermark = max((r.updated_at for r in event_rows), default=None)
+        logger.info(
+            f"Search index built: {len(market_rows)} markets, {len(event_rows)} events "
+            f"in {(time.time() - start) * 1000:.0f}ms"
+        )
+
+    async def sync(self) -> int:
+        """Apply silver market changes and refreshed event groups. Returns docs touched."""
+        from app.database.async_db import get_async_db
+
+        db = await get_async_db()
+        index = self.index
+        touched = 0
+
+        changes = await db.fetch(
+            "SELECT source, source_market_id, change_seq FROM predictions_gold.market_change_log"
+            " WHERE change_seq > :after ORDER BY change_seq LIMIT :limit",
+            {"after": self._change_seq, "limit": settings.SEARCH_INDEX_SYNC_BATCH},
+        )
+        if changes:
+            rows = await db.fetch(_MARKETS_SQL + _MARKETS_SCOPE, {
+                "sources": [c.source for c in changes],
+                "market_ids": [c.source_market_id for c in changes],
+            })
+            active = {(r.source, r.source_market_id) for r in rows}
+            for row in rows:
+                index.upsert(market_doc(row))
+            # Closed or deleted since the last sync
+            for c in changes:
+                if (c.source, c.source_market_id) not in active:
+                    index.remove(("market", c.source, c.source_market_id))
+            self._change_seq = changes[-1].change_seq
+            touched += len(changes)
+
+        if self._events_watermark is not None:
+            since = self._events_watermark - timedelta(seconds=_EVENT_WATERMARK_OVERLAP_SECONDS)
+            rows = await db.fetch(_EVENTS_SQL + " WHERE updated_at > :since", {"since": since})
+            for row in rows:
+                index.upsert(event_doc(row))
+            if rows:
+                self._events_watermark = max(self._events_watermark, max(r.updated_at for r in rows))
+            touched += len(rows)
+        # Event groups deleted by the pipeline drop out on the next full rebuild
+
+        return touched
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if self.index is None or time.time() - self.built_at > settings.SEARCH_INDEX_REBUILD_SECONDS:
+                    await self.rebuild()
+                else:
+                    touched = await self.sync()
+                    if touched:
+                        logger.debug(f"Search index sync: {touched} changes applied")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Search index refresh failed: {e}")
+            await asyncio.sleep(settings.SEARCH_INDEX_POLL_SECONDS)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+_search_service: Optional[SearchIndexService] = None
+
+
+def get_search_service() -> SearchIndexService:
+    """Process-wide search service (the index is shared by routers and chat tools)."""
+    global _search_service
+    if _search_service is None:
+        _search_service = SearchIndexService()
+    return _search_service
+
+
+def get_search_index() -> Optional[SearchIndex]:
+    """The current index, or None while the first build is still running."""
+    return get_search_service().index
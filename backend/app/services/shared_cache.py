@@ -0,0 +1,353 @@
+"""
+Shared (L2) cache tier for the response caches in app.utils.cache.
+
+Every AsyncCache is per process, so with N gunicorn workers a cold scan or
+an upstream fetch is paid N times. Caches created with shared=True also go
+through this tier, which all workers (and instances) see:
+
+- L1 miss -> L2 lookup; an L2 hit is decoded and served without computing
+- L2 miss -> one worker takes a short lock and computes, the others wait
+  for its result to appear in L2 (up to SHARED_CACHE_LOCK_SECONDS, then
+  compute themselves), so a cold start is paid once per cluster
+- Values are stored as orjson with their store time, so every worker ages
+  an entry from when it was computed, not from when it loaded it
+
+Keys are versioned by topics. A namespace always depends on its own name
+and optionally on data topics ("markets", "cross_venue"). Bumping a topic
+(INCR on its version key) makes every key built on the old version
+unreachable, and a message on the invalidation channel tells every worker
+to drop its L1 entries for the affected namespaces. The data pipeline bumps
+"markets" after ingestion and "cross_venue" after matching
+(data-pipeline predictions_ingest/cache_events.py); the key and channel
+names below are shared with it.
+
+Backends: RedisBackend (any Redis-compatible server, redis.asyncio) and
+MemoryBackend, an in-process fake with the same semantics for local runs
+and tests (several SharedCache instances on one MemoryBackend behave like
+workers sharing one server). SHARED_CACHE_URL selects one: "redis://...",
+"memory://", or empty to disable the tier.
+"""
+import asyncio
+import hashlib
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+import orjson
+
+from app.config import settings
+
+# Try to import redis, but make it optional
+try:
+    import redis.asyncio as redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "cg:cache"
+INVALIDATION_CHANNEL = f"{KEY_PREFIX}:invalidate"
+_LOCK_POLL_SECONDS = 0.1
+
+
+def version_key(topic: str) -> str:
+    return f"{KEY_PREFIX}:ver:{topic}"
+
+
+def _default(obj: Any) -> Any:
+    """orjson fallback: pydantic models and namedtuples."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    if hasattr(obj, "_asdict"):
+        return obj._asdict()
+    raise TypeError(f"Cannot serialize {type(obj).__name__} for the shared cache")
+
+
+def dumps(value: Any) -> bytes:
+    return orjson.dumps(value, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+loads = orjson.loads
+
+
+# ============================================
+# Backends
+# ============================================
+
+class CacheBackend:
+    """Minimal key/value + pub/sub interface the tier needs."""
+
+    async def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    async def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        return [await self.get(k) for k in keys]
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        raise NotImplementedError
+
+    async def set_nx(self, key: str, value: bytes, ttl: float) -> bool:
+        """Set only if missing; True when set."""
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    async def incr(self, key: str) -> int:
+        raise NotImplementedError
+
+    async def publish(self, channel: str, message: bytes) -> None:
+        raise NotImplementedError
+
+    def subscribe(self, channel: str) -> AsyncIterator[bytes]:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryBackend(CacheBackend):
+    """In-process stand-in for a Redis server (expiry, NX locks, pub/sub)."""
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[bytes, Optional[float]]] = {}
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+
+    def _live(self, key: str) -> Optional[bytes]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        value, expires = item
+        if expires is not None and time.monotonic() >= expires:
+            del self._data[key]
+            return None
+        return value
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._live(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._data[key] = (value, time.monotonic() + ttl)
+
+    async def set_nx(self, key: str, value: bytes, ttl: float) -> bool:
+        if self._live(key) is not None:
+            return False
+        await self.set(key, value, ttl)
+        return True
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    async def incr(self, key: str) -> int:
+        value = int(self._live(key) or 0) + 1
+        self._data[key] = (str(value).encode(), None)
+        return value
+
+    async def publish(self, channel: str, message: bytes) -> None:
+        for queue in self._subscribers.get(channel, []):
+            queue.put_nowait(message)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[bytes]:
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(channel, []).append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._subscribers[channel].remove(queue)
+
+
+class RedisBackend(CacheBackend):
+    """Redis (or any server speaking its protocol) via redis.asyncio."""
+
+    def __init__(self, url: str):
+        self._redis = redis.from_url(url, socket_timeout=2.0, socket_connect_timeout=2.0)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._redis.get(key)
+
+    async def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        return await self._redis.mget(keys) if keys else []
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self._redis.set(key, value, px=max(int(ttl * 1000), 1))
+
+    async def set_nx(self, key: str, value: bytes, ttl: float) -> bool:
+        return bool(await self._redis.set(key, value, px=max(int(ttl * 1000), 1), nx=True))
+
+    async def delete(self, key: str) -> None:
+        await self._redis.delete(key)
+
+    async def incr(self, key: str) -> int:
+        return int(await self._redis.incr(key))
+
+    async def publish(self, channel: str, message: bytes) -> None:
+        await self._redis.publish(channel, message)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[bytes]:
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(channel)
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    yield message["data"]
+        finally:
+            await pubsub.aclose()
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+# ============================================
+# Tier
+# ============================================
+
+class SharedCache:
+    """
+    Versioned key/value tier over a CacheBackend. Backend errors are logged
+    and treated as misses: the caller computes locally, as without the tier.
+    """
+
+    def __init__(self, backend: CacheBackend, lock_seconds: float = 30.0):
+        self.backend = backend
+        self.lock_seconds = lock_seconds
+        self._versions: Dict[str, int] = {}
+        self._listener: Optional[asyncio.Task] = None
+
+    # ── keys ──────────────────────────────────────────────────────────────
+
+    async def _topic_versions(self, topics: Iterable[str]) -> Tuple[int, ...]:
+        topics = tuple(topics)
+        missing = [t for t in topics if t not in self._versions]
+        if missing:
+            raw = await self.backend.mget([version_key(t) for t in missing])
+            for topic, value in zip(missing, raw):
+                self._versions[topic] = int(value or 0)
+        return tuple(self._versions[t] for t in topics)
+
+    async def data_key(self, namespace: str, topics: Iterable[str], key: Any) -> str:
+        versions = await self._topic_versions(topics)
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()[:20]
+        return f"{KEY_PREFIX}:{namespace}:{'.'.join(map(str, versions))}:{digest}"
+
+    # ── values ────────────────────────────────────────────────────────────
+
+    async def get(self, data_key: str) -> Optional[Tuple[float, Any]]:
+        """(stored wall time, decoded JSON value) or None."""
+        try:
+            raw = await self.backend.get(data_key)
+        except Exception as e:
+            logger.warning(f"Shared cache get failed: {e}")
+            return None
+        if raw is None:
+            return None
+        item = loads(raw)
+        return item["t"], item["v"]
+
+    async def set(self, data_key: str, value: Any, ttl: float) -> None:
+        try:
+            await self.backend.set(data_key, dumps({"t": time.time(), "v": value}), ttl)
+        except Exception as e:
+            logger.warning(f"Shared cache set failed: {e}")
+
+    async def acquire(self, data_key: str) -> bool:
+        """Compute lock for a key; True when this worker should compute it."""
+        try:
+            return await self.backend.set_nx(f"{data_key}:lock", b"1", self.lock_seconds)
+        except Exception as e:
+            logger.warning(f"Shared cache lock failed: {e}")
+            return True
+
+    async def release(self, data_key: str) -> None:
+        try:
+            await self.backend.delete(f"{data_key}:lock")
+        except Exception:
+            pass
+
+    async def wait_for(self, data_key: str) -> Optional[Tuple[float, Any]]:
+        """Poll for a value another worker is computing, up to lock_seconds."""
+        deadline = time.monotonic() + self.lock_seconds
+        while time.monotonic() < deadline:
+            await asyncio.sleep(_LOCK_POLL_SECONDS)
+            hit = await self.get(data_key)
+            if hit is not None:
+                return hit
+        return None
+
+    # ── invalidation ──────────────────────────────────────────────────────
+
+    async def bump(self, *topics: str) -> None:
+        """New version for each topic, announced to every worker."""
+        versions = {topic: await self.backend.incr(version_key(topic)) for topic in topics}
+        self._apply(versions)
+        await self.backend.publish(INVALIDATION_CHANNEL, dumps({"topics": versions}))
+
+    def _apply(self, versions: Dict[str, int]) -> None:
+        from app.utils.cache import NAMESPACES
+
+        for topic, version in versions.items():
+            self._versions[topic] = max(self._versions.get(topic, 0), int(version))
+        changed = set(versions)
+        for cache in NAMESPACES.values():
+            if cache.shared and changed & set(cache.topics):
+                cache.invalidate()
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async for message in self.backend.subscribe(INVALIDATION_CHANNEL):
+                    self._apply(loads(message).get("topics", {}))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Shared cache subscription lost: {e}")
+            # Versions may have moved while disconnected
+            self._versions.clear()
+            await asyncio.sleep(1.0)
+
+    def start(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        await self.backend.close()
+
+
+_shared_cache: Optional[SharedCache] = None
+_shared_cache_configured = False
+
+
+def create_backend(url: str) -> Optional[CacheBackend]:
+    if not url:
+        return None
+    if url.startswith("memory://"):
+        return MemoryBackend()
+    if not REDIS_AVAILABLE:
+        logger.warning("SHARED_CACHE_URL is set but redis is not installed; shared cache disabled")
+        return None
+    return RedisBackend(url)
+
+
+def get_shared_cache() -> Optional[SharedCache]:
+    """Process-wide shared tier, or None when SHARED_CACHE_URL is unset."""
+    global _shared_cache, _shared_cache_configured
+    if not _shared_cache_configured:
+        _shared_cache_configured = True
+        backend = create_backend(settings.SHARED_CACHE_URL)
+        if backend is not None:
+            _shared_cache = SharedCache(backend, settings.SHARED_CACHE_LOCK_SECONDS)
+    return _shared_cache
+
+
+def set_shared_cache(shared: Optional[SharedCache]) -> None:
+    """Install a tier explicitly (tests, scripts)."""
+    global _shared_cache, _shared_cache_configured
+    _shared_cache, _shared_cache_configured = shared, True
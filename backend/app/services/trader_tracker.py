@@ -2,24 +2,433 @@
 Trader Tracker Service - Tracks and aggregates trader performance across platforms
 
 Fetches real trade data from platform APIs and calculates:
-- PnL (profit & loss)
-- Win rate
+- PnL (profit & loss), overall and for the last 24h / 7d / 30d
+- Win rate, largest win / loss and win / loss streaks
 - Volume
 - ROI
 - Sharpe ratio
 
 Data is stored in trader_stats table for fast leaderboard queries.
+
+Refreshes run in batches of TRADER_REFRESH_BATCH wallets:
+- Trades are fetched for TRADER_REFRESH_CONCURRENCY wallets at a time
+  through the shared fetch engine, each only since its cursor in
+  trader_sync_cursors (newest stored trade); the next batch is fetched
+  while the current one is written. A wallet cut off at
+  TRADER_SYNC_MAX_TRADES after an existing cursor only advances it if the
+  kept trades are the oldest ones, so no gap is skipped; a first sync
+  starts its cursor at the newest kept trade
+- New trades are merged into trader_trades, and stats are recomputed for
+  the whole batch from the stored trades with NumPy (compute_trader_stats)
+- trader_stats is written with one COPY and one merge per batch
+
+Requires migration 024 (trader_trades, trader_sync_cursors, streak columns).
 """
 
-import httpx
-import os
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta
-from decimal import Decimal
 import asyncio
-import asyncpg
+import math
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from app.config import settings
+from app.services.fetch_engine import get_fetch_engine, trade_epoch
+
+_PAGE_SIZE = 1000
+# Positions are tracked in integer micro-shares, so a sell of exactly the
+# shares held closes the position instead of leaving float dust behind
+_SHARE_UNITS = 1_000_000
+# Realized PnL closer to zero than this is neither a win nor a loss
+_FLAT_PNL = 1e-6
+_DAY = 86400
+
+_TRADE_COLUMNS = (
+    "wallet_address", "platform", "trade_key", "token_id", "market_slug",
+    "side", "price", "shares", "traded_at",
+)
+
+_STATS_COLUMNS = (
+    "wallet_address", "platform",
+    "total_pnl", "pnl_24h", "pnl_7d", "pnl_30d",
+    "total_volume", "volume_24h", "volume_7d", "volume_30d",
+    "total_trades", "trades_24h", "trades_7d", "trades_30d",
+    "total_wins", "total_losses", "win_rate",
+    "avg_position_size", "roi_percent",
+    "sharpe_ratio", "max_drawdown_percent", "consistency_score",
+    "avg_hold_duration_hours", "largest_win", "largest_loss",
+    "longest_win_streak", "longest_loss_streak", "current_streak",
+    "is_whale", "is_active_7d", "strategy_type",
+    "top_market_1", "top_market_1_volume",
+    "top_market_2", "top_market_2_volume",
+    "top_market_3", "top_market_3_volume",
+    "first_trade_at", "last_trade_at", "last_updated_at",
+)
+
+_CURSORS_SQL = """
+    SELECT wallet_address, extract(epoch FROM last_trade_at)::float8 AS since
+    FROM trader_sync_cursors
+    WHERE platform = $1 AND wallet_address = ANY($2::text[])
+"""
+
+_MERGE_TRADES_SQL = """
+    INSERT INTO trader_trades SELECT * FROM _trader_trades_batch
+    ON CONFLICT (wallet_address, platform, trade_key) DO NOTHING
+"""
+
+_ADVANCE_CURSORS_SQL = """
+    INSERT INTO trader_sync_cursors (wallet_address, platform, last_trade_at, synced_at)
+    SELECT c.wallet, $1, to_timestamp(c.newest), NOW()
+    FROM unnest($2::text[], $3::float8[]) AS c(wallet, newest)
+    ON CONFLICT (wallet_address, platform) DO UPDATE SET
+        last_trade_at = GREATEST(trader_sync_cursors.last_trade_at, EXCLUDED.last_trade_at),
+        synced_at = EXCLUDED.synced_at
+"""
+
+# All stored trades of a batch as one row of column arrays. The whole
+# history is reloaded on purpose: every stat is a function of it (rolling
+# 24h / 7d / 30d windows move with `now`; average costs, hold times, streaks
+# and top markets run over every trade), so bounding this read would mean
+# persisting position state and the realized series per wallet. The cost is
+# one primary-key range read per batch, linear in the batch's stored trades.
+_BATCH_TRADES_SQL = """
+    SELECT
+        array_agg(wallet_address) AS wallet,
+        array_agg(token_id) AS token,
+        array_agg(market_slug) AS market,
+        array_agg(side = 'BUY') AS is_buy,
+        array_agg(side = 'SELL') AS is_sell,
+        array_agg(price) AS price,
+        array_agg(shares) AS shares,
+        array_agg(extract(epoch FROM traded_at)::float8) AS ts
+    FROM trader_trades
+    WHERE platform = $1 AND wallet_address = ANY($2::text[])
+"""
+
+_MERGE_STATS_SQL = f"""
+    INSERT INTO trader_stats ({", ".join(_STATS_COLUMNS)})
+    SELECT {", ".join(_STATS_COLUMNS)} FROM _trader_stats_batch
+    ON CONFLICT (wallet_address, platform) DO UPDATE SET
+        {", ".join(f"{c} = EXCLUDED.{c}" for c in _STATS_COLUMNS[2:])}
+"""
+
+
+def _trade_key(trade: Dict) -> str:
+    ident = trade.get("order_hash") or trade.get("tx_hash") or trade.get("trade_id") or ""
+    return "|".join(str(v) for v in (
+        ident,
+        trade.get("token_id", ""),
+        trade.get("side", ""),
+        trade.get("timestamp", ""),
+        trade.get("shares_normalized", ""),
+    ))
+
+
+def _trade_row(wallet: str, platform: str, trade: Dict) -> Optional[Tuple]:
+    """trader_trades COPY row for a Dome order, or None without a timestamp."""
+    epoch = trade_epoch(trade)
+    if epoch is None:
+        return None
+    try:
+        price = float(trade.get("price") or 0)
+        shares = float(trade.get("shares_normalized") or 0)
+    except (TypeError, ValueError):
+        return None
+    if not (math.isfinite(price) and math.isfinite(shares)):
+        return None
+    return (
+        wallet,
+        platform,
+        _trade_key(trade),
+        str(trade.get("token_id") or ""),
+        str(trade.get("market_slug") or "unknown"),
+        str(trade.get("side") or "").upper(),
+        price,
+        shares,
+        datetime.fromtimestamp(epoch, timezone.utc),
+    )
+
+
+def _codes(values: Sequence[str]) -> Tuple[np.ndarray, List[str]]:
+    """Integer codes for values, plus the value of each code."""
+    index: Dict[str, int] = {}
+    codes = np.fromiter((index.setdefault(v, len(index)) for v in values), np.int64, len(values))
+    return codes, list(index)
+
+
+def _starts(*keys: np.ndarray) -> np.ndarray:
+    """Mask of rows where any of the (sorted) key columns changes."""
+    start = np.zeros(len(keys[0]), bool)
+    if len(start):
+        start[0] = True
+        for key in keys:
+            start[1:] |= key[1:] != key[:-1]
+    return start
+
+
+def _segment_cumsum(values: np.ndarray, start: np.ndarray, seg: np.ndarray) -> np.ndarray:
+    """Running sum that restarts at every segment start."""
+    total = np.cumsum(values)
+    first = np.flatnonzero(start)
+    return total - (total[first] - values[first])[seg]
+
+
+def _segment_cummin(values: np.ndarray, start: np.ndarray, seg: np.ndarray) -> np.ndarray:
+    """Running minimum that restarts at every segment start (integer values)."""
+    first = np.flatnonzero(start)
+    lo = np.minimum.reduceat(values, first)
+    hi = np.maximum.reduceat(values, first)
+    # Shift each segment entirely below the one before it, so a single
+    # accumulate never carries a minimum across a segment boundary
+    step = np.zeros_like(lo)
+    step[1:] = hi[1:] - lo[:-1] + 1
+    offset = np.cumsum(step)[seg]
+    return np.minimum.accumulate(values - offset) + offset
+
+
+def _segment_logcumsumexp(values: np.ndarray, seg: np.ndarray) -> np.ndarray:
+    """Running log(sum(exp(values))) that restarts at every segment (by id)."""
+    finite = values[np.isfinite(values)]
+    if not len(finite):
+        return values.copy()
+    # Lift each segment far enough above the previous ones that whatever
+    # they accumulated is below float precision (exp(-80) ~ 1e-35)
+    offset = seg * (finite.max() - finite.min() + 80.0)
+    return np.logaddexp.accumulate(values + offset) - offset
+
+
+def _strategy_types(avg_hold_hours: np.ndarray, win_rate: np.ndarray, trade_count: np.ndarray) -> np.ndarray:
+    """Classify trader strategy type (first matching rule wins)"""
+    return np.select(
+        [
+            (avg_hold_hours < 6) & (trade_count > 100),         # Scalper: very short holds, high frequency
+            (avg_hold_hours >= 6) & (avg_hold_hours <= 168),    # Swing trader: 6h-7days
+            avg_hold_hours > 168,                               # Long-term: >7 days
+            (win_rate > 0.7) & (trade_count > 50),              # Arbitrageur: high win rate
+        ],
+        ["scalper", "swing_trader", "long_term", "arbitrageur"],
+        default="mixed",
+    )
+
+
+def compute_trader_stats(
+    wallet: np.ndarray,
+    token: np.ndarray,
+    market: np.ndarray,
+    is_buy: np.ndarray,
+    is_sell: np.ndarray,
+    price: np.ndarray,
+    shares: np.ndarray,
+    ts: np.ndarray,
+    n_wallets: int,
+    now: float,
+) -> Dict[str, np.ndarray]:
+    """
+    Stats for many wallets at once from flat per-trade columns.
+
+    wallet, token and market are integer codes (wallet in range(n_wallets));
+    rows (at least one) may come in any order. Returns one array of length
+    n_wallets per stat; top_market_N holds market codes (-1 = none).
+
+    Positions are average-cost per (wallet, token): a BUY adds shares at
+    its price, a SELL realizes (price - average cost) on at most the shares
+    held and is ignored without a position. Hold duration runs from the
+    token's first BUY to each realizing SELL.
+    """
+    n = len(wallet)
+    zeros = lambda dtype=np.float64: np.zeros(n_wallets, dtype)  # noqa: E731
+    stats = {
+        "first_trade_at": zeros(), "last_trade_at": zeros(),
+        "largest_win": zeros(), "largest_loss": zeros(),
+        "longest_win_streak": zeros(np.int64), "longest_loss_streak": zeros(np.int64),
+        "current_streak": zeros(np.int64),
+    }
+    for k in (1, 2, 3):
+        stats[f"top_market_{k}"] = np.full(n_wallets, -1, np.int64)
+        stats[f"top_market_{k}_volume"] = zeros()
+
+    # Wallet-major, oldest first; within a second, buys before sells
+    order = np.lexsort((~is_buy, ts, wallet))
+    wallet, token, market, is_buy, is_sell, price, shares, ts = (
+        a[order] for a in (wallet, token, market, is_buy, is_sell, price, shares, ts)
+    )
+    value = price * shares
+
+    # ── position ledger, per (wallet, token) in time order ──────────────
+    g = np.lexsort((token, wallet))  # Stable, so each token stays oldest first
+    g_start = _starts(wallet[g], token[g])
+    g_seg = np.cumsum(g_start) - 1
+    g_buy, g_sell, g_price, g_shares = is_buy[g], is_sell[g], price[g], shares[g]
+
+    units = np.rint(g_shares * _SHARE_UNITS).astype(np.int64)
+    signed = np.where(g_buy, units, np.where(g_sell, -units, 0))
+    # Shares held = running sum floored at zero (a sell never goes short):
+    # the unfloored sum minus its running minimum below zero
+    level = _segment_cumsum(signed, g_start, g_seg)
+    held = level - np.minimum(_segment_cummin(level, g_start, g_seg), 0)
+    held_before = np.zeros_like(held)
+    held_before[1:] = held[:-1]
+    held_before[g_start] = 0
+
+    realizing = g_sell & (held_before > 0)
+    sold = np.where(realizing, held_before - held, 0) / _SHARE_UNITS
+    closing = realizing & (held == 0)
+
+    # Average cost at a sell = sum(price * shares / survival) / sum(shares /
+    # survival) over the buys since the position last closed, where
+    # survival is the fraction of the position kept by the partial sells
+    # before that buy (each sell takes the same fraction of every lot).
+    # Summed in log space: 1/survival spans many orders of magnitude
+    partial = realizing & ~closing
+    kept = np.where(partial, held, 1) / np.where(partial, held_before, 1)
+    e_start = g_start.copy()
+    e_start[1:] |= closing[:-1]
+    e_seg = np.cumsum(e_start) - 1
+    log_kept = _segment_cumsum(np.log(kept), e_start, e_seg)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_lot = np.where(g_buy, np.log(np.maximum(g_shares, 0)) - log_kept, -np.inf)
+        log_cost = log_lot + np.log(np.maximum(g_price, 0))
+        lot_shares = _segment_logcumsumexp(log_lot, e_seg)
+        lot_cost = _segment_logcumsumexp(log_cost, e_seg)
+        avg_cost = np.where(realizing, np.exp(lot_cost - lot_shares), g_price)
+
+    first_buy = np.minimum.reduceat(np.where(g_buy, ts[g], np.inf), np.flatnonzero(g_start))[g_seg]
+    realized = np.zeros(n, bool)
+    realized[g] = realizing
+    pnl = np.zeros(n)
+    pnl[g] = np.where(realizing, (g_price - avg_cost) * sold, 0.0)
+    hold_hours = np.zeros(n)
+    hold_hours[g] = np.where(realizing, (ts[g] - first_buy) / 3600, 0.0)
+
+    # ── per-wallet sums ───────────────────────────────────────────────────
+    def per_wallet(weights=None, mask=None):
+        if mask is None:
+            return np.bincount(wallet, weights, minlength=n_wallets)
+        return np.bincount(wallet[mask], None if weights is None else weights[mask], minlength=n_wallets)
+
+    win = realized & (pnl > _FLAT_PNL)
+    loss = realized & (pnl < -_FLAT_PNL)
+    stats["total_trades"] = per_wallet().astype(np.int64)
+    stats["total_volume"] = per_wallet(value)
+    stats["total_pnl"] = per_wallet(pnl)
+    stats["total_wins"] = per_wallet(mask=win).astype(np.int64)
+    stats["total_losses"] = per_wallet(mask=loss).astype(np.int64)
+    for days, suffix in ((1, "24h"), (7, "7d"), (30, "30d")):
+        recent = ts >= now - days * _DAY
+        stats[f"pnl_{suffix}"] = per_wallet(pnl, recent)
+        stats[f"volume_{suffix}"] = per_wallet(value, recent)
+        stats[f"trades_{suffix}"] = per_wallet(mask=recent).astype(np.int64)
+    realized_count = per_wallet(mask=realized)
+    hold_total = per_wallet(hold_hours, realized)
+
+    w_start = np.flatnonzero(_starts(wallet))
+    present = wallet[w_start]
+    stats["first_trade_at"][present] = ts[w_start]
+    stats["last_trade_at"][present] = ts[np.r_[w_start[1:], n] - 1]
+    stats["largest_win"][present] = np.maximum.reduceat(np.where(win, pnl, 0.0), w_start)
+    stats["largest_loss"][present] = np.minimum.reduceat(np.where(loss, pnl, 0.0), w_start)
+
+    # ── streaks: runs of wins / losses in time order ──────────────────────
+    outcome = np.flatnonzero(win | loss)
+    if len(outcome):
+        o_wallet = wallet[outcome]
+        o_sign = np.where(win[outcome], 1, -1)
+        run = np.flatnonzero(_starts(o_wallet, o_sign))
+        run_len = np.diff(np.r_[run, len(outcome)])
+        run_wallet, run_sign = o_wallet[run], o_sign[run]
+        np.maximum.at(stats["longest_win_streak"], run_wallet[run_sign > 0], run_len[run_sign > 0])
+        np.maximum.at(stats["longest_loss_streak"], run_wallet[run_sign < 0], run_len[run_sign < 0])
+        last_run = np.r_[run_wallet[1:] != run_wallet[:-1], True]
+        stats["current_streak"][run_wallet[last_run]] = (run_sign * run_len)[last_run]
+
+    # ── top 3 markets by volume (ties: first traded first) ────────────────
+    span = int(market.max()) + 1
+    pairs, first_seen, inverse = np.unique(
+        wallet.astype(np.int64) * span + market, return_index=True, return_inverse=True
+    )
+    volume = np.bincount(inverse.ravel(), value)
+    ranked = np.lexsort((first_seen, -volume, pairs // span))
+    p_wallet = (pairs // span)[ranked]
+    p_start = np.flatnonzero(_starts(p_wallet))
+    rank = np.arange(len(ranked)) - np.repeat(p_start, np.diff(np.r_[p_start, len(ranked)]))
+    for k in (1, 2, 3):
+        top = ranked[rank == k - 1]
+        stats[f"top_market_{k}"][pairs[top] // span] = pairs[top] % span
+        stats[f"top_market_{k}_volume"][pairs[top] // span] = volume[top]
+
+    # ── derived ───────────────────────────────────────────────────────────
+    trades = stats["total_trades"]
+    closed = stats["total_wins"] + stats["total_losses"]
+    stats["win_rate"] = np.divide(stats["total_wins"], closed, out=zeros(), where=closed > 0)
+    stats["roi_percent"] = np.divide(
+        stats["total_pnl"] * 100, stats["total_volume"], out=zeros(), where=stats["total_volume"] > 0
+    )
+    stats["avg_position_size"] = np.divide(stats["total_volume"], trades, out=zeros(), where=trades > 0)
+    stats["avg_hold_duration_hours"] = np.divide(hold_total, realized_count, out=zeros(), where=realized_count > 0)
+    # Whale detection: $50K+ avg position OR $500K+ volume
+    stats["is_whale"] = (stats["avg_position_size"] > 50000) | (stats["total_volume"] > 500000)
+    stats["is_active_7d"] = (trades > 0) & (stats["last_trade_at"] >= now - 7 * _DAY)
+    stats["strategy_type"] = _strategy_types(stats["avg_hold_duration_hours"], stats["win_rate"], trades)
+    return stats
+
+
+def _stats_dicts(stats: Dict[str, np.ndarray], wallets: Sequence[str], markets: Sequence[str]) -> List[Dict]:
+    """Rows (rounded like the leaderboard columns) for wallets with trades."""
+    cols = {k: v.tolist() for k, v in stats.items()}
+
+    def at(ts: float) -> datetime:
+        return datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None)
+
+    rows = []
+    for i, wallet in enumerate(wallets):
+        if not cols["total_trades"][i]:
+            continue
+        row = {
+            "wallet_address": wallet,
+            "sharpe_ratio": 0,  # Simplified for now
+            "max_drawdown_percent": 0,
+            "consistency_score": round(cols["win_rate"][i], 4),  # Use win_rate as proxy
+            "first_trade_at": at(cols["first_trade_at"][i]),
+            "last_trade_at": at(cols["last_trade_at"][i]),
+        }
+        for key in ("total_pnl", "pnl_24h", "pnl_7d", "pnl_30d",
+                    "total_volume", "volume_24h", "volume_7d", "volume_30d",
+                    "avg_position_size", "avg_hold_duration_hours", "largest_win", "largest_loss"):
+            row[key] = round(cols[key][i], 2)
+        for key in ("win_rate", "roi_percent"):
+            row[key] = round(cols[key][i], 4)
+        for key in ("total_trades", "trades_24h", "trades_7d", "trades_30d", "total_wins", "total_losses",
+                    "longest_win_streak", "longest_loss_streak", "current_streak",
+                    "is_whale", "is_active_7d", "strategy_type"):
+            row[key] = cols[key][i]
+        for k in (1, 2, 3):
+            code = cols[f"top_market_{k}"][i]
+            row[f"top_market_{k}"] = markets[code] if code >= 0 else None
+            row[f"top_market_{k}_volume"] = round(cols[f"top_market_{k}_volume"][i], 2)
+        rows.append(row)
+    return rows
+
+
+def _score_batch(wallets: Sequence[str], columns, now: float) -> List[Dict]:
+    """Stats rows for a batch from _BATCH_TRADES_SQL's column arrays."""
+    if columns is None or not columns["wallet"]:
+        return []
+    position = {w: i for i, w in enumerate(wallets)}
+    wallet = np.fromiter((position[w] for w in columns["wallet"]), np.int64, len(columns["wallet"]))
+    token, _ = _codes(columns["token"])
+    market, markets = _codes(columns["market"])
+    stats = compute_trader_stats(
+        wallet, token, market,
+        np.array(columns["is_buy"], bool),
+        np.array(columns["is_sell"], bool),
+        np.array(columns["price"], np.float64),
+        np.array(columns["shares"], np.float64),
+        np.array(columns["ts"], np.float64),
+        len(wallets), now,
+    )
+    return _stats_dicts(stats, wallets, markets)
 
 
 class TraderTracker:
@@ -30,6 +439,25 @@ class TraderTracker:
         self.dome_base_url = "https://api.domeapi.io/v1"
         self.headers = {"Authorization": f"Bearer {self.dome_api_key}"} if self.dome_api_key else {}
     
+    async def _get_orders(self, params: Dict) -> Dict:
+        """One page of Dome orders; retries rate limits and server errors, raises on failure."""
+        for attempt in range(3):
+            response = await get_fetch_engine().get(
+                f"{self.dome_base_url}/polymarket/orders",
+                headers=self.headers,
+                params=params
+            )
+            if response.status_code != 429 and response.status_code < 500:
+                break
+            try:
+                delay = float(response.headers.get("Retry-After") or 2 ** attempt)
+            except ValueError:
+                delay = 2 ** attempt
+            await asyncio.sleep(min(delay, 30))
+        response.raise_for_status()
+        data = response.json()
+        return data if isinstance(data, dict) else {"orders": data}
+    
     async def fetch_polymarket_trades(
         self,
         limit: int = 1000,
@@ -38,7 +466,7 @@ class TraderTracker:
         user: Optional[str] = None
     ) -> List[Dict]:
         """
-        Fetch Polymarket trades from Dome API
+        Fetch Polymarket trades from Dome API (paginated up to limit)
         
         Args:
             limit: Max number of trades to fetch
@@ -53,35 +481,56 @@ class TraderTracker:
             print("⚠️ DOME_API_KEY not set, cannot fetch Polymarket trades")
             return []
         
-        try:
-            params = {"limit": limit}
-            
-            if start_time:
-                params["start_time"] = int(start_time.timestamp())
-            if end_time:
-                params["end_time"] = int(end_time.timestamp())
-            if user:
-                params["user"] = user
-            
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    f"{self.dome_base_url}/polymarket/orders",
-                    headers=self.headers,
-                    params=params
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    trades = data.get("orders", []) if isinstance(data, dict) else data
-                    print(f"✅ Fetched {len(trades)} Polymarket trades")
-                    return trades
-                else:
-                    print(f"❌ Polymarket trades API error: {response.status_code}")
-                    return []
+        params = {"limit": min(limit, _PAGE_SIZE)}
+        if start_time:
+            params["start_time"] = int(start_time.timestamp())
+        if end_time:
+            params["end_time"] = int(end_time.timestamp())
+        if user:
+            params["user"] = user
         
+        trades = []
+        try:
+            while len(trades) < limit:
+                data = await self._get_orders(params)
+                page = data.get("orders", [])
+                trades.extend(page)
+                cursor = (data.get("pagination") or {}).get("pagination_key")
+                if not page or not cursor:
+                    break
+                params["pagination_key"] = cursor
         except Exception as e:
             print(f"❌ Error fetching Polymarket trades: {e}")
-            return []
+            if not trades:
+                return []
+        
+        trades = trades[:limit]
+        print(f"✅ Fetched {len(trades)} Polymarket trades")
+        return trades
+    
+    async def fetch_wallet_trades(self, wallet: str, since: Optional[float] = None) -> Tuple[List[Dict], bool]:
+        """
+        A wallet's trades since epoch `since` (all, if None), in API order,
+        and whether they were cut off at TRADER_SYNC_MAX_TRADES. Raises on
+        failure, so the caller keeps the wallet's cursor where it was.
+        """
+        params = {"user": wallet, "limit": _PAGE_SIZE}
+        if since is not None:
+            # Overlaps by up to a second; trader_trades' key drops the repeats
+            params["start_time"] = int(since)
+        
+        limit = settings.TRADER_SYNC_MAX_TRADES
+        trades: List[Dict] = []
+        while True:
+            data = await self._get_orders(params)
+            page = data.get("orders", [])
+            trades.extend(page)
+            cursor = (data.get("pagination") or {}).get("pagination_key")
+            if not page or not cursor:
+                return trades[:limit], len(trades) > limit
+            if len(trades) >= limit:
+                return trades[:limit], True
+            params["pagination_key"] = cursor
     
     def calculate_trader_stats(self, trades: List[Dict], wallet: str) -> Dict:
         """
@@ -94,130 +543,22 @@ class TraderTracker:
         Returns:
             Dict with calculated stats including enhanced metrics
         """
-        if not trades:
+        rows = [row for row in (_trade_row(wallet, "", t) for t in trades) if row]
+        if not rows:
             return self._empty_trader_stats(wallet)
         
-        # Initialize tracking vars
-        total_volume = 0
-        buy_positions = {}  # token_id -> {shares, cost, entry_time}
-        realized_pnl = 0
-        winning_trades = 0
-        losing_trades = 0
-        position_sizes = []
-        hold_durations = []
-        market_volumes = {}  # market_slug -> volume
-        
-        # Sort trades by timestamp
-        sorted_trades = sorted(trades, key=lambda t: t.get("timestamp", 0))
-        
-        for trade in sorted_trades:
-            side = trade.get("side", "").upper()
-            price = float(trade.get("price", 0))
-            shares = float(trade.get("shares_normalized", 0))
-            token_id = trade.get("token_id", "")
-            market_slug = trade.get("market_slug", "unknown")
-            timestamp = trade.get("timestamp", 0)
-            
-            # Track volume
-            trade_value = price * shares
-            total_volume += trade_value
-            position_sizes.append(trade_value)
-            
-            # Track market specialization
-            market_volumes[market_slug] = market_volumes.get(market_slug, 0) + trade_value
-            
-            # Track positions and PnL
-            if side == "BUY":
-                if token_id not in buy_positions:
-                    buy_positions[token_id] = {"shares": 0, "cost": 0, "entry_time": timestamp}
-                
-                buy_positions[token_id]["shares"] += shares
-                buy_positions[token_id]["cost"] += trade_value
-            
-            elif side == "SELL" and token_id in buy_positions:
-                if buy_positions[token_id]["shares"] > 0:
-                    sell_shares = min(shares, buy_positions[token_id]["shares"])
-                    avg_cost = buy_positions[token_id]["cost"] / buy_positions[token_id]["shares"]
-                    
-                    # Calculate realized PnL
-                    cost_basis = avg_cost * sell_shares
-                    sale_proceeds = price * sell_shares
-                    pnl = sale_proceeds - cost_basis
-                    realized_pnl += pnl
-                    
-                    # Track hold duration (in hours)
-                    if buy_positions[token_id]["entry_time"]:
-                        duration = (timestamp - buy_positions[token_id]["entry_time"]) / 3600
-                        hold_durations.append(duration)
-                    
-                    if pnl > 0:
-                        winning_trades += 1
-                    elif pnl < 0:
-                        losing_trades += 1
-                    
-                    # Update position
-                    buy_positions[token_id]["shares"] -= sell_shares
-                    buy_positions[token_id]["cost"] -= cost_basis
-        
-        # Calculate metrics
-        total_closed = winning_trades + losing_trades
-        win_rate = winning_trades / total_closed if total_closed > 0 else 0
-        roi_percent = (realized_pnl / total_volume * 100) if total_volume > 0 else 0
-        avg_position_size = sum(position_sizes) / len(position_sizes) if position_sizes else 0
-        avg_hold_duration = sum(hold_durations) / len(hold_durations) if hold_durations else 0
-        
-        # Whale detection: $50K+ avg position OR $500K+ volume
-        is_whale = avg_position_size > 50000 or total_volume > 500000
-        
-        # Activity check: traded in last 7 days
-        last_trade_time = datetime.fromtimestamp(sorted_trades[-1].get("timestamp", 0)) if sorted_trades else None
-        is_active_7d = False
-        if last_trade_time:
-            is_active_7d = (datetime.utcnow() - last_trade_time).days <= 7
-        
-        # Strategy classification based on hold duration and activity
-        strategy_type = self._classify_strategy(avg_hold_duration, win_rate, len(trades))
-        
-        # Top 3 markets by volume
-        top_markets = sorted(market_volumes.items(), key=lambda x: x[1], reverse=True)[:3]
-        
-        return {
-            "wallet_address": wallet,
-            "total_pnl": round(realized_pnl, 2),
-            "pnl_24h": round(realized_pnl * 0.05, 2),
-            "pnl_7d": round(realized_pnl * 0.15, 2),
-            "pnl_30d": round(realized_pnl * 0.40, 2),
-            "total_volume": round(total_volume, 2),
-            "volume_24h": round(total_volume * 0.05, 2),
-            "volume_7d": round(total_volume * 0.15, 2),
-            "volume_30d": round(total_volume * 0.40, 2),
-            "total_trades": len(trades),
-            "trades_24h": max(1, int(len(trades) * 0.05)),
-            "trades_7d": max(1, int(len(trades) * 0.15)),
-            "trades_30d": max(1, int(len(trades) * 0.40)),
-            "total_wins": winning_trades,
-            "total_losses": losing_trades,
-            "win_rate": round(win_rate, 4),
-            "avg_position_size": round(avg_position_size, 2),
-            "roi_percent": round(roi_percent, 4),
-            "sharpe_ratio": 0,  # Simplified for now
-            "max_drawdown_percent": 0,
-            "consistency_score": round(win_rate, 4),  # Use win_rate as proxy
-            "avg_hold_duration_hours": round(avg_hold_duration, 2),
-            "is_whale": is_whale,
-            "is_active_7d": is_active_7d,
-            "strategy_type": strategy_type,
-            "top_market_1": top_markets[0][0] if len(top_markets) > 0 else None,
-            "top_market_1_volume": round(top_markets[0][1], 2) if len(top_markets) > 0 else 0,
-            "top_market_2": top_markets[1][0] if len(top_markets) > 1 else None,
-            "top_market_2_volume": round(top_markets[1][1], 2) if len(top_markets) > 1 else 0,
-            "top_market_3": top_markets[2][0] if len(top_markets) > 2 else None,
-            "top_market_3_volume": round(top_markets[2][1], 2) if len(top_markets) > 2 else 0,
-            "largest_win": 0,
-            "largest_loss": 0,
-            "first_trade_at": datetime.fromtimestamp(sorted_trades[0].get("timestamp", 0)) if sorted_trades else None,
-            "last_trade_at": last_trade_time,
-        }
+        token, _ = _codes([r[3] for r in rows])
+        market, markets = _codes([r[4] for r in rows])
+        stats = compute_trader_stats(
+            np.zeros(len(rows), np.int64), token, market,
+            np.array([r[5] == "BUY" for r in rows]),
+            np.array([r[5] == "SELL" for r in rows]),
+            np.array([r[6] for r in rows], np.float64),
+            np.array([r[7] for r in rows], np.float64),
+            np.array([r[8].timestamp() for r in rows], np.float64),
+            1, time.time(),
+        )
+        return _stats_dicts(stats, [wallet], markets)[0]
     
     def _empty_trader_stats(self, wallet: str) -> Dict:
         """Return empty stats dict"""
@@ -234,23 +575,6 @@ class TraderTracker:
             "top_market_1": None,
         }
     
-    def _classify_strategy(self, avg_hold_hours: float, win_rate: float, trade_count: int) -> str:
-        """Classify trader strategy type"""
-        # Scalper: Very short holds (<6h), high frequency
-        if avg_hold_hours < 6 and trade_count > 100:
-            return "scalper"
-        # Swing trader: 6h-7days
-        elif 6 <= avg_hold_hours <= 168:
-            return "swing_trader"
-        # Long-term: >7 days
-        elif avg_hold_hours > 168:
-            return "long_term"
-        # Arbitrageur: High win rate (>70%)
-        elif win_rate > 0.7 and trade_count > 50:
-            return "arbitrageur"
-        else:
-            return "mixed"
-    
     async def discover_active_traders(self, limit: int = 10000, days: int = 90) -> List[str]:
         """
         Discover active traders from recent trades
@@ -304,94 +628,126 @@ class TraderTracker:
             wallet: Trader's wallet address
             platform: Platform name
         """
-        # Fetch trader's trades
-        trades = await self.fetch_polymarket_trades(user=wallet, limit=1000)
-        
-        if not trades:
+        result = await self.refresh_wallets(db_pool, [wallet], platform=platform)
+        if result["scored"]:
+            print(f"✅ Updated stats for {wallet[:10]}...")
+        else:
             print(f"⚠️ No trades found for {wallet[:10]}...")
-            return
+    
+    async def _fetch_batch(
+        self, db_pool, wallets: List[str], platform: str
+    ) -> Tuple[List[Tuple], Dict[str, Optional[float]], int]:
+        """New trades of a batch: (trader_trades rows, wallet -> new cursor epoch, failures)."""
+        async with db_pool.acquire() as conn:
+            cursors = {r["wallet_address"]: r["since"] for r in await conn.fetch(_CURSORS_SQL, platform, wallets)}
         
-        # Calculate stats
-        stats = self.calculate_trader_stats(trades, wallet)
-        stats["platform"] = platform
+        slots = asyncio.Semaphore(settings.TRADER_REFRESH_CONCURRENCY)
         
-        # Upsert into database with ALL enhanced fields
+        async def fetch(wallet: str) -> Tuple[List[Dict], bool]:
+            async with slots:
+                return await self.fetch_wallet_trades(wallet, cursors.get(wallet))
+        
+        results = await asyncio.gather(*(fetch(w) for w in wallets), return_exceptions=True)
+        
+        rows: List[Tuple] = []
+        synced: Dict[str, Optional[float]] = {}
+        failed = 0
+        for wallet, result in zip(wallets, results):
+            if isinstance(result, BaseException):
+                failed += 1
+                if failed <= 3:
+                    print(f"❌ Error fetching trades for {wallet[:10]}...: {result}")
+                continue
+            trades, truncated = result
+            times = []
+            for trade in trades:
+                row = _trade_row(wallet, platform, trade)
+                if row:
+                    rows.append(row)
+                    times.append(row[-1].timestamp())
+            # The cursor may only move to a time up to which every trade is
+            # stored. A cut-off newest-first fetch since an existing cursor is
+            # missing the oldest trades after it, so that cursor stays put
+            # (None keeps it). A first sync keeps the newest
+            # TRADER_SYNC_MAX_TRADES as the wallet's history and starts from them
+            if truncated:
+                print(f"⚠️ {wallet[:10]}... has more than {settings.TRADER_SYNC_MAX_TRADES} new trades")
+            held = truncated and cursors.get(wallet) is not None and times and times[0] > times[-1]
+            synced[wallet] = max(times) if times and not held else None
+        return rows, synced, failed
+    
+    async def _store_and_score(
+        self, db_pool, wallets: List[str], platform: str,
+        rows: List[Tuple], synced: Dict[str, Optional[float]]
+    ) -> Tuple[int, int]:
+        """Merge new trades, advance cursors and rewrite the batch's stats: (new trades, wallets scored)."""
+        inserted = 0
         async with db_pool.acquire() as conn:
-            await conn.execute("""
-                INSERT INTO trader_stats (
-                    wallet_address, platform,
-                    total_pnl, pnl_24h, pnl_7d, pnl_30d,
-                    total_volume, volume_24h, volume_7d, volume_30d,
-                    total_trades, trades_24h, trades_7d, trades_30d,
-                    total_wins, total_losses, win_rate,
-                    avg_position_size, roi_percent,
-                    sharpe_ratio, max_drawdown_percent, consistency_score,
-                    avg_hold_duration_hours, largest_win, largest_loss,
-                    is_whale, is_active_7d, strategy_type,
-                    top_market_1, top_market_1_volume,
-                    top_market_2, top_market_2_volume,
-                    top_market_3, top_market_3_volume,
-                    first_trade_at, last_trade_at, last_updated_at
-                ) VALUES (
-                    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10,
-                    $11, $12, $13, $14, $15, $16, $17, $18, $19,
-                    $20, $21, $22, $23, $24, $25, $26, $27, $28,
-                    $29, $30, $31, $32, $33, $34, $35
+            async with conn.transaction():
+                if rows:
+                    await conn.execute("CREATE TEMP TABLE _trader_trades_batch (LIKE trader_trades) ON COMMIT DROP")
+                    await conn.copy_records_to_table("_trader_trades_batch", records=rows, columns=_TRADE_COLUMNS)
+                    inserted = int((await conn.execute(_MERGE_TRADES_SQL)).split()[-1])
+                if synced:
+                    await conn.execute(_ADVANCE_CURSORS_SQL, platform, list(synced), list(synced.values()))
+                columns = await conn.fetchrow(_BATCH_TRADES_SQL, platform, wallets)
+            
+            stats = await asyncio.to_thread(_score_batch, wallets, columns, time.time())
+            if not stats:
+                return inserted, 0
+            
+            updated_at = datetime.utcnow()
+            records = [
+                tuple(updated_at if c == "last_updated_at" else platform if c == "platform" else row[c]
+                      for c in _STATS_COLUMNS)
+                for row in stats
+            ]
+            async with conn.transaction():
+                await conn.execute(
+                    f"CREATE TEMP TABLE _trader_stats_batch ON COMMIT DROP AS "
+                    f"SELECT {', '.join(_STATS_COLUMNS)} FROM trader_stats WITH NO DATA"
                 )
-                ON CONFLICT (wallet_address, platform)
-                DO UPDATE SET
-                    total_pnl = EXCLUDED.total_pnl,
-                    pnl_24h = EXCLUDED.pnl_24h,
-                    pnl_7d = EXCLUDED.pnl_7d,
-                    pnl_30d = EXCLUDED.pnl_30d,
-                    total_volume = EXCLUDED.total_volume,
-                    volume_24h = EXCLUDED.volume_24h,
-                    volume_7d = EXCLUDED.volume_7d,
-                    volume_30d = EXCLUDED.volume_30d,
-                    total_trades = EXCLUDED.total_trades,
-                    trades_24h = EXCLUDED.trades_24h,
-                    trades_7d = EXCLUDED.trades_7d,
-                    trades_30d = EXCLUDED.trades_30d,
-                    total_wins = EXCLUDED.total_wins,
-                    total_losses = EXCLUDED.total_losses,
-                    win_rate = EXCLUDED.win_rate,
-                    avg_position_size = EXCLUDED.avg_position_size,
-                    roi_percent = EXCLUDED.roi_percent,
-                    sharpe_ratio = EXCLUDED.sharpe_ratio,
-                    max_drawdown_percent = EXCLUDED.max_drawdown_percent,
-                    consistency_score = EXCLUDED.consistency_score,
-                    avg_hold_duration_hours = EXCLUDED.avg_hold_duration_hours,
-                    largest_win = EXCLUDED.largest_win,
-                    largest_loss = EXCLUDED.largest_loss,
-                    is_whale = EXCLUDED.is_whale,
-                    is_active_7d = EXCLUDED.is_active_7d,
-                    strategy_type = EXCLUDED.strategy_type,
-                    top_market_1 = EXCLUDED.top_market_1,
-                    top_market_1_volume = EXCLUDED.top_market_1_volume,
-                    top_market_2 = EXCLUDED.top_market_2,
-                    top_market_2_volume = EXCLUDED.top_market_2_volume,
-                    top_market_3 = EXCLUDED.top_market_3,
-                    top_market_3_volume = EXCLUDED.top_market_3_volume,
-                    first_trade_at = EXCLUDED.first_trade_at,
-                    last_trade_at = EXCLUDED.last_trade_at,
-                    last_updated_at = EXCLUDED.last_updated_at
-            """, 
-                wallet, platform,
-                stats["total_pnl"], stats["pnl_24h"], stats["pnl_7d"], stats["pnl_30d"],
-                stats["total_volume"], stats["volume_24h"], stats["volume_7d"], stats["volume_30d"],
-                stats["total_trades"], stats["trades_24h"], stats["trades_7d"], stats["trades_30d"],
-                stats["total_wins"], stats["total_losses"], stats["win_rate"],
-                stats["avg_position_size"], stats["roi_percent"],
-                stats["sharpe_ratio"], stats["max_drawdown_percent"], stats["consistency_score"],
-                stats["avg_hold_duration_hours"], stats["largest_win"], stats["largest_loss"],
-                stats["is_whale"], stats["is_active_7d"], stats["strategy_type"],
-                stats["top_market_1"], stats["top_market_1_volume"],
-                stats["top_market_2"], stats["top_market_2_volume"],
-                stats["top_market_3"], stats["top_market_3_volume"],
-                stats["first_trade_at"], stats["last_trade_at"], datetime.utcnow()
-            )
+                await conn.copy_records_to_table("_trader_stats_batch", records=records, columns=_STATS_COLUMNS)
+                await conn.execute(_MERGE_STATS_SQL)
+        return inserted, len(stats)
+    
+    async def refresh_wallets(self, db_pool, wallets: Iterable[str], platform: str = "polymarket") -> Dict:
+        """
+        Sync and rescore wallets in batches of TRADER_REFRESH_BATCH
+        
+        Each batch is fetched incrementally (TRADER_REFRESH_CONCURRENCY wallets
+        at a time) while the previous batch is being written. A wallet whose
+        fetch fails keeps its cursor and is scored from its stored trades.
         
-        print(f"✅ Updated stats for {wallet[:10]}...")
+        Returns:
+            Dict with wallets, new_trades, scored and failed counts
+        """
+        wallets = list(dict.fromkeys(wallets))
+        size = max(settings.TRADER_REFRESH_BATCH, 1)
+        batches = [wallets[i:i + size] for i in range(0, len(wallets), size)]
+        totals = {"wallets": len(wallets), "new_trades": 0, "scored": 0, "failed": 0}
+        if not batches:
+            return totals
+        
+        started = time.time()
+        pending = asyncio.create_task(self._fetch_batch(db_pool, batches[0], platform))
+        try:
+            for i, batch in enumerate(batches):
+                rows, synced, failed = await pending
+                if i + 1 < len(batches):
+                    pending = asyncio.create_task(self._fetch_batch(db_pool, batches[i + 1], platform))
+                inserted, scored = await self._store_and_score(db_pool, batch, platform, rows, synced)
+                totals["new_trades"] += inserted
+                totals["scored"] += scored
+                totals["failed"] += failed
+                if len(batches) > 1:
+                    done = min((i + 1) * size, len(wallets))
+                    print(f"📊 Progress: {done}/{len(wallets)} traders processed "
+                          f"({inserted} new trades, {time.time() - started:.0f}s)")
+        finally:
+            if not pending.done():
+                pending.cancel()
+        return totals
     
     async def refresh_all_traders(self, db_pool, max_traders: int = 2000, lookback_days: int = 90):
         """
@@ -400,7 +756,7 @@ class TraderTracker:
         Strategy: Fetches trades from last N days, discovers traders, and calculates their stats.
         Traders are sorted by trade frequency, so we prioritize the most active traders.
         
-        Note: This discovers the top N most ACTIVE traders (by trade count), 
+        Note: This discovers the top N most ACTIVE traders (by trade count),
         then ranks them by PnL in the leaderboard.
         
         Args:
@@ -419,22 +775,12 @@ class TraderTracker:
         
         print(f"🎯 Processing top {len(traders)} most active traders...")
         
-        # Update stats for each trader (with rate limiting)
-        for i, wallet in enumerate(traders, 1):
-            try:
-                await self.update_trader_stats(db_pool, wallet, platform="polymarket")
-                
-                if i % 10 == 0:
-                    print(f"📊 Progress: {i}/{len(traders)} traders processed")
-                
-                # Rate limiting: 1 request per second to avoid API limits
-                await asyncio.sleep(1)
-            
-            except Exception as e:
-                print(f"❌ Error updating {wallet[:10]}...: {e}")
-                continue
+        started = time.time()
+        result = await self.refresh_wallets(db_pool, traders, platform="polymarket")
         
-        print(f"✅ Trader stats refresh complete! Processed {len(traders)} traders")
+        print(f"✅ Trader stats refresh complete! Processed {len(traders)} traders in "
+              f"{time.time() - started:.0f}s ({result['scored']} scored, "
+              f"{result['new_trades']} new trades, {result['failed']} fetch failures)")
 
 
 # Singleton instance
@@ -1,15 +1,33 @@
 """
 Caching middleware for API responses
 Uses in-memory TTL cache for frequently accessed data
+
+cached / cached_sync: plain TTL caches keyed on every argument.
+
+AsyncCache / cached_v2: namespaced async caches for hot, expensive
+results (scans, snapshots, upstream fetches):
+- single flight: concurrent misses on one key share one computation
+- stale-while-revalidate: within stale_ttl past expiry the old value is
+  served and one background task recomputes it
+- keys are built from the bound arguments, skipping FastAPI-injected
+  dependencies (Depends(...) defaults, sessions, requests)
+- per-namespace hit/miss/latency counters (get_cache_stats)
+- shared=True adds the cross-worker tier in app.services.shared_cache
 """
 
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple, TypeVar
 from cachetools import TTLCache
 from datetime import datetime
+from enum import Enum
+import asyncio
 import hashlib
+import inspect
 import json
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -160,7 +178,7 @@ def invalidate_cache(pattern: Optional[str] = None, ttl: Optional[str] = None):
 
 def get_cache_stats() -> dict:
     """Get statistics about all caches"""
-    return {
+    stats = {
         name: {
             "size": len(cache),
             "maxsize": cache.maxsize,
@@ -169,6 +187,342 @@ def get_cache_stats() -> dict:
         }
         for name, cache in CACHES.items()
     }
+    stats["namespaces"] = {name: c.stats() for name, c in NAMESPACES.items()}
+    return stats
+
+
+# ============================================
+# v2: single-flight, stale-while-revalidate caches
+# ============================================
+
+T = TypeVar("T")
+
+# Registry of AsyncCache instances by namespace
+NAMESPACES: Dict[str, "AsyncCache"] = {}
+
+
+@dataclass
+class CacheMetrics:
+    """Counters for one namespace."""
+    hits: int = 0
+    stale_hits: int = 0     # served past ttl while a refresh runs
+    shared_hits: int = 0    # computations answered by the shared tier
+    misses: int = 0         # caller waited for a computation
+    coalesced: int = 0      # misses that joined an in-flight computation
+    refreshes: int = 0      # background stale-while-revalidate recomputes
+    errors: int = 0
+    compute_count: int = 0
+    compute_seconds: float = 0.0
+    compute_max_seconds: float = 0.0
+
+    def record_compute(self, seconds: float) -> None:
+        self.compute_count += 1
+        self.compute_seconds += seconds
+        self.compute_max_seconds = max(self.compute_max_seconds, seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "refreshes": self.refreshes,
+            "errors": self.errors,
+            "hit_rate": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+            "avg_compute_ms": round(self.compute_seconds / self.compute_count * 1000, 1) if self.compute_count else 0.0,
+            "max_compute_ms": round(self.compute_max_seconds * 1000, 1),
+        }
+
+
+@dataclass
+class _Entry:
+    value: Any
+    stored_at: float = field(default_factory=time.monotonic)
+
+
+class AsyncCache:
+    """
+    Async cache for one namespace. Entries are fresh for ttl seconds and
+    served stale (with a background refresh) for stale_ttl more; the
+    least recently used entry is dropped past maxsize.
+
+    Failed computations are not cached: every caller waiting on one gets
+    the exception, and a failed background refresh keeps the stale value.
+
+    With shared=True a computation first looks in the shared tier (when
+    SHARED_CACHE_URL configures one) and stores its result there; topics
+    are the data topics whose version bumps invalidate the namespace.
+    encode/decode convert values to and from JSON-compatible data (pydantic
+    models and namedtuples encode automatically, but decode to dicts).
+
+    Use from the event loop only.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl: float,
+        stale_ttl: float = 0.0,
+        maxsize: int = 256,
+        shared: bool = False,
+        topics: Iterable[str] = (),
+        encode: Optional[Callable[[Any], Any]] = None,
+        decode: Optional[Callable[[Any], Any]] = None,
+    ):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.maxsize = maxsize
+        self.shared = shared
+        self.topics: Tuple[str, ...] = (namespace, *topics)
+        self._encode = encode or (lambda value: value)
+        self._decode = decode or (lambda raw: raw)
+        self.metrics = CacheMetrics()
+        self._entries: "OrderedDict[Any, _Entry]" = OrderedDict()
+        self._inflight: Dict[Any, asyncio.Future] = {}
+        NAMESPACES[namespace] = self
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def age(self, key: Any = "") -> Optional[float]:
+        """Seconds since key was stored, or None if it is not cached."""
+        entry = self._entries.get(key)
+        return time.monotonic() - entry.stored_at if entry else None
+
+    def peek(self, key: Any = "") -> Optional[Any]:
+        """Cached value (fresh or stale) without computing or counting a lookup."""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry.stored_at >= self.ttl + self.stale_ttl:
+            return None
+        return entry.value
+
+    def set(self, key: Any, value: Any, stored_at: Optional[float] = None) -> None:
+        self._entries[key] = _Entry(value, stored_at if stored_at is not None else time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Any = None) -> None:
+        """Drop one key, or everything when key is None."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def get_or_compute(self, key: Any, compute: Callable[[], Awaitable[T]]) -> T:
+        """Cached value for key, computing it (once across concurrent callers) when missing."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry.stored_at
+            if age < self.ttl:
+                self.metrics.hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+            if age < self.ttl + self.stale_ttl:
+                self.metrics.stale_hits += 1
+                self.refresh_nowait(key, compute)
+                return entry.value
+
+        self.metrics.misses += 1
+        future = self._inflight.get(key)
+        if future is not None:
+            self.metrics.coalesced += 1
+            return await asyncio.shield(future)
+        return await asyncio.shield(self._start(key, compute))
+
+    def get_nowait(self, key: Any, compute: Callable[[], Awaitable[T]]) -> Optional[T]:
+        """
+        Cached value (fresh or stale) or None, never waiting; a missing or
+        stale key is computed in the background for later callers.
+        """
+        entry = self._entries.get(key)
+        age = time.monotonic() - entry.stored_at if entry else None
+        if age is not None and age < self.ttl:
+            self.metrics.hits += 1
+            return entry.value
+        self.refresh_nowait(key, compute)
+        if age is not None and age < self.ttl + self.stale_ttl:
+            self.metrics.stale_hits += 1
+            return entry.value
+        self.metrics.misses += 1
+        return None
+
+    def refresh_nowait(self, key: Any, compute: Callable[[], Awaitable[T]]) -> None:
+        """Recompute key in the background unless a computation is already running."""
+        if key not in self._inflight:
+            self.metrics.refreshes += 1
+            future = self._start(key, compute)
+            # Nobody may await a background refresh; consume its exception
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+    async def refresh(self, key: Any, compute: Callable[[], Awaitable[T]]) -> T:
+        """Recompute key now (joining a running computation) and return the new value."""
+        future = self._inflight.get(key) or self._start(key, compute)
+        return await asyncio.shield(future)
+
+    def _start(self, key: Any, compute: Callable[[], Awaitable[T]]) -> asyncio.Future:
+        # A task, not the caller's coroutine: a cancelled request must not
+        # cancel the computation other callers are waiting on
+        task = asyncio.ensure_future(self._compute(key, compute))
+        self._inflight[key] = task
+        return task
+
+    async def _compute(self, key: Any, compute: Callable[[], Awaitable[T]]) -> T:
+        start = time.monotonic()
+        try:
+            value, stored_at = await self._load(key, compute)
+        except Exception as e:
+            self.metrics.errors += 1
+            logger.warning(f"Cache compute failed [{self.namespace}:{key}]: {e}")
+            raise
+        finally:
+            self._inflight.pop(key, None)
+            self.metrics.record_compute(time.monotonic() - start)
+        self.set(key, value, stored_at)
+        return value
+
+    async def _load(self, key: Any, compute: Callable[[], Awaitable[T]]) -> Tuple[T, float]:
+        """Value and its (monotonic) store time, via the shared tier when enabled."""
+        from app.services.shared_cache import get_shared_cache
+
+        tier = get_shared_cache() if self.shared else None
+        if tier is None:
+            return await compute(), time.monotonic()
+        try:
+            data_key = await tier.data_key(self.namespace, self.topics, key)
+        except Exception as e:
+            logger.warning(f"Shared cache unavailable [{self.namespace}]: {e}")
+            return await compute(), time.monotonic()
+
+        hit = await tier.get(data_key)
+        # A stale shared value is recomputed, not re-served as new
+        if hit is not None and time.time() - hit[0] >= self.ttl:
+            hit = None
+        locked = False
+        if hit is None:
+            locked = await tier.acquire(data_key)
+            if not locked:
+                # Another worker is computing it
+                hit = await tier.wait_for(data_key)
+        if hit is not None:
+            self.metrics.shared_hits += 1
+            stored, raw = hit
+            return self._decode(raw), time.monotonic() - max(time.time() - stored, 0.0)
+
+        try:
+            value = await compute()
+            await tier.set(data_key, self._encode(value), self.ttl + self.stale_ttl)
+        finally:
+            if locked:
+                await tier.release(data_key)
+        return value, time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "stale_ttl": self.stale_ttl,
+            "shared": self.shared,
+            "inflight": len(self._inflight),
+            **self.metrics.to_dict(),
+        }
+
+
+# Argument types that are injected per request and never part of a key
+_INJECTED_TYPE_NAMES = {"Session", "AsyncSession", "AsyncDB", "Request", "WebSocket", "BackgroundTasks", "Response"}
+
+
+def _is_injected(param: inspect.Parameter, value: Any) -> bool:
+    # FastAPI dependency defaults: Depends(...) / Security(...)
+    if type(param.default).__name__ in ("Depends", "Security"):
+        return True
+    return any(cls.__name__ in _INJECTED_TYPE_NAMES for cls in type(value).__mro__)
+
+
+def _key_value(value: Any) -> Any:
+    """Hashable, stable form of an argument value."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (list, tuple)):
+        return tuple(_key_value(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(_key_value(v) for v in value))
+    if isinstance(value, dict):
+        return tuple(sorted((k, _key_value(v)) for k, v in value.items()))
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return repr(value)
+
+
+def build_key(func: Callable, args: tuple, kwargs: dict, ignore: Iterable[str] = ()) -> Tuple:
+    """
+    Cache key for a call: (name, value) pairs of the bound arguments with
+    defaults applied, skipping injected dependencies and names in ignore.
+    f(1) and f(x=1) give the same key.
+    """
+    signature = inspect.signature(func)
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    ignore = set(ignore)
+    return tuple(
+        (name, _key_value(value))
+        for name, value in bound.arguments.items()
+        if name not in ignore and not _is_injected(signature.parameters[name], value)
+    )
+
+
+def cached_v2(
+    namespace: str,
+    ttl: float,
+    stale_ttl: float = 0.0,
+    maxsize: int = 256,
+    key: Optional[Callable[..., Any]] = None,
+    ignore: Iterable[str] = (),
+    shared: bool = False,
+    topics: Iterable[str] = (),
+    encode: Optional[Callable[[Any], Any]] = None,
+    decode: Optional[Callable[[Any], Any]] = None,
+):
+    """
+    Decorator for async functions: single-flight, stale-while-revalidate
+    cache in its own namespace.
+
+    Args:
+        namespace: Metrics and registry name (unique per cache)
+        ttl: Seconds a result is fresh
+        stale_ttl: Seconds past ttl a result is still served while it is
+            recomputed in the background
+        maxsize: Entries kept (least recently used dropped first)
+        key: Optional key builder called with the function's arguments;
+            defaults to build_key
+        ignore: Argument names left out of the default key
+        shared, topics, encode, decode: shared tier options (see AsyncCache)
+
+    The wrapper exposes the AsyncCache as .cache (invalidate, peek, ...).
+
+    Usage:
+        @cached_v2("arbitrage", ttl=20)
+        async def scan(min_spread: float, db: AsyncDB):
+            ...
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        cache = AsyncCache(
+            namespace, ttl=ttl, stale_ttl=stale_ttl, maxsize=maxsize,
+            shared=shared, topics=topics, encode=encode, decode=decode,
+        )
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> T:
+            cache_key = key(*args, **kwargs) if key else build_key(func, args, kwargs, ignore)
+            return await cache.get_or_compute(cache_key, lambda: func(*args, **kwargs))
+
+        wrapper.cache = cache
+        return wrapper
+    return decorator
 
 
 # ============================================
@@ -1,13 +1,15 @@
 """
 CoinGraph AI Backend - FastAPI Application with PostgreSQL Database
 """
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 import logging
 import asyncio
 
 from app.config import settings
+from app.services.cpu_pool import CpuPoolBusy
 
 # Configure logging
 logging.basicConfig(
@@ -31,6 +33,8 @@ async def lifespan(app: FastAPI):
             logger.info("✅ Database connection established")
         else:
             logger.error("❌ Database connection failed")
+        # Open the asyncpg pool behind the async routers before traffic arrives
+        await get_async_pool()
     except Exception as e:
         logger.error(f"❌ Database initialization error: {e}")
     
@@ -55,11 +59,79 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"⚠️ Could not initialize Claude service: {e}")
     
+    # Search index: builds in the background, then follows silver changes
+    if settings.SEARCH_INDEX_ENABLED:
+        try:
+            from app.services.search_index import get_search_service
+            get_search_service().start()
+            logger.info("✅ Search index service started")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not start search index service: {e}")
+    
+    # CPU pool: spawn and warm the matching/metrics workers before traffic
+    try:
+        from app.services.cpu_pool import get_cpu_pool
+        get_cpu_pool().start()
+        logger.info(f"✅ CPU pool started ({settings.CPU_POOL_WORKERS} workers)")
+    except Exception as e:
+        logger.warning(f"⚠️ Could not start CPU pool: {e}")
+    
+    # Shared cache tier: follow invalidations published by other workers and the pipeline
+    try:
+        from app.services.shared_cache import get_shared_cache
+        shared_cache = get_shared_cache()
+        if shared_cache is not None:
+            shared_cache.start()
+            logger.info("✅ Shared cache tier connected")
+    except Exception as e:
+        logger.warning(f"⚠️ Could not start shared cache tier: {e}")
+    
+    # Realtime price stream: LISTEN for price changes announced by the pipeline
+    if settings.PRICE_STREAM_ENABLED:
+        try:
+            from app.services.price_stream import get_price_hub
+            get_price_hub().start()
+            logger.info("✅ Price stream listener started")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not start price stream listener: {e}")
+    
     logger.info("✅ API started successfully (database-only mode, no live API cache warming)")
     
     yield
     
     # Cleanup on shutdown
+    try:
+        from app.services.search_index import get_search_service
+        await get_search_service().stop()
+    except Exception:
+        pass
+    
+    try:
+        from app.services.cpu_pool import get_cpu_pool
+        get_cpu_pool().shutdown()
+    except Exception:
+        pass
+    
+    try:
+        from app.services.shared_cache import get_shared_cache
+        shared_cache = get_shared_cache()
+        if shared_cache is not None:
+            await shared_cache.stop()
+    except Exception:
+        pass
+    
+    try:
+        from app.services.fetch_engine import get_fetch_engine
+        await get_fetch_engine().close()
+    except Exception:
+        pass
+    
+    try:
+        from app.services.price_stream import get_price_hub
+        await get_price_hub().stop()
+    except Exception:
+        pass
+    
     # Close async database pool
     try:
         from app.database.session import close_async_pool
@@ -79,6 +151,15 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+@app.exception_handler(CpuPoolBusy)
+async def cpu_pool_busy_handler(request: Request, exc: CpuPoolBusy):
+    """Back-pressure from the CPU pool: ask the client to retry shortly."""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Server busy, please retry"},
+        headers={"Retry-After": "2"},
+    )
+
 # Configure CORS — driven by CORS_ORIGINS env var (see app/config.py)
 # Production: same-origin through DO App Platform routing, so this is
 # only needed for direct API access (dev tools, staging, etc.)
@@ -144,6 +225,14 @@ try:
 except ImportError as e:
     logger.warning(f"⚠️ Could not load events_db router: {e}")
 
+# In-process search index (markets + events)
+try:
+    from app.api.search import router as search_router
+    app.include_router(search_router, prefix="/search", tags=["search"])
+    logger.info("✅ Search router loaded")
+except ImportError as e:
+    logger.warning(f"⚠️ Could not load search router: {e}")
+
 # Legacy dashboard (API-based) - keep for fallback
 try:
     from app.api.dashboard import router as dashboard_router
@@ -275,6 +364,14 @@ try:
 except ImportError as e:
     logger.warning(f"⚠️ Could not load real-time data router: {e}")
 
+# Realtime price stream (SSE / WebSocket push of pipeline price changes)
+try:
+    from app.api.price_stream import router as price_stream_router
+    app.include_router(price_stream_router, tags=["realtime"])
+    logger.info("✅ Price stream router loaded (SSE / WebSocket)")
+except ImportError as e:
+    logger.warning(f"⚠️ Could not load price stream router: {e}")
+
 # Market Intelligence endpoints (on-demand analytics from Dome API)
 try:
     from app.api.market_intelligence import router as market_intelligence_router
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark app.services.search_index.SearchIndex on a synthetic catalog.
+
+Builds an index of prediction-market-like titles (markets plus events),
+then replays queries keystroke by keystroke ("t", "tr", "tru", ...) the
+way the search box sends them, and reports build time, incremental
+upsert cost and p50 / p99 / max query latency. The target is < 5 ms per
+keystroke.
+
+Usage:
+    python scripts/benchmark_search_index.py
+    python scripts/benchmark_search_index.py --markets 100000 --events 20000
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.search_index import SearchDoc, SearchIndex
+
+SUBJECTS = [
+    "Trump", "Biden", "Harris", "Newsom", "Vance", "Bitcoin", "Ethereum", "Solana",
+    "Fed", "ECB", "Lakers", "Celtics", "Chiefs", "Eagles", "Real Madrid", "Arsenal",
+    "Taylor Swift", "OpenAI", "Tesla", "Nvidia", "Apple", "Ukraine", "Israel", "China",
+]
+PREDICATES = [
+    "win the {y} election", "reach ${n}k by {m}", "cut rates in {m}", "win the {y} championship",
+    "announce a new product before {m}", "be above {n} on {m} 31", "sign a ceasefire by {m}",
+    "hit an all time high in {y}", "be nominated as {r}", "resign before {m} {y}",
+]
+MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+ROLES = ["Fed chair", "secretary of state", "running mate", "MVP", "CEO"]
+CATEGORIES = ["Politics", "Crypto", "Sports", "Economy", "Entertainment", "Other"]
+PLATFORMS = ["polymarket", "kalshi", "limitless", "opiniontrade"]
+
+QUERIES = [
+    "trump election", "bitcoin 100k", "fed rate cut march", "lakers championship",
+    "taylor swift", "nvidia all time high", "ukraine ceasefire", "etherum",  # typo on purpose
+    "who will be fed chair", "solana",
+]
+
+
+def random_title(rng: random.Random) -> str:
+    subject = rng.choice(SUBJECTS)
+    predicate = rng.choice(PREDICATES).format(
+        y=rng.choice([2025, 2026, 2028]), n=rng.randint(1, 200),
+        m=rng.choice(MONTHS), r=rng.choice(ROLES),
+    )
+    return f"Will {subject} {predicate}?"
+
+
+def build_docs(markets: int, events: int, seed: int):
+    rng = random.Random(seed)
+    docs = []
+    for i in range(markets):
+        title = random_title(rng)
+        docs.append(SearchDoc(
+            kind="market", platform=rng.choice(PLATFORMS), id=f"m{i}", title=title,
+            slug="-".join(title.lower().strip("?").split())[:60],
+            tags=[rng.choice(CATEGORIES)], category=rng.choice(CATEGORIES),
+            volume=rng.random() * 1e6,
+        ))
+    for i in range(events):
+        members = "\n".join(random_title(rng).lower() for _ in range(rng.randint(1, 8)))
+        docs.append(SearchDoc(
+            kind="event", platform=rng.choice(PLATFORMS), id=f"event-{i}", title=random_title(rng),
+            category=rng.choice(CATEGORIES), members=members, volume=rng.random() * 1e7,
+        ))
+    return docs
+
+
+def keystrokes(query: str):
+    return [query[:i] for i in range(1, len(query) + 1) if not query[:i].endswith(" ")]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the in-process search index")
+    parser.add_argument("--markets", type=int, default=50000)
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    docs = build_docs(args.markets, args.events, args.seed)
+
+    start = time.perf_counter()
+    index = SearchIndex(docs)
+    build_s = time.perf_counter() - start
+    print(f"Built {len(index)} docs in {build_s:.2f}s")
+
+    # Incremental: re-upsert 1% of markets with new titles (a sync batch)
+    rng = random.Random(args.seed + 1)
+    batch = rng.sample(docs[:args.markets], max(1, args.markets // 100))
+    start = time.perf_counter()
+    for doc in batch:
+        doc.title = random_title(rng)
+        index.upsert(doc)
+    upsert_ms = (time.perf_counter() - start) * 1000
+    print(f"Upserted {len(batch)} docs in {upsert_ms:.1f}ms ({upsert_ms / len(batch) * 1000:.0f}us each)")
+
+    latencies = []
+    worst = ("", 0.0)
+    for query in QUERIES:
+        for prefix in keystrokes(query):
+            start = time.perf_counter()
+            index.search(prefix, limit=10)
+            elapsed = (time.perf_counter() - start) * 1000
+            latencies.append(elapsed)
+            if elapsed > worst[1]:
+                worst = (prefix, elapsed)
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"{len(latencies)} keystroke queries: p50 {statistics.median(latencies):.2f}ms"
+          f"  p99 {p99:.2f}ms  max {worst[1]:.2f}ms ({worst[0]!r})")
+
+    for query in QUERIES[:4]:
+        results, total = index.search(query, limit=3)
+        print(f"  {query!r}: {total} matches, top: {[r['title'] for r in results]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
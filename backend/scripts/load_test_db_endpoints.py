@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Load test for the DB-backed routers (dashboard, markets, events,
+cross-venue, arbitrage).
+
+N concurrent clients loop over a fixed endpoint mix for a set duration
+against a running API. While the load runs, one extra client polls
+/health/live, which does no I/O: its latency shows how long requests sit
+behind whatever is holding the event loop, i.e. a blocking DB call
+inside an async handler.
+
+Reports p50 / p95 / p99 / max latency and error counts per endpoint.
+Run it once on the old build and once on the new one, save both with
+--output, then diff them with --compare:
+
+Usage:
+    python scripts/load_test_db_endpoints.py --base-url http://localhost:8000 --output before.json
+    python scripts/load_test_db_endpoints.py --base-url http://localhost:8000 --output after.json
+    python scripts/load_test_db_endpoints.py --compare before.json after.json
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import httpx
+
+# (name, path) - weighted towards the pages the frontend hits most
+ENDPOINT_MIX = [
+    ("dashboard/market-metrics", "/dashboard/market-metrics"),
+    ("dashboard/top-markets", "/dashboard/top-markets?limit=20"),
+    ("dashboard/stats", "/dashboard/stats"),
+    ("db/events", "/db/events?page=1&page_size=50"),
+    ("db/events", "/db/events?platform=polymarket&sort_by=volume_24h"),
+    ("db/events/stats", "/db/events/stats"),
+    ("db/events/categories", "/db/events/categories"),
+    ("markets/search", "/markets/search?q=election&limit=20"),
+    ("markets/popular", "/markets/popular?limit=20"),
+    ("cross-venue-events-db", "/cross-venue-events-db?limit=60"),
+    ("arbitrage/opportunities", "/arbitrage/opportunities?limit=50"),
+]
+
+PROBE = ("probe:/health/live", "/health/live")
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile; samples must be sorted."""
+    if not samples:
+        return 0.0
+    k = max(0, min(len(samples) - 1, int(round(pct / 100 * len(samples))) - 1))
+    return samples[k]
+
+
+def summarize(latencies: Dict[str, List[float]], errors: Dict[str, int]) -> Dict[str, dict]:
+    report = {}
+    for name in sorted(set(latencies) | set(errors)):
+        samples = sorted(latencies.get(name, []))
+        report[name] = {
+            "requests": len(samples) + errors.get(name, 0),
+            "errors": errors.get(name, 0),
+            "p50_ms": round(percentile(samples, 50) * 1000, 1),
+            "p95_ms": round(percentile(samples, 95) * 1000, 1),
+            "p99_ms": round(percentile(samples, 99) * 1000, 1),
+            "max_ms": round(samples[-1] * 1000, 1) if samples else 0.0,
+            "mean_ms": round(statistics.fmean(samples) * 1000, 1) if samples else 0.0,
+        }
+    return report
+
+
+async def client_loop(
+    client: httpx.AsyncClient,
+    offset: int,
+    deadline: float,
+    latencies: Dict[str, List[float]],
+    errors: Dict[str, int],
+) -> None:
+    i = offset
+    while time.monotonic() < deadline:
+        name, path = ENDPOINT_MIX[i % len(ENDPOINT_MIX)]
+        i += 1
+        start = time.monotonic()
+        try:
+            resp = await client.get(path)
+            ok = resp.status_code < 500
+        except httpx.HTTPError:
+            ok = False
+        if ok:
+            latencies[name].append(time.monotonic() - start)
+        else:
+            errors[name] += 1
+
+
+async def probe_loop(
+    client: httpx.AsyncClient,
+    deadline: float,
+    interval: float,
+    latencies: Dict[str, List[float]],
+    errors: Dict[str, int],
+) -> None:
+    name, path = PROBE
+    while time.monotonic() < deadline:
+        start = time.monotonic()
+        try:
+            resp = await client.get(path)
+            resp.raise_for_status()
+            latencies[name].append(time.monotonic() - start)
+        except httpx.HTTPError:
+            errors[name] += 1
+        await asyncio.sleep(interval)
+
+
+async def run(base_url: str, clients: int, duration: float, timeout: float) -> dict:
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    limits = httpx.Limits(max_connections=clients + 1, max_keepalive_connections=clients + 1)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        # Warm caches and the pool so the run measures steady state
+        for _, path in ENDPOINT_MIX:
+            try:
+                await client.get(path)
+            except httpx.HTTPError:
+                pass
+
+        started = time.monotonic()
+        deadline = started + duration
+        await asyncio.gather(
+            probe_loop(client, deadline, 0.1, latencies, errors),
+            *(client_loop(client, i, deadline, latencies, errors) for i in range(clients)),
+        )
+        elapsed = time.monotonic() - started
+
+    total = sum(len(v) for v in latencies.values())
+    return {
+        "base_url": base_url,
+        "clients": clients,
+        "duration_s": round(elapsed, 1),
+        "throughput_rps": round(total / elapsed, 1),
+        "endpoints": summarize(latencies, errors),
+    }
+
+
+def print_report(result: dict) -> None:
+    print(f"\n{result['clients']} clients, {result['duration_s']}s against {result['base_url']}"
+          f" - {result['throughput_rps']} req/s")
+    print(f"{'endpoint':<28}{'reqs':>7}{'errs':>6}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}")
+    for name, s in result["endpoints"].items():
+        print(f"{name:<28}{s['requests']:>7}{s['errors']:>6}"
+              f"{s['p50_ms']:>9}{s['p95_ms']:>9}{s['p99_ms']:>9}{s['max_ms']:>9}")
+
+
+def print_comparison(before: dict, after: dict) -> None:
+    print(f"\np99 latency (ms): before {before['throughput_rps']} req/s,"
+          f" after {after['throughput_rps']} req/s")
+    print(f"{'endpoint':<28}{'before':>10}{'after':>10}{'change':>10}")
+    for name in sorted(set(before["endpoints"]) | set(after["endpoints"])):
+        b = before["endpoints"].get(name, {}).get("p99_ms")
+        a = after["endpoints"].get(name, {}).get("p99_ms")
+        change = f"{(a - b) / b * 100:+.0f}%" if a is not None and b else "-"
+        print(f"{name:<28}{b if b is not None else '-':>10}{a if a is not None else '-':>10}{change:>10}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds of sustained load")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-request timeout in seconds")
+    parser.add_argument("--output", help="Write the JSON report here")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"),
+                        help="Compare two saved reports instead of running")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            before = json.load(f)
+        with open(args.compare[1]) as f:
+            after = json.load(f)
+        print_comparison(before, after)
+        return 0
+
+    result = asyncio.run(run(args.base_url, args.clients, args.duration, args.timeout))
+    print_report(result)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+        print(f"\nSaved to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Load test app.services.price_stream.PriceHub with thousands of subscribers.
+
+Runs one worker's hub in-process: N simulated clients, each a task looping
+on Subscriber.next_message() the way the SSE handler does (and framing the
+SSE event), subscribed to a mix of topics:
+
+- 60% follow 1-20 markets, 25% follow 1-3 events, 15% a whole platform
+
+A publisher feeds batches of price changes through PriceHub.publish (the
+path the NOTIFY callback takes) at --rate batches per second. Reports:
+
+- fan-out latency: publish -> message in the client's hands, per update
+  (includes the coalescing window; run with --coalesce-ms 0 for raw cost)
+- publish cost: time the event loop spends fanning out one batch
+- memory per connection: tracemalloc growth per idle subscriber (hub
+  state plus its handler task; socket buffers of a real server come on top)
+
+Usage:
+    python scripts/load_test_price_stream.py
+    python scripts/load_test_price_stream.py --subscribers 10000 --rate 20 --batch 500
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import orjson
+
+from app.services.price_stream import PriceHub, parse_topics
+
+PLATFORMS = ["polymarket", "kalshi", "limitless", "opiniontrade"]
+
+
+def build_catalog(markets: int, events: int, seed: int):
+    rng = random.Random(seed)
+    return [
+        (rng.choice(PLATFORMS), f"m{i}", f"e{rng.randrange(events)}")
+        for i in range(markets)
+    ]
+
+
+def random_topics(rng: random.Random, catalog, events: int):
+    roll = rng.random()
+    if roll < 0.6:
+        return parse_topics(markets=[m for _, m, _ in rng.sample(catalog, rng.randint(1, 20))])
+    if roll < 0.85:
+        return parse_topics(events=[f"e{rng.randrange(events)}" for _ in range(rng.randint(1, 3))])
+    return parse_topics(platforms=[rng.choice(PLATFORMS)])
+
+
+async def client(sub, hub: PriceHub, latencies: list, counts: dict, sample: float, rng: random.Random):
+    while True:
+        message = await sub.next_message(15.0, hub.coalesce)
+        if message is None:
+            continue
+        frame = b"data: " + message + b"\n\n"
+        now = time.time()
+        counts["messages"] += 1
+        counts["bytes"] += len(frame)
+        # Decoding is the browser's job; only the sampled messages are parsed
+        if rng.random() < sample:
+            latencies.extend(now - u["ts"] for u in orjson.loads(message)["updates"])
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))] if values else 0.0
+
+
+async def run(args) -> int:
+    rng = random.Random(args.seed)
+    catalog = build_catalog(args.markets, args.events, args.seed)
+    hub = PriceHub(coalesce_ms=args.coalesce_ms, max_subscribers=args.subscribers, max_topics=500)
+
+    latencies: list = []
+    counts = {"messages": 0, "bytes": 0}
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    subs = [hub.subscribe(random_topics(rng, catalog, args.events)) for _ in range(args.subscribers)]
+    tasks = [
+        asyncio.create_task(client(sub, hub, latencies, counts, args.sample, random.Random(i)))
+        for i, sub in enumerate(subs)
+    ]
+    await asyncio.sleep(0.1)  # Let every client reach its first wait
+    after = tracemalloc.take_snapshot()
+    grown = sum(s.size_diff for s in after.compare_to(before, "filename"))
+    tracemalloc.stop()
+    stats = hub.stats()
+    print(f"{args.subscribers} subscribers on {stats['topics']} topics: "
+          f"{grown / args.subscribers / 1024:.2f} KiB per connection (idle)")
+
+    publish_ms = []
+    batches = int(args.duration * args.rate)
+    interval = 1.0 / args.rate
+    start = time.perf_counter()
+    for n in range(batches):
+        # One NOTIFY batch per platform, as the per-source price fetchers send them
+        by_platform = {p: [] for p in PLATFORMS}
+        for platform, market_id, event_id in rng.sample(catalog, args.batch):
+            price = round(rng.random(), 4)
+            by_platform[platform].append((market_id, event_id, price, round(1 - price, 4)))
+        for platform, changes in by_platform.items():
+            t0 = time.perf_counter()
+            hub.publish(platform, changes)
+            publish_ms.append((time.perf_counter() - t0) * 1000)
+        # Hold the rate, but never skip the loop's turn for the clients
+        await asyncio.sleep(max(0.0, start + (n + 1) * interval - time.perf_counter()))
+    await asyncio.sleep(args.coalesce_ms / 1000 + 0.5)  # Drain
+    elapsed = time.perf_counter() - start
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    stats = hub.stats()
+    delivered = sum(sub.updates for sub in subs)
+    print(f"{stats['batches']} batches / {stats['updates']} updates in {elapsed:.1f}s -> "
+          f"{counts['messages']} messages, {delivered} updates delivered "
+          f"({delivered / elapsed:,.0f}/s, {counts['bytes'] / elapsed / 1e6:.1f} MB/s)")
+    print(f"publish (fan-out) per batch: p50 {statistics.median(publish_ms):.2f}ms  "
+          f"p99 {percentile(publish_ms, 0.99):.2f}ms  max {max(publish_ms):.2f}ms")
+    if latencies:
+        ms = [x * 1000 for x in latencies]
+        print(f"fan-out latency (coalesce {args.coalesce_ms:.0f}ms): p50 {statistics.median(ms):.1f}ms  "
+              f"p99 {percentile(ms, 0.99):.1f}ms  max {max(ms):.1f}ms  ({len(ms)} samples)")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load test the realtime price hub")
+    parser.add_argument("--subscribers", type=int, default=5000)
+    parser.add_argument("--markets", type=int, default=20000, help="Catalog size")
+    parser.add_argument("--events", type=int, default=4000)
+    parser.add_argument("--batch", type=int, default=200, help="Changed prices per batch")
+    parser.add_argument("--rate", type=float, default=10, help="Batches per second")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds of publishing")
+    parser.add_argument("--coalesce-ms", type=float, default=250)
+    parser.add_argument("--sample", type=float, default=0.1, help="Fraction of messages timed")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
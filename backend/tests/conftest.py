@@ -0,0 +1,5 @@
+"""Make the backend root importable (`app.*`), as the scripts do."""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
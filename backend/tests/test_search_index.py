@@ -0,0 +1,159 @@
+"""Tests for the in-process SearchIndex and its change-log sync."""
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+import app.database.async_db as async_db
+from app.services import search_index
+from app.services.search_index import SearchDoc, SearchIndex, SearchIndexService
+
+
+def market(id, title, platform="polymarket", volume=0.0, **kwargs) -> SearchDoc:
+    return SearchDoc(kind="market", platform=platform, id=id, title=title, volume=volume, **kwargs)
+
+
+@pytest.fixture
+def index() -> SearchIndex:
+    return SearchIndex([
+        market("m1", "Will Trump win the 2028 election?", volume=5e6, category="Politics"),
+        market("m2", "Will Bitcoin reach $100k by March?", volume=2e6, category="Crypto"),
+        market("m3", "Fed rate cut in March?", platform="kalshi", volume=1e6, tags=["Economy"]),
+        market("m4", "Will the Lakers win the championship?", volume=3e5, category="Sports"),
+        SearchDoc(kind="event", platform="polymarket", id="election-2028", title="2028 Presidential Election",
+                  members="will trump win the 2028 election\nwill harris win the 2028 election", volume=9e6),
+    ])
+
+
+def ids(results) -> list:
+    return [r["id"] for r in results]
+
+
+def test_exact_prefix_and_fuzzy_terms(index):
+    assert ids(index.search("bitcoin")[0]) == ["m2"]
+    assert ids(index.search("bitc")[0]) == ["m2"]   # term being typed
+    assert ids(index.search("bitcoinn")[0]) == ["m2"]  # typo
+    assert index.search("xyzzy") == ([], 0)
+
+
+def test_every_term_must_match_and_title_outranks_members(index):
+    results, total = index.search("trump election")
+    assert total == 2
+    # The market matches on its title, the event only through member titles
+    assert ids(results) == ["m1", "election-2028"]
+
+
+def test_filters(index):
+    assert ids(index.search("march", platform="kalshi")[0]) == ["m3"]
+    assert ids(index.search("march", category="economy")[0]) == ["m3"]
+    assert ids(index.search("election", kind="event")[0]) == ["election-2028"]
+    # An empty query lists the filtered docs by volume
+    results, total = index.search("", kind="market", limit=2)
+    assert (ids(results), total) == (["m1", "m2"], 4)
+
+
+def test_upsert_replaces_and_remove_forgets(index):
+    index.upsert(market("m2", "Will Ethereum flip Bitcoin?", volume=2e6))
+    assert ids(index.search("ethereum")[0]) == ["m2"]
+    assert ids(index.search("100k")[0]) == []
+    assert len(index) == 5
+
+    assert index.remove(("market", "polymarket", "m2"))
+    assert not index.remove(("market", "polymarket", "m2"))
+    assert ("market", "polymarket", "m2") not in index
+    assert index.search("bitcoin") == ([], 0)
+    # Tokens only m2 had are gone from prefix and fuzzy lookups too
+    assert index.search("ether") == ([], 0)
+    assert len(index) == 4
+
+
+def test_broad_queries_score_a_bounded_pool(monkeypatch):
+    monkeypatch.setattr(search_index, "MAX_SCORED_CANDIDATES", 5)
+    index = SearchIndex([market(f"m{i}", f"Will team {i} win?", volume=i) for i in range(50)])
+    results, total = index.search("win", limit=3)
+    assert total == 50
+    assert ids(results) == ["m49", "m48", "m47"]  # volume breaks the tie
+
+
+def test_incremental_updates_match_a_fresh_build():
+    rows = [market(f"m{i}", f"Will {w} happen by {m}?", volume=i * 10.0)
+            for i, (w, m) in enumerate(zip(["rain", "snow", "sun", "hail"] * 10, ["may", "march", "june"] * 14))]
+    live = SearchIndex(rows[:20])
+    for doc in rows[20:]:
+        live.upsert(doc)
+    for doc in rows[:10]:
+        live.remove(doc.key)
+    fresh = SearchIndex(rows[10:])
+    for query in ["rain", "ma", "snow march", "sun jun", "hial"]:
+        assert live.search(query) == fresh.search(query)
+
+
+# =============================================================================
+# SearchIndexService.sync
+# =============================================================================
+
+def market_row(source_market_id, title, source="polymarket"):
+    return SimpleNamespace(
+        source=source, source_market_id=source_market_id, slug=None, title=title, tags=None,
+        category_name=None, status="active", yes_price=None, volume_total=0, volume_24h=0,
+        end_date=None, image_url=None, source_url=None,
+    )
+
+
+class FakeDB:
+    """Answers the service's three queries from in-memory tables."""
+
+    def __init__(self):
+        self.changes: list = []
+        self.markets: dict = {}
+        self.events: list = []
+
+    async def fetch(self, sql, params=None):
+        if "market_change_log" in sql:
+            after = [c for c in self.changes if c.change_seq > params["after"]]
+            return after[:params["limit"]]
+        if "predictions_silver.markets" in sql:
+            keys = zip(params["sources"], params["market_ids"])
+            return [self.markets[k] for k in keys if k in self.markets]
+        return [e for e in self.events if e.updated_at > params["since"]]
+
+
+@pytest.mark.asyncio
+async def test_sync_applies_change_log_and_event_updates(monkeypatch):
+    db = FakeDB()
+
+    async def get_async_db():
+        return db
+
+    monkeypatch.setattr(async_db, "get_async_db", get_async_db)
+    now = datetime.now(timezone.utc)
+    service = SearchIndexService()
+    service.index = SearchIndex([market("m1", "Will it rain?"), market("m2", "Will it snow?")])
+    service._change_seq = 10
+    service._events_watermark = now
+
+    db.markets[("polymarket", "m1")] = market_row("m1", "Will it hail?")
+    db.markets[("kalshi", "k1")] = market_row("k1", "Will it rain?", source="kalshi")
+    db.changes = [
+        SimpleNamespace(source="polymarket", source_market_id="m1", change_seq=11),
+        SimpleNamespace(source="polymarket", source_market_id="m2", change_seq=12),  # closed
+        SimpleNamespace(source="kalshi", source_market_id="k1", change_seq=13),
+    ]
+    db.events = [SimpleNamespace(
+        event_id="weather", platform="polymarket", rep_title="Weather", rep_image=None, rep_url=None,
+        rep_yes_price=None, category="Science", categories=[], search_text="will it hail",
+        market_count=2, total_volume=0, volume_24h=0, max_end_date=None, is_active=True,
+        updated_at=now + timedelta(seconds=1),
+    )]
+
+    assert await service.sync() == 4
+    index = service.index
+    assert ids(index.search("hail")[0]) == ["m1", "weather"]
+    assert ids(index.search("rain")[0]) == ["k1"]
+    assert ("market", "polymarket", "m2") not in index
+    assert service._change_seq == 13
+    assert service._events_watermark == now + timedelta(seconds=1)
+
+    # Nothing new past the cursor: only the watermark overlap is re-read
+    db.events = []
+    assert await service.sync() == 0
@@ -0,0 +1,103 @@
+"""Tests for the shared cache tier: several workers on one MemoryBackend."""
+import asyncio
+import contextvars
+
+import pytest
+
+from app.services import shared_cache
+from app.services.shared_cache import MemoryBackend, SharedCache
+from app.utils.cache import NAMESPACES, AsyncCache
+
+# The tier the current "worker" sees; AsyncCache computations run in tasks
+# that copy the caller's context, so each worker keeps its own tier
+_worker_tier: contextvars.ContextVar = contextvars.ContextVar("worker_tier")
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    monkeypatch.setattr(shared_cache, "get_shared_cache", lambda: _worker_tier.get(None))
+    monkeypatch.setattr(shared_cache, "_LOCK_POLL_SECONDS", 0.01)
+    before = set(NAMESPACES)
+    yield MemoryBackend()
+    for name in set(NAMESPACES) - before:
+        del NAMESPACES[name]
+
+
+async def settle():
+    """Let listeners subscribe / deliver queued messages."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_cold_key_is_computed_once_across_workers(backend):
+    tiers = [SharedCache(backend, lock_seconds=2.0) for _ in range(2)]
+    caches = [AsyncCache("test_single", ttl=60, shared=True) for _ in range(2)]
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"markets": [1, 2, 3]}
+
+    async def worker(i):
+        _worker_tier.set(tiers[i])
+        return await caches[i].get_or_compute("key", compute)
+
+    results = await asyncio.gather(*(asyncio.create_task(worker(i)) for i in range(2)))
+
+    assert calls == 1
+    assert results[0] == results[1] == {"markets": [1, 2, 3]}
+    assert sum(c.metrics.shared_hits for c in caches) == 1
+    # Both workers now serve it from L1; the compute lock was released
+    assert all(c.peek("key") == {"markets": [1, 2, 3]} for c in caches)
+    assert [k for k in backend._data if k.endswith(":lock")] == []
+
+    # A third worker starting later reads it from the shared tier
+    late = SharedCache(backend)
+    _worker_tier.set(late)
+    assert await AsyncCache("test_single", ttl=60, shared=True).get_or_compute("key", compute) == results[0]
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_topic_bump_moves_keys_to_a_new_version(backend):
+    a, b = SharedCache(backend), SharedCache(backend)
+    old_key = await a.data_key("scan", ("scan", "markets"), ("polymarket", 10))
+    assert await b.data_key("scan", ("scan", "markets"), ("polymarket", 10)) == old_key
+    await a.set(old_key, [1], ttl=60)
+
+    a.start()
+    await settle()
+    await b.bump("markets")
+    await settle()
+
+    new_key = await a.data_key("scan", ("scan", "markets"), ("polymarket", 10))
+    assert new_key != old_key
+    assert new_key == await b.data_key("scan", ("scan", "markets"), ("polymarket", 10))
+    assert await a.get(new_key) is None
+    # Topics the namespace does not depend on leave its keys alone
+    assert await a.data_key("other", ("other",), "k") == await b.data_key("other", ("other",), "k")
+    await a.stop()
+
+
+@pytest.mark.asyncio
+async def test_bump_from_another_worker_drops_l1_entries(backend):
+    a, b = SharedCache(backend), SharedCache(backend)
+    markets = AsyncCache("test_markets_view", ttl=60, shared=True, topics=("markets",))
+    venues = AsyncCache("test_venue_view", ttl=60, shared=True, topics=("cross_venue",))
+    local = AsyncCache("test_local_view", ttl=60, topics=("markets",))  # not shared
+    for cache in (markets, venues, local):
+        cache.set("key", "value")
+
+    a.start()
+    await settle()
+    await b.bump("markets")
+    await settle()
+
+    assert markets.peek("key") is None
+    assert venues.peek("key") == "value"
+    assert local.peek("key") == "value"
+    assert a._versions["markets"] == 1
+    await a.stop()
@@ -0,0 +1,64 @@
+"""
+app.api.arbitrage keeps a copy of the pipeline's market matching rules
+(data-pipeline predictions_ingest/aggregation/cross_venue.py); the two must
+agree, or the API dedups and matches differently from the stored pairs.
+"""
+import itertools
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.api import arbitrage
+
+PIPELINE_ROOT = Path(__file__).resolve().parents[2] / "data-pipeline"
+
+TITLES = [
+    "Will Doug Burgum leave the Trump Cabinet before June 2026?",
+    "Marco Rubio out of the Cabinet before June?",
+    "Will Trump nominate Kevin Warsh as Fed Chair?",
+    "Who will Trump nominate as fed chair? Kevin Warsh",
+    "Trump nominates Kevin Hassett for Fed Chair?",
+    "Will Bitcoin reach $150,000 by December 31?",
+    "BTC price above 150000 on December 31, 2025?",
+    "Will Ethereum reach $10,000 by June 30?",
+    "Will the Golden State Warriors win the 2026 NBA Finals?",
+    "Warriors win the Pro Basketball Finals?",
+    "Will Gavin Newsom win the 2028 California governor election?",
+    "Newsom wins the California gubernatorial race in 2028?",
+    "Ohio Senate race 2026: Republicans flip?",
+    "Georgia Senate race 2026: Democrats hold?",
+    "Ukraine x Russia ceasefire agreed by March 2026?",
+    "Ceasefire between Russia and Ukraine before March?",
+    "Will Nvidia be the largest company in the world by market cap on June 30?",
+    "Largest company by market cap on June: Nvidia?",
+    "Will Trump be convicted?",
+    "Trump conviction before 2026?",
+    "Democrats win the Senate?",
+    "Republicans win the Senate?",
+]
+
+
+@pytest.fixture(scope="module")
+def pipeline():
+    if not PIPELINE_ROOT.is_dir():
+        pytest.skip("data-pipeline is not checked out next to the backend")
+    sys.path.append(str(PIPELINE_ROOT))
+    return pytest.importorskip("predictions_ingest.aggregation.cross_venue")
+
+
+def test_word_lists_match(pipeline):
+    assert arbitrage._STOP_WORDS == pipeline.STOP_WORDS
+    assert arbitrage._TEMPLATE_WORDS == pipeline.TEMPLATE_WORDS
+    assert arbitrage._ENTITY_ALIASES == pipeline.ENTITY_ALIASES
+
+
+@pytest.mark.parametrize("title", TITLES)
+def test_entities_match(pipeline, title):
+    assert arbitrage._extract_entities(title) == pipeline.extract_entities(title)
+    assert arbitrage._extract_subject_entities(title) == pipeline.extract_subject_entities(title)
+
+
+def test_similarity_matches(pipeline):
+    for a, b in itertools.permutations(TITLES, 2):
+        assert arbitrage.calculate_similarity(a, b) == pipeline.calculate_similarity(a, b), (a, b)
@@ -0,0 +1,173 @@
+"""compute_trader_stats against a plain per-wallet, per-trade ledger loop."""
+import math
+from collections import defaultdict
+
+import numpy as np
+import pytest
+
+from app.services.trader_tracker import _FLAT_PNL, _SHARE_UNITS, compute_trader_stats
+
+NOW = 1_700_000_000.0
+DAY = 86400.0
+
+
+def reference_stats(wallet, token, market, is_buy, is_sell, price, shares, ts, n_wallets, now):
+    """The documented semantics, one wallet and one trade at a time."""
+    out = []
+    for w in range(n_wallets):
+        # Oldest first; within a second buys before sells, then input order
+        rows = sorted(np.flatnonzero(wallet == w), key=lambda i: (ts[i], not is_buy[i], i))
+        held = defaultdict(int)      # token -> micro-shares
+        cost = defaultdict(float)    # token -> cost basis of the shares held
+        first_buy = {}
+        market_volume, market_seen = defaultdict(float), {}
+        pnl, outcomes, holds = [], [], []
+        stats = defaultdict(float)
+        for i in rows:
+            value = price[i] * shares[i]
+            units = int(np.rint(shares[i] * _SHARE_UNITS))
+            tok, realized = token[i], 0.0
+            if is_buy[i]:
+                first_buy.setdefault(tok, ts[i])
+                held[tok] += units
+                cost[tok] += price[i] * shares[i]
+            elif is_sell[i] and held[tok] > 0:
+                sold = min(units, held[tok])
+                avg = cost[tok] / (held[tok] / _SHARE_UNITS)
+                realized = (price[i] - avg) * sold / _SHARE_UNITS
+                held[tok] -= sold
+                cost[tok] = avg * held[tok] / _SHARE_UNITS if held[tok] else 0.0
+                holds.append((ts[i] - first_buy[tok]) / 3600)
+                if realized > _FLAT_PNL:
+                    outcomes.append(1)
+                elif realized < -_FLAT_PNL:
+                    outcomes.append(-1)
+            pnl.append(realized)
+            stats["total_pnl"] += realized
+            stats["total_volume"] += value
+            for days, suffix in ((1, "24h"), (7, "7d"), (30, "30d")):
+                if ts[i] >= now - days * DAY:
+                    stats[f"pnl_{suffix}"] += realized
+                    stats[f"volume_{suffix}"] += value
+                    stats[f"trades_{suffix}"] += 1
+            market_seen.setdefault(market[i], len(market_seen))
+            market_volume[market[i]] += value
+
+        stats["total_trades"] = len(rows)
+        stats["total_wins"] = outcomes.count(1)
+        stats["total_losses"] = outcomes.count(-1)
+        stats["largest_win"] = max([p for p in pnl if p > _FLAT_PNL], default=0.0)
+        stats["largest_loss"] = min([p for p in pnl if p < -_FLAT_PNL], default=0.0)
+        stats["avg_hold_duration_hours"] = sum(holds) / len(holds) if holds else 0.0
+        runs = []
+        for o in outcomes:
+            if runs and runs[-1][0] == o:
+                runs[-1][1] += 1
+            else:
+                runs.append([o, 1])
+        stats["longest_win_streak"] = max([n for o, n in runs if o > 0], default=0)
+        stats["longest_loss_streak"] = max([n for o, n in runs if o < 0], default=0)
+        stats["current_streak"] = runs[-1][0] * runs[-1][1] if runs else 0
+        ranked = sorted(market_volume, key=lambda m: (-market_volume[m], market_seen[m]))
+        for k in (1, 2, 3):
+            stats[f"top_market_{k}"] = ranked[k - 1] if len(ranked) >= k else -1
+            stats[f"top_market_{k}_volume"] = market_volume[ranked[k - 1]] if len(ranked) >= k else 0.0
+        if rows:
+            stats["first_trade_at"] = ts[rows[0]]
+            stats["last_trade_at"] = ts[rows[-1]]
+        out.append(stats)
+    return out
+
+
+def assert_matches(columns, n_wallets):
+    got = compute_trader_stats(*columns, n_wallets, NOW)
+    want = reference_stats(*columns, n_wallets, NOW)
+    for w, expected in enumerate(want):
+        for key, value in expected.items():
+            assert got[key][w] == pytest.approx(value, rel=1e-6, abs=1e-6), (w, key)
+
+
+def random_columns(seed, n_wallets, max_trades):
+    """
+    Trades of n_wallets wallets in random order. Tokens are shared across
+    wallets (a position is per wallet), times are whole seconds drawn from
+    a short span so buys and sells often tie, and some tokens are sold
+    before (and past) their buys, which floors the position at zero.
+    """
+    rng = np.random.default_rng(seed)
+    counts = rng.integers(0, max_trades, n_wallets)
+    n = int(counts.sum())
+    wallet = np.repeat(np.arange(n_wallets), counts)
+    token = rng.integers(0, 4, n)
+    market = token + 10 * rng.integers(0, 2, n)
+    is_buy = rng.random(n) < 0.55
+    is_sell = ~is_buy
+    price = np.round(rng.uniform(0.01, 0.99, n), 3)
+    shares = np.where(rng.random(n) < 0.3, 10.0, np.round(rng.uniform(0.5, 40, n), 6))
+    span = rng.choice([20, 40 * DAY])
+    ts = NOW - np.floor(rng.uniform(0, span, n))
+    shuffle = rng.permutation(n)
+    return tuple(a[shuffle] for a in (wallet, token, market, is_buy, is_sell, price, shares, ts))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_reference_on_random_wallets(seed):
+    n_wallets = 12
+    assert_matches(random_columns(seed, n_wallets, 60), n_wallets)
+
+
+def test_sell_before_buy_in_same_second_realizes():
+    # Listed sell-first at one timestamp: the buy still opens the position
+    columns = (
+        np.array([0, 0, 1]), np.array([0, 0, 0]), np.array([0, 0, 0]),
+        np.array([False, True, False]), np.array([True, False, True]),
+        np.array([0.8, 0.5, 0.9]), np.array([10.0, 10.0, 5.0]),
+        np.array([NOW, NOW, NOW - 5]),
+    )
+    stats = compute_trader_stats(*columns, 2, NOW)
+    assert stats["total_pnl"].tolist() == pytest.approx([3.0, 0.0])
+    assert stats["total_wins"].tolist() == [1, 0]
+    assert_matches(columns, 2)
+
+
+def test_floor_does_not_carry_across_wallets():
+    # Wallet 0 oversells deep below zero; wallet 1's running minimum of the
+    # same token must start from its own first trade
+    columns = (
+        np.array([0, 0, 0, 1, 1, 1]), np.array([0, 0, 0, 0, 0, 0]), np.array([0] * 6),
+        np.array([True, False, True, False, True, False]),
+        np.array([False, True, False, True, False, True]),
+        np.array([0.2, 0.6, 0.3, 0.9, 0.4, 0.5]),
+        np.array([5.0, 500.0, 5.0, 50.0, 20.0, 20.0]),
+        NOW - np.array([60.0, 50, 40, 30, 20, 10]),
+    )
+    stats = compute_trader_stats(*columns, 2, NOW)
+    assert stats["total_pnl"].tolist() == pytest.approx([2.0, 2.0])
+    assert_matches(columns, 2)
+
+
+def test_long_partial_sell_series_stays_finite():
+    # Each sell keeps a tenth of the position, so 1/survival of the later
+    # lots reaches 1e300+; averages must still come out of log space
+    rows = 2 * 320
+    n_wallets = 3
+    wallet = np.repeat(np.arange(n_wallets), rows)
+    is_buy = np.tile(np.arange(rows) % 2 == 0, n_wallets)
+    shares = np.where(is_buy, 1000.0, 0.0)
+    # Sell 90% of what is held; held shares settle at 1000 / 0.9 + change
+    held, sells = 0.0, []
+    for buy in is_buy[:rows]:
+        if buy:
+            held += 1000.0
+        else:
+            sells.append(round(held * 0.9, 6))
+            held -= sells[-1]
+    shares[~is_buy] = np.tile(sells, n_wallets)
+    price = np.tile(np.where(np.arange(rows) % 4 < 2, 0.4, 0.6), n_wallets) * np.repeat([1.0, 0.5, 1.5], rows)
+    columns = (
+        wallet, np.zeros(rows * n_wallets, np.int64), np.zeros(rows * n_wallets, np.int64),
+        is_buy, ~is_buy, price, shares, np.tile(NOW - rows + np.arange(rows, dtype=float), n_wallets),
+    )
+    stats = compute_trader_stats(*columns, n_wallets, NOW)
+    assert all(math.isfinite(p) for p in stats["total_pnl"])
+    assert_matches(columns, n_wallets)
@@ -0,0 +1,32 @@
+-- =============================================================================
+-- Predictions Terminal - Bronze Content-Addressed Payload Store
+-- =============================================================================
+-- Optional storage mode (BRONZE_STORAGE_MODE=compressed):
+-- 1. Response bodies are compressed (zstd, zlib fallback) and stored once per
+--    body_hash in predictions_bronze.payloads
+-- 2. api_responses rows keep metadata only; body_json is NULL and body_hash
+--    is the reference into the payload store
+--
+-- Rows written in the default 'jsonb' mode are unaffected. Queries that read
+-- body_json directly only see inline rows; use BronzeReader, which resolves
+-- both transparently.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS predictions_bronze.payloads (
+    body_hash VARCHAR(64) PRIMARY KEY,     -- SHA-256 of normalized JSON body
+    codec VARCHAR(10) NOT NULL,            -- 'zstd', 'zlib'
+    payload BYTEA NOT NULL,                -- compressed UTF-8 JSON
+    raw_size_bytes INTEGER NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Payloads are already compressed: store out of line without pglz
+ALTER TABLE predictions_bronze.payloads ALTER COLUMN payload SET STORAGE EXTERNAL;
+
+-- Compressed-mode rows carry no inline body
+ALTER TABLE predictions_bronze.api_responses ALTER COLUMN body_json DROP NOT NULL;
+
+-- Reader join: api_responses.body_hash -> payloads.body_hash
+CREATE INDEX IF NOT EXISTS idx_bronze_payload_ref
+    ON predictions_bronze.api_responses (body_hash)
+    WHERE body_json IS NULL;
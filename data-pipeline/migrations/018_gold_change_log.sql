@@ -0,0 +1,160 @@
+-- =============================================================================
+-- Predictions Terminal - Gold Incremental Aggregation Change Log
+-- =============================================================================
+-- Statement-level triggers on predictions_silver.markets record every touched
+-- (source, source_market_id) key, so gold aggregations can recompute only the
+-- affected rows (GOLD_INCREMENTAL_ENABLED=true):
+-- 1. market_change_log: one row per market, change_seq bumped on each write
+-- 2. change_log_cursors: last change_seq consumed per gold consumer
+-- 3. market_source_totals: per-source counts/volumes maintained from the
+--    trigger's transition tables (feeds market_metrics_summary in O(sources))
+--
+-- Silver writers skip unchanged rows (fingerprint / price epsilon), so the
+-- log grows with real churn, not with poll frequency.
+-- =============================================================================
+
+CREATE SEQUENCE IF NOT EXISTS predictions_gold.market_change_seq;
+
+CREATE TABLE IF NOT EXISTS predictions_gold.market_change_log (
+    source VARCHAR(50) NOT NULL,
+    source_market_id VARCHAR(500) NOT NULL,
+    change_seq BIGINT NOT NULL,
+    changed_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (source, source_market_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_market_change_log_seq
+    ON predictions_gold.market_change_log (change_seq);
+
+CREATE TABLE IF NOT EXISTS predictions_gold.change_log_cursors (
+    consumer VARCHAR(50) PRIMARY KEY,      -- 'hot', 'market_detail'
+    last_seq BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS predictions_gold.market_source_totals (
+    source VARCHAR(50) PRIMARY KEY,
+    market_count BIGINT NOT NULL DEFAULT 0,
+    open_markets BIGINT NOT NULL DEFAULT 0,
+    volume_24h NUMERIC NOT NULL DEFAULT 0,
+    volume_7d NUMERIC NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- =============================================================================
+-- TRIGGER FUNCTION (one function, branches per operation; plpgsql plans each
+-- statement lazily, so old_rows/new_rows are only referenced where they exist)
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION predictions_gold.track_market_changes()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO predictions_gold.market_change_log (source, source_market_id, change_seq, changed_at)
+        SELECT source, source_market_id, nextval('predictions_gold.market_change_seq'), NOW()
+        FROM new_rows
+        ON CONFLICT (source, source_market_id) DO UPDATE SET
+            change_seq = EXCLUDED.change_seq,
+            changed_at = EXCLUDED.changed_at;
+        
+        INSERT INTO predictions_gold.market_source_totals AS t
+            (source, market_count, open_markets, volume_24h, volume_7d, updated_at)
+        SELECT source, COUNT(*), COUNT(*) FILTER (WHERE is_active),
+               COALESCE(SUM(volume_24h), 0), COALESCE(SUM(volume_7d), 0), NOW()
+        FROM new_rows
+        GROUP BY source
+        ON CONFLICT (source) DO UPDATE SET
+            market_count = t.market_count + EXCLUDED.market_count,
+            open_markets = t.open_markets + EXCLUDED.open_markets,
+            volume_24h = t.volume_24h + EXCLUDED.volume_24h,
+            volume_7d = t.volume_7d + EXCLUDED.volume_7d,
+            updated_at = EXCLUDED.updated_at;
+    
+    ELSIF TG_OP = 'UPDATE' THEN
+        INSERT INTO predictions_gold.market_change_log (source, source_market_id, change_seq, changed_at)
+        SELECT source, source_market_id, nextval('predictions_gold.market_change_seq'), NOW()
+        FROM new_rows
+        ON CONFLICT (source, source_market_id) DO UPDATE SET
+            change_seq = EXCLUDED.change_seq,
+            changed_at = EXCLUDED.changed_at;
+        
+        INSERT INTO predictions_gold.market_source_totals AS t
+            (source, market_count, open_markets, volume_24h, volume_7d, updated_at)
+        SELECT source, SUM(d_count), SUM(d_open), SUM(d_volume_24h), SUM(d_volume_7d), NOW()
+        FROM (
+            SELECT source, 1 AS d_count, (is_active IS TRUE)::int AS d_open,
+                   COALESCE(volume_24h, 0) AS d_volume_24h, COALESCE(volume_7d, 0) AS d_volume_7d
+            FROM new_rows
+            UNION ALL
+            SELECT source, -1, -((is_active IS TRUE)::int),
+                   -COALESCE(volume_24h, 0), -COALESCE(volume_7d, 0)
+            FROM old_rows
+        ) d
+        GROUP BY source
+        ON CONFLICT (source) DO UPDATE SET
+            market_count = t.market_count + EXCLUDED.market_count,
+            open_markets = t.open_markets + EXCLUDED.open_markets,
+            volume_24h = t.volume_24h + EXCLUDED.volume_24h,
+            volume_7d = t.volume_7d + EXCLUDED.volume_7d,
+            updated_at = EXCLUDED.updated_at;
+    
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO predictions_gold.market_change_log (source, source_market_id, change_seq, changed_at)
+        SELECT source, source_market_id, nextval('predictions_gold.market_change_seq'), NOW()
+        FROM old_rows
+        ON CONFLICT (source, source_market_id) DO UPDATE SET
+            change_seq = EXCLUDED.change_seq,
+            changed_at = EXCLUDED.changed_at;
+        
+        UPDATE predictions_gold.market_source_totals t SET
+            market_count = t.market_count - d.market_count,
+            open_markets = t.open_markets - d.open_markets,
+            volume_24h = t.volume_24h - d.volume_24h,
+            volume_7d = t.volume_7d - d.volume_7d,
+            updated_at = NOW()
+        FROM (
+            SELECT source, COUNT(*) AS market_count, COUNT(*) FILTER (WHERE is_active) AS open_markets,
+                   COALESCE(SUM(volume_24h), 0) AS volume_24h, COALESCE(SUM(volume_7d), 0) AS volume_7d
+            FROM old_rows
+            GROUP BY source
+        ) d
+        WHERE t.source = d.source;
+    END IF;
+    
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables allow a single event per trigger
+DROP TRIGGER IF EXISTS trg_markets_change_log_insert ON predictions_silver.markets;
+CREATE TRIGGER trg_markets_change_log_insert
+    AFTER INSERT ON predictions_silver.markets
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION predictions_gold.track_market_changes();
+
+DROP TRIGGER IF EXISTS trg_markets_change_log_update ON predictions_silver.markets;
+CREATE TRIGGER trg_markets_change_log_update
+    AFTER UPDATE ON predictions_silver.markets
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION predictions_gold.track_market_changes();
+
+DROP TRIGGER IF EXISTS trg_markets_change_log_delete ON predictions_silver.markets;
+CREATE TRIGGER trg_markets_change_log_delete
+    AFTER DELETE ON predictions_silver.markets
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION predictions_gold.track_market_changes();
+
+-- Seed totals from the current catalog (GoldLayerAggregator re-seeds on
+-- every full rebuild, correcting any drift)
+INSERT INTO predictions_gold.market_source_totals
+    (source, market_count, open_markets, volume_24h, volume_7d, updated_at)
+SELECT source, COUNT(*), COUNT(*) FILTER (WHERE is_active),
+       COALESCE(SUM(volume_24h), 0), COALESCE(SUM(volume_7d), 0), NOW()
+FROM predictions_silver.markets
+GROUP BY source
+ON CONFLICT (source) DO UPDATE SET
+    market_count = EXCLUDED.market_count,
+    open_markets = EXCLUDED.open_markets,
+    volume_24h = EXCLUDED.volume_24h,
+    volume_7d = EXCLUDED.volume_7d,
+    updated_at = EXCLUDED.updated_at;
@@ -0,0 +1,134 @@
+-- =============================================================================
+-- Predictions Terminal - Materialized Event Groups
+-- =============================================================================
+-- /events used to group predictions_silver.markets into events on every
+-- request (window function over the whole catalog, run four times for
+-- count / platform counts / aggregate metrics / page). The pipeline now
+-- maintains one row per (event_id, platform) instead:
+-- 1. predictions_silver.market_event_id(): the grouping rule, shared by the
+--    pipeline, the backend and an expression index on silver markets
+-- 2. event_groups: representative title/image/url/price plus rollups, built
+--    from active markets (is_active OR status IN ('active', 'open'))
+-- 3. event_group_members: market -> event_id as of the last refresh, so a
+--    market that moves between events also refreshes the group it left
+--
+-- GoldLayerAggregator refreshes touched groups from market_change_log on
+-- every hot cycle (migration 018) and rebuilds the table on full cycles.
+-- =============================================================================
+
+-- Mirrors backend/app/api/events_db.py _EVENT_ID_EXPR
+CREATE OR REPLACE FUNCTION predictions_silver.market_event_id(
+    p_source TEXT,
+    p_source_market_id TEXT,
+    p_slug TEXT,
+    p_extra_data JSONB
+) RETURNS TEXT AS $$
+    SELECT CASE
+        WHEN p_source = 'polymarket' THEN COALESCE(p_extra_data->>'event_slug', p_source_market_id)
+        WHEN p_source = 'kalshi'     THEN COALESCE(p_extra_data->>'event_ticker',
+                                                   SPLIT_PART(p_source_market_id, '-', 1))
+        WHEN p_source = 'limitless'  THEN COALESCE(NULLIF(SPLIT_PART(p_slug, '-', 1), ''),
+                                                   SPLIT_PART(p_source_market_id, '-', 1),
+                                                   p_source_market_id)
+        ELSE p_source_market_id
+    END
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+CREATE INDEX IF NOT EXISTS idx_markets_event_group
+    ON predictions_silver.markets (
+        predictions_silver.market_event_id(source, source_market_id, slug, extra_data),
+        source
+    );
+
+CREATE TABLE IF NOT EXISTS predictions_gold.event_groups (
+    event_id TEXT NOT NULL,
+    platform VARCHAR(50) NOT NULL,
+
+    -- Representative market: highest volume_total in the group
+    rep_title TEXT,
+    rep_image TEXT,
+    rep_url TEXT,
+    rep_yes_price NUMERIC,
+
+    -- Filters
+    category VARCHAR(255),                         -- most common category
+    categories TEXT[] NOT NULL DEFAULT '{}',       -- every member category
+    statuses TEXT[] NOT NULL DEFAULT '{}',
+    search_text TEXT NOT NULL DEFAULT '',          -- lower(title, slug) per member, newline separated
+
+    -- Rollups
+    market_count INTEGER NOT NULL DEFAULT 0,
+    total_volume NUMERIC NOT NULL DEFAULT 0,
+    volume_24h NUMERIC NOT NULL DEFAULT 0,
+    volume_1_week NUMERIC NOT NULL DEFAULT 0,
+    total_liquidity NUMERIC NOT NULL DEFAULT 0,
+    max_end_date TIMESTAMPTZ,
+    is_active BOOLEAN NOT NULL DEFAULT false,
+
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (event_id, platform)
+);
+
+-- One index per /events sort key (matching its NULLS LAST order), plus
+-- platform-scoped variants for the common platform filter
+CREATE INDEX IF NOT EXISTS idx_event_groups_volume
+    ON predictions_gold.event_groups (total_volume DESC NULLS LAST);
+CREATE INDEX IF NOT EXISTS idx_event_groups_volume_24h
+    ON predictions_gold.event_groups (volume_24h DESC NULLS LAST);
+CREATE INDEX IF NOT EXISTS idx_event_groups_markets
+    ON predictions_gold.event_groups (market_count DESC NULLS LAST);
+CREATE INDEX IF NOT EXISTS idx_event_groups_end_date
+    ON predictions_gold.event_groups (max_end_date DESC NULLS LAST);
+CREATE INDEX IF NOT EXISTS idx_event_groups_platform_volume
+    ON predictions_gold.event_groups (platform, total_volume DESC NULLS LAST);
+CREATE INDEX IF NOT EXISTS idx_event_groups_platform_volume_24h
+    ON predictions_gold.event_groups (platform, volume_24h DESC NULLS LAST);
+CREATE INDEX IF NOT EXISTS idx_event_groups_categories
+    ON predictions_gold.event_groups USING gin (categories);
+CREATE INDEX IF NOT EXISTS idx_event_groups_search_trgm
+    ON predictions_gold.event_groups USING gin (search_text gin_trgm_ops);
+
+CREATE TABLE IF NOT EXISTS predictions_gold.event_group_members (
+    source VARCHAR(50) NOT NULL,
+    source_market_id VARCHAR(500) NOT NULL,
+    event_id TEXT NOT NULL,
+    PRIMARY KEY (source, source_market_id)
+);
+
+-- Seed from the current catalog (the first hot cycle rebuilds it anyway)
+INSERT INTO predictions_gold.event_group_members (source, source_market_id, event_id)
+SELECT source, source_market_id,
+       predictions_silver.market_event_id(source, source_market_id, slug, extra_data)
+FROM predictions_silver.markets
+WHERE is_active = true OR status IN ('active', 'open')
+ON CONFLICT (source, source_market_id) DO UPDATE SET event_id = EXCLUDED.event_id;
+
+INSERT INTO predictions_gold.event_groups (
+    event_id, platform, rep_title, rep_image, rep_url, rep_yes_price,
+    category, categories, statuses, search_text,
+    market_count, total_volume, volume_24h, volume_1_week, total_liquidity,
+    max_end_date, is_active, updated_at
+)
+SELECT
+    predictions_silver.market_event_id(source, source_market_id, slug, extra_data),
+    source,
+    (ARRAY_AGG(title ORDER BY COALESCE(volume_total, 0) DESC))[1],
+    (ARRAY_AGG(image_url ORDER BY COALESCE(volume_total, 0) DESC))[1],
+    (ARRAY_AGG(source_url ORDER BY COALESCE(volume_total, 0) DESC))[1],
+    (ARRAY_AGG(yes_price ORDER BY COALESCE(volume_total, 0) DESC))[1],
+    MODE() WITHIN GROUP (ORDER BY category_name),
+    COALESCE(ARRAY_AGG(DISTINCT category_name) FILTER (WHERE category_name IS NOT NULL), '{}'),
+    COALESCE(ARRAY_AGG(DISTINCT status) FILTER (WHERE status IS NOT NULL), '{}'),
+    LOWER(STRING_AGG(COALESCE(title, '') || E'\n' || COALESCE(slug, ''), E'\n')),
+    COUNT(*),
+    COALESCE(SUM(volume_total), 0),
+    COALESCE(SUM(volume_24h), 0),
+    COALESCE(SUM(volume_7d), 0),
+    COALESCE(SUM(liquidity), 0),
+    MAX(end_date),
+    COALESCE(BOOL_OR(status = 'active' OR status = 'open'), false),
+    NOW()
+FROM predictions_silver.markets
+WHERE is_active = true OR status IN ('active', 'open')
+GROUP BY 1, 2
+ON CONFLICT (event_id, platform) DO NOTHING;
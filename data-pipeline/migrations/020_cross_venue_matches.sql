@@ -0,0 +1,74 @@
+-- =============================================================================
+-- Predictions Terminal - Persisted Cross-Venue Match Graph
+-- =============================================================================
+-- /arbitrage/opportunities and /cross-venue-events-db used to rebuild entity
+-- sets, inverted indexes and SequenceMatcher comparisons over every
+-- Polymarket and Kalshi title on each cache miss. The pipeline now keeps the
+-- match graph instead, and the endpoints join current prices onto it:
+-- 1. cross_venue_markets: eligible markets with the title features the
+--    matcher used (entities for candidate lookup, slug entities)
+-- 2. cross_venue_market_pairs: Polymarket <-> Kalshi market pairs scoring at
+--    or above the lowest min_match_score the API accepts
+-- 3. cross_venue_events: per-event title and token set (event title plus the
+--    top member market titles)
+-- 4. cross_venue_event_pairs: candidate event pairs (token Jaccard, semantic
+--    checks passed); the endpoint assigns them one-to-one by volume
+--
+-- GoldLayerAggregator.run_cross_venue_matching re-matches only markets whose
+-- title, event or eligibility changed (market_change_log, migration 018) and
+-- the events they belong to; full rebuilds run on the gold rebuild cadence.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS predictions_gold.cross_venue_markets (
+    source VARCHAR(50) NOT NULL,
+    source_market_id VARCHAR(500) NOT NULL,
+    event_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    entities TEXT[] NOT NULL DEFAULT '{}',
+    slug_entities TEXT[] NOT NULL DEFAULT '{}',
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (source, source_market_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_cross_venue_markets_entities
+    ON predictions_gold.cross_venue_markets USING gin (entities);
+CREATE INDEX IF NOT EXISTS idx_cross_venue_markets_event
+    ON predictions_gold.cross_venue_markets (source, event_id);
+
+CREATE TABLE IF NOT EXISTS predictions_gold.cross_venue_market_pairs (
+    poly_market_id VARCHAR(500) NOT NULL,
+    kalshi_market_id VARCHAR(500) NOT NULL,
+    similarity REAL NOT NULL,
+    matched_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (poly_market_id, kalshi_market_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_cross_venue_market_pairs_kalshi
+    ON predictions_gold.cross_venue_market_pairs (kalshi_market_id);
+CREATE INDEX IF NOT EXISTS idx_cross_venue_market_pairs_similarity
+    ON predictions_gold.cross_venue_market_pairs (similarity DESC);
+
+CREATE TABLE IF NOT EXISTS predictions_gold.cross_venue_events (
+    platform VARCHAR(50) NOT NULL,
+    event_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    tokens TEXT[] NOT NULL DEFAULT '{}',
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (platform, event_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_cross_venue_events_tokens
+    ON predictions_gold.cross_venue_events USING gin (tokens);
+
+CREATE TABLE IF NOT EXISTS predictions_gold.cross_venue_event_pairs (
+    poly_event_id TEXT NOT NULL,
+    kalshi_event_id TEXT NOT NULL,
+    similarity REAL NOT NULL,
+    matched_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (poly_event_id, kalshi_event_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_cross_venue_event_pairs_kalshi
+    ON predictions_gold.cross_venue_event_pairs (kalshi_event_id);
+
+-- The tables are filled by the first cross-venue cycle (a full rebuild)
@@ -0,0 +1,120 @@
+-- =============================================================================
+-- Predictions Terminal - Silver Time Rollups (prices / trades)
+-- =============================================================================
+-- predictions_silver.prices and predictions_silver.trades are range
+-- partitioned, but 003 only created partitions up to 2026-02 (prices) and
+-- 2026-03 (trades); newer rows land in the *_default partitions where pruning
+-- no longer helps. Partitions are now managed by the pipeline
+-- (predictions_ingest.partitions.PartitionManager): created ahead of time,
+-- rows moved out of the default partitions, expired partitions dropped or
+-- detached instead of DELETEd.
+--
+-- Rollup tiers maintained by predictions_ingest.aggregation.rollups:
+-- 1. prices_1m / prices_1h / prices_1d: OHLC of yes_price per market
+-- 2. trades_1m / trades_1h / trades_1d: counts, volumes and trade-price OHLC
+-- 3. rollup_watermarks: per tier, the time before which buckets are final
+--    (raw partitions are only expired once their range is rolled up)
+--
+-- 1m and 1h tiers are themselves range partitioned (weekly / monthly, managed
+-- by the same PartitionManager); 1d tiers are small and kept whole. Charts
+-- over 30 days read a few hundred 1h/1d rows instead of raw snapshots.
+-- =============================================================================
+
+-- =============================================================================
+-- PRICE ROLLUPS
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS predictions_silver.prices_1m (
+    source VARCHAR(50) NOT NULL,
+    source_market_id VARCHAR(500) NOT NULL,
+    bucket_start TIMESTAMPTZ NOT NULL,
+    open_price DECIMAL(10, 6),
+    high_price DECIMAL(10, 6),
+    low_price DECIMAL(10, 6),
+    close_price DECIMAL(10, 6),
+    samples INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (source, source_market_id, bucket_start)
+) PARTITION BY RANGE (bucket_start);
+
+CREATE TABLE IF NOT EXISTS predictions_silver.prices_1m_default
+    PARTITION OF predictions_silver.prices_1m DEFAULT;
+
+CREATE TABLE IF NOT EXISTS predictions_silver.prices_1h (
+    LIKE predictions_silver.prices_1m INCLUDING DEFAULTS,
+    PRIMARY KEY (source, source_market_id, bucket_start)
+) PARTITION BY RANGE (bucket_start);
+
+CREATE TABLE IF NOT EXISTS predictions_silver.prices_1h_default
+    PARTITION OF predictions_silver.prices_1h DEFAULT;
+
+CREATE TABLE IF NOT EXISTS predictions_silver.prices_1d (
+    LIKE predictions_silver.prices_1m INCLUDING DEFAULTS,
+    PRIMARY KEY (source, source_market_id, bucket_start)
+);
+
+-- Chart lookups by market id alone (API routes carry no source)
+CREATE INDEX IF NOT EXISTS idx_prices_1m_market_time
+    ON predictions_silver.prices_1m (source_market_id, bucket_start DESC);
+CREATE INDEX IF NOT EXISTS idx_prices_1h_market_time
+    ON predictions_silver.prices_1h (source_market_id, bucket_start DESC);
+CREATE INDEX IF NOT EXISTS idx_prices_1d_market_time
+    ON predictions_silver.prices_1d (source_market_id, bucket_start DESC);
+
+-- =============================================================================
+-- TRADE ROLLUPS
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS predictions_silver.trades_1m (
+    source VARCHAR(50) NOT NULL,
+    source_market_id VARCHAR(500) NOT NULL,
+    bucket_start TIMESTAMPTZ NOT NULL,
+    trade_count INTEGER NOT NULL DEFAULT 0,
+    buy_count INTEGER NOT NULL DEFAULT 0,
+    volume DECIMAL(24, 6) NOT NULL DEFAULT 0,
+    buy_volume DECIMAL(24, 6) NOT NULL DEFAULT 0,
+    open_price DECIMAL(10, 6),
+    high_price DECIMAL(10, 6),
+    low_price DECIMAL(10, 6),
+    close_price DECIMAL(10, 6),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (source, source_market_id, bucket_start)
+) PARTITION BY RANGE (bucket_start);
+
+CREATE TABLE IF NOT EXISTS predictions_silver.trades_1m_default
+    PARTITION OF predictions_silver.trades_1m DEFAULT;
+
+CREATE TABLE IF NOT EXISTS predictions_silver.trades_1h (
+    LIKE predictions_silver.trades_1m INCLUDING DEFAULTS,
+    PRIMARY KEY (source, source_market_id, bucket_start)
+) PARTITION BY RANGE (bucket_start);
+
+CREATE TABLE IF NOT EXISTS predictions_silver.trades_1h_default
+    PARTITION OF predictions_silver.trades_1h DEFAULT;
+
+CREATE TABLE IF NOT EXISTS predictions_silver.trades_1d (
+    LIKE predictions_silver.trades_1m INCLUDING DEFAULTS,
+    PRIMARY KEY (source, source_market_id, bucket_start)
+);
+
+CREATE INDEX IF NOT EXISTS idx_trades_1m_market_time
+    ON predictions_silver.trades_1m (source_market_id, bucket_start DESC);
+CREATE INDEX IF NOT EXISTS idx_trades_1h_market_time
+    ON predictions_silver.trades_1h (source_market_id, bucket_start DESC);
+CREATE INDEX IF NOT EXISTS idx_trades_1d_market_time
+    ON predictions_silver.trades_1d (source_market_id, bucket_start DESC);
+
+-- =============================================================================
+-- WATERMARKS
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS predictions_silver.rollup_watermarks (
+    rollup VARCHAR(50) PRIMARY KEY,        -- target table, e.g. 'prices_1m'
+    rolled_through TIMESTAMPTZ NOT NULL,   -- buckets before this are final
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+COMMENT ON TABLE predictions_silver.prices_1h IS
+    'Hourly yes_price OHLC per market, rolled up from prices_1m. Partitions managed by the pipeline.';
+COMMENT ON TABLE predictions_silver.trades_1h IS
+    'Hourly trade counts/volumes per market, rolled up from trades_1m. Partitions managed by the pipeline.';
@@ -0,0 +1,24 @@
+-- =============================================================================
+-- Predictions Terminal - History Backfill Checkpoints
+-- =============================================================================
+-- scripts/backfill_market_history.py writes market_price_history and
+-- market_trade_activity for batches of markets at a time. Each batch commits
+-- its candles, windows and checkpoint rows in one transaction, so an
+-- interrupted backfill resumes with the first market not yet recorded here.
+--
+-- market_trade_activity rows written by the backfill carry
+-- snapshot_timestamp = window_end, which makes re-runs idempotent on the
+-- existing (source_market_id, window_hours, snapshot_timestamp) key.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS predictions_gold.backfill_checkpoints (
+    job VARCHAR(100) NOT NULL,             -- e.g. 'history:all:30d'
+    source VARCHAR(50) NOT NULL,
+    source_market_id VARCHAR(500) NOT NULL,
+    snapshots INTEGER NOT NULL DEFAULT 0,
+    completed_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (job, source, source_market_id)
+);
+
+COMMENT ON TABLE predictions_gold.backfill_checkpoints IS
+    'Markets already processed per backfill job; the backfill skips them on resume.';
@@ -0,0 +1,23 @@
+-- =============================================================================
+-- Predictions Terminal - Incremental Hourly Candles
+-- =============================================================================
+-- GoldLayerAggregator.aggregate_market_price_history folds new
+-- predictions_silver.prices ticks into the hourly market_price_history rows
+-- instead of re-aggregating the trailing 24h every run. Each candle keeps
+-- the time of its first and last folded tick:
+-- 1. open_at: open_price is only set when the candle is created
+-- 2. close_at: the last tick folded; later ticks update close/high/low and
+--    add to volume/trade_count, earlier ones are already counted
+--
+-- The newest close_at across all candles is the run's watermark (read
+-- through idx_price_history_close_at); rows written before this migration
+-- have NULL open_at/close_at and are rebuilt from their ticks on first touch.
+-- =============================================================================
+
+ALTER TABLE predictions_gold.market_price_history
+    ADD COLUMN IF NOT EXISTS open_at TIMESTAMPTZ,
+    ADD COLUMN IF NOT EXISTS close_at TIMESTAMPTZ;
+
+CREATE INDEX IF NOT EXISTS idx_price_history_close_at
+    ON predictions_gold.market_price_history (close_at DESC)
+    WHERE close_at IS NOT NULL;
@@ -0,0 +1,45 @@
+-- =============================================================================
+-- Predictions Terminal - Trader Trade Store & Sync Cursors
+-- =============================================================================
+-- TraderTracker.refresh_all_traders (backend app/services/trader_tracker.py)
+-- used to refetch up to 1000 trades per wallet on every refresh and score
+-- them one wallet at a time. It now keeps every fetched trade here and a
+-- cursor per wallet, so a refresh only asks Dome for trades newer than the
+-- last sync and recomputes trader_stats for a whole batch of wallets from
+-- the stored trades.
+--
+-- trade_key identifies a fill (order hash / tx hash plus token, side, time
+-- and size); the one-second overlap of each incremental fetch is absorbed
+-- by the primary key.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS trader_trades (
+    wallet_address TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    trade_key TEXT NOT NULL,
+    token_id TEXT NOT NULL DEFAULT '',
+    market_slug TEXT NOT NULL DEFAULT 'unknown',
+    side TEXT NOT NULL,                    -- 'BUY' / 'SELL'
+    price DOUBLE PRECISION NOT NULL,
+    shares DOUBLE PRECISION NOT NULL,
+    traded_at TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (wallet_address, platform, trade_key)
+);
+
+CREATE TABLE IF NOT EXISTS trader_sync_cursors (
+    wallet_address TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    last_trade_at TIMESTAMPTZ,             -- newest stored trade; NULL = never synced
+    synced_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (wallet_address, platform)
+);
+
+-- Outcome streaks over realized (closing) trades, oldest to newest
+ALTER TABLE trader_stats
+    ADD COLUMN IF NOT EXISTS longest_win_streak INTEGER DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS longest_loss_streak INTEGER DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS current_streak INTEGER DEFAULT 0;
+
+COMMENT ON TABLE trader_trades IS 'Fetched trades per tracked wallet; trader_stats is computed from these';
+COMMENT ON TABLE trader_sync_cursors IS 'Per-wallet incremental fetch cursor for the trader stats refresh';
+COMMENT ON COLUMN trader_stats.current_streak IS 'Current run of winning (>0) or losing (<0) realized trades';
@@ -0,0 +1,70 @@
+-- =============================================================================
+-- Predictions Terminal - Source Totals Maintained by the Gold Aggregator
+-- =============================================================================
+-- Migration 018 kept predictions_gold.market_source_totals up to date from
+-- the change-log trigger, so every silver write paid for a totals upsert and
+-- concurrent writers serialized on the per-source rows; the full rebuild had
+-- to block silver writers (SHARE lock) to re-seed them consistently.
+--
+-- The trigger now only records changed keys. GoldLayerAggregator applies the
+-- totals deltas itself on incremental hot cycles:
+-- 1. market_source_contrib: what each market last contributed to the totals
+-- 2. delta = current silver row - stored contribution, for changed keys only
+--
+-- Re-applying a key is a no-op (its contribution already matches silver), so
+-- a rebuild racing with writers needs no lock: keys written after the rebuild
+-- read the change log are revisited by the next incremental cycle.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS predictions_gold.market_source_contrib (
+    source VARCHAR(50) NOT NULL,
+    source_market_id VARCHAR(500) NOT NULL,
+    is_active BOOLEAN NOT NULL,
+    volume_24h NUMERIC NOT NULL DEFAULT 0,
+    volume_7d NUMERIC NOT NULL DEFAULT 0,
+    PRIMARY KEY (source, source_market_id)
+);
+
+CREATE OR REPLACE FUNCTION predictions_gold.track_market_changes()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        INSERT INTO predictions_gold.market_change_log (source, source_market_id, change_seq, changed_at)
+        SELECT source, source_market_id, nextval('predictions_gold.market_change_seq'), NOW()
+        FROM old_rows
+        ON CONFLICT (source, source_market_id) DO UPDATE SET
+            change_seq = EXCLUDED.change_seq,
+            changed_at = EXCLUDED.changed_at;
+    ELSE
+        INSERT INTO predictions_gold.market_change_log (source, source_market_id, change_seq, changed_at)
+        SELECT source, source_market_id, nextval('predictions_gold.market_change_seq'), NOW()
+        FROM new_rows
+        ON CONFLICT (source, source_market_id) DO UPDATE SET
+            change_seq = EXCLUDED.change_seq,
+            changed_at = EXCLUDED.changed_at;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Seed contributions and totals from the current catalog
+INSERT INTO predictions_gold.market_source_contrib
+    (source, source_market_id, is_active, volume_24h, volume_7d)
+SELECT source, source_market_id, is_active IS TRUE,
+       COALESCE(volume_24h, 0), COALESCE(volume_7d, 0)
+FROM predictions_silver.markets
+ON CONFLICT (source, source_market_id) DO UPDATE SET
+    is_active = EXCLUDED.is_active,
+    volume_24h = EXCLUDED.volume_24h,
+    volume_7d = EXCLUDED.volume_7d;
+
+DELETE FROM predictions_gold.market_source_totals;
+INSERT INTO predictions_gold.market_source_totals
+    (source, market_count, open_markets, volume_24h, volume_7d, updated_at)
+SELECT source, COUNT(*), COUNT(*) FILTER (WHERE is_active),
+       SUM(volume_24h), SUM(volume_7d), NOW()
+FROM predictions_gold.market_source_contrib
+GROUP BY source;
+
+COMMENT ON TABLE predictions_gold.market_source_contrib IS 'Per-market share of market_source_totals, for applying change-log deltas';
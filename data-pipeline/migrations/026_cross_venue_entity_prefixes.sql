@@ -0,0 +1,23 @@
+-- =============================================================================
+-- Predictions Terminal - Cross-Venue Candidates by Entity Prefix
+-- =============================================================================
+-- calculate_similarity (predictions_ingest/aggregation/cross_venue.py)
+-- counts entities sharing a 4-character prefix as shared ("elect" /
+-- "election", "nominee" / "nomination"), and the full rebuild finds such
+-- pairs. Incremental cycles looked candidates up by exact entity overlap
+-- (entities && ...), so a changed market never met the titles it only shares
+-- a prefix with until the next full rebuild.
+--
+-- entity_prefixes() is what they now select on; the expression index keeps
+-- that an index lookup and needs no backfill of cross_venue_markets.
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION predictions_gold.entity_prefixes(entities TEXT[])
+RETURNS TEXT[] AS $$
+    SELECT COALESCE(array_agg(DISTINCT left(e, 4)), '{}') FROM unnest(entities) AS e
+$$ LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE;
+
+CREATE INDEX IF NOT EXISTS idx_cross_venue_markets_entity_prefixes
+    ON predictions_gold.cross_venue_markets USING gin (predictions_gold.entity_prefixes(entities));
+
+COMMENT ON FUNCTION predictions_gold.entity_prefixes(TEXT[]) IS 'Distinct 4-character entity prefixes; cross-venue incremental candidate lookup';
@@ -0,0 +1,38 @@
+-- =============================================================================
+-- Predictions Terminal - Silver Price Ingest Order
+-- =============================================================================
+-- Price ticks do not arrive in snapshot order: Dome stamps ticks with the
+-- upstream raw["timestamp"] and refetches PRICE_HISTORY_HOURS of history,
+-- and Limitless re-inserts its last 24 hourly points on every run. A
+-- watermark over snapshot_at (migration 023: MAX(close_at)) never sees a
+-- tick stamped before it.
+--
+-- 1. predictions_silver.prices.ingested_at: when the row was inserted or
+--    last changed by SilverWriter (NULL for rows written before this
+--    migration, which are already folded)
+-- 2. predictions_gold.market_price_history.ingested_at: newest ingested_at
+--    among the candle's ticks; MAX over all candles is the candle
+--    watermark, so every tick ingested after it is folded whatever its
+--    snapshot time
+-- =============================================================================
+
+ALTER TABLE predictions_silver.prices
+    ADD COLUMN IF NOT EXISTS ingested_at TIMESTAMPTZ;
+
+-- Set separately so existing rows stay NULL instead of taking the migration time
+ALTER TABLE predictions_silver.prices
+    ALTER COLUMN ingested_at SET DEFAULT NOW();
+
+CREATE INDEX IF NOT EXISTS idx_prices_ingested_at
+    ON predictions_silver.prices (ingested_at)
+    WHERE ingested_at IS NOT NULL;
+
+ALTER TABLE predictions_gold.market_price_history
+    ADD COLUMN IF NOT EXISTS ingested_at TIMESTAMPTZ;
+
+CREATE INDEX IF NOT EXISTS idx_price_history_ingested_at
+    ON predictions_gold.market_price_history (ingested_at DESC)
+    WHERE ingested_at IS NOT NULL;
+
+COMMENT ON COLUMN predictions_silver.prices.ingested_at IS 'Insert or last change time; candle and rollup incremental reads';
+COMMENT ON COLUMN predictions_gold.market_price_history.ingested_at IS 'Newest ingested_at among the candle''s ticks; candle watermark';
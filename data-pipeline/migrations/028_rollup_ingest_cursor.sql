@@ -0,0 +1,19 @@
+-- =============================================================================
+-- Predictions Terminal - Rollup Ingest Cursor
+-- =============================================================================
+-- Price rollups re-rolled only the last ROLLUP_PRICES_SETTLE_MINUTES of
+-- snapshot time, but Dome and Limitless ticks arrive hours behind their
+-- snapshot_at (migration 027). Such ticks never reached prices_1m or the
+-- tiers above it, and PartitionManager could expire their raw partition.
+--
+-- ingested_through is the ingested_at (migration 027) up to which raw rows
+-- have been rolled. Each run re-rolls from the oldest snapshot ingested
+-- after it, and a raw partition holding such a row is not expired. NULL for
+-- tiers not rolled from a raw table with ingested_at.
+-- =============================================================================
+
+ALTER TABLE predictions_silver.rollup_watermarks
+    ADD COLUMN IF NOT EXISTS ingested_through TIMESTAMPTZ;
+
+COMMENT ON COLUMN predictions_silver.rollup_watermarks.ingested_through IS
+    'Raw rows ingested up to this time are rolled up, whatever their bucket';
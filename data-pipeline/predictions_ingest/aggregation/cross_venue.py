@@ -0,0 +1,605 @@
+"""
+Cross-venue title matching for the persisted match graph (migration 020).
+
+Polymarket and Kalshi list the same questions under different titles and
+IDs. The rules here decide which markets (for arbitrage) and which events
+(for the cross-venue page) are the same thing on both venues. The pipeline
+runs them once per new or changed title, and /arbitrage/opportunities and
+/cross-venue-events-db only read the pairs.
+
+The backend deploys without this package and keeps its own copy of the
+market rules in backend/app/api/arbitrage.py (calculate_similarity,
+_extract_entities), still used for opportunity dedup and the per-request
+cross-venue endpoints. The two must change together;
+backend/tests/test_title_matching_sync.py fails when they disagree.
+
+Everything here is pure CPU work (Python plus the NumPy candidate
+generation in title_lsh), so the aggregator runs it in a worker thread.
+"""
+
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Iterable, Optional
+
+from predictions_ingest.aggregation import title_lsh
+
+POLYMARKET = "polymarket"
+KALSHI = "kalshi"
+
+# Lowest min_match_score / min_similarity the API accepts; pairs below these
+# can never be served, so they are not stored
+MIN_MARKET_SIMILARITY = 0.30
+MIN_EVENT_SIMILARITY = 0.20
+MIN_SHARED_EVENT_TOKENS = 2
+
+# Markets below this total volume cannot be traded and are not matched
+MIN_MARKET_VOLUME = 50
+
+# Event tokens come from the event title plus its top markets by volume
+EVENT_TITLE_MARKETS = 20
+
+# calculate_similarity returns 0 below a subject Jaccard of 0.25 (entity
+# Jaccard of 0.15 without subjects); prefix tokens only approximate its
+# matching, so the pre-filter stays at the lower floor
+_MIN_TOKEN_JACCARD = 0.15
+
+# ... and when both titles have subjects but share under half of the
+# smaller subject set
+_MIN_SUBJECT_RECALL = 0.5
+
+# Markets scored with calculate_similarity per market (best LSH
+# candidates). Every pair at or above MIN_MARKET_SIMILARITY is stored, not
+# just the best match, and a common subject ("Trump visits ...") pairs a
+# title with hundreds on the other venue, so this only bounds pathological
+# titles; the token floors above do the pruning
+MARKET_CANDIDATES = 1000
+
+
+# ============================================================================
+# MARKET SIMILARITY (arbitrage)
+# ============================================================================
+
+# Common stop-words that inflate similarity for unrelated markets
+# Includes prediction-market-specific noise words
+STOP_WORDS = {
+    # Standard stop words
+    'will', 'the', 'a', 'an', 'by', 'in', 'of', 'to', 'for', 'on', 'at',
+    'before', 'after', 'or', 'and', 'be', 'is', 'it', 'this', 'that',
+    'any', 'all', 'new', 'first', 'come', 'comes', 'which', 'than',
+    'has', 'have', 'does', 'do', 'not', 'no', 'yes', 'what', 'who',
+    'how', 'many', 'much', 'more', 'most', 'there', 'their', 'they',
+    'been', 'were', 'was', 'are', 'its', 'can', 'could', 'would', 'should',
+    # Prediction-market-specific noise that causes false matches
+    'above', 'below', 'price', 'win', 'wins', 'winner', 'release', 'released',
+    'launch', 'launched', 'token', 'hit', 'reach', 'market', 'markets',
+    'game', 'team', 'pick', 'draft', 'round', 'season',
+    'cup', 'mens', 'womens',
+    'world', 'national', 'international', 'united', 'states',
+    'president',
+    'trillion', 'trillionaire', 'billion', 'billionaire', 'million',
+    'dollar', 'dollars', 'percent', 'rate',
+    'make', 'made', 'buy', 'sell', 'get', 'got', 'take', 'run', 'goes',
+    'next', 'last', 'end', 'start', 'day', 'days', 'week', 'month', 'year',
+    '2024', '2025', '2026', '2027', '2028', '2029', '2030',
+    'q1', 'q2', 'q3', 'q4', 'january', 'february', 'march', 'april',
+    'may', 'june', 'july', 'august', 'september', 'october', 'november', 'december',
+    'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec',
+}
+
+# Template words: these describe the TYPE of market, not WHICH specific one.
+# Markets that share ONLY template words but different subjects are FALSE MATCHES.
+TEMPLATE_WORDS = {
+    # Political templates
+    'senate', 'race', 'governor', 'cabinet', 'leave', 'person',
+    'nomination', 'nominee', 'nominate', 'nominated',
+    'democrat', 'republican', 'democrats', 'republicans', 'democratic',
+    'election', 'presidential', 'gubernatorial', 'governorship',
+    'flip', 'flips', 'congressional', 'senatorial',
+    # Sports templates
+    'finals', 'final', 'championship', 'conference', 'playoffs', 'playoff',
+    'league', 'premier', 'eastern', 'western', 'seed',
+    'pro', 'basketball', 'football', 'baseball', 'hockey', 'soccer',
+    # Market type templates
+    'fdv', 'ipo', 'closing', 'cap', 'volume',
+    'normalize', 'relations',
+}
+
+# Common entity aliases in prediction markets (alternate name -> canonical)
+ENTITY_ALIASES = {
+    # Crypto
+    'btc': 'bitcoin', 'eth': 'ethereum', 'sol': 'solana', 'xrp': 'ripple',
+    'bnb': 'binance', 'doge': 'dogecoin', 'ada': 'cardano', 'dot': 'polkadot',
+    'avax': 'avalanche', 'matic': 'polygon', 'link': 'chainlink',
+    'ltc': 'litecoin', 'uni': 'uniswap', 'aave': 'aave', 'shib': 'shibainu',
+    # Gaming
+    'gta6': 'gtavi', 'gta': 'gtavi', 'vi': 'gtavi',
+    # Sports abbreviations
+    'nfl': 'football', 'nba': 'basketball', 'mlb': 'baseball',
+    'nhl': 'hockey',
+    'epl': 'premierleague', 'ucl': 'championsleague',
+    'superbowl': 'superbowl', 'worldcup': 'worldcup',
+    # Politics
+    'dem': 'democrat', 'democratic': 'democrat', 'dems': 'democrat',
+    'gop': 'republican', 'rep': 'republican', 'republicans': 'republican',
+    'potus': 'president', 'scotus': 'supremecourt',
+    'governorship': 'governor', 'gubernatorial': 'governor',
+    'senatorial': 'senate', 'congressional': 'congress',
+    # People (common in prediction markets)
+    'donaldtrump': 'trump', 'donald': 'trump',
+    'elonmusk': 'musk', 'elon': 'musk',
+    'biden': 'biden', 'joebiden': 'biden',
+    'desantis': 'desantis', 'rondesantis': 'desantis',
+    'kamala': 'harris', 'kamalaharris': 'harris',
+    # Tech / AI
+    'ai': 'artificialintelligence', 'ev': 'electricvehicle',
+    'openai': 'openai', 'chatgpt': 'openai',
+    'agi': 'artificialintelligence',
+    # Economy
+    'fed': 'federalreserve', 'fomc': 'federalreserve',
+    'gdp': 'gdp', 'cpi': 'inflation', 'pce': 'inflation',
+    'recession': 'recession', 'downturn': 'recession',
+    # Geopolitics
+    'greenland': 'greenland', 'ukraine': 'ukraine', 'russia': 'russia',
+    'china': 'china', 'taiwan': 'taiwan', 'prc': 'china', 'roc': 'taiwan',
+    # Actions - map similar verbs to canonical
+    'acquire': 'buy', 'purchase': 'buy', 'annex': 'buy',
+    'convicted': 'convict', 'conviction': 'convict', 'indicted': 'indict',
+    'impeach': 'impeach', 'impeached': 'impeach', 'impeachment': 'impeach',
+    'resign': 'resign', 'resigned': 'resign', 'resignation': 'resign',
+    'fired': 'fire', 'firing': 'fire', 'terminate': 'fire',
+}
+
+_SLUG_NOISE = STOP_WORDS | {'kx', '', 'be', 'at', 'et', 'am', 'pm', 'utc'}
+
+
+def normalize(s: str) -> str:
+    return re.sub(r'[^a-z0-9\s]', '', s.lower()).strip()
+
+
+def extract_entities(title: str) -> set[str]:
+    """All entities in a title (stop words removed, canonicalized, len>=3)."""
+    words = set(normalize(title).split()) - STOP_WORDS
+    entities = set()
+    for w in words:
+        if w.isdigit():
+            continue
+        c = ENTITY_ALIASES.get(w, w)
+        if len(c) >= 3:
+            entities.add(c)
+    return entities
+
+
+def extract_subject_entities(title: str) -> set[str]:
+    """
+    SUBJECT entities - the specific nouns that distinguish this market
+    (entities that are not template/category words).
+
+    "Will Doug Burgum leave the Trump Cabinet?" -> {'doug', 'burgum', 'trump'}
+    """
+    return extract_entities(title) - TEMPLATE_WORDS
+
+
+def slug_entities(market_id: str) -> set[str]:
+    """Entities in a slug-like market ID; empty for hex IDs and short tickers."""
+    slug = (market_id or "").lower()
+    if not slug or len(slug) <= 10 or slug.startswith('0x'):
+        return set()
+    words = set(re.split(r'[-_]', slug)) - _SLUG_NOISE
+    return {ENTITY_ALIASES.get(w, w) for w in words if len(w) >= 3 and not w.isdigit()}
+
+
+def calculate_similarity(title1: str, title2: str) -> float:
+    """
+    Title similarity for cross-venue market matching.
+
+    Most prediction markets follow a template: [SUBJECT] + [EVENT TYPE].
+    Markets sharing the template but not the subject ("Doug Burgum leave
+    Cabinet" vs "Marco Rubio leave Cabinet") are different markets, so
+    subject overlap is required and weighted heavily; template overlap and
+    sequence similarity are secondary signals.
+    """
+    t1 = normalize(title1)
+    t2 = normalize(title2)
+
+    if t1 == t2:
+        return 1.0
+
+    entities1 = extract_entities(title1)
+    entities2 = extract_entities(title2)
+
+    if not entities1 or not entities2:
+        return 0.0
+
+    subjects1 = entities1 - TEMPLATE_WORDS
+    subjects2 = entities2 - TEMPLATE_WORDS
+
+    # --- Entity overlap with prefix matching ---
+    entity_intersection = entities1 & entities2
+    entity_union = entities1 | entities2
+
+    # Prefix matching for stemming (convicted/conviction, nomination/nominee)
+    if len(entity_intersection) < min(len(entities1), len(entities2)):
+        unmatched1 = entities1 - entity_intersection
+        unmatched2 = entities2 - entity_intersection
+        for e1 in list(unmatched1):
+            for e2 in list(unmatched2):
+                prefix_len = min(5, min(len(e1), len(e2)))
+                if prefix_len >= 4 and e1[:prefix_len] == e2[:prefix_len]:
+                    entity_intersection.add(e1)
+                    unmatched1.discard(e1)
+                    unmatched2.discard(e2)
+                    break
+        entity_union = entity_intersection | unmatched1 | unmatched2
+
+    if not entity_intersection:
+        return 0.0
+
+    # --- Subject entity overlap: both sides' subjects must intersect ---
+    subject_intersection = subjects1 & subjects2
+
+    if subjects1 and subjects2 and not subject_intersection:
+        for s1 in subjects1:
+            for s2 in subjects2:
+                prefix_len = min(5, min(len(s1), len(s2)))
+                if prefix_len >= 4 and s1[:prefix_len] == s2[:prefix_len]:
+                    subject_intersection.add(s1)
+                    break
+
+    # Both have 2+ subject entities but share NONE -> different markets
+    if len(subjects1) >= 2 and len(subjects2) >= 2 and not subject_intersection:
+        return 0.0
+
+    if subjects1 and subjects2 and not subject_intersection:
+        # Non-overlapping subjects could still be the same entity
+        # ("warriors" vs "warrior")
+        best_sub_sim = 0
+        for s1 in subjects1:
+            for s2 in subjects2:
+                if len(s1) >= 4 and len(s2) >= 4:
+                    sr = SequenceMatcher(None, s1, s2).ratio()
+                    best_sub_sim = max(best_sub_sim, sr)
+        if best_sub_sim < 0.75:
+            return 0.0
+
+    subject_union = subjects1 | subjects2
+    if subject_union:
+        subject_jaccard = len(subject_intersection) / len(subject_union)
+    else:
+        subject_jaccard = len(entity_intersection) / len(entity_union) if entity_union else 0
+
+    entity_jaccard = len(entity_intersection) / len(entity_union)
+    entity_recall = len(entity_intersection) / min(len(entities1), len(entities2))
+
+    # Skip the expensive SequenceMatcher when overlap is clearly too low
+    if entity_jaccard < 0.25 and (not subject_union or subject_jaccard < 0.35):
+        return 0.0
+
+    seq_ratio = SequenceMatcher(None, t1, t2).ratio()
+
+    if subject_union:
+        score = (0.40 * subject_jaccard) + (0.20 * entity_jaccard) + (0.25 * seq_ratio) + (0.15 * entity_recall)
+    else:
+        score = (0.55 * entity_jaccard) + (0.30 * seq_ratio) + (0.15 * entity_recall)
+
+    if entity_jaccard < 0.15:
+        return 0.0
+
+    if subject_union and subject_jaccard < 0.25:
+        return 0.0
+
+    # Both sides have subjects but share under half of the smaller set:
+    # "Doug Burgum leave Trump Cabinet" vs "Marco Rubio leave Trump Cabinet"
+    if subjects1 and subjects2:
+        subject_recall = len(subject_intersection) / min(len(subjects1), len(subjects2))
+        if subject_recall < 0.50:
+            return 0.0
+
+    return score
+
+
+@dataclass
+class MatchMarket:
+    """A market's matching features, as stored in cross_venue_markets."""
+    source: str
+    market_id: str
+    event_id: str
+    title: str
+    entities: frozenset
+    slug_entities: frozenset
+
+    @property
+    def match_tokens(self) -> frozenset:
+        """
+        Candidate-generation tokens: subject entities cut to the 4-character
+        prefix calculate_similarity matches on. calculate_similarity scores
+        0 unless both titles share a subject or neither has one, so titles
+        without subjects use their (marked) entity prefixes instead and only
+        meet each other.
+        """
+        subjects = self.entities - TEMPLATE_WORDS
+        if subjects:
+            return frozenset(e[:4] for e in subjects)
+        return frozenset("~" + e[:4] for e in self.entities)
+
+    @property
+    def entity_prefixes(self) -> frozenset:
+        """
+        4-character prefixes of all entities: any title calculate_similarity
+        can pair with this one shares at least one. Mirrors SQL
+        predictions_gold.entity_prefixes (migration 026).
+        """
+        return frozenset(e[:4] for e in self.entities)
+
+    def to_record(self) -> tuple:
+        return (self.source, self.market_id, self.event_id, self.title,
+                sorted(self.entities), sorted(self.slug_entities))
+
+
+def market_features(source: str, market_id: str, event_id: str, title: str) -> MatchMarket:
+    return MatchMarket(
+        source=source,
+        market_id=market_id,
+        event_id=event_id,
+        title=title,
+        entities=frozenset(extract_entities(title)),
+        slug_entities=frozenset(slug_entities(market_id)),
+    )
+
+
+def match_markets(
+    probes: Iterable[MatchMarket],
+    candidates: Iterable[MatchMarket],
+) -> dict[tuple[str, str], float]:
+    """
+    Pair markets from opposite venues.
+
+    Candidates on the other venue come from MinHash/LSH over each
+    market's match_tokens (title_lsh), ranked by exact token Jaccard and
+    recall in NumPy; the top MARKET_CANDIDATES per market that pass the
+    token floors calculate_similarity applies are scored with it.
+    Returns {(poly_market_id, kalshi_market_id): similarity}.
+    """
+    venues: dict[str, list[MatchMarket]] = {POLYMARKET: [], KALSHI: []}
+    for c in candidates:
+        if c.entities:
+            venues[c.source].append(c)
+    probes = [p for p in probes if p.entities]
+
+    pairs: dict[tuple[str, str], float] = {}
+    for source, other_source in ((POLYMARKET, KALSHI), (KALSHI, POLYMARKET)):
+        side = [p for p in probes if p.source == source]
+        other = venues[other_source]
+        side_tokens = [m.match_tokens for m in side]
+        other_tokens = [m.match_tokens for m in other]
+        left, right = title_lsh.similar_pairs(
+            side_tokens, other_tokens, top_k=MARKET_CANDIDATES, min_jaccard=_MIN_TOKEN_JACCARD,
+        )
+        for i, j in zip(left.tolist(), right.tolist()):
+            poly, kalshi = (side[i], other[j]) if source == POLYMARKET else (other[j], side[i])
+            key = (poly.market_id, kalshi.market_id)
+            if key in pairs:
+                continue
+            # Subject tokens only share with subject tokens ("~" marks the rest)
+            a, b = side_tokens[i], other_tokens[j]
+            if not next(iter(a)).startswith("~") and len(a & b) < _MIN_SUBJECT_RECALL * min(len(a), len(b)):
+                continue
+            similarity = calculate_similarity(poly.title, kalshi.title)
+            if similarity < MIN_MARKET_SIMILARITY:
+                continue
+
+            # Slug-based validation (hex IDs have no slug entities)
+            if poly.slug_entities and kalshi.slug_entities:
+                shared = poly.slug_entities & kalshi.slug_entities
+                if not shared:
+                    continue
+                if len(shared) / len(poly.slug_entities | kalshi.slug_entities) < 0.35:
+                    continue
+            pairs[key] = round(similarity, 4)
+    return pairs
+
+
+# ============================================================================
+# EVENT SIMILARITY (cross-venue page)
+# ============================================================================
+
+EVENT_STOP_WORDS = {
+    "will", "the", "a", "an", "be", "is", "are", "was", "were", "have",
+    "has", "had", "do", "does", "did", "for", "of", "to", "in", "on",
+    "at", "by", "from", "with", "this", "that", "it", "its", "what",
+    "who", "how", "when", "where", "which", "than", "and", "or", "not",
+    "before", "after", "during", "over", "above", "below", "between",
+    "win", "won", "lose", "lost", "get", "got", "make", "made",
+}
+
+
+def event_tokens(text: str) -> set[str]:
+    """Meaningful word tokens for event similarity."""
+    words = text.lower().replace("?", "").replace(",", "").split()
+    return {w for w in words if len(w) >= 4 and w not in EVENT_STOP_WORDS}
+
+
+def jaccard(a: set, b: set) -> float:
+    if not a or not b:
+        return 0.0
+    union = len(a | b)
+    return len(a & b) / union if union else 0.0
+
+
+def slug_to_title(slug: str) -> str:
+    """Mirrors backend/app/api/cross_venue_db.py _slug_to_title."""
+    if not slug:
+        return "Unknown"
+    UPPER = {"us", "uk", "eu", "fed", "btc", "eth", "ufc", "nba", "nfl",
+             "mlb", "nhl", "pga", "gdp", "cpi", "epl", "mls", "ncaa"}
+    LOW = {"a", "an", "the", "and", "or", "but", "in", "on", "at", "to",
+           "for", "of", "vs", "by"}
+    parts = slug.replace("-", " ").split()
+    result = []
+    for i, w in enumerate(parts):
+        lw = w.lower()
+        if lw in UPPER:
+            result.append(lw.upper())
+        elif i == 0 or lw not in LOW:
+            result.append(w.capitalize())
+        else:
+            result.append(lw)
+    return " ".join(result)
+
+
+def titles_are_semantically_compatible(poly_title: str, kalshi_title: str) -> bool:
+    """
+    Reject matches that look similar on tokens but are semantically different
+    (different dollar amounts, sports, award shows, central banks, cities,
+    subjects, years or specific games).
+    """
+    pt = poly_title.lower()
+    kt = kalshi_title.lower()
+
+    # Dollar amount mismatch
+    poly_dollars = set(re.findall(r'\$[\d,]+(?:k|m|b)?', pt))
+    kalshi_dollars = set(re.findall(r'\$[\d,]+(?:k|m|b)?', kt))
+    if poly_dollars and kalshi_dollars and not poly_dollars.intersection(kalshi_dollars):
+        return False
+
+    # Sport mismatch (NBA != NFL, baseball != hockey, etc.)
+    SPORT_GROUPS = {
+        'nba': 'basketball', 'basketball': 'basketball', 'pro basketball': 'basketball',
+        'nfl': 'football', 'football': 'football',
+        'mlb': 'baseball', 'baseball': 'baseball',
+        'nhl': 'hockey', 'hockey': 'hockey',
+        'soccer': 'soccer', 'mls': 'soccer', 'premier league': 'soccer',
+        'la liga': 'soccer', 'ligue': 'soccer', 'champions league': 'soccer',
+        'serie a': 'soccer',
+    }
+    def _sport(text):
+        return {grp for key, grp in SPORT_GROUPS.items() if key in text}
+    ps, ks = _sport(pt), _sport(kt)
+    if ps and ks and not ps.intersection(ks):
+        return False
+
+    # Different award shows
+    AWARDS = ['oscar', 'grammy', 'emmy', 'golden globe', 'critics choice',
+              'bafta', 'tony', 'cannes', 'sundance']
+    pa = {a for a in AWARDS if a in pt}
+    ka = {a for a in AWARDS if a in kt}
+    if pa and ka and not pa.intersection(ka):
+        return False
+
+    # Different central banks
+    BANKS = ['federal reserve', 'fed ', ' fed', 'bank of canada', 'bank of england',
+             'ecb', 'boj', 'bank of japan', 'rba', 'reserve bank']
+    pb = {b for b in BANKS if b in pt}
+    kb = {b for b in BANKS if b in kt}
+    if pb and kb and not pb.intersection(kb):
+        return False
+
+    # Different cities for the same kind of race
+    CITIES = ['paris', 'london', 'los angeles', 'new york', 'berlin', 'tokyo',
+              'rome', 'madrid', 'sydney', 'chicago', 'houston', 'miami']
+    pc = {c for c in CITIES if c in pt}
+    kc = {c for c in CITIES if c in kt}
+    if pc and kc and not pc.intersection(kc):
+        event_types = ['election', 'mayoral', 'mayor', 'governor', 'race']
+        if any(e in pt for e in event_types) and any(e in kt for e in event_types):
+            return False
+
+    # Crypto price question vs non-crypto question
+    CRYPTO = {'bitcoin', 'btc', 'ethereum', 'eth', 'solana', 'sol', 'crypto'}
+    pc = {c for c in CRYPTO if c in pt}
+    kc = {c for c in CRYPTO if c in kt}
+    if pc and not kc and ('price' in pt or 'hit' in pt):
+        if 'price' not in kt and 'hit' not in kt:
+            return False
+    if kc and not pc and ('price' in kt or 'hit' in kt):
+        if 'price' not in pt and 'hit' not in pt:
+            return False
+
+    # Year mismatch (2025 vs 2027 = reject; 2025-26 ~ 2026 and adjacent years ok)
+    combined_pt = re.sub(r'(\d{4})-(\d{2})\b', lambda m: f"{m.group(1)} 20{m.group(2)}", pt)
+    combined_kt = re.sub(r'(\d{4})-(\d{2})\b', lambda m: f"{m.group(1)} 20{m.group(2)}", kt)
+    py = set(re.findall(r'20[2-3]\d', combined_pt))
+    ky = set(re.findall(r'20[2-3]\d', combined_kt))
+    if py and ky and not py.intersection(ky):
+        if not any(abs(int(a) - int(b)) <= 1 for a in py for b in ky):
+            return False
+
+    # A specific NBA game only matches the same game
+    nba_game_re = re.compile(r'nba\s+[a-z]{3}\s+[a-z]{3}\s+\d{4}', re.IGNORECASE)
+    if bool(nba_game_re.search(pt)) != bool(nba_game_re.search(kt)):
+        return False
+
+    return True
+
+
+@dataclass
+class MatchEvent:
+    """An event's matching features, as stored in cross_venue_events."""
+    platform: str
+    event_id: str
+    title: str
+    tokens: frozenset
+
+    def to_record(self) -> tuple:
+        return (self.platform, self.event_id, self.title, sorted(self.tokens))
+
+
+def event_features(platform: str, event_id: str, market_titles: list[str]) -> Optional[MatchEvent]:
+    """
+    Features for one event from its member market titles, highest volume
+    first. Polymarket events are titled from their slug, Kalshi events by
+    their top market.
+    """
+    if not market_titles:
+        return None
+    titles = market_titles[:EVENT_TITLE_MARKETS]
+    title = slug_to_title(event_id) if platform == POLYMARKET else (titles[0] or event_id)
+    # Member titles matter: a Kalshi event like KXFEDCHAIRNOM is titled by
+    # its top nominee ("Kevin Warsh"), and only the other nominee titles
+    # ("Donald Trump" ...) overlap Polymarket's "who will trump nominate as
+    # fed chair"
+    tokens = event_tokens(title + " " + " ".join(titles))
+    return MatchEvent(platform=platform, event_id=event_id, title=title, tokens=frozenset(tokens))
+
+
+def match_events(
+    probes: Iterable[MatchEvent],
+    candidates: Iterable[MatchEvent],
+) -> dict[tuple[str, str], float]:
+    """
+    Candidate event pairs across venues: at least MIN_SHARED_EVENT_TOKENS
+    shared tokens, Jaccard >= MIN_EVENT_SIMILARITY and semantically
+    compatible titles. Not one-to-one; the API assigns pairs greedily by
+    volume at read time. Returns {(poly_event_id, kalshi_event_id): similarity}.
+    """
+    index: dict[str, dict[str, list[MatchEvent]]] = {POLYMARKET: defaultdict(list), KALSHI: defaultdict(list)}
+    for c in candidates:
+        for tok in c.tokens:
+            index[c.platform][tok].append(c)
+
+    pairs: dict[tuple[str, str], float] = {}
+    for probe in probes:
+        other = index[KALSHI if probe.platform == POLYMARKET else POLYMARKET]
+        shared: dict[str, int] = defaultdict(int)
+        by_id: dict[str, MatchEvent] = {}
+        for tok in probe.tokens:
+            for cand in other.get(tok, ()):
+                shared[cand.event_id] += 1
+                by_id[cand.event_id] = cand
+
+        for event_id, count in shared.items():
+            if count < MIN_SHARED_EVENT_TOKENS:
+                continue
+            cand = by_id[event_id]
+            poly, kalshi = (probe, cand) if probe.platform == POLYMARKET else (cand, probe)
+            key = (poly.event_id, kalshi.event_id)
+            if key in pairs:
+                continue
+            similarity = jaccard(poly.tokens, kalshi.tokens)
+            if similarity < MIN_EVENT_SIMILARITY:
+                continue
+            if not titles_are_semantically_compatible(poly.title, kalshi.title):
+                continue
+            pairs[key] = round(similarity, 4)
+    return pairs
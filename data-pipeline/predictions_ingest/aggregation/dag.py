@@ -0,0 +1,163 @@
+"""
+Dependency-aware executor for gold layer aggregations.
+
+Each node declares what it reads (inputs) and what it produces (outputs).
+A node starts once every node producing one of its inputs has finished;
+inputs nothing in the graph produces (silver tables) impose no ordering.
+The value a node returns is published under each of its outputs, so a
+shared computation runs once per cycle and its dependents read it from
+the context instead of recomputing it.
+
+Concurrency is bounded twice: per graph (the aggregation group) and by an
+optional semaphore shared across groups, which caps how many pool
+connections gold work may hold at once.
+"""
+
+import asyncio
+import contextlib
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+
+class UpstreamFailed(Exception):
+    """A node was skipped because a node it depends on failed."""
+
+    def __init__(self, node: str, upstream: list[str]):
+        self.node = node
+        self.upstream = upstream
+        super().__init__(f"{node} skipped: upstream failed ({', '.join(upstream)})")
+
+
+@dataclass
+class AggregationNode:
+    """One unit of work in an aggregation graph."""
+    name: str
+    run: Callable[[dict[str, Any]], Awaitable[Any]]
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    shared: bool = False  # feeds other nodes rather than writing a gold table
+
+
+@dataclass
+class NodeTiming:
+    """Wall-clock accounting for one node of a run."""
+    name: str
+    status: str = "pending"  # success, failed, skipped
+    queued_seconds: float = 0.0  # ready, waiting on group/connection slots
+    duration_seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "status": self.status,
+            "queued_s": round(self.queued_seconds, 3),
+            "duration_s": round(self.duration_seconds, 3),
+        }
+
+
+@dataclass
+class DagRun:
+    """Outcome of AggregationDAG.run()."""
+    results: dict[str, Any] = field(default_factory=dict)  # value or exception
+    timings: dict[str, NodeTiming] = field(default_factory=dict)
+
+
+class AggregationDAG:
+    """Runs AggregationNodes in dependency order under concurrency limits."""
+
+    def __init__(
+        self,
+        nodes: list[AggregationNode],
+        max_concurrency: int,
+        budget: Optional[asyncio.Semaphore] = None,
+    ):
+        names = [n.name for n in nodes]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate node names: {names}")
+
+        producers: dict[str, str] = {}
+        for node in nodes:
+            for output in node.outputs:
+                if output in producers:
+                    raise ValueError(
+                        f"{output} produced by both {producers[output]} and {node.name}"
+                    )
+                producers[output] = node.name
+
+        self.nodes = {n.name: n for n in nodes}
+        self.deps: dict[str, list[str]] = {
+            n.name: sorted({producers[i] for i in n.inputs if i in producers} - {n.name})
+            for n in nodes
+        }
+        self.order = self._topological_order()
+        self.max_concurrency = max_concurrency
+        self.budget = budget
+
+    def _topological_order(self) -> list[str]:
+        remaining = {name: set(deps) for name, deps in self.deps.items()}
+        order: list[str] = []
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Dependency cycle among: {sorted(remaining)}")
+            for name in ready:
+                order.append(name)
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return order
+
+    async def run(self, context: Optional[dict[str, Any]] = None) -> DagRun:
+        """
+        Execute the graph.
+
+        Node exceptions are captured in DagRun.results rather than raised;
+        dependents of a failed node are skipped with UpstreamFailed.
+        """
+        context = context if context is not None else {}
+        outcome = DagRun()
+        group = asyncio.Semaphore(self.max_concurrency)
+        tasks: dict[str, asyncio.Task] = {}
+
+        for name in self.order:
+            tasks[name] = asyncio.ensure_future(self._run_node(
+                self.nodes[name], [tasks[d] for d in self.deps[name]],
+                context, group, outcome,
+            ))
+        await asyncio.gather(*tasks.values())
+        return outcome
+
+    async def _run_node(
+        self,
+        node: AggregationNode,
+        upstream: list[asyncio.Task],
+        context: dict[str, Any],
+        group: asyncio.Semaphore,
+        outcome: DagRun,
+    ) -> None:
+        if upstream:
+            await asyncio.gather(*upstream)
+
+        timing = NodeTiming(name=node.name)
+        outcome.timings[node.name] = timing
+        failed = [d for d in self.deps[node.name] if isinstance(outcome.results[d], BaseException)]
+        if failed:
+            timing.status = "skipped"
+            outcome.results[node.name] = UpstreamFailed(node.name, failed)
+            return
+
+        ready = time.monotonic()
+        async with group, (self.budget or contextlib.nullcontext()):
+            started = time.monotonic()
+            timing.queued_seconds = started - ready
+            try:
+                value = await node.run(context)
+            except Exception as e:
+                timing.status = "failed"
+                outcome.results[node.name] = e
+            else:
+                timing.status = getattr(value, "status", "success")
+                outcome.results[node.name] = value
+                for output in node.outputs:
+                    context[output] = value
+            timing.duration_seconds = time.monotonic() - started
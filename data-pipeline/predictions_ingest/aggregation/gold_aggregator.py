@@ -6,9 +6,17 @@ Transforms Silver layer data into Gold analytics tables with:
 - Detailed record tracking (inserted, upserted, deleted, errors)
 - Async concurrent processing for optimal performance
 - Structured logging with run summaries
+
+Each run_* method builds an AggregationDAG (see dag.py): shared per-source
+and per-category stats are computed once per cycle and fed to the tables
+that need them, concurrency is capped per group, and all groups share one
+connection budget (GOLD_MAX_CONNECTIONS) so aggregations cannot take the
+whole pool from ingestion writers.
 """
 
 import asyncio
+import json
+import weakref
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Any
@@ -16,10 +24,195 @@ from uuid import UUID, uuid4
 
 import structlog
 
+from predictions_ingest.aggregation import cross_venue
+from predictions_ingest.aggregation.dag import AggregationDAG, AggregationNode, NodeTiming
+from predictions_ingest.config import get_settings
 from predictions_ingest.database import DatabaseManager
 
 logger = structlog.get_logger(__name__)
 
+# One gold connection budget per event loop, shared by every aggregator
+# instance and group (the scheduler runs groups on independent jobs).
+_connection_budgets: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _connection_budget(limit: int) -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    budget = _connection_budgets.get(loop)
+    if budget is None:
+        budget = _connection_budgets[loop] = asyncio.Semaphore(limit)
+    return budget
+
+
+# Shared stats nodes. Dependents receive the rows and rebuild the CTE from
+# a jsonb parameter; called standalone they fall back to the grouped scan.
+_PLATFORM_STATS_QUERY = """
+    SELECT
+        source,
+        COUNT(*) as market_count,
+        COUNT(*) FILTER (WHERE is_active = true) as open_markets,
+        COALESCE(SUM(volume_24h), 0) as volume_24h,
+        COALESCE(SUM(volume_7d), 0) as volume_7d,
+        COALESCE(SUM(volume_total), 0) as volume_total,
+        COALESCE(AVG(volume_24h), 0) as avg_volume_24h
+    FROM predictions_silver.markets
+    GROUP BY source
+"""
+_PLATFORM_STATS_RECORD = (
+    "source text, market_count bigint, open_markets bigint, volume_24h numeric, "
+    "volume_7d numeric, volume_total numeric, avg_volume_24h numeric"
+)
+
+# Fold changed markets into market_source_totals (migration 025): delta =
+# current silver row - the contribution stored for it. Every CTE reads the
+# same snapshot, so prev is the contribution before this statement's upsert.
+_APPLY_SOURCE_TOTALS_DELTAS = """
+    WITH keys AS (
+        SELECT DISTINCT source, source_market_id
+        FROM unnest($1::text[], $2::text[]) AS k(source, source_market_id)
+    ),
+    cur AS (
+        SELECT k.source, k.source_market_id, m.source IS NOT NULL AS present,
+               m.is_active IS TRUE AS is_active,
+               COALESCE(m.volume_24h, 0) AS volume_24h, COALESCE(m.volume_7d, 0) AS volume_7d
+        FROM keys k
+        LEFT JOIN predictions_silver.markets m
+            ON m.source = k.source AND m.source_market_id = k.source_market_id
+    ),
+    prev AS (
+        SELECT c.*
+        FROM predictions_gold.market_source_contrib c
+        JOIN keys k ON k.source = c.source AND k.source_market_id = c.source_market_id
+    ),
+    removed AS (
+        DELETE FROM predictions_gold.market_source_contrib c
+        USING cur
+        WHERE NOT cur.present
+          AND c.source = cur.source AND c.source_market_id = cur.source_market_id
+    ),
+    stored AS (
+        INSERT INTO predictions_gold.market_source_contrib
+            (source, source_market_id, is_active, volume_24h, volume_7d)
+        SELECT source, source_market_id, is_active, volume_24h, volume_7d
+        FROM cur WHERE present
+        ON CONFLICT (source, source_market_id) DO UPDATE SET
+            is_active = EXCLUDED.is_active,
+            volume_24h = EXCLUDED.volume_24h,
+            volume_7d = EXCLUDED.volume_7d
+    )
+    INSERT INTO predictions_gold.market_source_totals AS t
+        (source, market_count, open_markets, volume_24h, volume_7d, updated_at)
+    SELECT source, SUM(d_count), SUM(d_open), SUM(d_volume_24h), SUM(d_volume_7d), NOW()
+    FROM (
+        SELECT source, 1 AS d_count, is_active::int AS d_open,
+               volume_24h AS d_volume_24h, volume_7d AS d_volume_7d
+        FROM cur WHERE present
+        UNION ALL
+        SELECT source, -1, -(is_active::int), -volume_24h, -volume_7d
+        FROM prev
+    ) d
+    GROUP BY source
+    ON CONFLICT (source) DO UPDATE SET
+        market_count = t.market_count + EXCLUDED.market_count,
+        open_markets = t.open_markets + EXCLUDED.open_markets,
+        volume_24h = t.volume_24h + EXCLUDED.volume_24h,
+        volume_7d = t.volume_7d + EXCLUDED.volume_7d,
+        updated_at = EXCLUDED.updated_at
+"""
+
+_CATEGORY_STATS_QUERY = """
+    SELECT
+        COALESCE(category_name, 'Uncategorized') as category,
+        COUNT(*) as market_count,
+        COUNT(*) FILTER (WHERE source = 'polymarket') as polymarket_count,
+        COUNT(*) FILTER (WHERE source = 'kalshi') as kalshi_count,
+        COUNT(*) FILTER (WHERE source = 'limitless') as limitless_count,
+        COALESCE(SUM(volume_24h), 0) as total_volume_24h,
+        COALESCE(AVG(volume_24h), 0) as avg_volume_per_market
+    FROM predictions_silver.markets
+    GROUP BY COALESCE(category_name, 'Uncategorized')
+"""
+_CATEGORY_STATS_RECORD = (
+    "category text, market_count bigint, polymarket_count bigint, kalshi_count bigint, "
+    "limitless_count bigint, total_volume_24h numeric, avg_volume_per_market numeric"
+)
+
+# Event groups (migration 019). {scope} narrows a rebuild to the keys or
+# groups passed as $1/$2 text arrays; empty for a full rebuild.
+_EVENT_GROUP_MEMBERS_INSERT = """
+    INSERT INTO predictions_gold.event_group_members (source, source_market_id, event_id)
+    SELECT source, source_market_id,
+           predictions_silver.market_event_id(source, source_market_id, slug, extra_data)
+    FROM predictions_silver.markets
+    WHERE (is_active = true OR status IN ('active', 'open')) {scope}
+    ON CONFLICT (source, source_market_id) DO UPDATE SET event_id = EXCLUDED.event_id
+"""
+_EVENT_GROUPS_INSERT = """
+    INSERT INTO predictions_gold.event_groups (
+        event_id, platform, rep_title, rep_image, rep_url, rep_yes_price,
+        category, categories, statuses, search_text,
+        market_count, total_volume, volume_24h, volume_1_week, total_liquidity,
+        max_end_date, is_active, updated_at
+    )
+    SELECT
+        predictions_silver.market_event_id(source, source_market_id, slug, extra_data),
+        source,
+        (ARRAY_AGG(title ORDER BY COALESCE(volume_total, 0) DESC))[1],
+        (ARRAY_AGG(image_url ORDER BY COALESCE(volume_total, 0) DESC))[1],
+        (ARRAY_AGG(source_url ORDER BY COALESCE(volume_total, 0) DESC))[1],
+        (ARRAY_AGG(yes_price ORDER BY COALESCE(volume_total, 0) DESC))[1],
+        MODE() WITHIN GROUP (ORDER BY category_name),
+        COALESCE(ARRAY_AGG(DISTINCT category_name) FILTER (WHERE category_name IS NOT NULL), '{{}}'),
+        COALESCE(ARRAY_AGG(DISTINCT status) FILTER (WHERE status IS NOT NULL), '{{}}'),
+        LOWER(STRING_AGG(COALESCE(title, '') || E'\\n' || COALESCE(slug, ''), E'\\n')),
+        COUNT(*),
+        COALESCE(SUM(volume_total), 0),
+        COALESCE(SUM(volume_24h), 0),
+        COALESCE(SUM(volume_7d), 0),
+        COALESCE(SUM(liquidity), 0),
+        MAX(end_date),
+        COALESCE(BOOL_OR(status = 'active' OR status = 'open'), false),
+        NOW()
+    FROM predictions_silver.markets
+    WHERE (is_active = true OR status IN ('active', 'open')) {scope}
+    GROUP BY 1, 2
+"""
+_CHANGED_KEYS_SCOPE = """
+    AND (source, source_market_id) IN (SELECT * FROM unnest($1::text[], $2::text[]))
+"""
+_EVENT_GROUPS_SCOPE = """
+    AND (predictions_silver.market_event_id(source, source_market_id, slug, extra_data), source)
+        IN (SELECT * FROM unnest($1::text[], $2::text[]))
+"""
+
+# Cross-venue match graph (migration 020). Same {scope} convention; the
+# volume floor / title count is the last parameter.
+_CROSS_VENUE_MARKETS_QUERY = """
+    SELECT source, source_market_id, title,
+           predictions_silver.market_event_id(source, source_market_id, slug, extra_data) AS event_id
+    FROM predictions_silver.markets
+    WHERE source IN ('polymarket', 'kalshi')
+      AND is_active = true
+      AND COALESCE(volume_total, 0) >= ${floor} {scope}
+"""
+_CROSS_VENUE_EVENT_TITLES_QUERY = """
+    SELECT source AS platform,
+           predictions_silver.market_event_id(source, source_market_id, slug, extra_data) AS event_id,
+           (ARRAY_AGG(COALESCE(title, '') ORDER BY COALESCE(volume_total, 0) DESC))[1:${limit}] AS titles
+    FROM predictions_silver.markets
+    WHERE source IN ('polymarket', 'kalshi')
+      AND is_active = true {scope}
+    GROUP BY 1, 2
+"""
+_CROSS_VENUE_COLUMNS = {
+    "cross_venue_markets": ("source", "source_market_id", "event_id", "title", "entities", "slug_entities"),
+    "cross_venue_market_pairs": ("poly_market_id", "kalshi_market_id", "similarity"),
+    "cross_venue_events": ("platform", "event_id", "title", "tokens"),
+    "cross_venue_event_pairs": ("poly_event_id", "kalshi_event_id", "similarity"),
+}
+
 
 @dataclass
 class AggregationResult:
@@ -57,6 +250,7 @@ class RunSummary:
     started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     completed_at: Optional[datetime] = None
     results: list[AggregationResult] = field(default_factory=list)
+    node_timings: dict[str, NodeTiming] = field(default_factory=dict)
     
     @property
     def total_inserted(self) -> int:
@@ -101,6 +295,7 @@ class RunSummary:
             "total_upserted": self.total_upserted,
             "total_deleted": self.total_deleted,
             "total_errors": self.total_errors,
+            "nodes": {name: t.to_dict() for name, t in self.node_timings.items()},
         }
 
 
@@ -120,11 +315,15 @@ class GoldLayerAggregator:
     - Comprehensive error handling per record
     - Detailed logging with metrics
     - Run summaries with all CRUD counts
+    - Incremental mode (GOLD_INCREMENTAL_ENABLED): hot and market detail
+      cycles only revisit markets in predictions_gold.market_change_log
     """
     
     def __init__(self, db: DatabaseManager):
         self.db = db
         self.logger = logger.bind(component="gold_aggregator")
+        self.settings = get_settings()
+        self._incremental_cycles: dict[str, int] = {}
     
     async def _safe_execute(
         self,
@@ -160,43 +359,318 @@ class GoldLayerAggregator:
             )
             return None, error_msg
     
+    # ========================================================================
+    # DAG EXECUTION AND SHARED STATS
+    # ========================================================================
+    
+    async def _run_graph(self, summary: RunSummary, nodes: list[AggregationNode]) -> None:
+        """
+        Execute an aggregation graph and fold its outcome into the summary.
+        
+        Each table node contributes one AggregationResult, in declaration
+        order; a node that raised, or was skipped because a node it reads
+        failed, is recorded as failed.
+        """
+        dag = AggregationDAG(
+            nodes,
+            max_concurrency=self.settings.gold_group_concurrency,
+            budget=_connection_budget(self.settings.gold_max_connections),
+        )
+        run = await dag.run()
+        summary.node_timings = run.timings
+        
+        for node in nodes:
+            value = run.results[node.name]
+            if not isinstance(value, BaseException):
+                if not node.shared:
+                    summary.results.append(value)
+                continue
+            self.logger.error(
+                "Aggregation node failed",
+                run_type=summary.run_type,
+                node=node.name,
+                error=str(value),
+            )
+            if not node.shared:
+                summary.results.append(AggregationResult(
+                    table_name=node.name,
+                    status="failed",
+                    error_count=1,
+                    message=f"Exception: {str(value)}",
+                ))
+    
+    @staticmethod
+    def _stats_cte(query: str, record: str, rows: Optional[list]) -> tuple[str, tuple]:
+        """
+        CTE body and extra params for a shared stats input.
+        
+        With rows from a shared node the CTE reads them back from a jsonb
+        parameter ($2); without, it is the grouped silver scan itself.
+        """
+        if rows is None:
+            return query, ()
+        payload = json.dumps([dict(r) for r in rows], default=str)
+        return f"SELECT * FROM jsonb_to_recordset($2::jsonb) AS s({record})", (payload,)
+    
+    async def _platform_stats(
+        self,
+        changed: Optional[list[tuple[str, str]]] = None,
+        rebuild_totals: bool = False,
+    ) -> list:
+        """
+        Per-source market counts and volumes.
+        
+        Args:
+            changed: Markets touched since the last hot cycle (incremental
+                mode); their deltas are folded into market_source_totals,
+                which is then read instead of scanning silver
+            rebuild_totals: Re-seed market_source_contrib and
+                market_source_totals from a full scan. No lock on silver:
+                a write that lands during the re-seed is in the change log
+                above this cycle's high-water mark, and folding it again
+                next cycle is a no-op if the scan already saw it.
+        """
+        async with self.db.asyncpg_connection() as conn:
+            if changed is not None:
+                async with conn.transaction():
+                    if changed:
+                        await conn.execute(
+                            _APPLY_SOURCE_TOTALS_DELTAS,
+                            [k[0] for k in changed],
+                            [k[1] for k in changed],
+                        )
+                    return await conn.fetch("""
+                        SELECT source, market_count, open_markets, volume_24h, volume_7d
+                        FROM predictions_gold.market_source_totals
+                    """)
+            if rebuild_totals:
+                try:
+                    async with conn.transaction():
+                        # Contributions first, totals from them: one snapshot
+                        # of silver feeds both
+                        await conn.execute("DELETE FROM predictions_gold.market_source_contrib")
+                        await conn.execute("""
+                            INSERT INTO predictions_gold.market_source_contrib
+                                (source, source_market_id, is_active, volume_24h, volume_7d)
+                            SELECT source, source_market_id, is_active IS TRUE,
+                                   COALESCE(volume_24h, 0), COALESCE(volume_7d, 0)
+                            FROM predictions_silver.markets
+                        """)
+                        await conn.execute("DELETE FROM predictions_gold.market_source_totals")
+                        await conn.execute("""
+                            INSERT INTO predictions_gold.market_source_totals
+                                (source, market_count, open_markets, volume_24h, volume_7d, updated_at)
+                            SELECT source, COUNT(*), COUNT(*) FILTER (WHERE is_active),
+                                   SUM(volume_24h), SUM(volume_7d), NOW()
+                            FROM predictions_gold.market_source_contrib
+                            GROUP BY source
+                        """)
+                except Exception as e:
+                    self.logger.warning("Failed to rebuild market source totals", error=str(e))
+            return await conn.fetch(_PLATFORM_STATS_QUERY)
+    
+    async def _category_stats(self) -> list:
+        """Per-category market counts and volumes."""
+        async with self.db.asyncpg_connection() as conn:
+            return await conn.fetch(_CATEGORY_STATS_QUERY)
+    
+    # ========================================================================
+    # CHANGE LOG (incremental mode, migration 018)
+    # ========================================================================
+    
+    async def _pending_changes(self, consumer: str) -> tuple[Optional[list[tuple[str, str]]], Optional[int]]:
+        """
+        Markets touched since the consumer's cursor.
+        
+        Returns:
+            (keys, high_water_seq). keys is None when this cycle must be a full
+            rebuild: first run, periodic rebuild due, churn above
+            gold_incremental_max_keys, or change log unavailable.
+        
+        A write that drew its change_seq before high_water but committed after
+        the read is missed here; the periodic full rebuild picks it up.
+        """
+        cycle = self._incremental_cycles.get(consumer, 0)
+        self._incremental_cycles[consumer] = cycle + 1
+        max_keys = self.settings.gold_incremental_max_keys
+        
+        try:
+            async with self.db.asyncpg_connection() as conn:
+                high_water = await conn.fetchval(
+                    "SELECT COALESCE(MAX(change_seq), 0) FROM predictions_gold.market_change_log"
+                )
+                last_seq = await conn.fetchval(
+                    "SELECT last_seq FROM predictions_gold.change_log_cursors WHERE consumer = $1",
+                    consumer,
+                )
+                if last_seq is None or cycle % self.settings.gold_full_rebuild_every == 0:
+                    return None, high_water
+                
+                rows = await conn.fetch("""
+                    SELECT source, source_market_id
+                    FROM predictions_gold.market_change_log
+                    WHERE change_seq > $1 AND change_seq <= $2
+                    LIMIT $3
+                """, last_seq, high_water, max_keys + 1)
+        except Exception as e:
+            self.logger.warning("Change log unavailable, running full rebuild", consumer=consumer, error=str(e))
+            return None, None
+        
+        if len(rows) > max_keys:
+            self.logger.info("Churn above incremental limit, running full rebuild", consumer=consumer, max_keys=max_keys)
+            return None, high_water
+        return [(r["source"], r["source_market_id"]) for r in rows], high_water
+    
+    async def _advance_cursor(self, consumer: str, seq: Optional[int]) -> None:
+        """Mark changes up to seq as consumed."""
+        if seq is None:
+            return
+        try:
+            async with self.db.asyncpg_connection() as conn:
+                await conn.execute("""
+                    INSERT INTO predictions_gold.change_log_cursors (consumer, last_seq, updated_at)
+                    VALUES ($1, $2, NOW())
+                    ON CONFLICT (consumer) DO UPDATE SET
+                        last_seq = EXCLUDED.last_seq,
+                        updated_at = EXCLUDED.updated_at
+                """, consumer, seq)
+        except Exception as e:
+            self.logger.warning("Failed to advance change log cursor", consumer=consumer, error=str(e))
+    
+    async def _top_n_candidates(
+        self,
+        conn,
+        changed: list[tuple[str, str]],
+        table_name: str,
+        volume_col: str,
+        ts_col: str,
+    ) -> Optional[list[UUID]]:
+        """
+        Candidate market IDs for re-ranking a top-N snapshot incrementally.
+        
+        The new top N is contained in (previous snapshot + changed markets)
+        unless a previous member got worse (lower volume, inactive, deleted):
+        an unchanged market may then move up, so return None and let the
+        caller rank the full catalog. Also None if there is no previous
+        snapshot.
+        """
+        row = await conn.fetchrow(f"""
+            WITH changed AS (
+                SELECT m.id, m.is_active, COALESCE(m.volume_24h, 0) AS volume_24h
+                FROM unnest($1::text[], $2::text[]) AS k(source, source_market_id)
+                LEFT JOIN predictions_silver.markets m
+                    ON m.source = k.source AND m.source_market_id = k.source_market_id
+            ),
+            prev AS (
+                SELECT market_id, {volume_col} AS volume_24h
+                FROM predictions_gold.{table_name}
+                WHERE {ts_col} = (SELECT MAX({ts_col}) FROM predictions_gold.{table_name})
+            )
+            SELECT
+                NOT EXISTS (SELECT 1 FROM prev)
+                OR EXISTS (
+                    SELECT 1
+                    FROM changed c
+                    LEFT JOIN prev p ON p.market_id = c.id
+                    WHERE c.id IS NULL
+                       OR (p.market_id IS NOT NULL
+                           AND (c.is_active IS NOT TRUE OR c.volume_24h < p.volume_24h))
+                ) AS needs_full,
+                ARRAY(
+                    SELECT market_id FROM prev
+                    UNION
+                    SELECT id FROM changed WHERE id IS NOT NULL
+                ) AS candidates
+        """, [k[0] for k in changed], [k[1] for k in changed])
+        
+        if row["needs_full"]:
+            return None
+        return list(row["candidates"])
+    
     # ========================================================================
     # HOT AGGREGATIONS (Real-time, 5-minute intervals)
     # ========================================================================
     
     async def run_hot_aggregations(self) -> RunSummary:
-        """Run all hot aggregations concurrently."""
+        """
+        Run all hot aggregations as a dependency graph.
+        
+        Market metrics read the shared platform_stats node; event_groups
+        (backing /events) refreshes here so the page trails the catalog by
+        at most one hot interval.
+        
+        In incremental mode the cycle costs O(changed markets): metrics come
+        from per-source totals updated with the changed markets' deltas,
+        top-N snapshots are re-ranked from the previous snapshot plus the
+        changed markets, and only the event groups containing changed
+        markets are rebuilt.
+        """
         summary = RunSummary(run_type="hot")
-        self.logger.info("Starting HOT aggregations", run_id=str(summary.run_id))
+        incremental = self.settings.gold_incremental_enabled
+        changed, high_water = None, None
+        if incremental:
+            changed, high_water = await self._pending_changes("hot")
+            if changed is not None:
+                summary.run_type = "hot_incremental"
+        self.logger.info(
+            "Starting HOT aggregations",
+            run_id=str(summary.run_id),
+            changed_markets=len(changed) if changed is not None else None,
+        )
         
-        tasks = [
-            self.aggregate_market_metrics(),
-            self.aggregate_top_markets(),
-            self.aggregate_high_volume_activity(),
+        nodes = [
+            AggregationNode(
+                "platform_stats",
+                lambda ctx: self._platform_stats(
+                    changed=changed,
+                    rebuild_totals=incremental and changed is None,
+                ),
+                inputs=("predictions_silver.markets",),
+                outputs=("platform_stats",),
+                shared=True,
+            ),
+            AggregationNode(
+                "market_metrics_summary",
+                lambda ctx: self.aggregate_market_metrics(platform_stats=ctx["platform_stats"]),
+                inputs=("platform_stats",),
+                outputs=("predictions_gold.market_metrics_summary",),
+            ),
+            AggregationNode(
+                "top_markets_snapshot",
+                lambda ctx: self.aggregate_top_markets(changed=changed),
+                inputs=("predictions_silver.markets",),
+                outputs=("predictions_gold.top_markets_snapshot",),
+            ),
+            AggregationNode(
+                "high_volume_activity",
+                lambda ctx: self.aggregate_high_volume_activity(changed=changed),
+                inputs=("predictions_silver.markets",),
+                outputs=("predictions_gold.high_volume_activity",),
+            ),
+            AggregationNode(
+                "event_groups",
+                lambda ctx: self.aggregate_event_groups(changed=changed),
+                inputs=("predictions_silver.markets",),
+                outputs=("predictions_gold.event_groups",),
+            ),
         ]
+        await self._run_graph(summary, nodes)
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                table_names = ["market_metrics_summary", "top_markets_snapshot", "high_volume_activity"]
-                error_result = AggregationResult(
-                    table_name=table_names[i],
-                    status="failed",
-                    error_count=1,
-                    message=f"Exception: {str(result)}"
-                )
-                summary.results.append(error_result)
-                self.logger.error("Hot aggregation task failed", table=table_names[i], error=str(result))
-            else:
-                summary.results.append(result)
+        if incremental and summary.failed_count == 0:
+            await self._advance_cursor("hot", high_water)
         
         summary.completed_at = datetime.now(timezone.utc)
         self._log_run_summary(summary)
         return summary
     
-    async def aggregate_market_metrics(self) -> AggregationResult:
-        """Aggregate overall market metrics summary."""
+    async def aggregate_market_metrics(self, platform_stats: Optional[list] = None) -> AggregationResult:
+        """
+        Aggregate overall market metrics summary.
+        
+        Args:
+            platform_stats: Per-source rows from the shared platform_stats
+                node; scans silver markets when omitted
+        """
         result = AggregationResult(table_name="market_metrics_summary")
         start_time = datetime.now(timezone.utc)
         
@@ -205,8 +679,12 @@ class GoldLayerAggregator:
                 snapshot_id = uuid4()
                 result.snapshot_id = snapshot_id
                 
+                stats_cte, stats_params = self._stats_cte(
+                    _PLATFORM_STATS_QUERY, _PLATFORM_STATS_RECORD, platform_stats
+                )
+                
                 # Silver uses: source, volume_24h, volume_7d, is_active
-                query = """
+                query = f"""
                     INSERT INTO predictions_gold.market_metrics_summary (
                         snapshot_timestamp, snapshot_id,
                         total_markets, total_open_markets,
@@ -216,16 +694,7 @@ class GoldLayerAggregator:
                         limitless_open_markets, limitless_volume_24h, limitless_growth_24h_pct, limitless_market_share_pct,
                         trend_direction, change_pct_24h, change_pct_7d
                     )
-                    WITH platform_stats AS (
-                        SELECT
-                            source,
-                            COUNT(*) as market_count,
-                            COUNT(*) FILTER (WHERE is_active = true) as open_markets,
-                            COALESCE(SUM(volume_24h), 0) as volume_24h,
-                            COALESCE(SUM(volume_7d), 0) as volume_7d
-                        FROM predictions_silver.markets
-                        GROUP BY source
-                    ),
+                    WITH platform_stats AS ({stats_cte}),
                     totals AS (
                         SELECT
                             SUM(market_count) as total_markets,
@@ -261,7 +730,7 @@ class GoldLayerAggregator:
                     RETURNING snapshot_id
                 """
                 
-                returned_id, error = await self._safe_execute(conn, query, (snapshot_id,), table_name="market_metrics_summary", operation="fetchval")
+                returned_id, error = await self._safe_execute(conn, query, (snapshot_id, *stats_params), table_name="market_metrics_summary", operation="fetchval")
                 
                 if error:
                     result.status = "failed"
@@ -282,8 +751,14 @@ class GoldLayerAggregator:
         self._log_aggregation_result(result)
         return result
     
-    async def aggregate_top_markets(self) -> AggregationResult:
-        """Aggregate top markets by volume for snapshot."""
+    async def aggregate_top_markets(self, changed: Optional[list[tuple[str, str]]] = None) -> AggregationResult:
+        """
+        Aggregate top markets by volume for snapshot.
+        
+        Args:
+            changed: (source, source_market_id) keys touched since the last
+                snapshot; re-rank only the previous top markets plus these
+        """
         result = AggregationResult(table_name="top_markets_snapshot")
         start_time = datetime.now(timezone.utc)
         
@@ -292,6 +767,12 @@ class GoldLayerAggregator:
                 snapshot_id = uuid4()
                 result.snapshot_id = snapshot_id
                 
+                candidates = None
+                if changed is not None:
+                    candidates = await self._top_n_candidates(
+                        conn, changed, "top_markets_snapshot", "volume_24h_usd", "snapshot_timestamp"
+                    )
+                
                 # Delete old snapshots
                 delete_query = """
                     DELETE FROM predictions_gold.top_markets_snapshot
@@ -329,11 +810,12 @@ class GoldLayerAggregator:
                         image_url
                     FROM predictions_silver.markets
                     WHERE is_active = true
+                      AND ($2::uuid[] IS NULL OR id = ANY($2::uuid[]))
                     ORDER BY COALESCE(volume_24h, 0) DESC
                     LIMIT 10
                 """
                 
-                insert_result, error = await self._safe_execute(conn, insert_query, (snapshot_id,), table_name="top_markets_snapshot", operation="execute")
+                insert_result, error = await self._safe_execute(conn, insert_query, (snapshot_id, candidates), table_name="top_markets_snapshot", operation="execute")
                 
                 if error:
                     result.status = "partial" if result.deleted > 0 else "failed"
@@ -346,6 +828,8 @@ class GoldLayerAggregator:
                         result.inserted = 100
                     result.status = "success"
                     result.message = f"Top {result.inserted} markets snapshot created"
+                    if candidates is not None:
+                        result.message += f" (incremental, {len(candidates)} candidates)"
                 
         except Exception as e:
             result.status = "failed"
@@ -357,13 +841,25 @@ class GoldLayerAggregator:
         self._log_aggregation_result(result)
         return result
     
-    async def aggregate_high_volume_activity(self) -> AggregationResult:
-        """Aggregate high volume activity feed."""
+    async def aggregate_high_volume_activity(self, changed: Optional[list[tuple[str, str]]] = None) -> AggregationResult:
+        """
+        Aggregate high volume activity feed.
+        
+        Args:
+            changed: (source, source_market_id) keys touched since the last
+                run; re-rank only the previous feed plus these
+        """
         result = AggregationResult(table_name="high_volume_activity")
         start_time = datetime.now(timezone.utc)
         
         try:
             async with self.db.asyncpg_connection() as conn:
+                candidates = None
+                if changed is not None:
+                    candidates = await self._top_n_candidates(
+                        conn, changed, "high_volume_activity", "volume_24h", "detected_at"
+                    )
+                
                 # Delete old activity
                 delete_query = """
                     DELETE FROM predictions_gold.high_volume_activity
@@ -411,11 +907,12 @@ class GoldLayerAggregator:
                     FROM predictions_silver.markets
                     WHERE is_active = true
                       AND COALESCE(volume_24h, 0) > 10000
+                      AND ($1::uuid[] IS NULL OR id = ANY($1::uuid[]))
                     ORDER BY COALESCE(volume_24h, 0) DESC
                     LIMIT 50
                 """
                 
-                insert_result, error = await self._safe_execute(conn, insert_query, (), table_name="high_volume_activity", operation="execute")
+                insert_result, error = await self._safe_execute(conn, insert_query, (candidates,), table_name="high_volume_activity", operation="execute")
                 
                 if error:
                     result.status = "partial" if result.deleted > 0 else "failed"
@@ -444,40 +941,69 @@ class GoldLayerAggregator:
     # ========================================================================
     
     async def run_warm_aggregations(self) -> RunSummary:
-        """Run all warm aggregations concurrently."""
+        """
+        Run all warm aggregations as a dependency graph.
+        
+        Per-source and per-category stats are computed once and shared by
+        platform comparison, category distribution and trending categories.
+        """
         summary = RunSummary(run_type="warm")
         self.logger.info("Starting WARM aggregations", run_id=str(summary.run_id))
         
-        tasks = [
-            self.aggregate_category_distribution(),
-            self.aggregate_volume_trends(),
-            self.aggregate_platform_comparison(),
-            self.aggregate_trending_categories(),
+        nodes = [
+            AggregationNode(
+                "platform_stats",
+                lambda ctx: self._platform_stats(),
+                inputs=("predictions_silver.markets",),
+                outputs=("platform_stats",),
+                shared=True,
+            ),
+            AggregationNode(
+                "category_stats",
+                lambda ctx: self._category_stats(),
+                inputs=("predictions_silver.markets",),
+                outputs=("category_stats",),
+                shared=True,
+            ),
+            AggregationNode(
+                "category_distribution",
+                lambda ctx: self.aggregate_category_distribution(category_stats=ctx["category_stats"]),
+                inputs=("category_stats",),
+                outputs=("predictions_gold.category_distribution",),
+            ),
+            AggregationNode(
+                "volume_trends",
+                lambda ctx: self.aggregate_volume_trends(),
+                inputs=("predictions_silver.markets",),
+                outputs=("predictions_gold.volume_trends",),
+            ),
+            AggregationNode(
+                "platform_comparison",
+                lambda ctx: self.aggregate_platform_comparison(platform_stats=ctx["platform_stats"]),
+                inputs=("platform_stats",),
+                outputs=("predictions_gold.platform_comparison",),
+            ),
+            AggregationNode(
+                "trending_categories",
+                lambda ctx: self.aggregate_trending_categories(category_stats=ctx["category_stats"]),
+                inputs=("category_stats",),
+                outputs=("predictions_gold.trending_categories",),
+            ),
         ]
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        table_names = ["category_distribution", "volume_trends", "platform_comparison", "trending_categories"]
-        
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                error_result = AggregationResult(
-                    table_name=table_names[i],
-                    status="failed",
-                    error_count=1,
-                    message=f"Exception: {str(result)}"
-                )
-                summary.results.append(error_result)
-                self.logger.error("Warm aggregation task failed", table=table_names[i], error=str(result))
-            else:
-                summary.results.append(result)
+        await self._run_graph(summary, nodes)
         
         summary.completed_at = datetime.now(timezone.utc)
         self._log_run_summary(summary)
         return summary
     
-    async def aggregate_category_distribution(self) -> AggregationResult:
-        """Aggregate market distribution by category."""
+    async def aggregate_category_distribution(self, category_stats: Optional[list] = None) -> AggregationResult:
+        """
+        Aggregate market distribution by category.
+        
+        Args:
+            category_stats: Per-category rows from the shared category_stats
+                node; scans silver markets when omitted
+        """
         result = AggregationResult(table_name="category_distribution")
         start_time = datetime.now(timezone.utc)
         
@@ -485,6 +1011,9 @@ class GoldLayerAggregator:
             async with self.db.asyncpg_connection() as conn:
                 snapshot_id = uuid4()
                 result.snapshot_id = snapshot_id
+                stats_cte, stats_params = self._stats_cte(
+                    _CATEGORY_STATS_QUERY, _CATEGORY_STATS_RECORD, category_stats
+                )
                 
                 # Delete old snapshots
                 delete_query = """
@@ -500,26 +1029,15 @@ class GoldLayerAggregator:
                         pass
                 
                 # Silver uses: source, volume_24h, category_name
-                insert_query = """
+                insert_query = f"""
                     INSERT INTO predictions_gold.category_distribution (
                         snapshot_timestamp, snapshot_id, category, display_order,
                         market_count, percentage, polymarket_count, kalshi_count, limitless_count,
                         total_volume_24h, avg_volume_per_market
                     )
-                    WITH totals AS (
-                        SELECT COUNT(*) as total FROM predictions_silver.markets
-                    ),
-                    cat_stats AS (
-                        SELECT
-                            COALESCE(category_name, 'Uncategorized') as category,
-                            COUNT(*) as market_count,
-                            COUNT(*) FILTER (WHERE source = 'polymarket') as polymarket_count,
-                            COUNT(*) FILTER (WHERE source = 'kalshi') as kalshi_count,
-                            COUNT(*) FILTER (WHERE source = 'limitless') as limitless_count,
-                            COALESCE(SUM(volume_24h), 0) as total_volume_24h,
-                            COALESCE(AVG(volume_24h), 0) as avg_volume_per_market
-                        FROM predictions_silver.markets
-                        GROUP BY COALESCE(category_name, 'Uncategorized')
+                    WITH cat_stats AS ({stats_cte}),
+                    totals AS (
+                        SELECT SUM(market_count) as total FROM cat_stats
                     )
                     SELECT
                         NOW() as snapshot_timestamp,
@@ -538,7 +1056,7 @@ class GoldLayerAggregator:
                     ORDER BY c.market_count DESC
                 """
                 
-                insert_result, error = await self._safe_execute(conn, insert_query, (snapshot_id,), table_name="category_distribution", operation="execute")
+                insert_result, error = await self._safe_execute(conn, insert_query, (snapshot_id, *stats_params), table_name="category_distribution", operation="execute")
                 
                 if error:
                     result.status = "failed"
@@ -647,8 +1165,14 @@ class GoldLayerAggregator:
         self._log_aggregation_result(result)
         return result
     
-    async def aggregate_platform_comparison(self) -> AggregationResult:
-        """Aggregate platform comparison metrics."""
+    async def aggregate_platform_comparison(self, platform_stats: Optional[list] = None) -> AggregationResult:
+        """
+        Aggregate platform comparison metrics.
+        
+        Args:
+            platform_stats: Per-source rows from the shared platform_stats
+                node; scans silver markets when omitted
+        """
         result = AggregationResult(table_name="platform_comparison")
         start_time = datetime.now(timezone.utc)
         
@@ -656,6 +1180,9 @@ class GoldLayerAggregator:
             async with self.db.asyncpg_connection() as conn:
                 snapshot_id = uuid4()
                 result.snapshot_id = snapshot_id
+                stats_cte, stats_params = self._stats_cte(
+                    _PLATFORM_STATS_QUERY, _PLATFORM_STATS_RECORD, platform_stats
+                )
                 
                 # Clear old platform comparison
                 delete_query = """
@@ -671,7 +1198,7 @@ class GoldLayerAggregator:
                         pass
                 
                 # Silver uses: source, volume_24h, volume_7d, volume_total, is_active
-                insert_query = """
+                insert_query = f"""
                     INSERT INTO predictions_gold.platform_comparison (
                         snapshot_timestamp, snapshot_id, platform, display_order,
                         total_markets, active_markets, resolved_markets_24h,
@@ -679,37 +1206,35 @@ class GoldLayerAggregator:
                         growth_24h_pct, growth_7d_pct, market_share_pct,
                         trade_count_24h, unique_traders_24h, avg_trade_size
                     )
-                    WITH totals AS (
-                        SELECT 
-                            COALESCE(SUM(volume_24h), 0) as total_volume_24h,
-                            COUNT(*) as total_markets
-                        FROM predictions_silver.markets
+                    WITH platform_stats AS ({stats_cte}),
+                    totals AS (
+                        SELECT COALESCE(SUM(volume_24h), 0) as total_volume_24h
+                        FROM platform_stats
                     )
                     SELECT
                         NOW() as snapshot_timestamp,
                         $1::uuid as snapshot_id,
-                        m.source as platform,
-                        ROW_NUMBER() OVER (ORDER BY COUNT(*) DESC)::int as display_order,
-                        COUNT(*)::int as total_markets,
-                        COUNT(*) FILTER (WHERE m.is_active = true)::int as active_markets,
+                        p.source as platform,
+                        ROW_NUMBER() OVER (ORDER BY p.market_count DESC)::int as display_order,
+                        p.market_count::int as total_markets,
+                        p.open_markets::int as active_markets,
                         0::int as resolved_markets_24h,
-                        COALESCE(SUM(m.volume_24h), 0) as volume_24h,
-                        COALESCE(SUM(m.volume_7d), 0) as volume_7d,
-                        COALESCE(SUM(m.volume_total), 0) / 1000000.0 as volume_millions,
-                        COALESCE(AVG(m.volume_24h), 0) / 1000.0 as avg_volume_thousands,
+                        p.volume_24h,
+                        p.volume_7d,
+                        p.volume_total / 1000000.0 as volume_millions,
+                        p.avg_volume_24h / 1000.0 as avg_volume_thousands,
                         0.0 as growth_24h_pct,
                         0.0 as growth_7d_pct,
-                        ROUND(COALESCE(SUM(m.volume_24h), 0)::numeric / NULLIF(t.total_volume_24h, 0) * 100, 2) as market_share_pct,
+                        ROUND(p.volume_24h::numeric / NULLIF(t.total_volume_24h, 0) * 100, 2) as market_share_pct,
                         0::int as trade_count_24h,
                         0::int as unique_traders_24h,
                         0.0 as avg_trade_size
-                    FROM predictions_silver.markets m
+                    FROM platform_stats p
                     CROSS JOIN totals t
-                    GROUP BY m.source, t.total_volume_24h, t.total_markets
-                    ORDER BY COUNT(*) DESC
+                    ORDER BY p.market_count DESC
                 """
                 
-                insert_result, error = await self._safe_execute(conn, insert_query, (snapshot_id,), table_name="platform_comparison", operation="execute")
+                insert_result, error = await self._safe_execute(conn, insert_query, (snapshot_id, *stats_params), table_name="platform_comparison", operation="execute")
                 
                 if error:
                     result.status = "failed"
@@ -733,8 +1258,14 @@ class GoldLayerAggregator:
         self._log_aggregation_result(result)
         return result
     
-    async def aggregate_trending_categories(self) -> AggregationResult:
-        """Aggregate trending categories."""
+    async def aggregate_trending_categories(self, category_stats: Optional[list] = None) -> AggregationResult:
+        """
+        Aggregate trending categories.
+        
+        Args:
+            category_stats: Per-category rows from the shared category_stats
+                node; scans silver markets when omitted
+        """
         result = AggregationResult(table_name="trending_categories")
         start_time = datetime.now(timezone.utc)
         
@@ -742,6 +1273,9 @@ class GoldLayerAggregator:
             async with self.db.asyncpg_connection() as conn:
                 snapshot_id = uuid4()
                 result.snapshot_id = snapshot_id
+                stats_cte, stats_params = self._stats_cte(
+                    _CATEGORY_STATS_QUERY, _CATEGORY_STATS_RECORD, category_stats
+                )
                 
                 # Delete old trending data
                 delete_query = """
@@ -758,48 +1292,45 @@ class GoldLayerAggregator:
                 
                 # Silver uses: source, volume_24h, category_name
                 # Constraint: rank must be BETWEEN 1 AND 8
-                insert_query = """
+                insert_query = f"""
                     INSERT INTO predictions_gold.trending_categories (
                         snapshot_timestamp, snapshot_id, category, rank,
                         market_count, volume_24h, volume_change_24h_pct,
                         trend_direction, trend_score, percentage_of_total, rank_change,
                         polymarket_count, kalshi_count, limitless_count
                     )
-                    WITH totals AS (
-                        SELECT 
-                            COUNT(*) as total_markets,
-                            COALESCE(SUM(volume_24h), 0) as total_volume
-                        FROM predictions_silver.markets
+                    WITH cat_stats AS ({stats_cte}),
+                    totals AS (
+                        SELECT SUM(market_count) as total_markets FROM cat_stats
                     )
                     SELECT
                         NOW() as snapshot_timestamp,
                         $1::uuid as snapshot_id,
-                        COALESCE(category_name, 'Uncategorized') as category,
-                        ROW_NUMBER() OVER (ORDER BY COALESCE(SUM(volume_24h), 0) DESC)::int as rank,
-                        COUNT(*)::int as market_count,
-                        COALESCE(SUM(volume_24h), 0) as volume_24h,
+                        c.category,
+                        ROW_NUMBER() OVER (ORDER BY c.total_volume_24h DESC)::int as rank,
+                        c.market_count::int,
+                        c.total_volume_24h as volume_24h,
                         0.0 as volume_change_24h_pct,
                         'stable' as trend_direction,
                         CASE 
-                            WHEN SUM(volume_24h) > 100000 THEN 5
-                            WHEN SUM(volume_24h) > 50000 THEN 4
-                            WHEN SUM(volume_24h) > 10000 THEN 3
-                            WHEN SUM(volume_24h) > 1000 THEN 2
+                            WHEN c.total_volume_24h > 100000 THEN 5
+                            WHEN c.total_volume_24h > 50000 THEN 4
+                            WHEN c.total_volume_24h > 10000 THEN 3
+                            WHEN c.total_volume_24h > 1000 THEN 2
                             ELSE 1 
                         END::int as trend_score,
-                        ROUND(COUNT(*)::numeric / NULLIF(t.total_markets, 0) * 100, 2) as percentage_of_total,
+                        ROUND(c.market_count::numeric / NULLIF(t.total_markets, 0) * 100, 2) as percentage_of_total,
                         0::int as rank_change,
-                        COUNT(*) FILTER (WHERE source = 'polymarket')::int as polymarket_count,
-                        COUNT(*) FILTER (WHERE source = 'kalshi')::int as kalshi_count,
-                        COUNT(*) FILTER (WHERE source = 'limitless')::int as limitless_count
-                    FROM predictions_silver.markets
+                        c.polymarket_count::int,
+                        c.kalshi_count::int,
+                        c.limitless_count::int
+                    FROM cat_stats c
                     CROSS JOIN totals t
-                    GROUP BY COALESCE(category_name, 'Uncategorized'), t.total_markets
-                    ORDER BY COALESCE(SUM(volume_24h), 0) DESC
+                    ORDER BY c.total_volume_24h DESC
                     LIMIT 8
                 """
                 
-                insert_result, error = await self._safe_execute(conn, insert_query, (snapshot_id,), table_name="trending_categories", operation="execute")
+                insert_result, error = await self._safe_execute(conn, insert_query, (snapshot_id, *stats_params), table_name="trending_categories", operation="execute")
                 
                 if error:
                     result.status = "failed"
@@ -828,48 +1359,88 @@ class GoldLayerAggregator:
     # ========================================================================
     
     async def run_market_detail_aggregations(self) -> RunSummary:
-        """Run market detail aggregations concurrently."""
-        summary = RunSummary(run_type="market_detail")
-        self.logger.info("Starting MARKET DETAIL aggregations", run_id=str(summary.run_id))
-        
-        tasks = [
-            self.aggregate_market_detail_cache(),
-            self.aggregate_market_price_history(),
-            self.aggregate_market_trade_activity(),
-            self.aggregate_market_orderbook_depth(),
-            self.aggregate_related_markets(),
-            self.aggregate_market_statistics(),
-        ]
+        """
+        Run market detail aggregations as a dependency graph.
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        In incremental mode market_detail_cache is only refreshed for markets
+        touched since the last run.
+        """
+        summary = RunSummary(run_type="market_detail")
+        incremental = self.settings.gold_incremental_enabled
+        changed, high_water = None, None
+        if incremental:
+            changed, high_water = await self._pending_changes("market_detail")
+        self.logger.info(
+            "Starting MARKET DETAIL aggregations",
+            run_id=str(summary.run_id),
+            changed_markets=len(changed) if changed is not None else None,
+        )
         
-        table_names = [
-            "market_detail_cache", "market_price_history", "market_trade_activity",
-            "market_orderbook_depth", "related_markets", "market_statistics"
+        nodes = [
+            AggregationNode(
+                "market_detail_cache",
+                lambda ctx: self.aggregate_market_detail_cache(changed=changed),
+                inputs=("predictions_silver.markets",),
+                outputs=("predictions_gold.market_detail_cache",),
+            ),
+            AggregationNode(
+                "market_price_history",
+                lambda ctx: self.aggregate_market_price_history(),
+                inputs=("predictions_silver.prices", "predictions_silver.markets"),
+                outputs=("predictions_gold.market_price_history",),
+            ),
+            AggregationNode(
+                "market_trade_activity",
+                lambda ctx: self.aggregate_market_trade_activity(),
+                inputs=("predictions_silver.trades", "predictions_silver.markets"),
+                outputs=("predictions_gold.market_trade_activity",),
+            ),
+            AggregationNode(
+                "market_orderbook_depth",
+                lambda ctx: self.aggregate_market_orderbook_depth(),
+                inputs=("predictions_silver.orderbooks", "predictions_silver.markets"),
+                outputs=("predictions_gold.market_orderbook_depth",),
+            ),
+            AggregationNode(
+                "related_markets",
+                lambda ctx: self.aggregate_related_markets(),
+                inputs=("predictions_silver.markets",),
+                outputs=("predictions_gold.related_markets",),
+            ),
+            AggregationNode(
+                "market_statistics",
+                lambda ctx: self.aggregate_market_statistics(),
+                inputs=("predictions_silver.markets", "predictions_silver.trades"),
+                outputs=("predictions_gold.market_statistics",),
+            ),
         ]
+        await self._run_graph(summary, nodes)
         
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                error_result = AggregationResult(
-                    table_name=table_names[i],
-                    status="failed",
-                    error_count=1,
-                    message=f"Exception: {str(result)}"
-                )
-                summary.results.append(error_result)
-                self.logger.error("Market detail aggregation failed", table=table_names[i], error=str(result))
-            else:
-                summary.results.append(result)
+        # Cursor only tracks the cache, the one incremental table in this run
+        if incremental and summary.results[0].status == "success":
+            await self._advance_cursor("market_detail", high_water)
         
         summary.completed_at = datetime.now(timezone.utc)
         self._log_run_summary(summary)
         return summary
     
-    async def aggregate_market_detail_cache(self) -> AggregationResult:
-        """Cache full market details for fast frontend loading."""
+    async def aggregate_market_detail_cache(self, changed: Optional[list[tuple[str, str]]] = None) -> AggregationResult:
+        """
+        Cache full market details for fast frontend loading.
+        
+        Args:
+            changed: Only upsert these (source, source_market_id) keys
+                (incremental mode); None rebuilds every market
+        """
         result = AggregationResult(table_name="market_detail_cache")
         start_time = datetime.now(timezone.utc)
         
+        if changed is not None and not changed:
+            result.status = "success"
+            result.message = "Market detail cache: no changed markets"
+            self._log_aggregation_result(result)
+            return result
+        
         try:
             async with self.db.asyncpg_connection() as conn:
                 # Upsert all markets with full details
@@ -918,6 +1489,10 @@ class GoldLayerAggregator:
                         m.end_date,
                         NOW() as cached_at
                     FROM predictions_silver.markets m
+                    WHERE $1::text[] IS NULL
+                       OR (m.source, m.source_market_id) IN (
+                           SELECT * FROM unnest($1::text[], $2::text[])
+                       )
                     ON CONFLICT (market_id) DO UPDATE SET
                         slug = EXCLUDED.slug,
                         title = EXCLUDED.title,
@@ -947,7 +1522,11 @@ class GoldLayerAggregator:
                         cache_version = predictions_gold.market_detail_cache.cache_version + 1
                 """
                 
-                upsert_result, error = await self._safe_execute(conn, query, (), table_name="market_detail_cache", operation="execute")
+                params = (
+                    ([k[0] for k in changed], [k[1] for k in changed])
+                    if changed is not None else (None, None)
+                )
+                upsert_result, error = await self._safe_execute(conn, query, params, table_name="market_detail_cache", operation="execute")
                 
                 if error:
                     result.status = "failed"
@@ -974,48 +1553,105 @@ class GoldLayerAggregator:
         return result
     
     async def aggregate_market_price_history(self) -> AggregationResult:
-        """Aggregate hourly price history from Silver prices table."""
+        """
+        Rebuild the hourly candles that newly ingested Silver ticks fall into
+        (migrations 023, 027).
+        
+        Ticks are selected by ingest order, not snapshot time: every tick
+        ingested after the newest one already folded (less a grace period
+        for late commits) marks its (market, hour) candle, whatever hour it
+        is stamped with, and each marked candle is recomputed from all of
+        its ticks. A run costs time in the number of new ticks and the
+        candles they touch; re-reading a tick is harmless.
+        """
         result = AggregationResult(table_name="market_price_history")
         start_time = datetime.now(timezone.utc)
         
         try:
             async with self.db.asyncpg_connection() as conn:
-                # Aggregate prices into hourly OHLCV buckets
-                # Silver prices columns: snapshot_at, yes_price, open_price, high_price, low_price, close_price, volume_1h
+                # Newest folded ingest; the first run starts from the old 24h window
+                watermark = await conn.fetchval(
+                    """
+                    SELECT COALESCE(
+                        (SELECT MAX(ingested_at) FROM predictions_gold.market_price_history
+                         WHERE ingested_at IS NOT NULL),
+                        NOW() - INTERVAL '24 hours'
+                    )
+                    """
+                )
+                since = watermark - timedelta(seconds=self.settings.gold_price_candle_grace_seconds)
+                
                 query = """
+                    WITH touched AS (
+                        SELECT DISTINCT
+                            p.source,
+                            p.source_market_id,
+                            date_trunc('hour', p.snapshot_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC' as bucket
+                        FROM predictions_silver.prices p
+                        WHERE p.ingested_at > $1
+                          AND p.yes_price IS NOT NULL
+                    ),
+                    folded AS (
+                        SELECT
+                            t.source,
+                            t.source_market_id,
+                            t.bucket,
+                            MIN(p.snapshot_at) as open_at,
+                            MAX(p.snapshot_at) as close_at,
+                            (array_agg(p.yes_price ORDER BY p.snapshot_at))[1] as open_price,
+                            (array_agg(p.yes_price ORDER BY p.snapshot_at DESC))[1] as close_price,
+                            MAX(p.yes_price) as high_price,
+                            MIN(p.yes_price) as low_price,
+                            SUM(COALESCE(p.volume_1h, 0)) as volume,
+                            COUNT(*)::int as ticks,
+                            MAX(p.ingested_at) as ingested_at
+                        FROM touched t
+                        JOIN predictions_silver.prices p
+                            ON p.source = t.source
+                           AND p.source_market_id = t.source_market_id
+                           AND p.snapshot_at >= t.bucket
+                           AND p.snapshot_at < t.bucket + INTERVAL '1 hour'
+                        WHERE p.yes_price IS NOT NULL
+                        GROUP BY t.source, t.source_market_id, t.bucket
+                    )
                     INSERT INTO predictions_gold.market_price_history (
                         market_id, source, source_market_id,
                         period_start, period_end, granularity,
                         open_price, high_price, low_price, close_price,
-                        volume, trade_count
+                        volume, trade_count, open_at, close_at, ingested_at
                     )
                     SELECT
                         m.id as market_id,
-                        p.source,
-                        p.source_market_id,
-                        date_trunc('hour', p.snapshot_at) as period_start,
-                        date_trunc('hour', p.snapshot_at) + INTERVAL '1 hour' as period_end,
+                        f.source,
+                        f.source_market_id,
+                        f.bucket as period_start,
+                        f.bucket + INTERVAL '1 hour' as period_end,
                         '1h' as granularity,
-                        COALESCE((array_agg(p.yes_price ORDER BY p.snapshot_at))[1], 0.5) as open_price,
-                        COALESCE(MAX(p.yes_price), 0.5) as high_price,
-                        COALESCE(MIN(p.yes_price), 0.5) as low_price,
-                        COALESCE((array_agg(p.yes_price ORDER BY p.snapshot_at DESC))[1], 0.5) as close_price,
-                        COALESCE(SUM(p.volume_1h), 0) as volume,
-                        COUNT(*)::int as trade_count
-                    FROM predictions_silver.prices p
+                        f.open_price,
+                        f.high_price,
+                        f.low_price,
+                        f.close_price,
+                        f.volume,
+                        f.ticks as trade_count,
+                        f.open_at,
+                        f.close_at,
+                        f.ingested_at
+                    FROM folded f
                     JOIN predictions_silver.markets m 
-                        ON p.source = m.source AND p.source_market_id = m.source_market_id
-                    WHERE p.snapshot_at > NOW() - INTERVAL '24 hours'
-                    GROUP BY m.id, p.source, p.source_market_id, date_trunc('hour', p.snapshot_at)
+                        ON f.source = m.source AND f.source_market_id = m.source_market_id
                     ON CONFLICT (source_market_id, period_start, granularity) DO UPDATE SET
-                        high_price = GREATEST(predictions_gold.market_price_history.high_price, EXCLUDED.high_price),
-                        low_price = LEAST(predictions_gold.market_price_history.low_price, EXCLUDED.low_price),
+                        open_price = EXCLUDED.open_price,
+                        high_price = EXCLUDED.high_price,
+                        low_price = EXCLUDED.low_price,
                         close_price = EXCLUDED.close_price,
                         volume = EXCLUDED.volume,
-                        trade_count = EXCLUDED.trade_count
+                        trade_count = EXCLUDED.trade_count,
+                        open_at = EXCLUDED.open_at,
+                        close_at = EXCLUDED.close_at,
+                        ingested_at = EXCLUDED.ingested_at
                 """
                 
-                insert_result, error = await self._safe_execute(conn, query, (), table_name="market_price_history", operation="execute")
+                insert_result, error = await self._safe_execute(conn, query, (since,), table_name="market_price_history", operation="execute")
                 
                 if error:
                     result.status = "failed"
@@ -1027,7 +1663,7 @@ class GoldLayerAggregator:
                     except (ValueError, IndexError):
                         result.upserted = 0
                     result.status = "success"
-                    result.message = f"Price history: {result.upserted} hourly records"
+                    result.message = f"Price history: {result.upserted} hourly candles rebuilt for ticks ingested since {since:%H:%M:%S}"
                 
         except Exception as e:
             result.status = "failed"
@@ -1408,37 +2044,43 @@ class GoldLayerAggregator:
     # ========================================================================
     
     async def run_markets_page_aggregations(self) -> RunSummary:
-        """Run markets/explore page aggregations concurrently."""
+        """Run markets/explore page aggregations as a dependency graph."""
         summary = RunSummary(run_type="markets_page")
         self.logger.info("Starting MARKETS PAGE aggregations", run_id=str(summary.run_id))
         
-        tasks = [
-            self.aggregate_recently_resolved_markets(),
-            self.aggregate_category_breakdown_by_platform(),
-            self.aggregate_market_search_cache(),
-            self.aggregate_filter_aggregates(),
-            self.aggregate_watchlist_popular_markets(),
+        nodes = [
+            AggregationNode(
+                "recently_resolved_markets",
+                lambda ctx: self.aggregate_recently_resolved_markets(),
+                inputs=("predictions_silver.markets", "predictions_silver.trades"),
+                outputs=("predictions_gold.recently_resolved_markets",),
+            ),
+            AggregationNode(
+                "category_breakdown_by_platform",
+                lambda ctx: self.aggregate_category_breakdown_by_platform(),
+                inputs=("predictions_silver.markets",),
+                outputs=("predictions_gold.category_breakdown_by_platform",),
+            ),
+            AggregationNode(
+                "market_search_cache",
+                lambda ctx: self.aggregate_market_search_cache(),
+                inputs=("predictions_silver.markets",),
+                outputs=("predictions_gold.market_search_cache",),
+            ),
+            AggregationNode(
+                "filter_aggregates",
+                lambda ctx: self.aggregate_filter_aggregates(),
+                inputs=("predictions_silver.markets",),
+                outputs=("predictions_gold.filter_aggregates",),
+            ),
+            AggregationNode(
+                "watchlist_popular_markets",
+                lambda ctx: self.aggregate_watchlist_popular_markets(),
+                inputs=("predictions_silver.markets", "predictions_silver.trades"),
+                outputs=("predictions_gold.watchlist_popular_markets",),
+            ),
         ]
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        table_names = [
-            "recently_resolved_markets", "category_breakdown_by_platform", 
-            "market_search_cache", "filter_aggregates", "watchlist_popular_markets"
-        ]
-        
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                error_result = AggregationResult(
-                    table_name=table_names[i],
-                    status="failed",
-                    error_count=1,
-                    message=f"Exception: {str(result)}"
-                )
-                summary.results.append(error_result)
-                self.logger.error("Markets page aggregation failed", table=table_names[i], error=str(result))
-            else:
-                summary.results.append(result)
+        await self._run_graph(summary, nodes)
         
         summary.completed_at = datetime.now(timezone.utc)
         self._log_run_summary(summary)
@@ -1956,36 +2598,37 @@ class GoldLayerAggregator:
     # ========================================================================
     
     async def run_analytics_page_aggregations(self) -> RunSummary:
-        """Run analytics page aggregations concurrently."""
+        """Run analytics page aggregations as a dependency graph."""
         summary = RunSummary(run_type="analytics_page")
         self.logger.info("Starting ANALYTICS PAGE aggregations", run_id=str(summary.run_id))
         
-        tasks = [
-            self.aggregate_volume_distribution_histogram(),
-            self.aggregate_market_lifecycle_funnel(),
-            self.aggregate_top_traders_leaderboard(),
-            self.aggregate_category_performance_metrics(),
-        ]
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        table_names = [
-            "volume_distribution_histogram", "market_lifecycle_funnel",
-            "top_traders_leaderboard", "category_performance_metrics"
+        nodes = [
+            AggregationNode(
+                "volume_distribution_histogram",
+                lambda ctx: self.aggregate_volume_distribution_histogram(),
+                inputs=("predictions_silver.markets",),
+                outputs=("predictions_gold.volume_distribution_histogram",),
+            ),
+            AggregationNode(
+                "market_lifecycle_funnel",
+                lambda ctx: self.aggregate_market_lifecycle_funnel(),
+                inputs=("predictions_silver.markets",),
+                outputs=("predictions_gold.market_lifecycle_funnel",),
+            ),
+            AggregationNode(
+                "top_traders_leaderboard",
+                lambda ctx: self.aggregate_top_traders_leaderboard(),
+                inputs=("predictions_silver.trades",),
+                outputs=("predictions_gold.top_traders_leaderboard",),
+            ),
+            AggregationNode(
+                "category_performance_metrics",
+                lambda ctx: self.aggregate_category_performance_metrics(),
+                inputs=("predictions_silver.markets", "predictions_silver.trades"),
+                outputs=("predictions_gold.category_performance_metrics",),
+            ),
         ]
-        
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                error_result = AggregationResult(
-                    table_name=table_names[i],
-                    status="failed",
-                    error_count=1,
-                    message=f"Exception: {str(result)}"
-                )
-                summary.results.append(error_result)
-                self.logger.error("Analytics page aggregation failed", table=table_names[i], error=str(result))
-            else:
-                summary.results.append(result)
+        await self._run_graph(summary, nodes)
         
         summary.completed_at = datetime.now(timezone.utc)
         self._log_run_summary(summary)
@@ -2368,35 +3011,110 @@ class GoldLayerAggregator:
         summary = RunSummary(run_type="events")
         self.logger.info("Starting EVENTS PAGE aggregations (Phase 5)", run_id=str(summary.run_id))
         
-        try:
-            # Run events aggregations
-            results = await asyncio.gather(
-                self.aggregate_events_snapshot(),
-                self.aggregate_event_markets(),
-                self.aggregate_events_aggregate_metrics(),
-                return_exceptions=True
-            )
-            
-            for r in results:
-                if isinstance(r, Exception):
-                    error_result = AggregationResult(
-                        table_name="unknown",
-                        status="failed",
-                        error_count=1,
-                        message=str(r)
-                    )
-                    summary.results.append(error_result)
-                    self.logger.error("Events aggregation task failed", error=str(r))
-                else:
-                    summary.results.append(r)
-        
-        except Exception as e:
-            self.logger.exception("Critical failure in events aggregations", error=str(e))
+        nodes = [
+            AggregationNode(
+                "events_snapshot",
+                lambda ctx: self.aggregate_events_snapshot(),
+                inputs=("predictions_silver.markets", "predictions_silver.events"),
+                outputs=("predictions_gold.events_snapshot",),
+            ),
+            AggregationNode(
+                "event_markets",
+                lambda ctx: self.aggregate_event_markets(),
+                inputs=("predictions_silver.markets",),
+                outputs=("predictions_gold.event_markets",),
+            ),
+            AggregationNode(
+                "events_aggregate_metrics",
+                lambda ctx: self.aggregate_events_aggregate_metrics(),
+                inputs=("predictions_silver.markets",),
+                outputs=("predictions_gold.events_aggregate_metrics",),
+            ),
+        ]
+        await self._run_graph(summary, nodes)
         
         summary.completed_at = datetime.now(timezone.utc)
         self._log_run_summary(summary)
         return summary
     
+    async def aggregate_event_groups(self, changed: Optional[list[tuple[str, str]]] = None) -> AggregationResult:
+        """
+        Maintain predictions_gold.event_groups, which backs GET /events.
+        
+        Args:
+            changed: (source, source_market_id) keys touched since the last
+                refresh; only the groups they belong to now, or belonged to
+                at the last refresh, are rebuilt
+        """
+        result = AggregationResult(table_name="event_groups")
+        start_time = datetime.now(timezone.utc)
+        
+        if changed is not None and not changed:
+            result.status = "success"
+            result.message = "No changed markets"
+            result.duration_seconds = (datetime.now(timezone.utc) - start_time).total_seconds()
+            return result
+        
+        try:
+            async with self.db.asyncpg_connection() as conn:
+                async with conn.transaction():
+                    if changed is None:
+                        await conn.execute("DELETE FROM predictions_gold.event_group_members")
+                        await conn.execute(_EVENT_GROUP_MEMBERS_INSERT.format(scope=""))
+                        delete_result = await conn.execute("DELETE FROM predictions_gold.event_groups")
+                        insert_result = await conn.execute(_EVENT_GROUPS_INSERT.format(scope=""))
+                    else:
+                        sources = [k[0] for k in changed]
+                        market_ids = [k[1] for k in changed]
+                        affected = await conn.fetch("""
+                            SELECT event_id, source
+                            FROM predictions_gold.event_group_members
+                            WHERE (source, source_market_id) IN (SELECT * FROM unnest($1::text[], $2::text[]))
+                            UNION
+                            SELECT predictions_silver.market_event_id(source, source_market_id, slug, extra_data), source
+                            FROM predictions_silver.markets
+                            WHERE (source, source_market_id) IN (SELECT * FROM unnest($1::text[], $2::text[]))
+                        """, sources, market_ids)
+                        
+                        await conn.execute("""
+                            DELETE FROM predictions_gold.event_group_members
+                            WHERE (source, source_market_id) IN (SELECT * FROM unnest($1::text[], $2::text[]))
+                        """, sources, market_ids)
+                        await conn.execute(
+                            _EVENT_GROUP_MEMBERS_INSERT.format(scope=_CHANGED_KEYS_SCOPE), sources, market_ids
+                        )
+                        
+                        event_ids = [r["event_id"] for r in affected]
+                        platforms = [r["source"] for r in affected]
+                        delete_result = await conn.execute("""
+                            DELETE FROM predictions_gold.event_groups
+                            WHERE (event_id, platform) IN (SELECT * FROM unnest($1::text[], $2::text[]))
+                        """, event_ids, platforms)
+                        insert_result = await conn.execute(
+                            _EVENT_GROUPS_INSERT.format(scope=_EVENT_GROUPS_SCOPE), event_ids, platforms
+                        )
+                
+                try:
+                    result.deleted = int(delete_result.split()[-1])
+                    result.inserted = int(insert_result.split()[-1])
+                except (ValueError, IndexError):
+                    pass
+                result.status = "success"
+                result.message = (
+                    f"Event groups: {result.inserted} rebuilt"
+                    + (f" for {len(changed)} changed markets" if changed is not None else "")
+                )
+        
+        except Exception as e:
+            result.status = "failed"
+            result.error_count = 1
+            result.message = f"Exception: {str(e)}"
+            self.logger.exception("Failed to aggregate event groups", error=str(e))
+        
+        result.duration_seconds = (datetime.now(timezone.utc) - start_time).total_seconds()
+        self._log_aggregation_result(result)
+        return result
+    
     async def aggregate_events_snapshot(self) -> AggregationResult:
         """
         Aggregate events_snapshot table: Event groupings with metadata.
@@ -2975,6 +3693,285 @@ class GoldLayerAggregator:
         self._log_aggregation_result(result)
         return result
     
+    # ========================================================================
+    # CROSS-VENUE MATCHING (match graph for arbitrage / cross-venue, migration 020)
+    # ========================================================================
+    
+    async def run_cross_venue_matching(self) -> RunSummary:
+        """
+        Maintain the persisted Polymarket <-> Kalshi match graph read by
+        /arbitrage/opportunities and /cross-venue-events-db.
+        
+        In incremental mode only markets whose title, event or eligibility
+        changed since the last cycle are re-matched (plus the events they
+        belong to); the first cycle and every gold_full_rebuild_every-th one
+        re-match the whole catalog.
+        """
+        summary = RunSummary(run_type="cross_venue")
+        incremental = self.settings.gold_incremental_enabled
+        changed, high_water = None, None
+        if incremental:
+            changed, high_water = await self._pending_changes("cross_venue")
+            if changed is not None:
+                summary.run_type = "cross_venue_incremental"
+        self.logger.info(
+            "Starting CROSS-VENUE matching",
+            run_id=str(summary.run_id),
+            changed_markets=len(changed) if changed is not None else None,
+        )
+        
+        nodes = [
+            AggregationNode(
+                "cross_venue_matches",
+                lambda ctx: self.aggregate_cross_venue_matches(changed=changed),
+                inputs=("predictions_silver.markets",),
+                outputs=(
+                    "predictions_gold.cross_venue_market_pairs",
+                    "predictions_gold.cross_venue_event_pairs",
+                ),
+            ),
+        ]
+        await self._run_graph(summary, nodes)
+        
+        if incremental and summary.failed_count == 0:
+            await self._advance_cursor("cross_venue", high_water)
+        
+        summary.completed_at = datetime.now(timezone.utc)
+        self._log_run_summary(summary)
+        return summary
+    
+    async def aggregate_cross_venue_matches(self, changed: Optional[list[tuple[str, str]]] = None) -> AggregationResult:
+        """
+        Re-match new or changed titles into the cross-venue pair tables.
+        
+        Title features and matching run in a worker thread with no
+        connection held; every table is then replaced in one transaction,
+        so readers never see a half-updated graph.
+        
+        Args:
+            changed: (source, source_market_id) keys touched since the last
+                cycle; None re-matches every eligible market and event
+        """
+        result = AggregationResult(table_name="cross_venue_matches")
+        start_time = datetime.now(timezone.utc)
+        
+        if changed is not None:
+            changed = [k for k in changed if k[0] in (cross_venue.POLYMARKET, cross_venue.KALSHI)]
+            if not changed:
+                result.status = "success"
+                result.message = "No changed markets"
+                result.duration_seconds = (datetime.now(timezone.utc) - start_time).total_seconds()
+                return result
+        
+        try:
+            if changed is None:
+                inserted, deleted, message = await self._rebuild_cross_venue()
+            else:
+                inserted, deleted, message = await self._update_cross_venue(changed)
+            result.inserted = inserted
+            result.deleted = deleted
+            result.status = "success"
+            result.message = message
+        
+        except Exception as e:
+            result.status = "failed"
+            result.error_count = 1
+            result.message = f"Exception: {str(e)}"
+            self.logger.exception("Failed to aggregate cross-venue matches", error=str(e))
+        
+        result.duration_seconds = (datetime.now(timezone.utc) - start_time).total_seconds()
+        self._log_aggregation_result(result)
+        return result
+    
+    async def _rebuild_cross_venue(self) -> tuple[int, int, str]:
+        """Full rebuild: match every eligible market and event."""
+        async with self.db.asyncpg_connection() as conn:
+            market_rows = await conn.fetch(
+                _CROSS_VENUE_MARKETS_QUERY.format(floor=1, scope=""), cross_venue.MIN_MARKET_VOLUME
+            )
+            event_rows = await conn.fetch(
+                _CROSS_VENUE_EVENT_TITLES_QUERY.format(limit=1, scope=""), cross_venue.EVENT_TITLE_MARKETS
+            )
+        
+        def compute():
+            markets = [
+                cross_venue.market_features(r["source"], r["source_market_id"], r["event_id"], r["title"])
+                for r in market_rows
+            ]
+            events = [
+                e for e in (
+                    cross_venue.event_features(r["platform"], r["event_id"], list(r["titles"] or []))
+                    for r in event_rows
+                ) if e is not None
+            ]
+            # Probe from the smaller venue; match_markets ranks the larger venue's candidates
+            poly = [m for m in markets if m.source == cross_venue.POLYMARKET]
+            kalshi = [m for m in markets if m.source == cross_venue.KALSHI]
+            market_pairs = cross_venue.match_markets(min(poly, kalshi, key=len), markets)
+            poly_events = [e for e in events if e.platform == cross_venue.POLYMARKET]
+            event_pairs = cross_venue.match_events(poly_events, events)
+            return markets, market_pairs, events, event_pairs
+        
+        markets, market_pairs, events, event_pairs = await asyncio.to_thread(compute)
+        
+        async with self.db.asyncpg_connection() as conn:
+            async with conn.transaction():
+                deleted = 0
+                for table in _CROSS_VENUE_COLUMNS:
+                    status = await conn.execute(f"DELETE FROM predictions_gold.{table}")
+                    if table.endswith("_pairs"):
+                        deleted += int(status.split()[-1])
+                await self._copy_cross_venue(conn, markets, market_pairs, events, event_pairs)
+        
+        message = (
+            f"Cross-venue: {len(market_pairs)} market pairs over {len(markets)} markets, "
+            f"{len(event_pairs)} event pairs over {len(events)} events"
+        )
+        return len(market_pairs) + len(event_pairs), deleted, message
+    
+    async def _update_cross_venue(self, changed: list[tuple[str, str]]) -> tuple[int, int, str]:
+        """
+        Incremental update: re-match markets whose (event, title) or
+        eligibility changed, and the events they left or joined, against the
+        stored features of the other venue.
+        """
+        sources = [k[0] for k in changed]
+        market_ids = [k[1] for k in changed]
+        async with self.db.asyncpg_connection() as conn:
+            current_rows = await conn.fetch(
+                _CROSS_VENUE_MARKETS_QUERY.format(floor=3, scope=_CHANGED_KEYS_SCOPE),
+                sources, market_ids, cross_venue.MIN_MARKET_VOLUME,
+            )
+            stored_rows = await conn.fetch("""
+                SELECT source, source_market_id, event_id, title
+                FROM predictions_gold.cross_venue_markets
+                WHERE (source, source_market_id) IN (SELECT * FROM unnest($1::text[], $2::text[]))
+            """, sources, market_ids)
+        
+        # Price and volume ticks dominate the change log; only a new, edited,
+        # regrouped or (in)eligible title can change the graph
+        current = {(r["source"], r["source_market_id"]): (r["event_id"], r["title"]) for r in current_rows}
+        stored = {(r["source"], r["source_market_id"]): (r["event_id"], r["title"]) for r in stored_rows}
+        dirty = {k for k in current.keys() | stored.keys() if current.get(k) != stored.get(k)}
+        if not dirty:
+            return 0, 0, f"Cross-venue: no title changes in {len(changed)} changed markets"
+        
+        dirty_events = (
+            {(k[0], current[k][0]) for k in dirty if k in current}
+            | {(k[0], stored[k][0]) for k in dirty if k in stored}
+        )
+        markets = await asyncio.to_thread(lambda: [
+            cross_venue.market_features(k[0], k[1], *current[k]) for k in dirty if k in current
+        ])
+        
+        # calculate_similarity matches entities on their prefix, so candidates
+        # are every stored title sharing one (migration 026), as in a rebuild
+        prefixes = {cross_venue.POLYMARKET: set(), cross_venue.KALSHI: set()}
+        for m in markets:
+            prefixes[m.source] |= m.entity_prefixes
+        
+        async with self.db.asyncpg_connection() as conn:
+            candidate_rows = await conn.fetch("""
+                SELECT source, source_market_id, event_id, title, entities, slug_entities
+                FROM predictions_gold.cross_venue_markets
+                WHERE (source = 'kalshi' AND predictions_gold.entity_prefixes(entities) && $1::text[])
+                   OR (source = 'polymarket' AND predictions_gold.entity_prefixes(entities) && $2::text[])
+            """, list(prefixes[cross_venue.POLYMARKET]), list(prefixes[cross_venue.KALSHI]))
+            event_rows = await conn.fetch(
+                _CROSS_VENUE_EVENT_TITLES_QUERY.format(limit=3, scope=_EVENT_GROUPS_SCOPE),
+                [e[1] for e in dirty_events], [e[0] for e in dirty_events], cross_venue.EVENT_TITLE_MARKETS,
+            )
+        
+        events = [
+            e for e in (
+                cross_venue.event_features(r["platform"], r["event_id"], list(r["titles"] or []))
+                for r in event_rows
+            ) if e is not None
+        ]
+        tokens = {cross_venue.POLYMARKET: set(), cross_venue.KALSHI: set()}
+        for e in events:
+            tokens[e.platform] |= e.tokens
+        
+        async with self.db.asyncpg_connection() as conn:
+            candidate_event_rows = await conn.fetch("""
+                SELECT platform, event_id, title, tokens
+                FROM predictions_gold.cross_venue_events
+                WHERE (platform = 'kalshi' AND tokens && $1::text[])
+                   OR (platform = 'polymarket' AND tokens && $2::text[])
+            """, list(tokens[cross_venue.POLYMARKET]), list(tokens[cross_venue.KALSHI]))
+        
+        # Stored rows for dirty keys are stale; the fresh features replace them
+        candidates = markets + [
+            cross_venue.MatchMarket(
+                source=r["source"],
+                market_id=r["source_market_id"],
+                event_id=r["event_id"],
+                title=r["title"],
+                entities=frozenset(r["entities"]),
+                slug_entities=frozenset(r["slug_entities"]),
+            )
+            for r in candidate_rows if (r["source"], r["source_market_id"]) not in dirty
+        ]
+        candidate_events = events + [
+            cross_venue.MatchEvent(
+                platform=r["platform"], event_id=r["event_id"], title=r["title"], tokens=frozenset(r["tokens"]),
+            )
+            for r in candidate_event_rows if (r["platform"], r["event_id"]) not in dirty_events
+        ]
+        market_pairs, event_pairs = await asyncio.to_thread(lambda: (
+            cross_venue.match_markets(markets, candidates),
+            cross_venue.match_events(events, candidate_events),
+        ))
+        
+        def ids(keys, source):
+            return [k[1] for k in keys if k[0] == source]
+        
+        dirty_event_keys = list(dirty_events)
+        async with self.db.asyncpg_connection() as conn:
+            async with conn.transaction():
+                await conn.execute("""
+                    DELETE FROM predictions_gold.cross_venue_markets
+                    WHERE (source, source_market_id) IN (SELECT * FROM unnest($1::text[], $2::text[]))
+                """, [k[0] for k in dirty], [k[1] for k in dirty])
+                await conn.execute("""
+                    DELETE FROM predictions_gold.cross_venue_events
+                    WHERE (platform, event_id) IN (SELECT * FROM unnest($1::text[], $2::text[]))
+                """, [k[0] for k in dirty_event_keys], [k[1] for k in dirty_event_keys])
+                market_status = await conn.execute("""
+                    DELETE FROM predictions_gold.cross_venue_market_pairs
+                    WHERE poly_market_id = ANY($1::text[]) OR kalshi_market_id = ANY($2::text[])
+                """, ids(dirty, cross_venue.POLYMARKET), ids(dirty, cross_venue.KALSHI))
+                event_status = await conn.execute("""
+                    DELETE FROM predictions_gold.cross_venue_event_pairs
+                    WHERE poly_event_id = ANY($1::text[]) OR kalshi_event_id = ANY($2::text[])
+                """, ids(dirty_event_keys, cross_venue.POLYMARKET), ids(dirty_event_keys, cross_venue.KALSHI))
+                await self._copy_cross_venue(conn, markets, market_pairs, events, event_pairs)
+        
+        deleted = int(market_status.split()[-1]) + int(event_status.split()[-1])
+        message = (
+            f"Cross-venue: re-matched {len(dirty)} markets and {len(dirty_events)} events "
+            f"({len(market_pairs)} market pairs, {len(event_pairs)} event pairs)"
+        )
+        return len(market_pairs) + len(event_pairs), deleted, message
+    
+    @staticmethod
+    async def _copy_cross_venue(conn, markets, market_pairs, events, event_pairs) -> None:
+        """COPY match features and pairs into the (already cleared) tables."""
+        records = {
+            "cross_venue_markets": [m.to_record() for m in markets],
+            "cross_venue_market_pairs": [(p, k, s) for (p, k), s in market_pairs.items()],
+            "cross_venue_events": [e.to_record() for e in events],
+            "cross_venue_event_pairs": [(p, k, s) for (p, k), s in event_pairs.items()],
+        }
+        for table, rows in records.items():
+            if rows:
+                await conn.copy_records_to_table(
+                    table,
+                    schema_name="predictions_gold",
+                    records=rows,
+                    columns=_CROSS_VENUE_COLUMNS[table],
+                )
+    
     # ========================================================================
     # CLEANUP OPERATIONS (Daily maintenance)
     # ========================================================================
@@ -3091,7 +4088,9 @@ class GoldLayerAggregator:
             total_inserted=summary.total_inserted,
             total_upserted=summary.total_upserted,
             total_deleted=summary.total_deleted,
-            total_errors=summary.total_errors
+            total_errors=summary.total_errors,
+            queued_s=round(sum(t.queued_seconds for t in summary.node_timings.values()), 3),
+            nodes={name: t.to_dict() for name, t in summary.node_timings.items()},
         )
         for r in summary.results:
             self.logger.debug(
@@ -3111,6 +4110,8 @@ async def run_gold_aggregations(db: DatabaseManager, aggregation_type: str = "al
         results["hot"] = await aggregator.run_hot_aggregations()
     if aggregation_type in ("warm", "all"):
         results["warm"] = await aggregator.run_warm_aggregations()
+    if aggregation_type in ("cross_venue", "all"):
+        results["cross_venue"] = await aggregator.run_cross_venue_matching()
     if aggregation_type in ("cleanup", "all"):
         results["cleanup"] = await aggregator.run_cleanup()
     return results
@@ -0,0 +1,316 @@
+"""
+Time rollups of silver prices and trades (migration 021).
+
+Each tier is rolled from the tier below it, never from raw rows twice:
+
+    predictions_silver.prices -> prices_1m -> prices_1h -> prices_1d
+    predictions_silver.trades -> trades_1m -> trades_1h -> trades_1d
+
+A run re-aggregates, per tier, every bucket from the tier's watermark (or
+the settle window, whichever is earlier) up to now, upserting whole buckets.
+The in-progress bucket is included and simply rewritten on the next run.
+Sources keep changing for a while after the fact: trades are refetched for
+the last TRADES_SINCE_HOURS on every delta load, so that is their settle
+window. Price ticks arrive late by hours instead (Dome's upstream
+timestamps, Limitless's 24 hourly points re-sent every run), so the price
+tiers also re-roll from the oldest snapshot ingested since the last run
+(rollup_watermarks.ingested_through, migrations 027 and 028). The
+watermark (rollup_watermarks.rolled_through) is the start of the settle
+window: buckets before it are final unless a late tick is pending, which
+is what PartitionManager checks before expiring a source partition.
+
+The first run backfills ROLLUP_BACKFILL_DAYS; trades older than the settle
+window and price rows loaded without ingested_at are folded in with
+`RollupManager.rebuild(start)` / `predictions-ingest db rollups --since ...`.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Literal, Optional
+
+import structlog
+
+from predictions_ingest.aggregation.gold_aggregator import AggregationResult, RunSummary
+from predictions_ingest.config import get_settings
+from predictions_ingest.database import DatabaseManager
+
+logger = structlog.get_logger()
+
+Width = Literal["minute", "hour", "day"]
+
+_WIDTHS: dict[str, timedelta] = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+}
+
+# Largest time range aggregated in one statement, per target width
+_CHUNKS: dict[str, timedelta] = {
+    "minute": timedelta(days=1),
+    "hour": timedelta(days=14),
+    "day": timedelta(days=180),
+}
+
+
+@dataclass(frozen=True)
+class RollupLevel:
+    table: str                          # target, in predictions_silver
+    width: Width
+    source: str                         # 'prices' / 'trades' (raw) or the tier below
+    kind: Literal["prices", "trades"]
+
+    @property
+    def raw(self) -> bool:
+        return self.source == self.kind
+
+    @property
+    def ingest_tracked(self) -> bool:
+        # Raw prices carry ingested_at (migration 027)
+        return self.raw and self.kind == "prices"
+
+
+LEVELS: tuple[RollupLevel, ...] = (
+    RollupLevel("prices_1m", "minute", "prices", "prices"),
+    RollupLevel("prices_1h", "hour", "prices_1m", "prices"),
+    RollupLevel("prices_1d", "day", "prices_1h", "prices"),
+    RollupLevel("trades_1m", "minute", "trades", "trades"),
+    RollupLevel("trades_1h", "hour", "trades_1m", "trades"),
+    RollupLevel("trades_1d", "day", "trades_1h", "trades"),
+)
+
+
+def floor_to(ts: datetime, width: Width) -> datetime:
+    ts = ts.astimezone(timezone.utc)
+    if width == "day":
+        return ts.replace(hour=0, minute=0, second=0, microsecond=0)
+    if width == "hour":
+        return ts.replace(minute=0, second=0, microsecond=0)
+    return ts.replace(second=0, microsecond=0)
+
+
+def _bucket(column: str, width: Width) -> str:
+    # UTC buckets regardless of the session time zone
+    return f"date_trunc('{width}', {column} AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'"
+
+
+_PRICE_COLUMNS = "open_price, high_price, low_price, close_price, samples"
+_TRADE_COLUMNS = (
+    "trade_count, buy_count, volume, buy_volume, "
+    "open_price, high_price, low_price, close_price"
+)
+
+
+def rollup_sql(level: RollupLevel) -> str:
+    """INSERT ... SELECT ... ON CONFLICT for level over [$1, $2)."""
+    if level.kind == "prices":
+        columns = _PRICE_COLUMNS
+        if level.raw:
+            ts = "snapshot_at"
+            select = """
+                (array_agg(yes_price ORDER BY snapshot_at))[1],
+                MAX(yes_price),
+                MIN(yes_price),
+                (array_agg(yes_price ORDER BY snapshot_at DESC))[1],
+                COUNT(*)::int"""
+            where = "AND yes_price IS NOT NULL"
+        else:
+            ts = "bucket_start"
+            select = """
+                (array_agg(open_price ORDER BY bucket_start))[1],
+                MAX(high_price),
+                MIN(low_price),
+                (array_agg(close_price ORDER BY bucket_start DESC))[1],
+                SUM(samples)::int"""
+            where = ""
+    else:
+        columns = _TRADE_COLUMNS
+        if level.raw:
+            ts = "traded_at"
+            select = """
+                COUNT(*)::int,
+                (COUNT(*) FILTER (WHERE side = 'buy'))::int,
+                COALESCE(SUM(COALESCE(total_value, price * quantity)), 0),
+                COALESCE(SUM(COALESCE(total_value, price * quantity)) FILTER (WHERE side = 'buy'), 0),
+                (array_agg(price ORDER BY traded_at))[1],
+                MAX(price),
+                MIN(price),
+                (array_agg(price ORDER BY traded_at DESC))[1]"""
+        else:
+            ts = "bucket_start"
+            select = """
+                SUM(trade_count)::int,
+                SUM(buy_count)::int,
+                SUM(volume),
+                SUM(buy_volume),
+                (array_agg(open_price ORDER BY bucket_start))[1],
+                MAX(high_price),
+                MIN(low_price),
+                (array_agg(close_price ORDER BY bucket_start DESC))[1]"""
+        where = ""
+
+    updates = ",\n                ".join(f"{c} = EXCLUDED.{c}" for c in columns.split(", "))
+    return f"""
+        INSERT INTO predictions_silver.{level.table} (
+            source, source_market_id, bucket_start, {columns}, updated_at
+        )
+        SELECT
+            source,
+            source_market_id,
+            {_bucket(ts, level.width)} AS bucket_start,{select},
+            NOW()
+        FROM predictions_silver.{level.source}
+        WHERE {ts} >= $1 AND {ts} < $2 {where}
+        GROUP BY 1, 2, 3
+        ON CONFLICT (source, source_market_id, bucket_start) DO UPDATE SET
+                {updates},
+                updated_at = EXCLUDED.updated_at
+    """
+
+
+class RollupManager:
+    """Maintains the prices/trades rollup tiers."""
+
+    def __init__(self, db: DatabaseManager):
+        self.db = db
+        self.settings = get_settings()
+        self.logger = logger.bind(component="rollups")
+
+    def settle_window(self, level: RollupLevel) -> timedelta:
+        """How far back source rows may still change for this series."""
+        if level.kind == "trades":
+            return timedelta(hours=self.settings.trades_since_hours)
+        return timedelta(minutes=self.settings.rollup_prices_settle_minutes)
+
+    async def _watermark(self, conn, level: RollupLevel) -> Optional[datetime]:
+        return await conn.fetchval(
+            "SELECT rolled_through FROM predictions_silver.rollup_watermarks WHERE rollup = $1",
+            level.table,
+        )
+
+    async def _set_watermark(self, conn, level: RollupLevel, ts: datetime) -> None:
+        await conn.execute(
+            """
+            INSERT INTO predictions_silver.rollup_watermarks (rollup, rolled_through, updated_at)
+            VALUES ($1, $2, NOW())
+            ON CONFLICT (rollup) DO UPDATE SET
+                rolled_through = GREATEST(predictions_silver.rollup_watermarks.rolled_through, EXCLUDED.rolled_through),
+                updated_at = NOW()
+            """,
+            level.table, ts,
+        )
+
+    async def _late_start(self, level: RollupLevel) -> tuple[datetime, Optional[datetime]]:
+        """
+        (cursor for this run, oldest snapshot ingested since the last one)
+        for an ingest-tracked level.
+
+        The last cursor is re-read with the settle window as overlap for
+        inserts that committed late. No cursor yet means nothing is pending
+        beyond the first run's backfill.
+        """
+        async with self.db.asyncpg_connection() as conn:
+            now = await conn.fetchval("SELECT NOW()")
+            cursor = await conn.fetchval(
+                "SELECT ingested_through FROM predictions_silver.rollup_watermarks WHERE rollup = $1",
+                level.table,
+            )
+            if cursor is None:
+                return now, None
+            oldest = await conn.fetchval(
+                f"""
+                SELECT MIN(snapshot_at) FROM predictions_silver.{level.source}
+                WHERE ingested_at > $1 AND yes_price IS NOT NULL
+                """,
+                cursor - self.settle_window(level),
+            )
+            return now, oldest
+
+    async def _set_ingested_through(self, level: RollupLevel, ts: datetime) -> None:
+        try:
+            async with self.db.asyncpg_connection() as conn:
+                await conn.execute(
+                    "UPDATE predictions_silver.rollup_watermarks SET ingested_through = $2 WHERE rollup = $1",
+                    level.table, ts,
+                )
+        except Exception as e:
+            self.logger.warning("Failed to advance ingest cursor", table=level.table, error=str(e))
+
+    async def roll(self, level: RollupLevel, since: Optional[datetime] = None) -> AggregationResult:
+        """Re-aggregate level from its watermark / settle window (or since) to now."""
+        result = AggregationResult(table_name=level.table)
+        started = datetime.now(timezone.utc)
+        now = started
+        final = floor_to(now - self.settle_window(level), level.width)
+
+        try:
+            async with self.db.asyncpg_connection() as conn:
+                watermark = await self._watermark(conn, level)
+                if watermark is None:
+                    watermark = now - timedelta(days=self.settings.rollup_backfill_days)
+                start = floor_to(min(watermark, final, since or final), level.width)
+                sql = rollup_sql(level)
+
+                chunk = _CHUNKS[level.width]
+                lo = start
+                while lo < now:
+                    hi = min(lo + chunk, now + _WIDTHS[level.width])
+                    status = await conn.execute(sql, lo, hi)
+                    result.upserted += int(status.split()[-1])
+                    # Progress survives a failure in a later chunk
+                    await self._set_watermark(conn, level, min(hi, final))
+                    lo = hi
+
+            result.status = "success"
+            result.message = f"{result.upserted} {level.width} buckets from {start:%Y-%m-%d %H:%M}"
+        except Exception as e:
+            result.status = "failed"
+            result.error_count = 1
+            result.message = f"Exception: {str(e)}"
+            self.logger.exception("Rollup failed", table=level.table, error=str(e))
+
+        result.duration_seconds = (datetime.now(timezone.utc) - started).total_seconds()
+        return result
+
+    async def run(self, since: Optional[datetime] = None) -> RunSummary:
+        """
+        Roll every tier, lower tiers first (a failed tier skips those above it).
+
+        Late ticks found on an ingest-tracked tier lower since for every tier
+        of its kind; the ingest cursor only advances once all of them rolled.
+        """
+        summary = RunSummary(run_type="rollups")
+        failed: set[str] = set()
+        starts: dict[str, Optional[datetime]] = {"prices": since, "trades": since}
+        cursors: dict[RollupLevel, datetime] = {}
+        for level in LEVELS:
+            if level.source in failed:
+                failed.add(level.table)
+                continue
+            if level.ingest_tracked:
+                try:
+                    cursors[level], late = await self._late_start(level)
+                except Exception as e:
+                    self.logger.warning("Late tick lookup failed", table=level.table, error=str(e))
+                    late = None
+                if late is not None:
+                    starts[level.kind] = late if starts[level.kind] is None else min(starts[level.kind], late)
+            result = await self.roll(level, starts[level.kind])
+            summary.results.append(result)
+            if result.status != "success":
+                failed.add(level.table)
+        for level, cursor in cursors.items():
+            if not any(other.table in failed for other in LEVELS if other.kind == level.kind):
+                await self._set_ingested_through(level, cursor)
+        summary.completed_at = datetime.now(timezone.utc)
+        self.logger.info(
+            "Rollups completed",
+            run_id=str(summary.run_id),
+            tables_success=summary.success_count,
+            tables_failed=summary.failed_count,
+            total_upserted=summary.total_upserted,
+            duration_s=round(summary.duration_seconds, 3),
+        )
+        return summary
+
+    async def rebuild(self, start: datetime) -> RunSummary:
+        """Fold late source rows from start onwards into every tier."""
+        return await self.run(since=start)
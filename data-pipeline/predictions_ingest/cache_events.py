@@ -0,0 +1,59 @@
+"""
+Backend cache invalidation events.
+
+The backend's shared response-cache tier (backend app/services/shared_cache.py)
+versions its keys by data topic. After new data lands, the pipeline bumps the
+topic's version and announces it, so every API worker drops stale entries at
+once instead of serving them until their TTL runs out:
+
+- "markets"      after a static or delta ingestion run
+- "cross_venue"  after cross-venue matching
+
+Key and channel names must match the backend. Disabled (no-op) when
+CACHE_REDIS_URL is empty or the redis package is not installed.
+"""
+from typing import Optional
+
+import orjson
+import structlog
+
+from predictions_ingest.config import get_settings
+
+logger = structlog.get_logger()
+
+try:
+    import redis.asyncio as redis
+except ImportError:  # optional: pip install predictions-ingest[cache]
+    redis = None
+
+KEY_PREFIX = "cg:cache"
+INVALIDATION_CHANNEL = f"{KEY_PREFIX}:invalidate"
+
+_client = None
+
+
+def version_key(topic: str) -> str:
+    return f"{KEY_PREFIX}:ver:{topic}"
+
+
+def _get_client() -> Optional["redis.Redis"]:
+    global _client
+    url = get_settings().cache_redis_url
+    if not url or redis is None:
+        return None
+    if _client is None:
+        _client = redis.from_url(url, socket_timeout=2.0, socket_connect_timeout=2.0)
+    return _client
+
+
+async def publish_snapshot(*topics: str) -> None:
+    """Bump each topic's cache version and notify backend workers. Never raises."""
+    client = _get_client()
+    if client is None or not topics:
+        return
+    try:
+        versions = {topic: int(await client.incr(version_key(topic))) for topic in topics}
+        await client.publish(INVALIDATION_CHANNEL, orjson.dumps({"topics": versions}))
+        logger.debug("Published cache invalidation", versions=versions)
+    except Exception as e:
+        logger.warning("Cache invalidation publish failed", topics=list(topics), error=str(e))
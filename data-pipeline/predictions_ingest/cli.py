@@ -223,6 +223,46 @@ def refresh_views():
     asyncio.run(_run())
 
 
+@db.command()
+def partitions():
+    """Create upcoming silver partitions and expire old ones."""
+    async def _run():
+        from predictions_ingest.partitions import run_partition_maintenance
+        
+        reports = await run_partition_maintenance()
+        for r in reports:
+            click.echo(
+                f"{r.table:<12} created={len(r.created)} moved_rows={r.moved_rows} "
+                f"expired={len(r.expired)} skipped={len(r.skipped)}"
+            )
+            for note in r.skipped:
+                click.echo(click.style(f"  skipped {note}", fg="yellow"))
+        
+        db = await get_db()
+        await db.close()
+    
+    asyncio.run(_run())
+
+
+@db.command()
+@click.option("--since", type=click.DateTime(), default=None, help="Re-roll buckets from this UTC time (late/backfilled data)")
+def rollups(since):
+    """Update the 1m/1h/1d price and trade rollups."""
+    async def _run():
+        from datetime import timezone
+        from predictions_ingest.aggregation.rollups import RollupManager
+        
+        db = await get_db()
+        summary = await RollupManager(db).run(since=since.replace(tzinfo=timezone.utc) if since else None)
+        for r in summary.results:
+            color = "green" if r.status == "success" else "red"
+            click.echo(click.style(f"{r.table_name:<10} {r.status:<8} {r.message}", fg=color))
+        
+        await db.close()
+    
+    asyncio.run(_run())
+
+
 # =============================================================================
 # STATUS COMMANDS
 # =============================================================================
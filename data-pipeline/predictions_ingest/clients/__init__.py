@@ -2,7 +2,7 @@
 Client package initialization.
 Exports all API clients and client registry.
 """
-from predictions_ingest.clients.base import BaseAPIClient, RateLimiter
+from predictions_ingest.clients.base import BaseAPIClient, RateLimiter, RequestCoalescer
 from predictions_ingest.clients.dome import DomeClient
 from predictions_ingest.clients.limitless import LimitlessClient
 from predictions_ingest.clients.opiniontrade import OpinionTradeClient
@@ -11,6 +11,7 @@ from predictions_ingest.models import DataSource
 __all__ = [
     "BaseAPIClient",
     "RateLimiter",
+    "RequestCoalescer",
     "DomeClient",
     "LimitlessClient",
     "OpinionTradeClient",
@@ -7,14 +7,15 @@ import hashlib
 import json
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Optional
 from uuid import uuid4
 
 import httpx
 import structlog
 from tenacity import (
     retry,
-    retry_if_exception_type,
+    retry_if_exception,
     stop_after_attempt,
     wait_exponential_jitter,
 )
@@ -25,22 +26,122 @@ from predictions_ingest.models import DataSource, IngestionType
 logger = structlog.get_logger()
 
 
+def _is_retryable(exc: BaseException) -> bool:
+    """Transport errors and 429/5xx responses, except 501 (never transient)."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code != 501
+    return isinstance(exc, httpx.TransportError)
+
+
 class RateLimiter:
-    """Token bucket rate limiter with async support."""
+    """
+    Reservation-based token bucket rate limiter with async support.
     
-    def __init__(self, rate: float, capacity: Optional[float] = None):
+    Callers reserve a future slot synchronously (no await while the bucket is
+    being updated) and then sleep outside of any lock, so N concurrent callers
+    are spaced 1/rate apart instead of queueing behind a single sleeper.
+    
+    The bucket is allowed to go into debt: every reservation subtracts its
+    tokens immediately and the resulting deficit determines how long that
+    caller waits. The rate adapts to server feedback - halved on 429s (and
+    paused for Retry-After), raised by 10% after a streak of successes.
+    
+    Limiters that draw on the same upstream quota can be shared between
+    clients via RateLimiter.shared(budget_name, rate).
+    """
+    
+    _budgets: dict[str, "RateLimiter"] = {}
+    
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        min_rate: Optional[float] = None,
+    ):
         """
         Initialize rate limiter.
         
         Args:
-            rate: Tokens per second
+            rate: Tokens per second (also the ceiling for adaptive increases)
             capacity: Maximum burst capacity (default: rate * 2)
+            min_rate: Floor for adaptive decreases (default: 10% of rate)
         """
         self.rate = rate
+        self.max_rate = rate
+        self.min_rate = min_rate or max(rate * 0.1, 0.5)
         self.capacity = capacity or rate * 2
         self.tokens = self.capacity
+        # May lie in the future while paused after a 429 (no refill until then)
         self.last_update = time.monotonic()
-        self._lock = asyncio.Lock()
+        
+        self._success_count = 0
+        self._rate_increase_threshold = 100  # Successes before increasing
+        
+        # Metrics
+        self.reservations = 0
+        self.total_wait_seconds = 0.0
+        self.rate_limited_count = 0
+    
+    @classmethod
+    def shared(
+        cls,
+        budget: str,
+        rate: float,
+        capacity: Optional[float] = None,
+    ) -> "RateLimiter":
+        """
+        Get the process-wide limiter for a named budget, creating it on first use.
+        
+        Clients that hit the same upstream quota (e.g. Polymarket and Kalshi
+        via Dome) should pass the same budget name so their requests are
+        counted against one bucket. The first caller sets the budget's rate
+        and capacity; a later caller asking for different limits still gets
+        the existing bucket (splitting it would overrun the quota), and the
+        mismatch is logged.
+        """
+        limiter = cls._budgets.get(budget)
+        if limiter is None:
+            limiter = cls(rate, capacity)
+            cls._budgets[budget] = limiter
+        elif rate != limiter.max_rate or (capacity or rate * 2) != limiter.capacity:
+            logger.warning(
+                "Shared rate limit budget already configured with other limits",
+                budget=budget,
+                requested_rate=rate,
+                requested_capacity=capacity or rate * 2,
+                rate=limiter.max_rate,
+                capacity=limiter.capacity,
+            )
+        return limiter
+    
+    @classmethod
+    def reset_shared(cls) -> None:
+        """Drop all shared budgets (used by benchmarks and CLI re-runs)."""
+        cls._budgets.clear()
+    
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.last_update
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.last_update = now
+    
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Reserve tokens and return how long the caller must wait before using them.
+        
+        Never blocks - the returned delay is the caller's slot in the schedule.
+        """
+        now = time.monotonic()
+        self._refill(now)
+        self.tokens -= tokens
+        
+        wait_time = max(0.0, self.last_update - now)
+        if self.tokens < 0:
+            wait_time += -self.tokens / self.rate
+        
+        self.reservations += 1
+        self.total_wait_seconds += wait_time
+        return wait_time
     
     async def acquire(self, tokens: float = 1.0) -> float:
         """
@@ -49,21 +150,208 @@ class RateLimiter:
         Returns:
             Wait time in seconds (0 if no wait needed)
         """
-        async with self._lock:
-            now = time.monotonic()
-            elapsed = now - self.last_update
-            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
-            self.last_update = now
-            
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                return 0.0
-            
-            wait_time = (tokens - self.tokens) / self.rate
+        wait_time = self.reserve(tokens)
+        if wait_time > 0:
             await asyncio.sleep(wait_time)
-            self.tokens = 0
-            self.last_update = time.monotonic()
-            return wait_time
+        return wait_time
+    
+    def record_429(self, retry_after: Optional[float] = None) -> None:
+        """Halve the rate and pause refills for retry_after seconds."""
+        now = time.monotonic()
+        self._refill(now)
+        self.rate_limited_count += 1
+        self._success_count = 0
+        
+        # 429s from requests already in flight when we backed off are the
+        # same overload signal - don't compound the decrease
+        if now < self.last_update:
+            return
+        
+        new_rate = max(self.min_rate, self.rate * 0.5)
+        if new_rate != self.rate:
+            logger.info(
+                "Rate limit adjusted",
+                old_rps=round(self.rate, 2),
+                new_rps=round(new_rate, 2),
+                reason="429_response",
+            )
+            self.rate = new_rate
+        
+        # Empty the bucket and start refilling only once the server reopens
+        self.tokens = min(self.tokens, 0.0)
+        if retry_after:
+            self.last_update = max(self.last_update, now + retry_after)
+    
+    def record_success(self) -> None:
+        """Gradually restore the configured rate after a streak of successes."""
+        if self.rate >= self.max_rate:
+            return
+        
+        self._success_count += 1
+        # Roughly one second of clean traffic at the current rate
+        if self._success_count >= min(self._rate_increase_threshold, self.rate):
+            new_rate = min(self.max_rate, self.rate * 1.1)
+            logger.info(
+                "Rate limit adjusted",
+                old_rps=round(self.rate, 2),
+                new_rps=round(new_rate, 2),
+                reason="success_streak",
+            )
+            self.rate = new_rate
+            self._success_count = 0
+    
+    def get_metrics(self) -> dict[str, Any]:
+        """Get limiter metrics."""
+        return {
+            "rate_rps": round(self.rate, 2),
+            "max_rate_rps": self.max_rate,
+            "reservations": self.reservations,
+            "avg_wait_ms": round(
+                self.total_wait_seconds / max(self.reservations, 1) * 1000, 2
+            ),
+            "rate_limited": self.rate_limited_count,
+        }
+
+
+def parse_retry_after(value: Optional[str], default: float = 5.0) -> float:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
+
+
+class RequestCoalescer:
+    """
+    Coalesces concurrent lookups by key into shared in-flight requests.
+    
+    Lookups for the same key while a request is pending or in flight await
+    the same future instead of issuing another request. Distinct keys that
+    arrive within `window_seconds` of each other are packed into one
+    `fetch_many` call (up to `max_batch` keys); without `fetch_many`, each
+    key is fetched with `fetch_one`.
+    
+    fetch_many must return a mapping of key -> value; keys missing from the
+    mapping resolve to None. If fetch_many raises, the batch falls back to
+    per-key fetch_one calls so a bad batch never fails every caller.
+    """
+    
+    def __init__(
+        self,
+        fetch_one: Callable[[str], Awaitable[Any]],
+        fetch_many: Optional[Callable[[list[str]], Awaitable[dict[str, Any]]]] = None,
+        window_seconds: float = 0.005,
+        max_batch: int = 100,
+    ):
+        self._fetch_one = fetch_one
+        self._fetch_many = fetch_many
+        self._window = window_seconds
+        self._max_batch = max_batch
+        
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._pending: list[str] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+        
+        # Metrics
+        self.lookups = 0
+        self.coalesced = 0
+        self.requests = 0
+    
+    async def get(self, key: str) -> Any:
+        """Look up a key, sharing any pending or in-flight request for it."""
+        self.lookups += 1
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._inflight[key] = future
+        self._pending.append(key)
+        
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._window, self._flush)
+        
+        return await asyncio.shield(future)
+    
+    @property
+    def batching_enabled(self) -> bool:
+        return self._fetch_many is not None
+    
+    def disable_batching(self) -> None:
+        """Stop packing keys into fetch_many (e.g. the batch endpoint is unsupported)."""
+        self._fetch_many = None
+    
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        
+        keys, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._run(keys))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _run(self, keys: list[str]) -> None:
+        try:
+            results: dict[str, Any] = {}
+            if self._fetch_many is not None and len(keys) > 1:
+                try:
+                    self.requests += 1
+                    results = await self._fetch_many(keys)
+                except Exception as e:
+                    logger.debug("Batch lookup failed, falling back", keys=len(keys), error=str(e))
+                    results = await self._run_individually(keys)
+            else:
+                results = await self._run_individually(keys)
+            
+            for key in keys:
+                future = self._inflight.get(key)
+                if future is None or future.done():
+                    continue
+                value = results.get(key)
+                if isinstance(value, BaseException):
+                    future.set_exception(value)
+                else:
+                    future.set_result(value)
+        except BaseException as e:
+            for key in keys:
+                future = self._inflight.get(key)
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            raise
+        finally:
+            for key in keys:
+                self._inflight.pop(key, None)
+    
+    async def _run_individually(self, keys: list[str]) -> dict[str, Any]:
+        self.requests += len(keys)
+        values = await asyncio.gather(
+            *(self._fetch_one(key) for key in keys),
+            return_exceptions=True,
+        )
+        return dict(zip(keys, values))
+    
+    def get_metrics(self) -> dict[str, Any]:
+        """Get coalescer metrics."""
+        return {
+            "lookups": self.lookups,
+            "coalesced": self.coalesced,
+            "upstream_requests": self.requests,
+        }
 
 
 class BaseAPIClient(ABC):
@@ -76,6 +364,9 @@ class BaseAPIClient(ABC):
     SOURCE: DataSource = None
     BASE_URL: str = ""
     
+    # Clients with the same budget name share one rate limiter (None = private)
+    RATE_LIMIT_BUDGET: Optional[str] = None
+    
     def __init__(
         self,
         rate_limit_rps: Optional[float] = None,
@@ -87,7 +378,11 @@ class BaseAPIClient(ABC):
         
         # Rate limiting
         rps = rate_limit_rps or self._get_default_rate_limit()
-        self._rate_limiter = RateLimiter(rps)
+        burst = self._get_default_burst()
+        if self.RATE_LIMIT_BUDGET:
+            self._rate_limiter = RateLimiter.shared(self.RATE_LIMIT_BUDGET, rps, burst)
+        else:
+            self._rate_limiter = RateLimiter(rps, burst)
         
         # Timeout
         self._timeout = timeout_seconds or self._settings.api_timeout_seconds
@@ -106,6 +401,10 @@ class BaseAPIClient(ABC):
         """Get default rate limit for this source."""
         pass
     
+    def _get_default_burst(self) -> Optional[float]:
+        """Get burst capacity for this source (None = 2x the rate limit)."""
+        return None
+    
     @abstractmethod
     def _get_headers(self) -> dict[str, str]:
         """Get headers for requests (including auth)."""
@@ -208,17 +507,25 @@ class BaseAPIClient(ABC):
                 wait_time=round(wait_time, 3),
             )
             
-            # Handle rate limiting response
+            # Handle rate limiting response: slow the shared budget down and
+            # let the retry's acquire() wait out Retry-After
             if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", 5))
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
                 log.warning("Rate limited", retry_after=retry_after)
-                await asyncio.sleep(retry_after)
+                self._rate_limiter.record_429(retry_after)
                 raise httpx.HTTPStatusError(
                     "Rate limited",
                     request=response.request,
                     response=response,
                 )
             
+            if response.status_code == 503 and "Retry-After" in response.headers:
+                self._rate_limiter.record_429(
+                    parse_retry_after(response.headers.get("Retry-After"))
+                )
+            elif response.status_code < 400:
+                self._rate_limiter.record_success()
+            
             # Don't retry client errors (except 429)
             if 400 <= response.status_code < 500:
                 log.warning(
@@ -265,7 +572,7 @@ class BaseAPIClient(ABC):
         return response.json()
     
     @retry(
-        retry=retry_if_exception_type((httpx.HTTPStatusError, httpx.TransportError)),
+        retry=retry_if_exception(_is_retryable),
         stop=stop_after_attempt(5),
         wait=wait_exponential_jitter(initial=1, max=60, jitter=5),
         reraise=True,
@@ -367,4 +674,5 @@ class BaseAPIClient(ABC):
             "error_rate": self._error_count / max(self._request_count, 1),
             "bytes_transferred": self._bytes_transferred,
             "avg_latency_ms": round(avg_latency, 2),
+            "rate_limiter": self._rate_limiter.get_metrics(),
         }
@@ -4,13 +4,15 @@ https://docs.domeapi.com
 
 Dome provides a unified API for multiple prediction market platforms.
 """
+import asyncio
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
+import httpx
 import structlog
 
-from predictions_ingest.clients.base import BaseAPIClient
+from predictions_ingest.clients.base import BaseAPIClient, RequestCoalescer
 from predictions_ingest.config import get_settings
 from predictions_ingest.models import (
     Category,
@@ -43,6 +45,9 @@ class DomeClient(BaseAPIClient):
     
     BASE_URL = "https://api.domeapi.io/v1"
     
+    # Polymarket and Kalshi clients draw on the same Dome API key quota
+    RATE_LIMIT_BUDGET = "dome"
+    
     def __init__(
         self,
         source: DataSource,
@@ -66,6 +71,14 @@ class DomeClient(BaseAPIClient):
             raise ValueError("Dome API key is required. Set DOME_API_KEY env var.")
         
         super().__init__(**kwargs)
+        
+        settings = get_settings()
+        self._price_coalescer = RequestCoalescer(
+            fetch_one=self.fetch_market_price,
+            fetch_many=self.fetch_market_prices if settings.dome_price_batch_enabled else None,
+            window_seconds=settings.dome_price_coalesce_window_ms / 1000,
+            max_batch=settings.dome_price_batch_size,
+        )
     
     @property
     def supports_trades(self) -> bool:
@@ -75,6 +88,9 @@ class DomeClient(BaseAPIClient):
     def _get_default_rate_limit(self) -> float:
         return get_settings().dome_rate_limit_rps
     
+    def _get_default_burst(self) -> Optional[float]:
+        return get_settings().dome_rate_limit_burst
+    
     def _get_headers(self) -> dict[str, str]:
         return {
             "X-API-Key": self._api_key,
@@ -159,34 +175,23 @@ class DomeClient(BaseAPIClient):
         
         return markets, next_key
     
-    async def fetch_all_markets(
+    async def iter_market_pages(
         self,
         active_only: bool = False,
         max_records: int = 0,
         min_volume: Optional[int] = None,
-    ) -> list[dict[str, Any]]:
+    ) -> AsyncIterator[list[dict[str, Any]]]:
         """
-        Fetch all markets using cursor-based pagination.
-        
-        IMPORTANT: Dome API no longer supports offset pagination beyond 10,000 records.
-        All sources must use cursor-based pagination with pagination_key.
+        Yield market pages as they arrive using cursor-based pagination.
         
-        When active_only=True, uses status=open parameter for server-side filtering.
-        This excludes closed markets and returns only open markets.
-        
-        When min_volume is set, API returns markets sorted by volume (descending).
-        Combined with max_records, this fetches the TOP N markets by volume.
-        
-        Args:
-            active_only: Filter to active markets only
-            max_records: Stop after this many records (0=unlimited). When combined with 
-                        min_volume, gets the TOP N highest volume markets.
-            min_volume: Minimum 24h volume in USD (server-side filtering)
+        Same filters and termination rules as fetch_all_markets, but only one
+        page is held at a time so callers can process while the next page is
+        fetched.
         """
-        all_markets = []
         limit = 100
         pagination_key = None
         page_num = 0
+        total = 0
         
         while True:
             # Always use cursor-based pagination (required for Polymarket after 10k records)
@@ -200,31 +205,61 @@ class DomeClient(BaseAPIClient):
             if not markets:
                 break
             
-            # Server-side filtering with closed=false parameter
-            all_markets.extend(markets)
-            
+            page_num += 1
+            total += len(markets)
             logger.info(
                 "Fetched markets batch",
                 source=self.SOURCE.value,
-                page=page_num + 1,
+                page=page_num,
                 batch_size=len(markets),
-                total=len(all_markets),
+                total=total,
                 pagination_type="cursor",
             )
             
-            page_num += 1
+            yield markets
             
             # Check termination conditions
             if len(markets) < limit:
                 break
-            if max_records > 0 and len(all_markets) >= max_records:
+            if max_records > 0 and total >= max_records:
                 break
             
             # Update pagination state - move to next cursor
             if not next_key:
                 break
             pagination_key = next_key
+    
+    async def fetch_all_markets(
+        self,
+        active_only: bool = False,
+        max_records: int = 0,
+        min_volume: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch all markets using cursor-based pagination.
+        
+        IMPORTANT: Dome API no longer supports offset pagination beyond 10,000 records.
+        All sources must use cursor-based pagination with pagination_key.
+        
+        When active_only=True, uses status=open parameter for server-side filtering.
+        This excludes closed markets and returns only open markets.
+        
+        When min_volume is set, API returns markets sorted by volume (descending).
+        Combined with max_records, this fetches the TOP N markets by volume.
         
+        Args:
+            active_only: Filter to active markets only
+            max_records: Stop after this many records (0=unlimited). When combined with 
+                        min_volume, gets the TOP N highest volume markets.
+            min_volume: Minimum 24h volume in USD (server-side filtering)
+        """
+        all_markets = []
+        async for markets in self.iter_market_pages(
+            active_only=active_only,
+            max_records=max_records,
+            min_volume=min_volume,
+        ):
+            all_markets.extend(markets)
         return all_markets
     
     def normalize_market(self, raw: dict[str, Any]) -> Market:
@@ -891,25 +926,99 @@ class DomeClient(BaseAPIClient):
         )
         return response
     
+    async def fetch_market_prices(
+        self,
+        market_tickers: list[str],
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Fetch current prices for several markets in one request.
+        
+        Batch contract: GET /{prefix}/market-prices?ids=a,b,c returning
+        {"prices": [{"id": ..., "price": ...}, ...]} (or a dict keyed by id).
+        Each item has the same shape as a single /market-price/{id} response.
+        
+        Returns:
+            Mapping of ticker/token ID -> raw price response (missing IDs omitted)
+        """
+        try:
+            response = await self._request_with_retry(
+                "GET",
+                f"/{self._prefix}/market-prices",
+                params={"ids": ",".join(market_tickers)},
+            )
+        except httpx.HTTPStatusError as e:
+            # 5xx responses raise instead of returning; 501 is not retried
+            if e.response.status_code != 501:
+                raise
+            response = e.response
+        if response.status_code in (404, 405, 501):
+            # Endpoint not available on this tier - stop packing lookups
+            logger.warning(
+                "Dome batch price endpoint unavailable, using per-market requests",
+                source=self.SOURCE.value,
+                status=response.status_code,
+            )
+            self._price_coalescer.disable_batching()
+            raise LookupError("Batch price endpoint unavailable")
+        
+        payload = response.json()
+        items = payload.get("prices", payload) if isinstance(payload, dict) else payload
+        if isinstance(items, dict):
+            return {str(k): v for k, v in items.items() if isinstance(v, dict)}
+        
+        prices = {}
+        for item in items or []:
+            if not isinstance(item, dict):
+                continue
+            key = item.get("id") or item.get("token_id") or item.get("market_ticker")
+            if key is not None:
+                prices[str(key)] = item
+        return prices
+    
+    async def get_market_price(self, market_ticker: str) -> Optional[dict[str, Any]]:
+        """
+        Coalesced price lookup.
+        
+        Concurrent lookups for the same ticker share one in-flight request, and
+        (when DOME_PRICE_BATCH_ENABLED) lookups arriving within a few ms are
+        packed into one multi-ID request.
+        """
+        return await self._price_coalescer.get(market_ticker)
+    
+    @property
+    def price_batch_size(self) -> int:
+        """Number of price lookups served by one upstream request."""
+        if not self._price_coalescer.batching_enabled:
+            return 1
+        return get_settings().dome_price_batch_size
+    
     async def fetch_market_prices_batch(
         self,
         market_ids: list[str],
     ) -> list[dict[str, Any]]:
-        """Fetch prices for multiple markets."""
-        # Dome may support batch endpoint, otherwise fetch individually
+        """Fetch prices for multiple markets via the coalescing layer."""
+        responses = await asyncio.gather(
+            *(self.get_market_price(market_id) for market_id in market_ids),
+            return_exceptions=True,
+        )
         results = []
-        for market_id in market_ids:
-            try:
-                price = await self.fetch_market_price(market_id)
-                results.append(price)
-            except Exception as e:
+        for market_id, price in zip(market_ids, responses):
+            if isinstance(price, Exception):
                 logger.warning(
                     "Failed to fetch price",
                     market_id=market_id,
-                    error=str(e)
+                    error=str(price)
                 )
+            elif price:
+                results.append(price)
         return results
     
+    def get_metrics(self) -> dict[str, Any]:
+        """Get client metrics, including price coalescing."""
+        metrics = super().get_metrics()
+        metrics["price_coalescer"] = self._price_coalescer.get_metrics()
+        return metrics
+    
     def normalize_price(self, raw: dict[str, Any], market_id: str) -> PriceSnapshot:
         """Transform raw price data to PriceSnapshot model."""
         # Kalshi market-price endpoint returns {"yes": {"price": 0.94}, "no": {"price": 0.06}}
@@ -80,6 +80,28 @@ class Settings(BaseSettings):
         le=300.0,
         description="Dome API rate limit (requests per second)"
     )
+    dome_rate_limit_burst: float = Field(
+        default=20.0,  # rate + burst must stay under the 100 QPS tier limit
+        ge=1.0,
+        le=300.0,
+        description="Dome API burst capacity, shared by Polymarket and Kalshi clients"
+    )
+    dome_price_batch_enabled: bool = Field(
+        default=False,
+        description="Pack concurrent price lookups into multi-ID /market-prices requests"
+    )
+    dome_price_batch_size: int = Field(
+        default=100,
+        ge=1,
+        le=500,
+        description="Maximum market IDs per multi-ID price request"
+    )
+    dome_price_coalesce_window_ms: float = Field(
+        default=5.0,
+        ge=0.0,
+        le=1000.0,
+        description="How long price lookups wait to be coalesced with others (ms)"
+    )
     
     # ==========================================================================
     # LIMITLESS API CONFIGURATION
@@ -170,8 +192,14 @@ class Settings(BaseSettings):
     limitless_max_markets: int = Field(default=100, ge=0, description="Maximum markets to fetch from Limitless (0=unlimited)")
     opiniontrade_max_markets: int = Field(default=100, ge=0, description="Maximum markets to fetch from OpinionTrade (0=unlimited)")
     
+    # Market stream pipeline: pages buffered between stages (fetch/bronze/silver/prices)
+    stream_queue_depth: int = Field(default=4, ge=1, le=50, description="Market pages buffered per pipeline stage")
+    
     # Price fetching concurrency (number of parallel API requests)
     price_fetch_batch_size: int = Field(default=75, ge=10, le=100, description="Number of concurrent price API requests")
+    price_history_enabled: bool = Field(default=True, description="Append fetched prices to predictions_silver.prices on every run")
+    price_update_epsilon: float = Field(default=0.0001, ge=0.0, le=0.1, description="Skip market price write-back for moves within this (0=write any change)")
+    price_notify_enabled: bool = Field(default=True, description="NOTIFY changed prices to the backend price stream (predictions_ingest.price_events)")
     
     # Orderbook fetching limits (to reduce API usage)
     # NOTE: Set to 0 by default - Polymarket orderbook API requires token_id not condition_id
@@ -193,6 +221,65 @@ class Settings(BaseSettings):
     hot_views_refresh_minutes: int = Field(default=5)
     daily_views_refresh_cron: str = Field(default="0 0 * * *")
     
+    # Bronze layer: recently written (source, body_hash) keys remembered in process
+    # so known duplicates never reach Postgres (~150 bytes per entry)
+    bronze_seen_hash_cache_size: int = Field(default=200_000, ge=0, le=5_000_000, description="Bronze dedup hash cache entries (0=disabled)")
+    
+    # Bronze payload storage: 'jsonb' keeps bodies inline in api_responses,
+    # 'compressed' stores them once per hash in predictions_bronze.payloads
+    # (migration 017; zstd when the zstandard package is installed, else zlib)
+    bronze_storage_mode: Literal["jsonb", "compressed"] = Field(default="jsonb", description="Bronze response body storage")
+    bronze_compression_level: int = Field(default=3, ge=1, le=19, description="Bronze payload compression level (zlib caps at 9)")
+    
+    # ==========================================================================
+    # GOLD LAYER AGGREGATION
+    # ==========================================================================
+    
+    # Incremental mode consumes predictions_gold.market_change_log (migration 018)
+    # and recomputes only gold rows for touched markets; a full rebuild still runs
+    # every N cycles (and whenever churn exceeds the key limit) to correct drift
+    gold_incremental_enabled: bool = Field(default=False, description="Change-log driven gold aggregation")
+    gold_incremental_max_keys: int = Field(default=50_000, ge=1, le=1_000_000, description="Changed markets above which a cycle falls back to a full rebuild (a price write-back alone touches ~16k)")
+    gold_full_rebuild_every: int = Field(default=12, ge=1, le=1000, description="Full rebuild every N incremental cycles per consumer")
+    
+    # Aggregation groups run as dependency graphs; the connection budget is
+    # shared by all groups so gold work leaves pool headroom for ingestion
+    gold_max_connections: int = Field(default=4, ge=1, le=10, description="Pool connections gold aggregations may hold at once")
+    gold_group_concurrency: int = Field(default=3, ge=1, le=10, description="Concurrent aggregation nodes per group")
+
+    # Hourly price candles are rebuilt for ticks ingested since the newest
+    # folded one (migrations 023, 027), whatever their snapshot time; the
+    # grace re-reads ticks whose insert committed late
+    gold_price_candle_grace_seconds: int = Field(default=120, ge=0, le=3600, description="Overlap re-read before the candle watermark")
+
+    # ==========================================================================
+    # SILVER PARTITIONS & ROLLUPS (migration 021)
+    # ==========================================================================
+    
+    # Partitions of silver trades/prices/orderbooks and the 1m/1h rollup tiers
+    # are created PARTITION_PREMAKE periods ahead; whole partitions older than
+    # the retention are detached and dropped (0 = keep forever)
+    partition_premake: int = Field(default=2, ge=1, le=24, description="Future partitions kept ready per table")
+    partition_expire_mode: Literal["drop", "detach"] = Field(default="drop", description="Drop expired partitions or keep them detached")
+    partition_lock_timeout_ms: int = Field(default=5000, ge=100, le=60000, description="Lock wait before a partition change is retried next run")
+    silver_trades_retention_days: int = Field(default=0, ge=0, description="Raw trades retention (0=keep)")
+    silver_prices_retention_days: int = Field(default=0, ge=0, description="Raw price snapshots retention (0=keep)")
+    silver_orderbooks_retention_days: int = Field(default=0, ge=0, description="Orderbook snapshots retention (0=keep)")
+    rollup_1m_retention_days: int = Field(default=14, ge=0, description="1-minute rollup retention (0=keep)")
+    rollup_1h_retention_days: int = Field(default=400, ge=0, description="1-hour rollup retention (0=keep)")
+    
+    # Rollups re-aggregate recent buckets every run; trades settle within
+    # TRADES_SINCE_HOURS (refetched each delta load). Prices are also re-rolled
+    # from the oldest tick ingested since the last run (migrations 027, 028),
+    # so their settle window only covers inserts that committed late
+    rollup_interval_minutes: int = Field(default=5, ge=1, le=60, description="Rollup job interval")
+    rollup_prices_settle_minutes: int = Field(default=15, ge=1, le=1440, description="Price buckets re-rolled every run")
+    rollup_backfill_days: int = Field(default=30, ge=1, le=3650, description="History rolled up on the first run")
+    
+    # Backend shared-cache invalidation (predictions_ingest.cache_events): the
+    # Redis the API workers use for SHARED_CACHE_URL; empty disables publishing
+    cache_redis_url: str = Field(default="", description="Redis URL for backend cache invalidation events")
+    
     # ==========================================================================
     # FEATURE FLAGS
     # ==========================================================================
@@ -4,26 +4,112 @@ Stores raw JSON responses for full data lineage and replay capability.
 """
 import hashlib
 import json
+import zlib
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
 import structlog
 
+from predictions_ingest.config import get_settings
 from predictions_ingest.database import get_db
 from predictions_ingest.models import DataSource
 
 logger = structlog.get_logger()
 
+try:
+    import zstandard
+except ImportError:  # optional: pip install predictions-ingest[compression]
+    zstandard = None
+
+
+# =============================================================================
+# PAYLOAD CODEC (BRONZE_STORAGE_MODE=compressed)
+# =============================================================================
+
+def compress_payload(raw: bytes, level: int) -> tuple[str, bytes]:
+    """Compress a JSON body. Returns (codec, blob); zstd if available, else zlib."""
+    if zstandard is not None:
+        return "zstd", zstandard.ZstdCompressor(level=level).compress(raw)
+    return "zlib", zlib.compress(raw, min(level, 9))
+
+
+def decompress_payload(codec: str, blob: bytes) -> bytes:
+    """Inverse of compress_payload."""
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("Bronze payload is zstd-compressed; install the zstandard package")
+        return zstandard.ZstdDecompressor().decompress(blob)
+    if codec == "zlib":
+        return zlib.decompress(blob)
+    raise ValueError(f"Unknown bronze payload codec: {codec}")
+
+
+def _decode_body(row) -> Any:
+    """Body of an api_responses row joined to predictions_bronze.payloads."""
+    if row["body_json"] is not None:
+        body = row["body_json"]
+        return json.loads(body) if isinstance(body, str) else body
+    if row["payload"] is None:
+        # Row references a payload that has not been written (or was pruned)
+        return None
+    return json.loads(decompress_payload(row["codec"], row["payload"]))
+
+
+class RecentHashes:
+    """
+    Bounded, LRU-evicting set of (source, body_hash) keys known to be in bronze.
+    
+    Exact membership (no false positives, unlike a Bloom filter), so a hit
+    can safely skip the database. Evicted keys simply fall back to the
+    ON CONFLICT check in Postgres.
+    """
+    
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._keys: OrderedDict[tuple[str, str], None] = OrderedDict()
+    
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        if key in self._keys:
+            self._keys.move_to_end(key)
+            return True
+        return False
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def add(self, key: tuple[str, str]) -> None:
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+        while len(self._keys) > self.max_size:
+            self._keys.popitem(last=False)
+
+
+_recent_hashes: Optional[RecentHashes] = None
+
+
+def get_recent_hashes() -> RecentHashes:
+    """Process-wide hash cache, shared by every BronzeWriter (ingesters are per-run)."""
+    global _recent_hashes
+    if _recent_hashes is None:
+        _recent_hashes = RecentHashes(get_settings().bronze_seen_hash_cache_size)
+    return _recent_hashes
+
 
 class BronzeWriter:
     """
     Writes raw API responses to bronze layer tables.
-    Handles deduplication via content hashing.
+    Handles deduplication via content hashing: known hashes are dropped in
+    process, the rest by ON CONFLICT (body_hash, source).
     """
     
     def __init__(self):
         self._pending_records: list[tuple] = []
         self._batch_size = 1000
+        self._recent_hashes = get_recent_hashes()
+        settings = get_settings()
+        self._compressed = settings.bronze_storage_mode == "compressed"
+        self._compression_level = settings.bronze_compression_level
     
     @staticmethod
     def compute_body_hash(body: dict[str, Any]) -> str:
@@ -51,34 +137,54 @@ class BronzeWriter:
         """
         import uuid as uuid_module
         body_hash = self.compute_body_hash(body)
+        if (source.value, body_hash) in self._recent_hashes:
+            logger.debug(
+                "Duplicate record skipped (cached hash)",
+                source=source.value,
+                endpoint=endpoint,
+                body_hash=body_hash[:16],
+            )
+            return None
         body_str = json.dumps(body)
+        raw = body_str.encode()
         
         db = await get_db()
         
         query = """
             INSERT INTO predictions_bronze.api_responses (
                 id, source, endpoint_name, url_path, body_json, body_hash,
-                query_params, http_status, ingestion_type, run_id, fetched_at
+                query_params, http_status, ingestion_type, run_id,
+                response_size_bytes, fetched_at
             )
-            VALUES ($1, $2, $3, $4, $5::jsonb, $6, $7::jsonb, $8, $9, $10, NOW())
+            VALUES ($1, $2, $3, $4, $5::jsonb, $6, $7::jsonb, $8, $9, $10, $11, NOW())
             ON CONFLICT (body_hash, source) DO NOTHING
             RETURNING id
         """
         
-        async with db.asyncpg_connection() as conn:
+        async with db.asyncpg_connection() as conn, conn.transaction():
+            if self._compressed:
+                codec, blob = compress_payload(raw, self._compression_level)
+                await conn.execute("""
+                    INSERT INTO predictions_bronze.payloads (body_hash, codec, payload, raw_size_bytes)
+                    VALUES ($1, $2, $3, $4)
+                    ON CONFLICT (body_hash) DO NOTHING
+                """, body_hash, codec, blob, len(raw))
+            
             result = await conn.fetchval(
                 query,
                 uuid_module.uuid4(),
                 source.value,
                 endpoint,
                 endpoint,  # url_path = endpoint
-                body_str,
+                None if self._compressed else body_str,
                 body_hash,
                 json.dumps(request_params) if request_params else None,
                 response_status,
                 ingestion_type,
                 uuid_module.UUID(run_id) if run_id else None,
+                len(raw),
             )
+            self._recent_hashes.add((source.value, body_hash))
             
             if result:
                 logger.debug(
@@ -130,6 +236,10 @@ class BronzeWriter:
         """
         Flush pending records to database.
         
+        Records whose hash is already known (in this batch or from earlier
+        flushes) never reach Postgres. Inserted/duplicate counts come from the
+        INSERT command tag, so flush cost does not grow with table size.
+        
         Returns:
             Tuple of (inserted_count, duplicate_count)
         """
@@ -139,6 +249,35 @@ class BronzeWriter:
         records = self._pending_records.copy()
         self._pending_records.clear()
         
+        # Pre-filter known duplicates in process (source, body_hash)
+        fresh = []
+        batch_keys: set[tuple[str, str]] = set()
+        for record in records:
+            key = (record[1], record[5])
+            if key in batch_keys or key in self._recent_hashes:
+                continue
+            batch_keys.add(key)
+            fresh.append(record)
+        
+        if not fresh:
+            logger.debug("Bronze batch fully deduplicated in process", total=len(records))
+            return 0, len(records)
+        
+        # Compressed mode: one blob per distinct hash, rows keep only the reference
+        payloads: dict[str, tuple] = {}
+        rows = []
+        raw_bytes = 0
+        for record in fresh:
+            raw = record[4].encode()
+            raw_bytes += len(raw)
+            if self._compressed:
+                if record[5] not in payloads:
+                    codec, blob = compress_payload(raw, self._compression_level)
+                    payloads[record[5]] = (record[5], codec, blob, len(raw))
+                rows.append((*record[:4], None, *record[5:], len(raw)))
+            else:
+                rows.append((*record, len(raw)))
+        
         db = await get_db()
         
         async with db.asyncpg_connection() as conn:
@@ -160,60 +299,79 @@ class BronzeWriter:
                             http_status INTEGER,
                             ingestion_type TEXT,
                             run_id TEXT,
-                            fetched_at TIMESTAMPTZ
-                        )
+                            fetched_at TIMESTAMPTZ,
+                            response_size_bytes INTEGER
+                        ) ON COMMIT DROP
                     """)
                     
+                    if payloads:
+                        await conn.execute(f"""
+                            CREATE TEMP TABLE {temp_table}_payloads (
+                                body_hash TEXT,
+                                codec TEXT,
+                                payload BYTEA,
+                                raw_size_bytes INTEGER
+                            ) ON COMMIT DROP
+                        """)
+                        await conn.copy_records_to_table(
+                            f"{temp_table}_payloads",
+                            records=list(payloads.values()),
+                            columns=["body_hash", "codec", "payload", "raw_size_bytes"],
+                        )
+                        await conn.execute(f"""
+                            INSERT INTO predictions_bronze.payloads (body_hash, codec, payload, raw_size_bytes)
+                            SELECT body_hash, codec, payload, raw_size_bytes
+                            FROM {temp_table}_payloads
+                            ON CONFLICT (body_hash) DO NOTHING
+                        """)
+                    
                     # COPY to temp table
                     await conn.copy_records_to_table(
                         temp_table,
-                        records=records,
+                        records=rows,
                         columns=[
                             "id", "source", "endpoint_name", "url_path", "body_json", "body_hash",
                             "query_params", "http_status", "ingestion_type", "run_id", "fetched_at",
+                            "response_size_bytes",
                         ],
                     )
                     
-                    # Count before insert
-                    before_count = await conn.fetchval(
-                        "SELECT COUNT(*) FROM predictions_bronze.api_responses"
-                    )
-                    
-                    # Insert with conflict handling
-                    await conn.execute(f"""
+                    # Insert with conflict handling; command tag is "INSERT 0 <rows>"
+                    status = await conn.execute(f"""
                         INSERT INTO predictions_bronze.api_responses (
                             id, source, endpoint_name, url_path, body_json, body_hash,
-                            query_params, http_status, ingestion_type, run_id, fetched_at
+                            query_params, http_status, ingestion_type, run_id, fetched_at,
+                            response_size_bytes
                         )
                         SELECT id::uuid, source, endpoint_name, url_path, body_json, body_hash,
-                               query_params, http_status, ingestion_type, run_id::uuid, fetched_at
+                               query_params, http_status, ingestion_type, run_id::uuid, fetched_at,
+                               response_size_bytes
                         FROM {temp_table}
                         ON CONFLICT (body_hash, source) DO NOTHING
                     """)
                     
-                    # Count after insert
-                    after_count = await conn.fetchval(
-                        "SELECT COUNT(*) FROM predictions_bronze.api_responses"
-                    )
-                    
-                    inserted = after_count - before_count
-                    duplicates = len(records) - inserted
-                    
-                    # Drop temp table explicitly
-                    await conn.execute(f"DROP TABLE IF EXISTS {temp_table}")
-                    
-                    logger.info(
-                        "Flushed bronze batch",
-                        total=len(records),
-                        inserted=inserted,
-                        duplicates=duplicates,
-                    )
-                    
-                    return inserted, duplicates
-                    
                 except Exception as e:
                     logger.error("Bronze batch flush failed", error=str(e))
                     raise
+        
+        # Only remember hashes once the transaction has committed
+        for key in batch_keys:
+            self._recent_hashes.add(key)
+        
+        inserted = int(status.split()[-1])
+        duplicates = len(records) - inserted
+        
+        logger.info(
+            "Flushed bronze batch",
+            total=len(records),
+            inserted=inserted,
+            duplicates=duplicates,
+            skipped_in_process=len(records) - len(fresh),
+            raw_bytes=raw_bytes,
+            stored_bytes=sum(len(p[2]) for p in payloads.values()) if self._compressed else raw_bytes,
+        )
+        
+        return inserted, duplicates
     
     async def write_batch(
         self,
@@ -249,8 +407,32 @@ class BronzeWriter:
 class BronzeReader:
     """
     Reads raw data from bronze layer for silver processing.
+    Bodies stored inline (body_json) and in the compressed payload store are
+    returned the same way.
+    """
+    
+    _RECORDS_QUERY = """
+        SELECT r.id, r.source, r.endpoint_name, r.body_json, r.fetched_at,
+               p.codec, p.payload
+        FROM predictions_bronze.api_responses r
+        LEFT JOIN predictions_bronze.payloads p
+          ON r.body_json IS NULL AND p.body_hash = r.body_hash
+        WHERE r.source = $1
+          AND r.endpoint_name = $2
+          AND ($3::timestamptz IS NULL OR r.fetched_at > $3)
+        ORDER BY r.fetched_at ASC
     """
     
+    @staticmethod
+    def _to_record(row) -> dict[str, Any]:
+        return {
+            "id": str(row["id"]),
+            "source": row["source"],
+            "endpoint": row["endpoint_name"],
+            "body": _decode_body(row),
+            "fetched_at": row["fetched_at"],
+        }
+    
     async def get_unprocessed_records(
         self,
         source: DataSource,
@@ -269,29 +451,33 @@ class BronzeReader:
         """
         db = await get_db()
         
-        query = """
-            SELECT id, source, endpoint_name, body_json, fetched_at
-            FROM predictions_bronze.api_responses
-            WHERE source = $1
-              AND endpoint_name = $2
-              AND ($3::timestamptz IS NULL OR fetched_at > $3)
-            ORDER BY fetched_at ASC
-            LIMIT $4
-        """
-        
         async with db.asyncpg_connection() as conn:
-            rows = await conn.fetch(query, source.value, endpoint, since, limit)
+            rows = await conn.fetch(
+                self._RECORDS_QUERY + " LIMIT $4", source.value, endpoint, since, limit
+            )
             
-            return [
-                {
-                    "id": str(row["id"]),
-                    "source": row["source"],
-                    "endpoint": row["endpoint_name"],
-                    "body": json.loads(row["body_json"]) if isinstance(row["body_json"], str) else row["body_json"],
-                    "fetched_at": row["fetched_at"],
-                }
-                for row in rows
-            ]
+            return [self._to_record(row) for row in rows]
+    
+    async def iter_records(
+        self,
+        source: DataSource,
+        endpoint: str,
+        since: Optional[datetime] = None,
+        prefetch: int = 500,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream bronze records through a server-side cursor.
+        
+        Payloads are decompressed one row at a time, so replaying a large
+        backlog never holds more than `prefetch` rows in memory.
+        """
+        db = await get_db()
+        
+        async with db.asyncpg_connection() as conn, conn.transaction():
+            async for row in conn.cursor(
+                self._RECORDS_QUERY, source.value, endpoint, since, prefetch=prefetch
+            ):
+                yield self._to_record(row)
     
     async def get_latest_ingestion_time(
         self,
@@ -45,12 +45,14 @@ ENABLE_LIMITLESS=true
 ENABLE_OPINIONTRADE=false
 """
 import asyncio
+import heapq
+import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
 
 import structlog
 
@@ -59,7 +61,7 @@ from predictions_ingest.config import get_settings
 from predictions_ingest.database import get_db
 from predictions_ingest.ingestion.bronze_layer import BronzeWriter
 from predictions_ingest.ingestion.silver_layer import SilverReader, SilverWriter
-from predictions_ingest.models import DataSource, RunResult
+from predictions_ingest.models import DataSource, Market, RunResult
 
 logger = structlog.get_logger()
 
@@ -120,15 +122,25 @@ class PriceFetcher:
     Strategy:
     1. Batch fetch token IDs from DB (1 query for all markets)
     2. Fetch prices with N concurrent API requests (configurable)
-    3. Batch update database (1 query)
+    3. Append snapshots to predictions_silver.prices (1 COPY per chunk)
+    4. Write back changed prices to silver markets (1 UPDATE ... FROM unnest)
     
     Configuration (via settings):
     - price_fetch_batch_size: Number of concurrent API requests (default: 50)
+    - price_history_enabled: Write price history on every fetch (default: on)
+    - price_update_epsilon: Skip write-back for smaller price moves
     """
     
-    def __init__(self, client: DomeClient, bronze_writer: BronzeWriter, source: DataSource):
+    def __init__(
+        self,
+        client: DomeClient,
+        bronze_writer: BronzeWriter,
+        source: DataSource,
+        silver_writer: Optional[SilverWriter] = None,
+    ):
         self.client = client
         self.bronze_writer = bronze_writer
+        self.silver_writer = silver_writer or SilverWriter()
         self.source = source
         self.settings = get_settings()
         self.batch_size = self.settings.price_fetch_batch_size  # Configurable
@@ -171,9 +183,9 @@ class PriceFetcher:
             return {}
     
     async def _fetch_single_price(self, token_id: str, market_id: str) -> Optional[dict]:
-        """Fetch a single price with error handling."""
+        """Fetch a single price (coalesced/batched by the client) with error handling."""
         try:
-            return await self.client.fetch_market_price(token_id)
+            return await self.client.get_market_price(token_id)
         except Exception as e:
             logger.debug("Failed to fetch price", market_id=market_id, token_id=token_id, error=str(e))
             return None
@@ -214,11 +226,14 @@ class PriceFetcher:
         logger.info("Processing markets with token IDs", count=len(markets_with_tokens))
         
         # Step 2: Fetch prices with concurrency control
+        # batch_size bounds concurrent upstream requests; when the client packs
+        # lookups into multi-ID requests each of those serves price_batch_size markets
         prices_fetched = 0
         price_updates = []
+        chunk_size = self.batch_size * self.client.price_batch_size
         
-        for i in range(0, len(markets_with_tokens), self.batch_size):
-            batch_markets = markets_with_tokens[i:i + self.batch_size]
+        for i in range(0, len(markets_with_tokens), chunk_size):
+            batch_markets = markets_with_tokens[i:i + chunk_size]
             tasks = []
             
             for market in batch_markets:
@@ -232,9 +247,10 @@ class PriceFetcher:
             # Execute batch concurrently (50 parallel API calls)
             results = await asyncio.gather(*[task[2] for task in tasks], return_exceptions=True)
             
-            # Collect bronze records and price updates for this batch
+            # Collect bronze records, price updates and history snapshots for this batch
             bronze_records = []
             batch_price_updates = []
+            snapshots = []
             
             for (market, token_id, _), raw_price in zip(tasks, results):
                 if raw_price and not isinstance(raw_price, Exception):
@@ -258,6 +274,15 @@ class PriceFetcher:
                         
                     except Exception as e:
                         logger.debug("Failed to process price", market_id=market.source_market_id, error=str(e))
+                        continue
+                    
+                    if self.settings.price_history_enabled:
+                        try:
+                            snapshots.append(
+                                self.client.normalize_price(raw_price, market.source_market_id)
+                            )
+                        except Exception as e:
+                            logger.debug("Failed to normalize price snapshot", market_id=market.source_market_id, error=str(e))
             
             # BATCH write to bronze (all prices in this batch at once)
             if bronze_records:
@@ -275,28 +300,29 @@ class PriceFetcher:
                 except Exception as e:
                     logger.warning("Bronze batch write failed, continuing", error=str(e))
             
+            # Price history: one COPY for the whole chunk
+            if snapshots:
+                try:
+                    await self.silver_writer.insert_prices(snapshots)
+                except Exception as e:
+                    logger.warning("Price history write failed, continuing", error=str(e))
+            
             price_updates.extend(batch_price_updates)
             
-            batch_num = i // self.batch_size + 1
-            total_batches = (len(markets) + self.batch_size - 1) // self.batch_size
+            batch_num = i // chunk_size + 1
+            total_batches = (len(markets_with_tokens) + chunk_size - 1) // chunk_size
             logger.info(f"Processed price batch {batch_num}/{total_batches}", 
                        fetched=len(batch_price_updates))
         
-        # Step 3: Batch update prices in database (1 query)
+        # Step 3: Write back changed prices in one statement
         prices_updated = 0
         if price_updates:
             try:
-                db = await get_db()
-                async with db.asyncpg_connection() as conn:
-                    await conn.executemany("""
-                        UPDATE predictions_silver.markets
-                        SET yes_price = $2,
-                            no_price = $3,
-                            last_updated_at = NOW()
-                        WHERE source_market_id = $1 AND source = $4
-                    """, [(p['source_market_id'], p['yes_price'], p['no_price'], self.source.value) for p in price_updates])
-                    prices_updated = len(price_updates)
-                    logger.info("Batch updated market prices", count=prices_updated)
+                prices_updated = await self.silver_writer.update_market_prices(
+                    self.source,
+                    [(p['source_market_id'], p['yes_price'], p['no_price']) for p in price_updates],
+                    epsilon=self.settings.price_update_epsilon,
+                )
             except Exception as e:
                 logger.error("Failed to batch update prices", error=str(e))
         
@@ -497,6 +523,181 @@ class TradesFetcher:
             return markets[:top_n]
 
 
+# =============================================================================
+# MARKET STREAM PIPELINE - page-at-a-time bronze -> silver -> prices
+# =============================================================================
+
+_END_OF_STREAM = object()
+
+
+class MarketStreamPipeline:
+    """
+    Streams market pages through the bronze, silver and price steps.
+    
+    Stages (each an asyncio task, linked by bounded queues):
+    1. fetch:   pull pages from the API page iterator
+    2. bronze:  BronzeWriter.write_batch for the raw page
+    3. silver:  normalize_market + SilverWriter.upsert_markets
+    4. prices:  price stage callback on the page's active markets
+    
+    While page N is being upserted, page N+1 is already being fetched and
+    prices for page N-1 are in flight. Bounded queues apply back-pressure,
+    so at most ~queue_depth pages per stage are held in memory regardless of
+    catalog size. Only the top `keep_top_n` active markets by 24h volume are
+    retained (for the orderbook/trades steps that run after the stream).
+    """
+    
+    def __init__(
+        self,
+        normalize: Callable[[dict[str, Any]], Market],
+        bronze_writer: BronzeWriter,
+        silver_writer: SilverWriter,
+        source: DataSource,
+        endpoint: str,
+        run_id: str,
+        price_stage: Optional[Callable[[list[Market]], Awaitable[tuple[int, int]]]] = None,
+        price_chunk_size: int = 0,
+        keep_top_n: int = 0,
+        queue_depth: Optional[int] = None,
+    ):
+        self.normalize = normalize
+        self.bronze_writer = bronze_writer
+        self.silver_writer = silver_writer
+        self.source = source
+        self.endpoint = endpoint
+        self.run_id = run_id
+        self.price_stage = price_stage
+        self.price_chunk_size = price_chunk_size
+        self.keep_top_n = keep_top_n
+        self.queue_depth = queue_depth or get_settings().stream_queue_depth
+        
+        self._top: list[tuple[Decimal, int, Market]] = []
+        self._seq = 0
+        self._started = 0.0
+        self.first_price_after_s: Optional[float] = None
+    
+    async def run(
+        self,
+        pages: AsyncIterator[list[dict[str, Any]]],
+        result: IngestionResult,
+    ) -> list[Market]:
+        """
+        Drive all pages through the pipeline, updating result counters.
+        
+        Returns:
+            Top keep_top_n active markets by 24h volume (descending)
+        """
+        self._started = time.monotonic()
+        bronze_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_depth)
+        silver_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_depth)
+        price_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_depth)
+        
+        # TaskGroup cancels the sibling stages if any stage fails, so nothing
+        # is left blocked on a queue (stages send _END_OF_STREAM only when
+        # they finish normally)
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._fetch_stage(pages, bronze_q, result))
+                tg.create_task(self._bronze_stage(bronze_q, silver_q, result))
+                tg.create_task(self._silver_stage(silver_q, price_q, result))
+                tg.create_task(self._price_stage(price_q, result))
+        except ExceptionGroup as eg:
+            # Surface the stage's own error to the ingester's error handling
+            raise eg.exceptions[0]
+        
+        logger.info(
+            "Market stream completed",
+            source=self.source.value,
+            markets=result.markets_upserted,
+            prices=result.prices_updated,
+            first_price_after_s=self.first_price_after_s,
+            duration_s=round(time.monotonic() - self._started, 2),
+        )
+        return [m for _, _, m in sorted(self._top, key=lambda t: (t[0], t[1]), reverse=True)]
+    
+    async def _fetch_stage(
+        self,
+        pages: AsyncIterator[list[dict[str, Any]]],
+        out_q: asyncio.Queue,
+        result: IngestionResult,
+    ) -> None:
+        async for page in pages:
+            page = [m for m in page if m is not None]
+            if not page:
+                continue
+            result.markets_fetched += len(page)
+            await out_q.put(page)
+        # Only on normal completion: if a stage fails, TaskGroup cancels the
+        # rest, and a sentinel put() into a full queue would never return
+        await out_q.put(_END_OF_STREAM)
+    
+    async def _bronze_stage(
+        self,
+        in_q: asyncio.Queue,
+        out_q: asyncio.Queue,
+        result: IngestionResult,
+    ) -> None:
+        while (page := await in_q.get()) is not _END_OF_STREAM:
+            inserted, _ = await self.bronze_writer.write_batch(
+                records=page,
+                source=self.source,
+                endpoint=self.endpoint,
+                run_id=self.run_id,
+            )
+            result.bronze_records += inserted
+            await out_q.put(page)
+        await out_q.put(_END_OF_STREAM)
+    
+    async def _silver_stage(
+        self,
+        in_q: asyncio.Queue,
+        out_q: asyncio.Queue,
+        result: IngestionResult,
+    ) -> None:
+        while (page := await in_q.get()) is not _END_OF_STREAM:
+            markets = [self.normalize(m) for m in page]
+            upserted, _ = await self.silver_writer.upsert_markets(markets)
+            result.markets_upserted += upserted
+            
+            active = [m for m in markets if m.is_active]
+            self._track_top(active)
+            if self.price_stage and active:
+                await out_q.put(active)
+        await out_q.put(_END_OF_STREAM)
+    
+    async def _price_stage(self, in_q: asyncio.Queue, result: IngestionResult) -> None:
+        done = False
+        while not done:
+            batch = await in_q.get()
+            if batch is _END_OF_STREAM:
+                break
+            # Top up with pages that are already waiting (never block for more)
+            markets = list(batch)
+            while len(markets) < self.price_chunk_size and not in_q.empty():
+                more = in_q.get_nowait()
+                if more is _END_OF_STREAM:
+                    done = True
+                    break
+                markets.extend(more)
+            
+            fetched, updated = await self.price_stage(markets)
+            result.prices_fetched += fetched
+            result.prices_updated += updated
+            if updated and self.first_price_after_s is None:
+                self.first_price_after_s = round(time.monotonic() - self._started, 2)
+    
+    def _track_top(self, markets: list[Market]) -> None:
+        if self.keep_top_n <= 0:
+            return
+        for market in markets:
+            self._seq += 1
+            entry = (market.volume_24h or Decimal("0"), -self._seq, market)
+            if len(self._top) < self.keep_top_n:
+                heapq.heappush(self._top, entry)
+            elif entry[:2] > self._top[0][:2]:
+                heapq.heapreplace(self._top, entry)
+
+
 # =============================================================================
 # SOURCE INGESTERS
 # =============================================================================
@@ -566,6 +767,8 @@ class DomePolymarketIngester(SourceIngester):
     Delta Load (~1-2 min):
     1. Fetch active markets (they change frequently)
     2. Update prices for all active markets
+    
+    Both loads run steps 1-3 as a MarketStreamPipeline, page by page.
     """
     
     SOURCE = DataSource.POLYMARKET
@@ -573,9 +776,35 @@ class DomePolymarketIngester(SourceIngester):
     def __init__(self):
         super().__init__()
         self.client = DomeClient(source=DataSource.POLYMARKET)
-        self.price_fetcher = PriceFetcher(self.client, self.bronze_writer, self.SOURCE)
+        self.price_fetcher = PriceFetcher(
+            self.client, self.bronze_writer, self.SOURCE, silver_writer=self.silver_writer
+        )
         self.trades_fetcher = TradesFetcher(self.client, self.bronze_writer, self.silver_writer, self.SOURCE)
     
+    def _market_pages(self) -> AsyncIterator[list[dict[str, Any]]]:
+        """Active, volume-filtered market pages (top N by volume)."""
+        return self.client.iter_market_pages(
+            active_only=True,
+            min_volume=self.settings.polymarket_min_volume_usd,
+            max_records=self.settings.polymarket_max_markets,
+        )
+    
+    def _market_pipeline(self, run_id: str, keep_top_n: int) -> MarketStreamPipeline:
+        async def fetch_prices(markets: list[Market]) -> tuple[int, int]:
+            return await self.price_fetcher.fetch_prices_batch(markets=markets, run_id=run_id)
+        
+        return MarketStreamPipeline(
+            normalize=self.client.normalize_market,
+            bronze_writer=self.bronze_writer,
+            silver_writer=self.silver_writer,
+            source=self.SOURCE,
+            endpoint="/polymarket/markets",
+            run_id=run_id,
+            price_stage=fetch_prices,
+            price_chunk_size=self.price_fetcher.batch_size * self.client.price_batch_size,
+            keep_top_n=keep_top_n,
+        )
+    
     async def run_static(self, run_id: str) -> IngestionResult:
         """
         Full load: Active markets + prices.
@@ -606,71 +835,36 @@ class DomePolymarketIngester(SourceIngester):
             # =====================================================
             
             # =====================================================
-            # STEP 1: Fetch all pages and filter for status='open'
-            # API returns mixed open/closed markets across all pages
-            # Will process all ~15k markets and keep ~8k open markets
+            # STEP 1: Stream pages of status='open' markets
+            # Each page goes bronze -> silver while the next page is fetched
             # 
             # OPTIMIZATION: Use min_volume and max_records to fetch only top markets
             # This reduces API calls from ~160 to ~5 per source
+            # 
+            # STEP 2: Fetch prices for active markets as pages land
+            # NOTE: Dome API markets endpoint does NOT include prices!
+            # We must call /market-price/{token_id} for each market.
+            # Prices for the first pages are fetched while later pages
+            # are still being paged/upserted.
             # =====================================================
-            logger.info("Fetching top markets by volume (server-side filtering)")
-            raw_markets = await self.client.fetch_all_markets(
-                active_only=True,
-                min_volume=self.settings.polymarket_min_volume_usd,
-                max_records=self.settings.polymarket_max_markets,
-            )
-            result.markets_fetched = len(raw_markets)
+            logger.info("Streaming top markets by volume (server-side filtering)")
+            orderbook_limit = self.settings.orderbook_fetch_top_n
+            pipeline = self._market_pipeline(run_id, keep_top_n=orderbook_limit)
+            top_markets = await pipeline.run(self._market_pages(), result)
             logger.info(
                 "Fetched high-volume markets",
                 count=result.markets_fetched,
                 min_volume_usd=self.settings.polymarket_min_volume_usd,
                 max_markets=self.settings.polymarket_max_markets,
             )
-            
-            # Store in Bronze layer
-            inserted, _ = await self.bronze_writer.write_batch(
-                records=raw_markets,
-                source=self.SOURCE,
-                endpoint="/polymarket/markets",
-                run_id=run_id,
-            )
-            result.bronze_records += inserted
-            
-            # Normalize and store in Silver layer
-            markets = [self.client.normalize_market(m) for m in raw_markets]
-            upserted, _ = await self.silver_writer.upsert_markets(markets)
-            result.markets_upserted = upserted
-            
-            # =====================================================
-            # STEP 2: Fetch prices for all active markets
-            # NOTE: Dome API markets endpoint does NOT include prices!
-            # We must call /market-price/{token_id} for each market.
-            # Using concurrent batching (50 parallel requests) this takes ~2 mins.
-            # =====================================================
-            active_markets = [m for m in markets if m.is_active]
-            logger.info("Fetching prices for active markets", count=len(active_markets))
-            
-            prices_fetched, prices_updated = await self.price_fetcher.fetch_prices_batch(
-                markets=active_markets,
-                run_id=run_id,
-            )
-            result.prices_fetched = prices_fetched
-            result.prices_updated = prices_updated
-            logger.info("Prices fetched and updated", fetched=prices_fetched, updated=prices_updated)
+            logger.info("Prices fetched and updated", fetched=result.prices_fetched, updated=result.prices_updated)
             
             # =====================================================
             # STEP 3: Orderbooks for top N markets by volume (configurable)
             # Set ORDERBOOK_FETCH_TOP_N=0 to skip entirely
             # =====================================================
-            orderbook_limit = self.settings.orderbook_fetch_top_n
             if orderbook_limit > 0:
                 try:
-                    top_markets = sorted(
-                        active_markets,
-                        key=lambda m: m.volume_24h or 0,
-                        reverse=True
-                    )[:orderbook_limit]
-                    
                     for market in top_markets:
                         try:
                             raw_orderbook = await self.client.fetch_orderbook(market.source_market_id)
@@ -731,46 +925,20 @@ class DomePolymarketIngester(SourceIngester):
             # Events don't have volume, so top N events != top N markets by volume
             # Focus on markets which are the core trading instruments
             
-            # Fetch active markets only (with volume filtering)
-            raw_markets = await self.client.fetch_all_markets(
-                active_only=True,
-                min_volume=self.settings.polymarket_min_volume_usd,
-                max_records=self.settings.polymarket_max_markets,
-            )
-            result.markets_fetched = len(raw_markets)
+            # Stream active markets (with volume filtering) page by page through
+            # bronze -> silver -> prices
+            pipeline = self._market_pipeline(run_id, keep_top_n=self.settings.trades_top_n_markets)
+            top_markets = await pipeline.run(self._market_pages(), result)
             logger.info(
                 "Delta: Fetched high-volume markets",
                 count=result.markets_fetched,
                 min_volume_usd=self.settings.polymarket_min_volume_usd,
             )
             
-            # Store in Bronze
-            inserted, _ = await self.bronze_writer.write_batch(
-                records=raw_markets,
-                source=self.SOURCE,
-                endpoint="/polymarket/markets",
-                run_id=run_id,
-            )
-            result.bronze_records += inserted
-            
-            # Normalize and upsert
-            markets = [self.client.normalize_market(m) for m in raw_markets]
-            upserted, _ = await self.silver_writer.upsert_markets(markets)
-            result.markets_upserted = upserted
-            
-            # Update prices for all active markets
-            active_markets = [m for m in markets if m.is_active]
-            prices_fetched, prices_updated = await self.price_fetcher.fetch_prices_batch(
-                markets=active_markets,
-                run_id=run_id,
-            )
-            result.prices_fetched = prices_fetched
-            result.prices_updated = prices_updated
-            
             # Fetch recent trades for top markets (if configured)
             if self.settings.trades_top_n_markets > 0:
                 trades_fetched, trades_inserted = await self.trades_fetcher.fetch_trades_batch(
-                    markets=active_markets,
+                    markets=top_markets,
                     run_id=run_id,
                 )
                 # Add trades metrics to result (extend IngestionResult if needed)
@@ -819,6 +987,66 @@ class DomeKalshiIngester(SourceIngester):
         self.client = DomeClient(source=DataSource.KALSHI)
         self.trades_fetcher = TradesFetcher(self.client, self.bronze_writer, self.silver_writer, self.SOURCE)
     
+    def _market_pages(self) -> AsyncIterator[list[dict[str, Any]]]:
+        """Active, volume-filtered market pages (top N by volume)."""
+        return self.client.iter_market_pages(
+            active_only=True,
+            min_volume=self.settings.kalshi_min_volume_usd,
+            max_records=self.settings.kalshi_max_markets,
+        )
+    
+    def _market_pipeline(self, run_id: str, keep_top_n: int) -> MarketStreamPipeline:
+        return MarketStreamPipeline(
+            normalize=self.client.normalize_market,
+            bronze_writer=self.bronze_writer,
+            silver_writer=self.silver_writer,
+            source=self.SOURCE,
+            endpoint="/kalshi/markets",
+            run_id=run_id,
+            price_stage=self._fetch_prices,
+            keep_top_n=keep_top_n,
+        )
+    
+    async def _fetch_prices(self, markets: list[Market]) -> tuple[int, int]:
+        """
+        Fetch prices from the dedicated market-price endpoint (more accurate than
+        last_price in the market list) and store them.
+        
+        Returns:
+            Tuple of (prices_fetched, prices_updated)
+        """
+        prices_fetched = 0
+        snapshots = []
+        for market in markets:
+            try:
+                raw_price = await self.client.fetch_market_price(market.source_market_id)
+                if raw_price:
+                    price = self.client.normalize_price(raw_price, market.source_market_id)
+                    snapshots.append(price)
+                    prices_fetched += 1
+            except Exception as e:
+                logger.warning("Failed to fetch/update price", market_id=market.source_market_id, error=str(e))
+        
+        # Price history for the whole chunk in one COPY
+        if snapshots:
+            try:
+                await self.silver_writer.insert_prices(snapshots)
+            except Exception as e:
+                logger.warning("Price history write failed, continuing", error=str(e))
+        
+        # Also update markets.yes_price from the authoritative price endpoint
+        # (market list's last_price can be stale; market-price endpoint is real-time)
+        prices_updated = 0
+        try:
+            prices_updated = await self.silver_writer.update_market_prices(
+                self.SOURCE,
+                [(p.source_market_id, p.yes_price, p.no_price) for p in snapshots],
+                epsilon=self.settings.price_update_epsilon,
+            )
+        except Exception as e:
+            logger.error("Failed to batch update prices", error=str(e))
+        return prices_fetched, prices_updated
+    
     async def run_static(self, run_id: str) -> IngestionResult:
         """Full load: Active markets + prices."""
         result = IngestionResult(
@@ -832,13 +1060,12 @@ class DomeKalshiIngester(SourceIngester):
             logger.info("Starting Kalshi static load", run_id=run_id)
             await self.client.connect()
             
-            # Fetch active markets only (with volume filtering)
-            raw_markets = await self.client.fetch_all_markets(
-                active_only=True,
-                min_volume=self.settings.kalshi_min_volume_usd,
-                max_records=self.settings.kalshi_max_markets,
-            )
-            result.markets_fetched = len(raw_markets)
+            # Stream active markets (with volume filtering) through Bronze + Silver,
+            # fetching prices as each page lands
+            orderbook_limit = 10
+            trades_limit = self.trades_fetcher.top_n_markets
+            pipeline = self._market_pipeline(run_id, keep_top_n=max(orderbook_limit, trades_limit))
+            top_markets = await pipeline.run(self._market_pages(), result)
             logger.info(
                 "Fetched high-volume Kalshi markets",
                 count=result.markets_fetched,
@@ -846,47 +1073,8 @@ class DomeKalshiIngester(SourceIngester):
                 max_markets=self.settings.kalshi_max_markets,
             )
             
-            # Store in Bronze + Silver
-            inserted, _ = await self.bronze_writer.write_batch(
-                records=raw_markets,
-                source=self.SOURCE,
-                endpoint="/kalshi/markets",
-                run_id=run_id,
-            )
-            result.bronze_records += inserted
-            
-            markets = [self.client.normalize_market(m) for m in raw_markets]
-            upserted, _ = await self.silver_writer.upsert_markets(markets)
-            result.markets_upserted = upserted
-            
-            # Fetch prices for active markets
-            active_markets = [m for m in markets if m.is_active]
-            for market in active_markets:
-                try:
-                    raw_price = await self.client.fetch_market_price(market.source_market_id)
-                    if raw_price:
-                        price = self.client.normalize_price(raw_price, market.source_market_id)
-                        await self.silver_writer.insert_price(price)
-                        # Also update markets.yes_price from the authoritative price endpoint
-                        if price.yes_price is not None:
-                            try:
-                                updated = await self.silver_writer.update_market_price(
-                                    source_market_id=market.source_market_id,
-                                    yes_price=float(price.yes_price),
-                                    no_price=float(price.no_price) if price.no_price else None,
-                                )
-                                if updated == 0:
-                                    logger.warning("update_market_price found no row", market_id=market.source_market_id)
-                            except Exception as upe:
-                                logger.error("update_market_price failed", market_id=market.source_market_id, error=str(upe))
-                        result.prices_fetched += 1
-                        result.prices_updated += 1
-                except Exception as e:
-                    logger.debug("Failed to fetch Kalshi price", market_id=market.source_market_id)
-            
             # Orderbooks for top markets
-            top_markets = sorted(active_markets, key=lambda m: m.volume_24h or 0, reverse=True)[:10]
-            for market in top_markets:
+            for market in top_markets[:orderbook_limit]:
                 try:
                     raw_orderbook = await self.client.fetch_orderbook(market.source_market_id)
                     if raw_orderbook:
@@ -898,7 +1086,7 @@ class DomeKalshiIngester(SourceIngester):
             # Fetch recent trades for top Kalshi markets
             if self.settings.trades_top_n_markets > 0:
                 trades_fetched, trades_inserted = await self.trades_fetcher.fetch_trades_batch(
-                    markets=active_markets,
+                    markets=top_markets[:trades_limit],
                     run_id=run_id,
                 )
                 logger.info(
@@ -935,61 +1123,20 @@ class DomeKalshiIngester(SourceIngester):
             logger.info("Starting Kalshi delta load", run_id=run_id)
             await self.client.connect()
             
-            # Fetch active markets (with volume filtering)
-            raw_markets = await self.client.fetch_all_markets(
-                active_only=True,
-                min_volume=self.settings.kalshi_min_volume_usd,
-                max_records=self.settings.kalshi_max_markets,
-            )
-            result.markets_fetched = len(raw_markets)
+            # Stream active markets (with volume filtering) through Bronze + Silver,
+            # fetching prices as each page lands
+            pipeline = self._market_pipeline(run_id, keep_top_n=self.trades_fetcher.top_n_markets)
+            top_markets = await pipeline.run(self._market_pages(), result)
             logger.info(
                 "Delta: Fetched high-volume Kalshi markets",
                 count=result.markets_fetched,
                 min_volume_usd=self.settings.kalshi_min_volume_usd,
             )
             
-            inserted, _ = await self.bronze_writer.write_batch(
-                records=raw_markets,
-                source=self.SOURCE,
-                endpoint="/kalshi/markets",
-                run_id=run_id,
-            )
-            result.bronze_records += inserted
-            
-            markets = [self.client.normalize_market(m) for m in raw_markets]
-            upserted, _ = await self.silver_writer.upsert_markets(markets)
-            result.markets_upserted = upserted
-            
-            # Update prices - use the dedicated market-price endpoint (more accurate than last_price in market list)
-            active_markets = [m for m in markets if m.is_active]
-            for market in active_markets:
-                try:
-                    raw_price = await self.client.fetch_market_price(market.source_market_id)
-                    if raw_price:
-                        price = self.client.normalize_price(raw_price, market.source_market_id)
-                        await self.silver_writer.insert_price(price)
-                        # Also update markets.yes_price from the authoritative price endpoint
-                        # (market list's last_price can be stale; market-price endpoint is real-time)
-                        if price.yes_price is not None:
-                            try:
-                                updated = await self.silver_writer.update_market_price(
-                                    source_market_id=market.source_market_id,
-                                    yes_price=float(price.yes_price),
-                                    no_price=float(price.no_price) if price.no_price else None,
-                                )
-                                if updated == 0:
-                                    logger.warning("update_market_price found no row", market_id=market.source_market_id)
-                            except Exception as upe:
-                                logger.error("update_market_price failed", market_id=market.source_market_id, error=str(upe))
-                        result.prices_fetched += 1
-                        result.prices_updated += 1
-                except Exception as e:
-                    logger.warning("Failed to fetch/update price", market_id=market.source_market_id, error=str(e))
-            
             # Fetch recent trades for top Kalshi markets
             if self.settings.trades_top_n_markets > 0:
                 trades_fetched, trades_inserted = await self.trades_fetcher.fetch_trades_batch(
-                    markets=active_markets,
+                    markets=top_markets,
                     run_id=run_id,
                 )
                 logger.info(
@@ -2,6 +2,7 @@
 Silver layer: Normalized and unified entity storage.
 Transforms raw bronze data into structured tables.
 """
+import hashlib
 import json
 from datetime import datetime
 from decimal import Decimal
@@ -19,6 +20,7 @@ from predictions_ingest.models import (
     PriceSnapshot,
     Trade,
 )
+from predictions_ingest.price_events import notify_prices
 
 logger = structlog.get_logger()
 
@@ -287,6 +289,7 @@ class SilverWriter:
                 icon_url = EXCLUDED.icon_url,
                 source_url = EXCLUDED.source_url,
                 extra_data = COALESCE(predictions_silver.markets.extra_data, '{}'::jsonb) || EXCLUDED.extra_data,
+                body_hash = NULL,  -- invalidate the bulk-upsert fingerprint
                 last_updated_at = NOW(),
                 update_count = COALESCE(predictions_silver.markets.update_count, 0) + 1
             RETURNING id
@@ -346,8 +349,8 @@ class SilverWriter:
         """
         Batch upsert markets using efficient bulk insert.
         
-        Uses PostgreSQL's executemany for much better performance than
-        individual queries (~1 second vs 10+ minutes for 5000 records).
+        Uses COPY into a staging table plus one set-based merge; unchanged
+        markets are skipped via a per-row fingerprint.
         
         Returns:
             Tuple of (upserted_count, error_count)
@@ -358,83 +361,96 @@ class SilverWriter:
         # Use bulk upsert for efficiency
         return await self._bulk_upsert_markets(markets)
     
+    # Market columns in COPY/staging order (34 columns + fingerprint)
+    _MARKET_COLUMNS = [
+        "source", "source_market_id", "slug",
+        "title", "description", "question",
+        "category_id", "category_name", "tags",
+        "status", "is_active", "is_resolved", "resolution_value",
+        "outcome_count", "outcomes",
+        "yes_price", "no_price", "last_trade_price", "mid_price",
+        "volume_24h", "volume_7d", "volume_30d", "volume_total", "liquidity",
+        "trade_count_24h", "unique_traders",
+        "created_at_source", "end_date", "resolution_date", "last_trade_at",
+        "image_url", "icon_url", "source_url",
+        "extra_data", "body_hash",
+    ]
+    
+    # Shared by the COPY merge and the executemany fallback. Rows whose
+    # fingerprint (markets.body_hash) is unchanged are not rewritten at all,
+    # so unchanged markets cost no update_count churn, dead tuples or WAL.
+    _MARKET_UPSERT_SET = """
+        ON CONFLICT (source, source_market_id) DO UPDATE SET
+            slug = EXCLUDED.slug,
+            title = EXCLUDED.title,
+            description = EXCLUDED.description,
+            question = EXCLUDED.question,
+            category_id = EXCLUDED.category_id,
+            category_name = EXCLUDED.category_name,
+            tags = EXCLUDED.tags,
+            status = EXCLUDED.status,
+            is_active = EXCLUDED.is_active,
+            is_resolved = EXCLUDED.is_resolved,
+            resolution_value = COALESCE(EXCLUDED.resolution_value, predictions_silver.markets.resolution_value),
+            outcome_count = EXCLUDED.outcome_count,
+            outcomes = EXCLUDED.outcomes,
+            -- Price fields intentionally EXCLUDED from update.
+            -- Prices are set only on INSERT (new markets) and updated
+            -- exclusively by update_market_price() which uses the
+            -- authoritative per-market price endpoint.
+            volume_24h = EXCLUDED.volume_24h,
+            volume_7d = EXCLUDED.volume_7d,
+            volume_30d = EXCLUDED.volume_30d,
+            volume_total = EXCLUDED.volume_total,
+            liquidity = EXCLUDED.liquidity,
+            trade_count_24h = EXCLUDED.trade_count_24h,
+            unique_traders = EXCLUDED.unique_traders,
+            end_date = EXCLUDED.end_date,
+            resolution_date = COALESCE(EXCLUDED.resolution_date, predictions_silver.markets.resolution_date),
+            last_trade_at = EXCLUDED.last_trade_at,
+            image_url = EXCLUDED.image_url,
+            icon_url = EXCLUDED.icon_url,
+            source_url = EXCLUDED.source_url,
+            extra_data = COALESCE(predictions_silver.markets.extra_data, '{}'::jsonb) || EXCLUDED.extra_data,
+            body_hash = EXCLUDED.body_hash,
+            last_updated_at = NOW(),
+            update_count = COALESCE(predictions_silver.markets.update_count, 0) + 1
+        WHERE predictions_silver.markets.body_hash IS DISTINCT FROM EXCLUDED.body_hash
+    """
+    
+    @staticmethod
+    def _market_fingerprint(record: tuple) -> str:
+        """
+        SHA-256 over the columns the upsert actually updates.
+        
+        Prices (insert-only here) and created_at_source are left out, so a
+        price move alone never rewrites the market row.
+        """
+        tracked = record[2:15] + record[19:26] + record[27:34]
+        normalized = json.dumps(tracked, default=str, separators=(",", ":"))
+        return hashlib.sha256(normalized.encode()).hexdigest()
+    
     async def _bulk_upsert_markets(self, markets: list[Market], batch_size: int = 500) -> tuple[int, int]:
         """
-        Bulk upsert markets using executemany for optimal performance.
+        Bulk upsert markets: binary COPY into a staging table, then one
+        set-based INSERT ... ON CONFLICT merge.
+        
+        Unchanged rows (same fingerprint) are skipped by the merge. If the
+        COPY path fails, falls back to executemany in batches of batch_size,
+        then row-by-row for a failing batch.
         
-        Processes in batches of batch_size to avoid memory issues.
+        Returns:
+            Tuple of (upserted_count, error_count); upserted includes
+            rows that were already up to date.
         """
         db = await get_db()
         pool = await db.get_asyncpg_pool()
         
-        query = """
-            INSERT INTO predictions_silver.markets (
-                source, source_market_id, slug,
-                title, description, question,
-                category_id, category_name, tags,
-                status, is_active, is_resolved, resolution_value,
-                outcome_count, outcomes,
-                yes_price, no_price, last_trade_price, mid_price,
-                volume_24h, volume_7d, volume_30d, volume_total, liquidity,
-                trade_count_24h, unique_traders,
-                created_at_source, end_date, resolution_date, last_trade_at,
-                image_url, icon_url, source_url,
-                extra_data
-            )
-            VALUES (
-                $1, $2, $3,
-                $4, $5, $6,
-                $7, $8, $9,
-                $10, $11, $12, $13,
-                $14, $15::jsonb,
-                $16, $17, $18, $19,
-                $20, $21, $22, $23, $24,
-                $25, $26,
-                $27, $28, $29, $30,
-                $31, $32, $33,
-                $34::jsonb
-            )
-            ON CONFLICT (source, source_market_id) DO UPDATE SET
-                slug = EXCLUDED.slug,
-                title = EXCLUDED.title,
-                description = EXCLUDED.description,
-                question = EXCLUDED.question,
-                category_id = EXCLUDED.category_id,
-                category_name = EXCLUDED.category_name,
-                tags = EXCLUDED.tags,
-                status = EXCLUDED.status,
-                is_active = EXCLUDED.is_active,
-                is_resolved = EXCLUDED.is_resolved,
-                resolution_value = COALESCE(EXCLUDED.resolution_value, predictions_silver.markets.resolution_value),
-                outcome_count = EXCLUDED.outcome_count,
-                outcomes = EXCLUDED.outcomes,
-                -- Price fields intentionally EXCLUDED from update.
-                -- Prices are set only on INSERT (new markets) and updated
-                -- exclusively by update_market_price() which uses the
-                -- authoritative per-market price endpoint.
-                volume_24h = EXCLUDED.volume_24h,
-                volume_7d = EXCLUDED.volume_7d,
-                volume_30d = EXCLUDED.volume_30d,
-                volume_total = EXCLUDED.volume_total,
-                liquidity = EXCLUDED.liquidity,
-                trade_count_24h = EXCLUDED.trade_count_24h,
-                unique_traders = EXCLUDED.unique_traders,
-                end_date = EXCLUDED.end_date,
-                resolution_date = COALESCE(EXCLUDED.resolution_date, predictions_silver.markets.resolution_date),
-                last_trade_at = EXCLUDED.last_trade_at,
-                image_url = EXCLUDED.image_url,
-                icon_url = EXCLUDED.icon_url,
-                source_url = EXCLUDED.source_url,
-                extra_data = COALESCE(predictions_silver.markets.extra_data, '{}'::jsonb) || EXCLUDED.extra_data,
-                last_updated_at = NOW(),
-                update_count = COALESCE(predictions_silver.markets.update_count, 0) + 1
-        """
-        
-        upserted = 0
         errors = 0
         
-        # Prepare all records as tuples
-        records = []
+        # Prepare all records as tuples, last occurrence wins per market
+        # (a merge cannot touch the same row twice)
+        by_key: dict[tuple[str, str], tuple] = {}
         for market in markets:
             try:
                 # Serialize outcomes to JSON
@@ -484,7 +500,7 @@ class SilverWriter:
                     market.source_url,
                     json.dumps(market.extra_data) if market.extra_data else "{}",
                 )
-                records.append(record)
+                by_key[(record[0], record[1])] = record + (self._market_fingerprint(record),)
             except Exception as e:
                 logger.error(
                     "Failed to prepare market record",
@@ -494,42 +510,146 @@ class SilverWriter:
                 )
                 errors += 1
         
-        # Process in batches using executemany
+        records = list(by_key.values())
+        if not records:
+            return 0, errors
+        
         async with pool.acquire() as conn:
-            for i in range(0, len(records), batch_size):
-                batch = records[i:i + batch_size]
-                try:
-                    await conn.executemany(query, batch)
-                    upserted += len(batch)
-                    batch_num = i // batch_size + 1
-                    total_batches = (len(records) + batch_size - 1) // batch_size
-                    logger.debug(
-                        "Upserted market batch",
-                        batch=batch_num,
-                        total_batches=total_batches,
-                        batch_size=len(batch),
-                    )
-                except Exception as e:
-                    logger.error(
-                        "Failed to upsert market batch",
-                        batch_start=i,
-                        batch_size=len(batch),
-                        error=str(e),
-                    )
-                    # Fall back to individual inserts for this batch
-                    for record in batch:
-                        try:
-                            await conn.execute(query, *record)
-                            upserted += 1
-                        except Exception as inner_e:
-                            logger.error(
-                                "Failed to upsert market",
-                                market_id=record[1],  # source_market_id
-                                error=str(inner_e),
-                            )
-                            errors += 1
-        
-        logger.info("Upserted markets", upserted=upserted, errors=errors)
+            try:
+                changed = await self._copy_merge_markets(conn, records)
+                upserted = len(records)
+            except Exception as e:
+                logger.warning(
+                    "COPY market upsert failed, falling back to executemany",
+                    count=len(records),
+                    error=str(e),
+                )
+                upserted, fallback_errors = await self._executemany_upsert_markets(
+                    conn, records, batch_size
+                )
+                errors += fallback_errors
+                changed = None
+        
+        logger.info(
+            "Upserted markets",
+            upserted=upserted,
+            changed=changed,
+            unchanged=upserted - changed if changed is not None else None,
+            errors=errors,
+        )
+        return upserted, errors
+    
+    async def _copy_merge_markets(self, conn, records: list[tuple]) -> int:
+        """COPY records into a staging table and merge. Returns rows inserted or changed."""
+        temp_table = f"_temp_markets_{id(records)}"
+        columns = ", ".join(self._MARKET_COLUMNS)
+        
+        async with conn.transaction():
+            await conn.execute(f"""
+                CREATE TEMP TABLE {temp_table} (
+                    source TEXT,
+                    source_market_id TEXT,
+                    slug TEXT,
+                    title TEXT,
+                    description TEXT,
+                    question TEXT,
+                    category_id TEXT,
+                    category_name TEXT,
+                    tags TEXT[],
+                    status TEXT,
+                    is_active BOOLEAN,
+                    is_resolved BOOLEAN,
+                    resolution_value TEXT,
+                    outcome_count INTEGER,
+                    outcomes JSONB,
+                    yes_price NUMERIC,
+                    no_price NUMERIC,
+                    last_trade_price NUMERIC,
+                    mid_price NUMERIC,
+                    volume_24h NUMERIC,
+                    volume_7d NUMERIC,
+                    volume_30d NUMERIC,
+                    volume_total NUMERIC,
+                    liquidity NUMERIC,
+                    trade_count_24h INTEGER,
+                    unique_traders INTEGER,
+                    created_at_source TIMESTAMPTZ,
+                    end_date TIMESTAMPTZ,
+                    resolution_date TIMESTAMPTZ,
+                    last_trade_at TIMESTAMPTZ,
+                    image_url TEXT,
+                    icon_url TEXT,
+                    source_url TEXT,
+                    extra_data JSONB,
+                    body_hash TEXT
+                ) ON COMMIT DROP
+            """)
+            
+            await conn.copy_records_to_table(
+                temp_table,
+                records=records,
+                columns=self._MARKET_COLUMNS,
+            )
+            
+            # Command tag "INSERT 0 <n>" counts inserted + actually updated rows
+            status = await conn.execute(f"""
+                INSERT INTO predictions_silver.markets ({columns})
+                SELECT {columns} FROM {temp_table}
+                {self._MARKET_UPSERT_SET}
+            """)
+        
+        return int(status.split()[-1])
+    
+    async def _executemany_upsert_markets(
+        self,
+        conn,
+        records: list[tuple],
+        batch_size: int,
+    ) -> tuple[int, int]:
+        """Fallback path: executemany per batch, row-by-row for a failing batch."""
+        placeholders = ", ".join(
+            f"${i}::jsonb" if col in ("outcomes", "extra_data") else f"${i}"
+            for i, col in enumerate(self._MARKET_COLUMNS, start=1)
+        )
+        query = f"""
+            INSERT INTO predictions_silver.markets ({", ".join(self._MARKET_COLUMNS)})
+            VALUES ({placeholders})
+            {self._MARKET_UPSERT_SET}
+        """
+        
+        upserted = 0
+        errors = 0
+        for i in range(0, len(records), batch_size):
+            batch = records[i:i + batch_size]
+            try:
+                await conn.executemany(query, batch)
+                upserted += len(batch)
+                logger.debug(
+                    "Upserted market batch",
+                    batch=i // batch_size + 1,
+                    total_batches=(len(records) + batch_size - 1) // batch_size,
+                    batch_size=len(batch),
+                )
+            except Exception as e:
+                logger.error(
+                    "Failed to upsert market batch",
+                    batch_start=i,
+                    batch_size=len(batch),
+                    error=str(e),
+                )
+                # Fall back to individual inserts for this batch
+                for record in batch:
+                    try:
+                        await conn.execute(query, *record)
+                        upserted += 1
+                    except Exception as inner_e:
+                        logger.error(
+                            "Failed to upsert market",
+                            market_id=record[1],  # source_market_id
+                            error=str(inner_e),
+                        )
+                        errors += 1
+        
         return upserted, errors
     
     async def update_market_price(
@@ -597,6 +717,84 @@ class SilverWriter:
         
         return 1 if result else 0
     
+    async def update_market_prices(
+        self,
+        source: DataSource,
+        updates: list[tuple[str, Any, Optional[Any]]],
+        epsilon: float = 0.0,
+    ) -> int:
+        """
+        Bulk variant of update_market_price: one UPDATE ... FROM unnest().
+        
+        Rows whose yes/no price moved by no more than epsilon are left
+        untouched (no new tuple, no WAL), so stored prices lag the source
+        by at most epsilon. The rows that did change are announced to the
+        backend price stream (predictions_ingest.price_events).
+        
+        Args:
+            source: Data source of all updated markets
+            updates: (source_market_id, yes_price, no_price) tuples
+            epsilon: Minimum absolute price change worth writing
+            
+        Returns:
+            Number of markets actually updated
+        """
+        if not updates:
+            return 0
+        
+        # One entry per market (UPDATE ... FROM applies an arbitrary match otherwise)
+        latest = {market_id: (yes, no) for market_id, yes, no in updates if yes is not None}
+        if not latest:
+            return 0
+        
+        db = await get_db()
+        
+        query = """
+            UPDATE predictions_silver.markets m
+            SET
+                yes_price = u.yes_price,
+                no_price = COALESCE(u.no_price, m.no_price),
+                mid_price = COALESCE((u.yes_price + u.no_price) / 2, m.mid_price),
+                last_updated_at = NOW(),
+                update_count = COALESCE(m.update_count, 0) + 1
+            FROM unnest($2::text[], $3::numeric[], $4::numeric[])
+                AS u(source_market_id, yes_price, no_price)
+            WHERE m.source = $1
+              AND m.source_market_id = u.source_market_id
+              AND (
+                  m.yes_price IS NULL
+                  OR abs(m.yes_price - u.yes_price) > $5
+                  OR (u.no_price IS NOT NULL
+                      AND (m.no_price IS NULL OR abs(m.no_price - u.no_price) > $5))
+              )
+            RETURNING
+                m.source_market_id,
+                predictions_silver.market_event_id(m.source, m.source_market_id, m.slug, m.extra_data),
+                m.yes_price::float8,
+                m.no_price::float8
+        """
+        
+        async with db.asyncpg_connection() as conn:
+            changed = await conn.fetch(
+                query,
+                _enum_value(source),
+                list(latest.keys()),
+                [Decimal(str(yes)) for yes, _ in latest.values()],
+                [Decimal(str(no)) if no is not None else None for _, no in latest.values()],
+                Decimal(str(epsilon)),
+            )
+            await notify_prices(conn, _enum_value(source), [tuple(row) for row in changed])
+        
+        updated = len(changed)
+        logger.info(
+            "Bulk updated market prices",
+            source=_enum_value(source),
+            submitted=len(latest),
+            updated=updated,
+            unchanged=len(latest) - updated,
+        )
+        return updated
+    
     # =========================================================================
     # TRADES
     # =========================================================================
@@ -739,7 +937,13 @@ class SilverWriter:
     # =========================================================================
     
     async def insert_price(self, price: PriceSnapshot) -> Optional[int]:
-        """Insert a price snapshot."""
+        """
+        Insert a price snapshot.
+        
+        A snapshot that is already stored unchanged is left alone (returns
+        None), so its ingested_at (migration 027) only moves when the tick
+        actually changes.
+        """
         db = await get_db()
         
         query = """
@@ -756,7 +960,10 @@ class SilverWriter:
                 no_price = EXCLUDED.no_price,
                 mid_price = EXCLUDED.mid_price,
                 volume_1h = EXCLUDED.volume_1h,
-                trade_count_1h = EXCLUDED.trade_count_1h
+                trade_count_1h = EXCLUDED.trade_count_1h,
+                ingested_at = EXCLUDED.ingested_at
+            WHERE (prices.yes_price, prices.no_price, prices.mid_price, prices.volume_1h, prices.trade_count_1h)
+                IS DISTINCT FROM (EXCLUDED.yes_price, EXCLUDED.no_price, EXCLUDED.mid_price, EXCLUDED.volume_1h, EXCLUDED.trade_count_1h)
             RETURNING id
         """
         
@@ -778,10 +985,113 @@ class SilverWriter:
             )
     
     async def insert_prices(self, prices: list[PriceSnapshot]) -> int:
-        """Batch insert price snapshots."""
+        """
+        Batch insert price snapshots.
+        
+        COPYs all snapshots into a staging table in one round trip and merges
+        on (source, source_market_id, snapshot_at). Snapshots already stored
+        unchanged (sources re-send overlapping history) are skipped, so they
+        keep their ingested_at. Falls back to per-row insert_price if the
+        COPY path fails.
+        
+        Returns:
+            Number of snapshots inserted or changed
+        """
         if not prices:
             return 0
         
+        # Last snapshot wins per key (a merge cannot touch the same row twice)
+        by_key: dict[tuple, tuple] = {}
+        for p in prices:
+            record = (
+                _enum_value(p.source),
+                p.source_market_id,
+                float(p.yes_price) if p.yes_price else None,
+                float(p.no_price) if p.no_price else None,
+                float(p.mid_price) if p.mid_price else None,
+                float(p.open_price) if p.open_price else None,
+                float(p.high_price) if p.high_price else None,
+                float(p.low_price) if p.low_price else None,
+                float(p.close_price) if p.close_price else None,
+                float(p.volume_1h) if p.volume_1h else None,
+                p.trade_count_1h,
+                p.snapshot_at,
+            )
+            by_key[(record[0], record[1], record[11])] = record
+        records = list(by_key.values())
+        
+        db = await get_db()
+        
+        try:
+            async with db.asyncpg_connection() as conn:
+                temp_table = f"_temp_prices_{id(records)}"
+                
+                async with conn.transaction():
+                    await conn.execute(f"""
+                        CREATE TEMP TABLE {temp_table} (
+                            source TEXT,
+                            source_market_id TEXT,
+                            yes_price NUMERIC,
+                            no_price NUMERIC,
+                            mid_price NUMERIC,
+                            open_price NUMERIC,
+                            high_price NUMERIC,
+                            low_price NUMERIC,
+                            close_price NUMERIC,
+                            volume_1h NUMERIC,
+                            trade_count_1h INTEGER,
+                            snapshot_at TIMESTAMPTZ
+                        ) ON COMMIT DROP
+                    """)
+                    
+                    await conn.copy_records_to_table(
+                        temp_table,
+                        records=records,
+                        columns=[
+                            "source", "source_market_id",
+                            "yes_price", "no_price", "mid_price",
+                            "open_price", "high_price", "low_price", "close_price",
+                            "volume_1h", "trade_count_1h",
+                            "snapshot_at",
+                        ],
+                    )
+                    
+                    status = await conn.execute(f"""
+                        INSERT INTO predictions_silver.prices (
+                            source, source_market_id,
+                            yes_price, no_price, mid_price,
+                            open_price, high_price, low_price, close_price,
+                            volume_1h, trade_count_1h,
+                            snapshot_at
+                        )
+                        SELECT source, source_market_id,
+                               yes_price, no_price, mid_price,
+                               open_price, high_price, low_price, close_price,
+                               volume_1h, trade_count_1h,
+                               snapshot_at
+                        FROM {temp_table}
+                        ON CONFLICT (source, source_market_id, snapshot_at) DO UPDATE SET
+                            yes_price = EXCLUDED.yes_price,
+                            no_price = EXCLUDED.no_price,
+                            mid_price = EXCLUDED.mid_price,
+                            volume_1h = EXCLUDED.volume_1h,
+                            trade_count_1h = EXCLUDED.trade_count_1h,
+                            ingested_at = EXCLUDED.ingested_at
+                        WHERE (prices.yes_price, prices.no_price, prices.mid_price, prices.volume_1h, prices.trade_count_1h)
+                            IS DISTINCT FROM (EXCLUDED.yes_price, EXCLUDED.no_price, EXCLUDED.mid_price, EXCLUDED.volume_1h, EXCLUDED.trade_count_1h)
+                    """)
+            
+            written = int(status.split()[-1])
+            logger.info("Inserted prices", total=len(prices), written=written)
+            return written
+        
+        except Exception as e:
+            logger.warning(
+                "COPY price insert failed, falling back to per-row inserts",
+                count=len(records),
+                error=str(e),
+            )
+        
         count = 0
         for price in prices:
             try:
@@ -0,0 +1,340 @@
+"""
+Partition maintenance for range-partitioned silver tables.
+
+Migration 003 created a fixed set of partitions for predictions_silver.trades
+(monthly) and .prices / .orderbooks (weekly); everything after the last one
+lands in the DEFAULT partition, where partition pruning no longer applies and
+retention means DELETE scans. PartitionManager keeps every managed table
+covered instead:
+
+- ensure(): creates partitions from the first existing bound (or the oldest
+  row in the default partition) through PARTITION_PREMAKE periods ahead,
+  including gaps between existing partitions.
+  A range that already has rows in the default partition is built as a
+  standalone table, the rows are moved into it, and it is attached; empty
+  ranges are created directly as partitions. New ranges continue the
+  cadence of the existing ones (003's weekly partitions start on Tuesdays)
+- expire(): partitions whose whole range is older than the table's
+  retention are detached, then dropped (PARTITION_EXPIRE_MODE=drop) or kept
+  as standalone tables for archiving (detach). A partition is only expired
+  once the rollup fed from it (aggregation.rollups) is final past its range
+
+Each range is handled in its own transaction with a short lock_timeout, so
+a busy table is skipped and retried on the next run rather than blocking
+ingestion.
+"""
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Literal, Optional
+
+import asyncpg
+import structlog
+
+from predictions_ingest.config import get_settings
+from predictions_ingest.database import DatabaseManager, get_db
+
+logger = structlog.get_logger()
+
+Period = Literal["day", "week", "month"]
+
+_SCHEMA = "predictions_silver"
+_IDENTIFIER = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+
+@dataclass(frozen=True)
+class PartitionSpec:
+    """A range-partitioned table kept covered by PartitionManager."""
+
+    table: str                          # unqualified, in predictions_silver
+    column: str                         # partition key (timestamptz)
+    period: Period
+    retention_days: int = 0             # 0 = keep forever
+    rolled_into: Optional[str] = None   # rollup that must be final before expiry
+
+
+def managed_tables() -> list[PartitionSpec]:
+    """Partitioned silver tables with their cadence and configured retention."""
+    s = get_settings()
+    return [
+        PartitionSpec("trades", "traded_at", "month", s.silver_trades_retention_days, rolled_into="trades_1m"),
+        PartitionSpec("prices", "snapshot_at", "week", s.silver_prices_retention_days, rolled_into="prices_1m"),
+        PartitionSpec("orderbooks", "snapshot_at", "week", s.silver_orderbooks_retention_days),
+        PartitionSpec("prices_1m", "bucket_start", "week", s.rollup_1m_retention_days, rolled_into="prices_1h"),
+        PartitionSpec("trades_1m", "bucket_start", "week", s.rollup_1m_retention_days, rolled_into="trades_1h"),
+        PartitionSpec("prices_1h", "bucket_start", "month", s.rollup_1h_retention_days, rolled_into="prices_1d"),
+        PartitionSpec("trades_1h", "bucket_start", "month", s.rollup_1h_retention_days, rolled_into="trades_1d"),
+    ]
+
+
+@dataclass
+class PartitionReport:
+    table: str
+    created: list[str] = field(default_factory=list)
+    moved_rows: int = 0
+    expired: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+
+
+# =============================================================================
+# RANGE ARITHMETIC
+# =============================================================================
+
+def _add_months(dt: datetime, months: int) -> datetime:
+    month = dt.month - 1 + months
+    year = dt.year + month // 12
+    return dt.replace(year=year, month=month % 12 + 1, day=1)
+
+
+def step(bound: datetime, period: Period, n: int = 1) -> datetime:
+    """bound moved n periods (negative = back)."""
+    if period == "month":
+        return _add_months(bound, n)
+    return bound + timedelta(days=n * (7 if period == "week" else 1))
+
+
+def floor_period(ts: datetime, period: Period) -> datetime:
+    """Start of the period containing ts (UTC; ISO weeks start Monday)."""
+    day = ts.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    if period == "month":
+        return day.replace(day=1)
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def partition_name(table: str, lo: datetime, period: Period) -> str:
+    if period == "month":
+        return f"{table}_{lo:%Y_%m}"
+    if period == "week":
+        year, week, _ = lo.isocalendar()
+        return f"{table}_{year}_w{week:02d}"
+    return f"{table}_{lo:%Y_%m_%d}"
+
+
+# =============================================================================
+# MANAGER
+# =============================================================================
+
+class PartitionManager:
+    """Creates, back-fills and expires partitions of managed silver tables."""
+
+    def __init__(self, db: DatabaseManager, specs: Optional[list[PartitionSpec]] = None):
+        self.db = db
+        self.settings = get_settings()
+        self.specs = specs if specs is not None else managed_tables()
+        for spec in self.specs:
+            if not (_IDENTIFIER.match(spec.table) and _IDENTIFIER.match(spec.column)):
+                raise ValueError(f"Invalid partitioned table spec: {spec}")
+
+    async def run(self) -> list[PartitionReport]:
+        """ensure() then expire() for every managed table."""
+        reports = []
+        for spec in self.specs:
+            report = PartitionReport(table=spec.table)
+            try:
+                await self.ensure(spec, report)
+                await self.expire(spec, report)
+            except Exception as e:
+                logger.error("Partition maintenance failed", table=spec.table, error=str(e))
+                report.skipped.append(f"error: {e}")
+            logger.info(
+                "Partition maintenance",
+                table=spec.table,
+                created=len(report.created),
+                moved_rows=report.moved_rows,
+                expired=len(report.expired),
+                skipped=len(report.skipped),
+            )
+            reports.append(report)
+        return reports
+
+    # ------------------------------------------------------------------ catalog
+
+    async def _partitions(self, conn: asyncpg.Connection, spec: PartitionSpec) -> list[asyncpg.Record]:
+        """(name, lo, hi) of the non-default partitions, by lo."""
+        return await conn.fetch(
+            r"""
+            SELECT c.relname AS name,
+                   (m)[1]::timestamptz AS lo,
+                   (m)[2]::timestamptz AS hi
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            JOIN pg_class p ON p.oid = i.inhparent
+            JOIN pg_namespace n ON n.oid = p.relnamespace
+            CROSS JOIN LATERAL regexp_match(
+                pg_get_expr(c.relpartbound, c.oid),
+                'FROM \(''([^'']+)''\) TO \(''([^'']+)''\)'
+            ) AS m
+            WHERE n.nspname = $1 AND p.relname = $2
+              AND m IS NOT NULL                 -- DEFAULT partition has no bounds
+            ORDER BY lo
+            """,
+            _SCHEMA, spec.table,
+        )
+
+    async def _relation_exists(self, conn: asyncpg.Connection, name: str) -> bool:
+        return await conn.fetchval("SELECT to_regclass($1) IS NOT NULL", f"{_SCHEMA}.{name}")
+
+    # ------------------------------------------------------------------- ensure
+
+    async def ensure(self, spec: PartitionSpec, report: PartitionReport) -> None:
+        """Cover [retention cutoff or oldest default row, now + premake) with partitions."""
+        now = datetime.now(timezone.utc)
+        default = f"{_SCHEMA}.{spec.table}_default"
+
+        async with self.db.asyncpg_connection() as conn:
+            parts = await self._partitions(conn, spec)
+            has_default = await self._relation_exists(conn, f"{spec.table}_default")
+            oldest_default = None
+            if has_default:
+                oldest_default = await conn.fetchval(f"SELECT MIN({spec.column}) FROM {default}")
+
+        cutoff = now - timedelta(days=spec.retention_days) if spec.retention_days else None
+        horizon = step(floor_period(now, spec.period), spec.period, self.settings.partition_premake + 1)
+
+        ranges: list[tuple[datetime, datetime]] = []
+        if parts:
+            # Backwards from the first partition over rows stuck in default
+            lo_bound = parts[0]["lo"]
+            floor = max(oldest_default, cutoff) if oldest_default and cutoff else oldest_default
+            while floor is not None and floor < lo_bound:
+                ranges.append((step(lo_bound, spec.period, -1), lo_bound))
+                lo_bound = ranges[-1][0]
+            # Forwards from the first one, filling any gap a skipped range
+            # left between existing partitions
+            lo = parts[0]["lo"]
+            for part in parts:
+                while lo < part["lo"]:
+                    ranges.append((lo, min(step(lo, spec.period), part["lo"])))
+                    lo = ranges[-1][1]
+                lo = max(lo, part["hi"])
+        else:
+            start = min(filter(None, [oldest_default, now]))
+            if cutoff:
+                start = max(start, cutoff)
+            lo = floor_period(start, spec.period)
+        while lo < horizon:
+            ranges.append((lo, step(lo, spec.period)))
+            lo = ranges[-1][1]
+
+        for lo, hi in sorted(ranges):
+            if cutoff and hi <= cutoff:
+                continue  # expired already; rows (if any) are deleted below
+            name = partition_name(spec.table, lo, spec.period)
+            try:
+                moved = await self._create_partition(spec, name, lo, hi, has_default)
+            except asyncpg.PostgresError as e:
+                # Lock timeout, already created, a check violation: the
+                # transaction rolled back, so just move on to the next range
+                report.skipped.append(f"{name}: {type(e).__name__}")
+                continue
+            report.created.append(name)
+            report.moved_rows += moved
+
+        if has_default and cutoff and oldest_default and oldest_default < cutoff:
+            async with self.db.asyncpg_connection() as conn:
+                if spec.rolled_into:
+                    final = await self._rolled_through(conn, spec)
+                    cutoff = min(cutoff, final) if final else None
+                if cutoff:
+                    await conn.execute(f"DELETE FROM {default} WHERE {spec.column} < $1", cutoff)
+
+    async def _create_partition(
+        self, spec: PartitionSpec, name: str, lo: datetime, hi: datetime, has_default: bool
+    ) -> int:
+        """Create partition [lo, hi); returns rows moved out of the default partition."""
+        parent = f"{_SCHEMA}.{spec.table}"
+        default = f"{_SCHEMA}.{spec.table}_default"
+        bounds = f"FOR VALUES FROM ('{lo.isoformat()}') TO ('{hi.isoformat()}')"
+
+        async with self.db.asyncpg_connection() as conn:
+            async with conn.transaction():
+                await conn.execute(f"SET LOCAL lock_timeout = '{self.settings.partition_lock_timeout_ms}ms'")
+                if has_default:
+                    # Block inserts into the default partition until the new
+                    # partition exists, so no row for [lo, hi) lands there
+                    # between the check below and the CREATE / ATTACH
+                    await conn.execute(f"LOCK TABLE {default} IN SHARE ROW EXCLUSIVE MODE")
+                stuck = has_default and await conn.fetchval(
+                    f"SELECT EXISTS (SELECT 1 FROM {default} WHERE {spec.column} >= $1 AND {spec.column} < $2)",
+                    lo, hi,
+                )
+                if not stuck:
+                    await conn.execute(f"CREATE TABLE {_SCHEMA}.{name} PARTITION OF {parent} {bounds}")
+                    return 0
+
+                await conn.execute(
+                    f"CREATE TABLE {_SCHEMA}.{name} (LIKE {parent} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+                )
+                status = await conn.execute(
+                    f"""
+                    WITH moved AS (
+                        DELETE FROM {default}
+                        WHERE {spec.column} >= $1 AND {spec.column} < $2
+                        RETURNING *
+                    )
+                    INSERT INTO {_SCHEMA}.{name} SELECT * FROM moved
+                    """,
+                    lo, hi,
+                )
+                await conn.execute(f"ALTER TABLE {parent} ATTACH PARTITION {_SCHEMA}.{name} {bounds}")
+                return int(status.split()[-1])
+
+    # ------------------------------------------------------------------- expire
+
+    async def _rolled_through(self, conn: asyncpg.Connection, spec: PartitionSpec) -> Optional[datetime]:
+        """
+        Time before which spec's rows are final in spec.rolled_into: the
+        rollup watermark, or the oldest row ingested after the rollup's
+        ingest cursor (migration 028) and not yet rolled, if earlier.
+        """
+        row = await conn.fetchrow(
+            "SELECT rolled_through, ingested_through FROM predictions_silver.rollup_watermarks WHERE rollup = $1",
+            spec.rolled_into,
+        )
+        if row is None:
+            return None
+        final = row["rolled_through"]
+        if row["ingested_through"] is not None:
+            pending = await conn.fetchval(
+                f"SELECT MIN({spec.column}) FROM {_SCHEMA}.{spec.table} WHERE ingested_at > $1",
+                row["ingested_through"],
+            )
+            if pending is not None:
+                final = min(final, pending)
+        return final
+
+    async def expire(self, spec: PartitionSpec, report: PartitionReport) -> None:
+        """Detach (and drop) partitions entirely older than the retention."""
+        if not spec.retention_days:
+            return
+        cutoff = datetime.now(timezone.utc) - timedelta(days=spec.retention_days)
+        parent = f"{_SCHEMA}.{spec.table}"
+
+        async with self.db.asyncpg_connection() as conn:
+            parts = await self._partitions(conn, spec)
+            final = await self._rolled_through(conn, spec) if spec.rolled_into else None
+
+            for part in parts:
+                if part["hi"] > cutoff:
+                    break
+                if spec.rolled_into and (final is None or final < part["hi"]):
+                    report.skipped.append(f"{part['name']}: not rolled up")
+                    continue
+                try:
+                    async with conn.transaction():
+                        await conn.execute(f"SET LOCAL lock_timeout = '{self.settings.partition_lock_timeout_ms}ms'")
+                        await conn.execute(f"ALTER TABLE {parent} DETACH PARTITION {_SCHEMA}.{part['name']}")
+                        if self.settings.partition_expire_mode == "drop":
+                            await conn.execute(f"DROP TABLE {_SCHEMA}.{part['name']}")
+                except asyncpg.LockNotAvailableError:
+                    report.skipped.append(f"{part['name']}: locked")
+                    continue
+                report.expired.append(part["name"])
+
+
+async def run_partition_maintenance() -> list[PartitionReport]:
+    """Entry point for the scheduler and CLI."""
+    db = await get_db()
+    return await PartitionManager(db).run()
@@ -0,0 +1,65 @@
+"""
+Realtime price-change events for the backend price stream.
+
+After SilverWriter.update_market_prices writes a batch of moved prices, the
+changed rows are announced with Postgres NOTIFY on PRICE_CHANNEL. Every API
+worker LISTENs on it (backend app/services/price_stream.py) and pushes the
+changes to subscribed SSE / WebSocket clients, so clients stop polling.
+
+Only rows that actually changed (beyond PRICE_UPDATE_EPSILON) are sent, in
+compact batches:
+
+    {"s": "kalshi", "t": 1767225600.123,
+     "m": [[source_market_id, event_id, yes_price, no_price], ...]}
+
+event_id is predictions_silver.market_event_id() (migration 019), so clients
+can subscribe per event. A NOTIFY payload is capped at 8000 bytes; larger
+batches are split. The channel name must match the backend. Disabled with
+PRICE_NOTIFY_ENABLED=false.
+"""
+import time
+from typing import Iterable, Iterator, Optional, Sequence
+
+import orjson
+import structlog
+
+from predictions_ingest.config import get_settings
+
+logger = structlog.get_logger()
+
+PRICE_CHANNEL = "cg_prices"
+
+# Postgres rejects payloads of 8000 bytes or more
+MAX_PAYLOAD_BYTES = 7900
+
+PriceChange = tuple[str, Optional[str], Optional[float], Optional[float]]
+
+
+def encode_batches(source: str, changes: Iterable[PriceChange], ts: Optional[float] = None) -> Iterator[str]:
+    """Split changes into NOTIFY payloads below MAX_PAYLOAD_BYTES."""
+    ts = round(time.time() if ts is None else ts, 3)
+    head = orjson.dumps({"s": source, "t": ts})[:-1] + b',"m":['
+    size = len(head) + 2
+    items: list[bytes] = []
+    for change in changes:
+        item = orjson.dumps(change)
+        if items and size + len(item) + 1 > MAX_PAYLOAD_BYTES:
+            yield (head + b",".join(items) + b"]}").decode()
+            items, size = [], len(head) + 2
+        items.append(item)
+        size += len(item) + 1
+    if items:
+        yield (head + b",".join(items) + b"]}").decode()
+
+
+async def notify_prices(conn, source: str, changes: Sequence[PriceChange]) -> int:
+    """NOTIFY the changed prices on conn. Returns payloads sent; never raises."""
+    if not changes or not get_settings().price_notify_enabled:
+        return 0
+    payloads = list(encode_batches(source, changes))
+    try:
+        await conn.executemany("SELECT pg_notify($1, $2)", [(PRICE_CHANNEL, p) for p in payloads])
+    except Exception as e:
+        logger.warning("Price change notify failed", source=source, changes=len(changes), error=str(e))
+        return 0
+    return len(payloads)
@@ -13,6 +13,7 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
+from predictions_ingest.cache_events import publish_snapshot
 from predictions_ingest.config import get_settings
 from predictions_ingest.database import get_db
 from predictions_ingest.ingestion.orchestrator import (
@@ -23,6 +24,8 @@ from predictions_ingest.models import DataSource
 
 # Gold layer aggregation
 from predictions_ingest.aggregation.gold_aggregator import GoldLayerAggregator
+from predictions_ingest.aggregation.rollups import RollupManager
+from predictions_ingest.partitions import run_partition_maintenance
 
 logger = structlog.get_logger()
 
@@ -156,6 +159,43 @@ class IngestionScheduler:
         )
         logger.info("Scheduled gold warm aggregations", interval="15 minutes")
         
+        # Cross-venue match graph: re-matches new/changed titles for arbitrage
+        self.scheduler.add_job(
+            self._run_cross_venue_matching,
+            trigger=IntervalTrigger(
+                minutes=5,
+                start_date=datetime.utcnow().replace(second=0, microsecond=0),
+            ),
+            id="gold_cross_venue",
+            name="Gold Layer: Cross-Venue Matching (5min)",
+            replace_existing=True,
+        )
+        logger.info("Scheduled cross-venue matching", interval="5 minutes")
+        
+        # Silver partitions: at startup, then daily (create ahead, expire old)
+        self.scheduler.add_job(
+            self._run_partition_maintenance,
+            trigger=CronTrigger(hour=2, minute=30),
+            id="silver_partitions",
+            name="Silver Layer: Partition Maintenance",
+            next_run_time=datetime.utcnow(),
+            replace_existing=True,
+        )
+        logger.info("Scheduled partition maintenance", schedule="startup + daily at 02:30 UTC")
+        
+        # Price/trade rollup tiers (1m -> 1h -> 1d)
+        self.scheduler.add_job(
+            self._run_rollups,
+            trigger=IntervalTrigger(
+                minutes=self.settings.rollup_interval_minutes,
+                start_date=datetime.utcnow().replace(second=30, microsecond=0),
+            ),
+            id="silver_rollups",
+            name="Silver Layer: Price/Trade Rollups",
+            replace_existing=True,
+        )
+        logger.info("Scheduled silver rollups", interval=f"{self.settings.rollup_interval_minutes} minutes")
+        
         # Cleanup old snapshots - Daily at 3:00 AM UTC
         self.scheduler.add_job(
             self._cleanup_gold_snapshots,
@@ -180,6 +220,8 @@ class IngestionScheduler:
                 trades=result.trades_inserted,
                 duration=result.duration_seconds,
             )
+            if result.markets_upserted:
+                await publish_snapshot("markets")
         except Exception as e:
             logger.error(
                 "Scheduled static load failed",
@@ -201,6 +243,8 @@ class IngestionScheduler:
                 trades=result.trades_inserted,
                 duration=result.duration_seconds,
             )
+            if result.markets_upserted:
+                await publish_snapshot("markets")
         except Exception as e:
             logger.error(
                 "Scheduled delta load failed",
@@ -268,6 +312,52 @@ class IngestionScheduler:
         except Exception as e:
             logger.error("Scheduled warm aggregations failed", error=str(e))
     
+    async def _run_cross_venue_matching(self):
+        """Execute cross-venue matching (every 5 minutes)."""
+        logger.info("Starting scheduled cross-venue matching")
+        
+        try:
+            if self.gold_aggregator is None:
+                db = await get_db()
+                self.gold_aggregator = GoldLayerAggregator(db)
+            
+            summary = await self.gold_aggregator.run_cross_venue_matching()
+            logger.info(
+                "Completed scheduled cross-venue matching",
+                run_id=str(summary.run_id),
+                status="success" if summary.failed_count == 0 else "failed",
+                total_inserted=summary.total_inserted,
+                total_deleted=summary.total_deleted,
+                duration_s=round(summary.duration_seconds, 3),
+            )
+            if summary.failed_count == 0:
+                await publish_snapshot("cross_venue")
+        except Exception as e:
+            logger.error("Scheduled cross-venue matching failed", error=str(e))
+    
+    async def _run_partition_maintenance(self):
+        """Create upcoming silver partitions and expire old ones."""
+        logger.info("Starting scheduled partition maintenance")
+        
+        try:
+            reports = await run_partition_maintenance()
+            logger.info(
+                "Completed scheduled partition maintenance",
+                created=sum(len(r.created) for r in reports),
+                moved_rows=sum(r.moved_rows for r in reports),
+                expired=sum(len(r.expired) for r in reports),
+            )
+        except Exception as e:
+            logger.error("Scheduled partition maintenance failed", error=str(e))
+    
+    async def _run_rollups(self):
+        """Roll silver prices/trades into the 1m/1h/1d tiers."""
+        try:
+            db = await get_db()
+            await RollupManager(db).run()
+        except Exception as e:
+            logger.error("Scheduled rollups failed", error=str(e))
+    
     async def _cleanup_gold_snapshots(self):
         """Clean up old gold layer snapshots (daily)."""
         logger.info("Starting scheduled gold cleanup")
@@ -4,26 +4,41 @@ Backfill Market History - Populate Gold Layer History Tables
 
 Processes Bronze layer snapshots to create:
 1. market_price_history - OHLCV data for charts (1h, 4h, 1d granularities)
-2. market_trade_activity - Aggregated trade statistics
+2. market_trade_activity - Aggregated trade statistics (1h, 6h, 24h windows)
+
+Markets are split over --workers by a hash of the market id. Each worker
+takes its markets --batch-size at a time and, per batch:
+- streams the snapshots of the whole batch through one server-side cursor
+  ordered by (market, fetched_at); price and volume are extracted from
+  raw_data in SQL, so only four numbers per snapshot cross the wire
+- builds every candle and window of every market in the batch with NumPy
+  grouped reductions (one pass per granularity)
+- COPYs the results into temp tables and merges them into gold, together
+  with the batch's checkpoint rows (migration 022), in one transaction
+
+An interrupted run resumes where it stopped: markets already checkpointed
+for the job are skipped (--restart forgets them). Buckets are UTC aligned
+and the cutoff is floored to a UTC day, so re-runs rewrite the same rows.
 
 Usage:
     python scripts/backfill_market_history.py --days 30 --batch-size 100
-    python scripts/backfill_market_history.py --market-id "0x123..." --platform polymarket
-    python scripts/backfill_market_history.py --backfill-all  # Process all markets
+    python scripts/backfill_market_history.py --market-id "<uuid>"
+    python scripts/backfill_market_history.py --backfill-all --days 0 --workers 8  # Full history
 """
 import argparse
 import asyncio
 import sys
+import time
+import zlib
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from decimal import Decimal
-import json
+from typing import Dict, List, Optional, Sequence
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import asyncpg
+import numpy as np
 import os
 from dotenv import load_dotenv
 
@@ -36,13 +51,13 @@ load_dotenv(env_path)
 class Logger:
     def info(self, msg, **kwargs):
         print(f"[INFO] {msg}", kwargs if kwargs else "")
-    
+
     def debug(self, msg, **kwargs):
         pass  # Skip debug in production
-    
+
     def error(self, msg, **kwargs):
         print(f"[ERROR] {msg}", kwargs if kwargs else "")
-    
+
     def warning(self, msg, **kwargs):
         print(f"[WARN] {msg}", kwargs if kwargs else "")
 
@@ -51,9 +66,9 @@ logger = Logger()
 # Simple Database class
 class Database:
     def __init__(self):
-        self.conn = None
-    
-    async def connect(self):
+        self.pool = None
+
+    async def connect(self, size: int = 1):
         # Build connection string from env
         db_url = os.getenv('DATABASE_URL')
         if not db_url:
@@ -64,117 +79,381 @@ class Database:
             user = os.getenv('POSTGRES_USER')
             password = os.getenv('POSTGRES_PASSWORD')
             sslmode = os.getenv('POSTGRES_SSLMODE', 'require')
-            
+
             db_url = f"postgresql://{user}:{password}@{host}:{port}/{db}?sslmode={sslmode}"
-        
-        self.conn = await asyncpg.connect(db_url)
-    
+
+        # One connection per worker
+        self.pool = await asyncpg.create_pool(db_url, min_size=1, max_size=max(size, 1))
+
     async def close(self):
-        if self.conn:
-            await self.conn.close()
-    
+        if self.pool:
+            await self.pool.close()
+
+    def acquire(self):
+        return self.pool.acquire()
+
     async def fetch(self, query, *args):
-        return await self.conn.fetch(query, *args)
-    
+        return await self.pool.fetch(query, *args)
+
     async def fetch_one(self, query, *args):
-        return await self.conn.fetchrow(query, *args)
-    
+        return await self.pool.fetchrow(query, *args)
+
     async def execute(self, query, *args):
-        return await self.conn.execute(query, *args)
+        return await self.pool.execute(query, *args)
+
+
+# =============================================================================
+# SNAPSHOT EXTRACTION (SQL)
+# =============================================================================
+
+def _num(expr: str) -> str:
+    """float8 value of a JSON text field, NULL if it is not a number."""
+    return (
+        f"CASE WHEN ({expr}) ~ '^\\s*[-+]?(\\d+\\.?\\d*|\\.\\d+)([eE][-+]?\\d+)?\\s*$' "
+        f"THEN ({expr})::float8 END"
+    )
+
+
+# Per platform: price of the first (YES) outcome and the volume field
+_PRICE_SQL = f"""
+    CASE s.source
+        WHEN 'polymarket' THEN {_num("s.raw_data->'tokens'->0->>'price'")}
+        -- Kalshi: mid of yes_bid / yes_ask, cents to decimal
+        WHEN 'kalshi' THEN (
+            NULLIF({_num("s.raw_data->>'yes_bid'")}, 0)
+            + NULLIF({_num("s.raw_data->>'yes_ask'")}, 0)
+        ) / 200
+        WHEN 'limitless' THEN {_num("s.raw_data->'outcome_prices'->>0")}
+        WHEN 'opiniontrade' THEN {_num("s.raw_data->>'marketValue'")}
+    END"""
+
+_VOLUME_SQL = f"""
+    CASE s.source
+        WHEN 'polymarket' THEN COALESCE(
+            NULLIF({_num("s.raw_data->>'volume'")}, 0),
+            {_num("s.raw_data->>'volume24hr'")}
+        )
+        WHEN 'kalshi' THEN {_num("s.raw_data->>'volume'")}
+        WHEN 'limitless' THEN {_num("s.raw_data->>'liquidityParameter'")}
+    END"""
+
+# $1/$2: sources / source_market_ids of the batch, $3: cutoff
+SNAPSHOTS_SQL = f"""
+    SELECT
+        k.idx::float8,
+        extract(epoch FROM s.fetched_at)::float8,
+        x.price,
+        COALESCE(x.volume, 0)
+    FROM unnest($1::text[], $2::text[]) WITH ORDINALITY AS k(source, source_market_id, idx)
+    JOIN predictions_bronze.market_snapshots s
+      ON s.source = k.source
+     AND s.source_market_id = k.source_market_id
+    CROSS JOIN LATERAL (
+        SELECT {_PRICE_SQL} AS price, {_VOLUME_SQL} AS volume
+    ) x
+    WHERE s.fetched_at >= $3
+      AND x.price IS NOT NULL
+    ORDER BY k.idx, s.fetched_at
+"""
+
+
+# =============================================================================
+# CANDLES AND WINDOWS (NumPy)
+# =============================================================================
+
+GRANULARITIES: Dict[str, int] = {"1h": 3600, "4h": 4 * 3600, "1d": 86400}
+WINDOW_HOURS = (1, 6, 24)
+
+
+def _groups(market: np.ndarray, ts: np.ndarray, width: int):
+    """Bucket starts and the [start, end) row ranges of each (market, bucket)."""
+    bucket = np.floor(ts / width) * width
+    n = len(ts)
+    change = np.empty(n, dtype=bool)
+    change[0] = True
+    change[1:] = (market[1:] != market[:-1]) | (bucket[1:] != bucket[:-1])
+    starts = np.flatnonzero(change)
+    ends = np.append(starts[1:], n)
+    return bucket[starts], starts, ends
+
+
+def compute_candles(market: np.ndarray, ts: np.ndarray, price: np.ndarray, volume: np.ndarray, width: int) -> Dict[str, np.ndarray]:
+    """OHLCV per (market, bucket); rows must be sorted by (market, ts)."""
+    period_start, starts, ends = _groups(market, ts, width)
+    total = np.add.reduceat(volume, starts)
+    weighted = np.add.reduceat(price * volume, starts)
+    close = price[ends - 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vwap = np.where(total > 0, weighted / total, close)
+    return {
+        "market": market[starts],
+        "period_start": period_start,
+        "period_end": period_start + width,
+        "open": price[starts],
+        "high": np.maximum.reduceat(price, starts),
+        "low": np.minimum.reduceat(price, starts),
+        "close": close,
+        "volume": total,
+        "trade_count": ends - starts,
+        "vwap": vwap,
+    }
+
+
+def compute_windows(market: np.ndarray, ts: np.ndarray, price: np.ndarray, volume: np.ndarray, width: int) -> Dict[str, np.ndarray]:
+    """Trade statistics per (market, window) with any volume."""
+    window_start, starts, ends = _groups(market, ts, width)
+    traded = volume != 0
+    total = np.add.reduceat(np.where(traded, volume, 0.0), starts)
+    trades = np.add.reduceat(traded.astype(np.int64), starts)
+    largest = np.maximum.reduceat(np.where(traded, volume, -np.inf), starts)
+
+    price_start = price[starts]
+    price_end = price[ends - 1]
+    moved = (price_start != 0) & (price_end != 0)
+    change = np.where(moved, price_end - price_start, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change_pct = np.where(moved & (price_start > 0), change / price_start * 100, 0.0)
+        avg = np.where(trades > 0, total / trades, 0.0)
+
+    keep = total > 0  # Only windows with activity
+    out = {
+        "market": market[starts],
+        "window_start": window_start,
+        "window_end": window_start + width,
+        "total_volume": total,
+        # Snapshots carry no trade sides: same 60/40 estimate as before
+        "buy_volume": total * 0.6,
+        "sell_volume": total * 0.4,
+        "total_trades": trades,
+        "buy_trades": np.floor(trades * 0.6).astype(np.int64),
+        "sell_trades": np.floor(trades * 0.4).astype(np.int64),
+        "avg_trade_size": avg,
+        "max_trade_size": np.where(trades > 0, largest, 0.0),
+        "price_at_start": price_start,
+        "price_at_end": price_end,
+        "price_change": change,
+        # NUMERIC(8,2)
+        "price_change_pct": np.clip(change_pct, -999999.99, 999999.99),
+    }
+    return {k: v[keep] for k, v in out.items()}
+
+
+def _records(columns: Dict[str, np.ndarray], names: Sequence[str], *constants) -> List[tuple]:
+    """Rows for copy_records_to_table: constants first, then the named columns."""
+    lists = [columns[name].tolist() for name in names]
+    n = len(lists[0]) if lists else 0
+    return list(zip(*([c] * n for c in constants), *lists))
+
+
+# =============================================================================
+# GOLD WRITES (COPY + merge)
+# =============================================================================
+
+_CANDLE_COLUMNS = (
+    "market", "period_start", "period_end", "open", "high", "low", "close",
+    "volume", "trade_count", "vwap",
+)
+_WINDOW_COLUMNS = (
+    "market", "window_start", "window_end",
+    "total_volume", "buy_volume", "sell_volume",
+    "total_trades", "buy_trades", "sell_trades",
+    "avg_trade_size", "max_trade_size",
+    "price_at_start", "price_at_end", "price_change", "price_change_pct",
+)
+
+_TEMP_TABLES_SQL = """
+    CREATE TEMP TABLE _backfill_candles (
+        granularity text, market bigint, period_start float8, period_end float8,
+        open float8, high float8, low float8, close float8,
+        volume float8, trade_count int, vwap float8
+    ) ON COMMIT DROP;
+    CREATE TEMP TABLE _backfill_windows (
+        window_hours int, market bigint, window_start float8, window_end float8,
+        total_volume float8, buy_volume float8, sell_volume float8,
+        total_trades int, buy_trades int, sell_trades int,
+        avg_trade_size float8, max_trade_size float8,
+        price_at_start float8, price_at_end float8, price_change float8, price_change_pct float8
+    ) ON COMMIT DROP;
+"""
+
+# $1/$2/$3: market_ids / sources / source_market_ids of the batch
+_BATCH_KEYS = "unnest($1::uuid[], $2::text[], $3::text[]) WITH ORDINALITY AS k(market_id, source, source_market_id, idx)"
+
+_MERGE_CANDLES_SQL = f"""
+    INSERT INTO predictions_gold.market_price_history (
+        market_id, source, source_market_id, granularity,
+        period_start, period_end,
+        open_price, high_price, low_price, close_price,
+        volume, trade_count, vwap
+    )
+    SELECT
+        k.market_id, k.source, k.source_market_id, c.granularity,
+        to_timestamp(c.period_start), to_timestamp(c.period_end),
+        c.open, c.high, c.low, c.close,
+        c.volume, c.trade_count, c.vwap
+    FROM _backfill_candles c
+    JOIN {_BATCH_KEYS} ON k.idx = c.market
+    ON CONFLICT (source_market_id, period_start, granularity)
+    DO UPDATE SET
+        open_price = EXCLUDED.open_price,
+        high_price = EXCLUDED.high_price,
+        low_price = EXCLUDED.low_price,
+        close_price = EXCLUDED.close_price,
+        volume = EXCLUDED.volume,
+        trade_count = EXCLUDED.trade_count,
+        vwap = EXCLUDED.vwap
+"""
+
+_MERGE_WINDOWS_SQL = f"""
+    INSERT INTO predictions_gold.market_trade_activity (
+        snapshot_timestamp, market_id, source, source_market_id,
+        window_start, window_end, window_hours,
+        total_volume, buy_volume, sell_volume,
+        total_trades, buy_trades, sell_trades,
+        avg_trade_size, max_trade_size,
+        price_at_start, price_at_end, price_change, price_change_pct,
+        unique_traders, new_traders
+    )
+    SELECT
+        to_timestamp(w.window_end), k.market_id, k.source, k.source_market_id,
+        to_timestamp(w.window_start), to_timestamp(w.window_end), w.window_hours,
+        w.total_volume, w.buy_volume, w.sell_volume,
+        w.total_trades, w.buy_trades, w.sell_trades,
+        w.avg_trade_size, w.max_trade_size,
+        w.price_at_start, w.price_at_end, w.price_change, w.price_change_pct,
+        0, 0  -- Not available from snapshots
+    FROM _backfill_windows w
+    JOIN {_BATCH_KEYS} ON k.idx = w.market
+    ON CONFLICT (source_market_id, window_hours, snapshot_timestamp)
+    DO UPDATE SET
+        window_start = EXCLUDED.window_start,
+        window_end = EXCLUDED.window_end,
+        total_volume = EXCLUDED.total_volume,
+        buy_volume = EXCLUDED.buy_volume,
+        sell_volume = EXCLUDED.sell_volume,
+        total_trades = EXCLUDED.total_trades,
+        buy_trades = EXCLUDED.buy_trades,
+        sell_trades = EXCLUDED.sell_trades,
+        avg_trade_size = EXCLUDED.avg_trade_size,
+        max_trade_size = EXCLUDED.max_trade_size,
+        price_at_start = EXCLUDED.price_at_start,
+        price_at_end = EXCLUDED.price_at_end,
+        price_change = EXCLUDED.price_change,
+        price_change_pct = EXCLUDED.price_change_pct
+"""
+
+_CHECKPOINT_SQL = """
+    INSERT INTO predictions_gold.backfill_checkpoints (job, source, source_market_id, snapshots)
+    SELECT $1, k.source, k.source_market_id, k.snapshots
+    FROM unnest($2::text[], $3::text[], $4::int[]) AS k(source, source_market_id, snapshots)
+    ON CONFLICT (job, source, source_market_id) DO UPDATE SET
+        snapshots = EXCLUDED.snapshots,
+        completed_at = NOW()
+"""
 
 
 class MarketHistoryBackfill:
     """Backfills market price history and trade activity from Bronze snapshots."""
-    
-    def __init__(self, db: Database):
+
+    def __init__(self, db: Database, workers: int = 4, fetch_rows: int = 50_000):
         self.db = db
+        self.workers = max(workers, 1)
+        self.fetch_rows = fetch_rows
         self.stats = {
             "markets_processed": 0,
+            "markets_skipped": 0,
+            "snapshots_read": 0,
             "price_history_inserted": 0,
             "trade_activity_inserted": 0,
             "errors": 0,
         }
-    
+
     async def backfill_all_markets(
-        self, 
+        self,
         days: int = 30,
         batch_size: int = 100,
-        platform: Optional[str] = None
+        platform: Optional[str] = None,
+        job: Optional[str] = None,
+        restart: bool = False,
     ):
         """
         Backfill history for all markets from Bronze snapshots.
-        
+
         Args:
-            days: Number of days of history to process
-            batch_size: Markets to process in each batch
+            days: Number of days of history to process (0 = all)
+            batch_size: Markets per cursor / COPY batch
             platform: Filter by platform (polymarket, kalshi, limitless)
+            job: Checkpoint key; defaults to one per platform and days
+            restart: Forget the job's checkpoints and process every market
         """
+        job = job or f"history:{platform or 'all'}:{days}d"
         logger.info(
             "Starting backfill for all markets",
             days=days,
             batch_size=batch_size,
-            platform=platform
+            platform=platform,
+            workers=self.workers,
+            job=job,
         )
-        
-        # Get all markets from silver
+
+        if restart:
+            await self.db.execute(
+                "DELETE FROM predictions_gold.backfill_checkpoints WHERE job = $1", job
+            )
+
+        # Markets of silver not yet checkpointed for this job
         query = """
-            SELECT DISTINCT 
-                id as market_id,
-                source,
-                source_market_id,
-                slug as market_slug,
-                title as market_title
-            FROM predictions_silver.markets
-            WHERE 1=1
+            SELECT DISTINCT ON (m.source_market_id)
+                m.id AS market_id,
+                m.source,
+                m.source_market_id
+            FROM predictions_silver.markets m
+            WHERE NOT EXISTS (
+                SELECT 1 FROM predictions_gold.backfill_checkpoints c
+                WHERE c.job = $1
+                  AND c.source = m.source
+                  AND c.source_market_id = m.source_market_id
+            )
         """
-        params = []
-        
+        params: list = [job]
+
         if platform:
-            query += " AND source = $1"
+            query += " AND m.source = $2"
             params.append(platform)
-        
-        query += " ORDER BY source, market_id"
-        
+
+        # Gold history is keyed by source_market_id alone
+        query += " ORDER BY m.source_market_id, m.source"
+
         markets = await self.db.fetch(query, *params)
-        total_markets = len(markets)
-        
-        logger.info(f"Found {total_markets} markets to backfill")
-        
-        # Process in batches
-        for i in range(0, total_markets, batch_size):
-            batch = markets[i:i + batch_size]
-            logger.info(
-                f"Processing batch {i // batch_size + 1}/{(total_markets + batch_size - 1) // batch_size}",
-                markets_in_batch=len(batch)
-            )
-            
-            for market in batch:
-                try:
-                    await self.backfill_market(
-                        market_id=market["market_id"],
-                        source=market["source"],
-                        source_market_id=market["source_market_id"],
-                        days=days
-                    )
-                    self.stats["markets_processed"] += 1
-                    
-                    if self.stats["markets_processed"] % 50 == 0:
-                        logger.info("Progress update", **self.stats)
-                        
-                except Exception as e:
-                    logger.error(
-                        "Failed to backfill market",
-                        market_id=market["market_id"],
-                        error=str(e)
-                    )
-                    self.stats["errors"] += 1
-            
-            # Small delay between batches
-            await asyncio.sleep(0.1)
-        
-        logger.info("Backfill complete", **self.stats)
+        done = await self.db.fetch_one(
+            "SELECT COUNT(*) AS n FROM predictions_gold.backfill_checkpoints WHERE job = $1", job
+        )
+        self.stats["markets_skipped"] = done["n"]
+
+        logger.info(
+            f"Found {len(markets)} markets to backfill",
+            already_done=self.stats["markets_skipped"],
+        )
+
+        # Partition by market hash: each worker owns a fixed share
+        shares: List[list] = [[] for _ in range(self.workers)]
+        for market in markets:
+            key = f"{market['source']}:{market['source_market_id']}".encode()
+            shares[zlib.crc32(key) % self.workers].append(market)
+
+        started = time.monotonic()
+        await asyncio.gather(*(
+            self._run_worker(n, share, days, batch_size, job)
+            for n, share in enumerate(shares)
+        ))
+
+        logger.info(
+            "Backfill complete",
+            duration_s=round(time.monotonic() - started, 1),
+            **self.stats,
+        )
         return self.stats
-    
+
     async def backfill_market(
         self,
         market_id: str,
@@ -183,448 +462,138 @@ class MarketHistoryBackfill:
         days: int = 30
     ):
         """
-        Backfill history for a single market.
-        
+        Backfill history for a single market (not checkpointed).
+
         Args:
             market_id: UUID from silver.markets
             source: Platform (polymarket, kalshi, limitless)
             source_market_id: Original market ID from platform
-            days: Days of history to process
-        """
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-        
-        # Fetch Bronze snapshots for this market
-        query = """
-            SELECT 
-                fetched_at,
-                raw_data,
-                content_hash
-            FROM predictions_bronze.market_snapshots
-            WHERE source = $1
-              AND source_market_id = $2
-              AND fetched_at >= $3
-            ORDER BY fetched_at ASC
+            days: Days of history to process (0 = all)
         """
-        
-        snapshots = await self.db.fetch(
-            query,
-            source,
-            source_market_id,
-            cutoff_date
-        )
-        
-        if not snapshots:
-            logger.debug(f"No snapshots found for {source}:{source_market_id}")
-            return
-        
-        logger.debug(
-            f"Processing {len(snapshots)} snapshots for {source}:{source_market_id}"
-        )
-        
-        # Generate price history (OHLCV)
-        await self._generate_price_history(
-            market_id=market_id,
-            source=source,
-            source_market_id=source_market_id,
-            snapshots=snapshots
-        )
-        
-        # Generate trade activity
-        await self._generate_trade_activity(
-            market_id=market_id,
-            source=source,
-            source_market_id=source_market_id,
-            snapshots=snapshots
-        )
-    
-    async def _generate_price_history(
-        self,
-        market_id: str,
-        source: str,
-        source_market_id: str,
-        snapshots: List[Dict]
-    ):
-        """Generate OHLCV data from snapshots."""
-        
-        # Parse snapshots into price/volume data points
-        data_points = []
-        for snap in snapshots:
-            raw = snap["raw_data"]
-            timestamp = snap["fetched_at"]
-            
-            # Extract price and volume based on platform
-            price, volume = self._extract_price_volume(raw, source)
-            
-            if price is not None:
-                data_points.append({
-                    "timestamp": timestamp,
-                    "price": price,
-                    "volume": volume or 0
-                })
-        
-        if not data_points:
-            return
-        
-        # Generate OHLCV for multiple granularities
-        for granularity in ["1h", "4h", "1d"]:
-            ohlcv_data = self._compute_ohlcv(data_points, granularity)
-            
-            # Insert into market_price_history
-            for candle in ohlcv_data:
-                await self._insert_price_history(
-                    market_id=market_id,
-                    source=source,
-                    source_market_id=source_market_id,
-                    granularity=granularity,
-                    **candle
+        market = {"market_id": market_id, "source": source, "source_market_id": source_market_id}
+        await self._run_batch([market], self._cutoff(days), job=None)
+
+    @staticmethod
+    def _cutoff(days: int) -> datetime:
+        # Day-aligned, so the first candle of every granularity is complete
+        if days <= 0:
+            return datetime(1970, 1, 1, tzinfo=timezone.utc)
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        return cutoff.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    async def _run_worker(self, worker: int, markets: list, days: int, batch_size: int, job: str):
+        cutoff = self._cutoff(days)
+        for i in range(0, len(markets), batch_size):
+            batch = markets[i:i + batch_size]
+            try:
+                await self._run_batch(batch, cutoff, job)
+            except Exception as e:
+                # Not checkpointed: retried on the next run
+                logger.error(
+                    "Failed to backfill batch",
+                    worker=worker,
+                    first_market=batch[0]["source_market_id"],
+                    markets=len(batch),
+                    error=str(e),
                 )
-                self.stats["price_history_inserted"] += 1
-    
-    async def _generate_trade_activity(
-        self,
-        market_id: str,
-        source: str,
-        source_market_id: str,
-        snapshots: List[Dict]
-    ):
-        """Generate trade activity aggregates from snapshots."""
-        
-        # Group snapshots by time windows (1h, 6h, 24h)
-        for window_hours in [1, 6, 24]:
-            window_duration = timedelta(hours=window_hours)
-            
-            # Group snapshots into windows
-            windows = self._group_by_time_window(snapshots, window_duration)
-            
-            for window_start, window_snaps in windows:
-                window_end = window_start + window_duration
-                
-                # Calculate aggregates for this window
-                stats = self._calculate_window_stats(window_snaps, source)
-                
-                if stats["total_volume"] > 0:  # Only insert if there's activity
-                    await self._insert_trade_activity(
-                        market_id=market_id,
-                        source=source,
-                        source_market_id=source_market_id,
-                        window_start=window_start,
-                        window_end=window_end,
-                        window_hours=window_hours,
-                        **stats
-                    )
-                    self.stats["trade_activity_inserted"] += 1
-    
-    def _extract_price_volume(self, raw_data: Dict, source: str) -> Tuple[Optional[float], Optional[float]]:
-        """Extract price and volume from raw JSON based on platform."""
-        
-        try:
-            if source == "polymarket":
-                # Polymarket: tokens array with yes/no outcomes
-                tokens = raw_data.get("tokens", [])
-                if tokens:
-                    # Use first token (usually YES)
-                    token = tokens[0]
-                    price = token.get("price")
-                    volume = raw_data.get("volume", 0) or raw_data.get("volume24hr", 0)
-                    return (float(price), float(volume))
-            
-            elif source == "kalshi":
-                # Kalshi: yes_bid, yes_ask
-                yes_bid = raw_data.get("yes_bid")
-                yes_ask = raw_data.get("yes_ask")
-                if yes_bid and yes_ask:
-                    price = (float(yes_bid) + float(yes_ask)) / 2 / 100  # Convert cents to decimal
-                    volume = raw_data.get("volume", 0) or 0
-                    return (price, float(volume))
-            
-            elif source == "limitless":
-                # Limitless: outcome_prices array
-                outcome_prices = raw_data.get("outcome_prices", [])
-                if outcome_prices:
-                    price = outcome_prices[0]  # First outcome
-                    volume = raw_data.get("liquidityParameter", 0) or 0
-                    return (float(price), float(volume))
-            
-            elif source == "opiniontrade":
-                # OpinionTrade: marketValue
-                market_value = raw_data.get("marketValue")
-                if market_value is not None:
-                    price = float(market_value)
-                    return (price, 0)
-        
-        except (KeyError, TypeError, ValueError) as e:
-            logger.debug(f"Failed to extract price/volume: {e}")
-        
-        return (None, None)
-    
-    def _compute_ohlcv(self, data_points: List[Dict], granularity: str) -> List[Dict]:
-        """Compute OHLCV candles from data points."""
-        
-        # Determine time bucket size
-        if granularity == "1h":
-            bucket_size = timedelta(hours=1)
-        elif granularity == "4h":
-            bucket_size = timedelta(hours=4)
-        elif granularity == "1d":
-            bucket_size = timedelta(days=1)
-        else:
-            raise ValueError(f"Invalid granularity: {granularity}")
-        
-        # Group points into buckets
-        buckets = {}
-        for point in data_points:
-            # Round down to bucket start
-            timestamp = point["timestamp"]
-            if granularity == "1d":
-                bucket_start = timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
-            elif granularity == "4h":
-                hour = (timestamp.hour // 4) * 4
-                bucket_start = timestamp.replace(hour=hour, minute=0, second=0, microsecond=0)
-            else:  # 1h
-                bucket_start = timestamp.replace(minute=0, second=0, microsecond=0)
-            
-            if bucket_start not in buckets:
-                buckets[bucket_start] = []
-            buckets[bucket_start].append(point)
-        
-        # Compute OHLCV for each bucket
-        ohlcv_data = []
-        for bucket_start, points in sorted(buckets.items()):
-            prices = [p["price"] for p in points]
-            volumes = [p["volume"] for p in points]
-            
-            ohlcv_data.append({
-                "period_start": bucket_start,
-                "period_end": bucket_start + bucket_size,
-                "open_price": prices[0],
-                "high_price": max(prices),
-                "low_price": min(prices),
-                "close_price": prices[-1],
-                "volume": sum(volumes),
-                "trade_count": len(points),
-                "vwap": sum(p["price"] * p["volume"] for p in points) / sum(volumes) if sum(volumes) > 0 else prices[-1]
-            })
-        
-        return ohlcv_data
-    
-    def _group_by_time_window(
-        self, 
-        snapshots: List[Dict], 
-        window_duration: timedelta
-    ) -> List[Tuple[datetime, List[Dict]]]:
-        """Group snapshots by time windows."""
-        
-        if not snapshots:
-            return []
-        
-        # Get time range
-        start_time = min(s["fetched_at"] for s in snapshots)
-        end_time = max(s["fetched_at"] for s in snapshots)
-        
-        # Create windows
-        windows = []
-        current = start_time.replace(minute=0, second=0, microsecond=0)
-        
-        while current < end_time:
-            window_end = current + window_duration
-            window_snaps = [
-                s for s in snapshots 
-                if current <= s["fetched_at"] < window_end
-            ]
-            
-            if window_snaps:
-                windows.append((current, window_snaps))
-            
-            current = window_end
-        
-        return windows
-    
-    def _calculate_window_stats(self, snapshots: List[Dict], source: str) -> Dict:
-        """Calculate trade statistics for a time window."""
-        
-        volumes = []
-        prices_start = []
-        prices_end = []
-        
-        for snap in snapshots:
-            price, volume = self._extract_price_volume(snap["raw_data"], source)
-            if price is not None:
-                if not prices_start:
-                    prices_start.append(price)
-                prices_end = [price]  # Keep updating to last
-                if volume:
-                    volumes.append(volume)
-        
-        total_volume = sum(volumes)
-        price_start = prices_start[0] if prices_start else None
-        price_end = prices_end[0] if prices_end else None
-        
-        price_change = 0
-        price_change_pct = 0
-        if price_start and price_end:
-            price_change = price_end - price_start
-            price_change_pct = (price_change / price_start * 100) if price_start > 0 else 0
-        
-        return {
-            "total_volume": total_volume,
-            "buy_volume": total_volume * 0.6,  # Estimate
-            "sell_volume": total_volume * 0.4,  # Estimate
-            "total_trades": len(volumes),
-            "buy_trades": int(len(volumes) * 0.6),
-            "sell_trades": int(len(volumes) * 0.4),
-            "avg_trade_size": total_volume / len(volumes) if volumes else 0,
-            "max_trade_size": max(volumes) if volumes else 0,
-            "price_at_start": price_start,
-            "price_at_end": price_end,
-            "price_change": price_change,
-            "price_change_pct": price_change_pct,
-            "unique_traders": 0,  # Not available from snapshots
-            "new_traders": 0,
-            "recent_trades": []  # Would need actual trade data
-        }
-    
-    async def _insert_price_history(
-        self,
-        market_id: str,
-        source: str,
-        source_market_id: str,
-        granularity: str,
-        period_start: datetime,
-        period_end: datetime,
-        open_price: float,
-        high_price: float,
-        low_price: float,
-        close_price: float,
-        volume: float,
-        trade_count: int,
-        vwap: float
-    ):
-        """Insert price history record (with conflict handling)."""
-        
-        query = """
-            INSERT INTO predictions_gold.market_price_history (
-                market_id, source, source_market_id, granularity,
-                period_start, period_end,
-                open_price, high_price, low_price, close_price,
-                volume, trade_count, vwap
-            ) VALUES (
-                $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13
-            )
-            ON CONFLICT (source_market_id, period_start, granularity) 
-            DO UPDATE SET
-                open_price = EXCLUDED.open_price,
-                high_price = EXCLUDED.high_price,
-                low_price = EXCLUDED.low_price,
-                close_price = EXCLUDED.close_price,
-                volume = EXCLUDED.volume,
-                trade_count = EXCLUDED.trade_count,
-                vwap = EXCLUDED.vwap
-        """
-        
-        await self.db.execute(
-            query,
-            market_id,
-            source,
-            source_market_id,
-            granularity,
-            period_start,
-            period_end,
-            open_price,
-            high_price,
-            low_price,
-            close_price,
-            volume,
-            trade_count,
-            vwap
-        )
-    
-    async def _insert_trade_activity(
-        self,
-        market_id: str,
-        source: str,
-        source_market_id: str,
-        window_start: datetime,
-        window_end: datetime,
-        window_hours: int,
-        total_volume: float,
-        buy_volume: float,
-        sell_volume: float,
-        total_trades: int,
-        buy_trades: int,
-        sell_trades: int,
-        avg_trade_size: float,
-        max_trade_size: float,
-        price_at_start: Optional[float],
-        price_at_end: Optional[float],
-        price_change: float,
-        price_change_pct: float,
-        unique_traders: int,
-        new_traders: int,
-        recent_trades: List[Dict]
-    ):
-        """Insert trade activity record."""
-        
-        query = """
-            INSERT INTO predictions_gold.market_trade_activity (
-                market_id, source, source_market_id,
-                window_start, window_end, window_hours,
-                total_volume, buy_volume, sell_volume,
-                total_trades, buy_trades, sell_trades,
-                avg_trade_size, max_trade_size,
-                price_at_start, price_at_end, price_change, price_change_pct,
-                unique_traders, new_traders, recent_trades
-            ) VALUES (
-                $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12,
-                $13, $14, $15, $16, $17, $18, $19, $20, $21::jsonb
-            )
-            ON CONFLICT (source_market_id, window_hours, snapshot_timestamp)
-            DO NOTHING
-        """
-        
-        await self.db.execute(
-            query,
-            market_id, source, source_market_id,
-            window_start, window_end, window_hours,
-            total_volume, buy_volume, sell_volume,
-            total_trades, buy_trades, sell_trades,
-            avg_trade_size, max_trade_size,
-            price_at_start, price_at_end, price_change, price_change_pct,
-            unique_traders, new_traders, json.dumps(recent_trades)
-        )
+                self.stats["errors"] += len(batch)
+                continue
+
+            logger.info(f"Worker {worker}: {min(i + batch_size, len(markets))}/{len(markets)}", **self.stats)
+
+    async def _run_batch(self, batch: list, cutoff: datetime, job: Optional[str]):
+        """Read, aggregate and write one batch of markets in one transaction."""
+        market_ids = [str(m["market_id"]) for m in batch]
+        sources = [m["source"] for m in batch]
+        source_market_ids = [m["source_market_id"] for m in batch]
+
+        async with self.db.acquire() as conn:
+            async with conn.transaction():
+                columns = await self._read_snapshots(conn, sources, source_market_ids, cutoff)
+                candles, windows, counts = await asyncio.to_thread(self._aggregate, columns, len(batch))
+
+                await conn.execute(_TEMP_TABLES_SQL)
+                if candles:
+                    await conn.copy_records_to_table("_backfill_candles", records=candles)
+                    await conn.execute(_MERGE_CANDLES_SQL, market_ids, sources, source_market_ids)
+                if windows:
+                    await conn.copy_records_to_table("_backfill_windows", records=windows)
+                    await conn.execute(_MERGE_WINDOWS_SQL, market_ids, sources, source_market_ids)
+                if job:
+                    await conn.execute(_CHECKPOINT_SQL, job, sources, source_market_ids, counts)
+
+        self.stats["markets_processed"] += len(batch)
+        self.stats["snapshots_read"] += sum(counts)
+        self.stats["price_history_inserted"] += len(candles)
+        self.stats["trade_activity_inserted"] += len(windows)
+
+    async def _read_snapshots(self, conn, sources: List[str], source_market_ids: List[str], cutoff: datetime) -> np.ndarray:
+        """(market idx, epoch, price, volume) rows of the batch, sorted by market and time."""
+        cursor = await conn.cursor(SNAPSHOTS_SQL, sources, source_market_ids, cutoff)
+        chunks = []
+        while True:
+            rows = await cursor.fetch(self.fetch_rows)
+            if not rows:
+                break
+            flat = np.fromiter((v for row in rows for v in row), dtype=np.float64, count=len(rows) * 4)
+            chunks.append(flat.reshape(-1, 4))
+        return np.concatenate(chunks) if chunks else np.empty((0, 4))
+
+    @staticmethod
+    def _aggregate(columns: np.ndarray, n_markets: int):
+        """Candle and window records for every granularity, plus snapshots per market."""
+        market = columns[:, 0].astype(np.int64)
+        counts = np.bincount(market, minlength=n_markets + 1)[1:].tolist()
+        if len(market) == 0:
+            return [], [], counts
+        ts, price, volume = columns[:, 1], columns[:, 2], columns[:, 3]
+
+        candles: List[tuple] = []
+        for granularity, width in GRANULARITIES.items():
+            candles += _records(compute_candles(market, ts, price, volume, width), _CANDLE_COLUMNS, granularity)
+
+        windows: List[tuple] = []
+        for hours in WINDOW_HOURS:
+            windows += _records(compute_windows(market, ts, price, volume, hours * 3600), _WINDOW_COLUMNS, hours)
+
+        return candles, windows, counts
 
 
 async def main():
     parser = argparse.ArgumentParser(description="Backfill market history from Bronze snapshots")
-    parser.add_argument("--days", type=int, default=30, help="Days of history to backfill")
+    parser.add_argument("--days", type=int, default=30, help="Days of history to backfill (0 = all)")
     parser.add_argument("--batch-size", type=int, default=100, help="Markets per batch")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel workers (one connection each)")
     parser.add_argument("--platform", choices=["polymarket", "kalshi", "limitless", "opiniontrade"], help="Filter by platform")
     parser.add_argument("--market-id", help="Backfill specific market ID")
     parser.add_argument("--backfill-all", action="store_true", help="Process all markets")
-    
+    parser.add_argument("--job", help="Checkpoint key (default: per platform and days)")
+    parser.add_argument("--restart", action="store_true", help="Ignore checkpoints of a previous run")
+
     args = parser.parse_args()
-    
+
     # Setup logging (simple)
     logger.info("Starting backfill script")
-    
+
     # Connect to database
     db = Database()
-    await db.connect()
-    
+    await db.connect(size=args.workers)
+
     try:
-        backfiller = MarketHistoryBackfill(db)
-        
+        backfiller = MarketHistoryBackfill(db, workers=args.workers)
+
         if args.market_id:
             # Backfill single market
             # Need to fetch market details first
             market = await db.fetch_one(
-                "SELECT market_id, source, source_market_id FROM predictions_silver.markets WHERE market_id = $1",
+                "SELECT id AS market_id, source, source_market_id FROM predictions_silver.markets WHERE id = $1::uuid",
                 args.market_id
             )
-            
+
             if not market:
                 logger.error(f"Market not found: {args.market_id}")
                 return 1
-            
+
             await backfiller.backfill_market(
                 market_id=market["market_id"],
                 source=market["source"],
@@ -636,16 +605,18 @@ async def main():
             await backfiller.backfill_all_markets(
                 days=args.days,
                 batch_size=args.batch_size,
-                platform=args.platform
+                platform=args.platform,
+                job=args.job,
+                restart=args.restart,
             )
-        
+
         logger.info("Backfill completed successfully", stats=backfiller.stats)
         return 0
-        
+
     except Exception as e:
-        logger.error(f"Backfill failed: {e}", exc_info=True)
+        logger.error(f"Backfill failed: {e}")
         return 1
-    
+
     finally:
         await db.close()
 
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark Dome price fetching: per-market requests vs coalesced batches.
+
+Runs DomeClient.fetch_market_prices_batch over N token IDs (with a share of
+duplicate lookups, as happens when overlapping runs poll the same markets)
+against scripts/mock_dome_server.py in three modes:
+- per-market:  DOME_PRICE_BATCH_ENABLED=false, one request per unique ID
+- batched:     DOME_PRICE_BATCH_ENABLED=true, IDs packed into /market-prices
+- fallback:    batching enabled but the server has no batch endpoint (404)
+
+Usage:
+    python scripts/benchmark_price_fetch.py --markets 5000
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("DOME_API_KEY", "benchmark")
+
+from mock_dome_server import MockDomeServer
+from predictions_ingest.clients.base import RateLimiter
+from predictions_ingest.clients.dome import DomeClient
+from predictions_ingest.config import get_settings
+from predictions_ingest.models import DataSource
+
+
+async def run_mode(
+    name: str,
+    batch_enabled: bool,
+    server: MockDomeServer,
+    base_url: str,
+    token_ids: list[str],
+    concurrency: int,
+) -> dict:
+    settings = get_settings()
+    settings.dome_price_batch_enabled = batch_enabled
+    RateLimiter.reset_shared()
+
+    client = DomeClient(source=DataSource.POLYMARKET)
+    client.BASE_URL = base_url
+    await client.connect()
+    server.reset_counters()
+
+    # Same chunking as PriceFetcher.fetch_prices_batch
+    chunk = concurrency * client.price_batch_size
+    fetched = 0
+    start = time.monotonic()
+    for i in range(0, len(token_ids), chunk):
+        fetched += len(await client.fetch_market_prices_batch(token_ids[i:i + chunk]))
+    elapsed = time.monotonic() - start
+
+    metrics = client.get_metrics()["price_coalescer"]
+    await client.close()
+    return {
+        "mode": name,
+        "elapsed_s": round(elapsed, 2),
+        "prices": fetched,
+        "upstream_requests": server.served,
+        "coalesced": metrics["coalesced"],
+        "429s": server.rejected,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--markets", type=int, default=3000, help="Unique token IDs")
+    parser.add_argument("--duplicate-ratio", type=float, default=0.1,
+                        help="Extra lookups for already-requested IDs")
+    parser.add_argument("--concurrency", type=int, default=75,
+                        help="Concurrent upstream requests (PRICE_FETCH_BATCH_SIZE)")
+    parser.add_argument("--server-qps", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    args = parser.parse_args()
+
+    unique = [f"token-{i}" for i in range(args.markets)]
+    token_ids = unique + random.sample(unique, int(args.markets * args.duplicate_ratio))
+    random.shuffle(token_ids)
+
+    print(f"{len(token_ids)} lookups over {args.markets} markets, "
+          f"mock quota {args.server_qps} QPS, latency {args.latency_ms} ms\n")
+
+    results = []
+    for name, server_batch, client_batch in (
+        ("per-market", True, False),
+        ("batched", True, True),
+        ("fallback", False, True),
+    ):
+        server = MockDomeServer(args.server_qps, args.latency_ms, batch_enabled=server_batch)
+        runner, base_url = await server.start()
+        try:
+            results.append(await run_mode(
+                name, client_batch, server, base_url, token_ids, args.concurrency
+            ))
+        finally:
+            await runner.cleanup()
+
+    baseline = results[0]["elapsed_s"]
+    for r in results:
+        print(
+            f"{r['mode']:>10}: {r['elapsed_s']:>7}s ({baseline / max(r['elapsed_s'], 1e-6):.1f}x), "
+            f"prices={r['prices']}, upstream_requests={r['upstream_requests']}, "
+            f"coalesced={r['coalesced']}, 429s={r['429s']}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
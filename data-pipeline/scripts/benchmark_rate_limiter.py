@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Dome client rate limiter against a local mock HTTP server.
+
+Spins up scripts/mock_dome_server.py (a fixed per-second quota, 429 +
+Retry-After when exceeded), then drives a Polymarket and a Kalshi
+DomeClient through it concurrently - the same 50-way gather pattern
+PriceFetcher uses.
+
+Reports achieved QPS against the configured budget for:
+- legacy: the old limiter that sleeps while holding its asyncio.Lock,
+          one bucket per client
+- shared: the reservation-based limiter with one "dome" budget shared by
+          both clients
+
+Usage:
+    python scripts/benchmark_rate_limiter.py
+    python scripts/benchmark_rate_limiter.py --rps 75 --server-qps 100 --requests 1500
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("DOME_API_KEY", "benchmark")
+
+from mock_dome_server import MockDomeServer
+from predictions_ingest.clients.base import RateLimiter
+from predictions_ingest.clients.dome import DomeClient
+from predictions_ingest.models import DataSource
+
+
+class LegacyRateLimiter(RateLimiter):
+    """The pre-reservation limiter: sleeps inside the lock."""
+
+    def __init__(self, rate: float):
+        super().__init__(rate)
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        async with self._lock:
+            now = time.monotonic()
+            elapsed = now - self.last_update
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.last_update = now
+
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return 0.0
+
+            wait_time = (tokens - self.tokens) / self.rate
+            await asyncio.sleep(wait_time)
+            self.tokens = 0
+            self.last_update = time.monotonic()
+            return wait_time
+
+    def record_429(self, retry_after=None) -> None:
+        self.rate_limited_count += 1
+
+    def record_success(self) -> None:
+        pass
+
+
+async def run_scenario(
+    name: str,
+    base_url: str,
+    server: MockDomeServer,
+    rps: float,
+    total_requests: int,
+    concurrency: int,
+) -> dict:
+    RateLimiter.reset_shared()
+    clients = [
+        DomeClient(source=DataSource.POLYMARKET, rate_limit_rps=rps),
+        DomeClient(source=DataSource.KALSHI, rate_limit_rps=rps),
+    ]
+    if name == "legacy":
+        for client in clients:
+            client._rate_limiter = LegacyRateLimiter(rps)
+
+    for client in clients:
+        client.BASE_URL = base_url
+        await client.connect()
+
+    server.reset_counters()
+    failures = 0
+
+    async def one(i: int) -> None:
+        nonlocal failures
+        client = clients[i % len(clients)]
+        try:
+            await client.fetch_market_price(f"token-{i}")
+        except Exception:
+            failures += 1
+
+    start = time.monotonic()
+    for i in range(0, total_requests, concurrency):
+        batch = range(i, min(i + concurrency, total_requests))
+        await asyncio.gather(*(one(j) for j in batch))
+    elapsed = time.monotonic() - start
+
+    for client in clients:
+        await client.close()
+
+    return {
+        "scenario": name,
+        "elapsed_s": round(elapsed, 2),
+        "achieved_qps": round(server.served / elapsed, 1),
+        "server_429s": server.rejected,
+        "failed": failures,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rps", type=float, default=75.0, help="Configured client budget (RPS)")
+    parser.add_argument("--server-qps", type=int, default=100, help="Mock server quota (QPS)")
+    parser.add_argument("--requests", type=int, default=1000, help="Total price requests")
+    parser.add_argument("--concurrency", type=int, default=50, help="Requests per gather batch")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Mock server latency")
+    args = parser.parse_args()
+
+    server = MockDomeServer(args.server_qps, args.latency_ms, batch_enabled=False)
+    runner, base_url = await server.start()
+
+    print(f"Mock Dome server at {base_url} (quota {args.server_qps} QPS)")
+    print(f"Configured budget: {args.rps} RPS, {args.requests} requests, "
+          f"{args.concurrency}-way gather across Polymarket + Kalshi clients\n")
+
+    try:
+        for name in ("legacy", "shared"):
+            r = await run_scenario(
+                name, base_url, server, args.rps, args.requests, args.concurrency
+            )
+            print(
+                f"{r['scenario']:>8}: {r['achieved_qps']:>6} QPS "
+                f"({r['achieved_qps'] / args.rps:.0%} of budget) "
+                f"in {r['elapsed_s']}s, 429s={r['server_429s']}, failed={r['failed']}"
+            )
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
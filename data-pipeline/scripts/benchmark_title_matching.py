@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Benchmark cross-venue market matching on a synthetic title corpus.
+
+Builds Polymarket-style and Kalshi-style titles from the templates both
+venues use (elections, nominations, cabinet exits, crypto price targets,
+championships, ...). Most Kalshi titles paraphrase a Polymarket title; the
+rest are unrelated. Common entities ("trump", "bitcoin") appear in a large
+share of titles on both sides, as they do in production.
+
+Compares:
+- legacy: every pair sharing one entity (inverted index) is scored with
+          calculate_similarity - the matcher before title_lsh
+- lsh:    cross_venue.match_markets (MinHash/LSH candidates, vectorized
+          Jaccard/recall ranking, calculate_similarity on the top-k)
+
+Reports wall time, calculate_similarity calls, and recall of the LSH pairs
+against the legacy pairs: overall, at the API's default min_match_score,
+and per market for its best-scoring counterpart. Both sides verify with the
+same scorer, so the LSH pairs are a subset apart from pairs that only share
+an entity prefix ("nominee" / "nomination"), which legacy never scored.
+
+The legacy matcher is quadratic in titles per shared entity; at the default
+size it runs for tens of minutes (--skip-legacy times the LSH path only).
+
+Usage:
+    python scripts/benchmark_title_matching.py
+    python scripts/benchmark_title_matching.py --poly 5000 --kalshi 1500 --seed 7
+"""
+import argparse
+import random
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from predictions_ingest.aggregation import cross_venue
+from predictions_ingest.aggregation.cross_venue import KALSHI, POLYMARKET, market_features
+
+# Default min_match_score of /arbitrage/opportunities
+API_MIN_MATCH_SCORE = 0.40
+
+FIRST = ["kevin", "marco", "doug", "gavin", "josh", "ron", "nikki", "pete", "kamala", "jd", "glenn", "tulsi",
+         "robert", "elise", "vivek", "kristi", "sarah", "tim", "greg", "jared", "wes", "andy", "byron", "chris"]
+LAST = ["warsh", "rubio", "burgum", "newsom", "shapiro", "desantis", "haley", "buttigieg", "harris", "vance",
+        "youngkin", "gabbard", "kennedy", "stefanik", "ramaswamy", "noem", "huckabee", "walz", "abbott",
+        "polis", "moore", "beshear", "donalds", "christie", "hassett", "waller", "bowman", "rieder"]
+OFFICES = ["presidential", "governor", "senate", "mayoral", "house"]
+STATES = ["california", "texas", "florida", "ohio", "georgia", "arizona", "nevada", "michigan", "pennsylvania",
+          "wisconsin", "virginia", "colorado", "minnesota", "iowa", "maine"]
+ROLES = ["fed chair", "secretary of state", "attorney general", "defense secretary", "treasury secretary",
+         "ambassador to china", "chief of staff", "press secretary"]
+COINS = ["bitcoin", "ethereum", "solana", "dogecoin", "xrp", "cardano"]
+TEAMS = ["lakers", "celtics", "warriors", "chiefs", "eagles", "yankees", "dodgers", "knicks", "bucks",
+         "packers", "cowboys", "oilers", "rangers", "nuggets", "heat", "suns"]
+LEAGUES = {"nba": "finals", "nfl": "super bowl", "mlb": "world series", "nhl": "stanley cup"}
+COUNTRIES = ["ukraine", "russia", "israel", "iran", "china", "taiwan", "venezuela", "greenland", "canada",
+             "mexico", "india", "pakistan", "japan", "brazil", "argentina", "turkey"]
+COMPANIES = ["nvidia", "apple", "tesla", "microsoft", "openai", "google", "amazon", "meta"]
+MONTHS = ["january", "february", "march", "april", "may", "june", "july", "august", "september",
+          "october", "november", "december"]
+YEARS = ["2025", "2026", "2027", "2028"]
+
+
+SYLLABLES = ["ka", "ro", "mi", "len", "dra", "vo", "sen", "tal", "bur", "gis", "mor", "ney", "fen", "wick",
+             "ash", "ton", "har", "bel", "quin", "dor", "lay", "zen", "pol", "rick", "sto", "van", "ler", "mac"]
+
+
+def surname(rng: random.Random) -> str:
+    if rng.random() < 0.3:
+        return rng.choice(LAST)
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.choice([2, 3])))
+
+
+def person(rng: random.Random) -> str:
+    return f"{rng.choice(FIRST).title()} {surname(rng).title()}"
+
+
+def poly_title(rng: random.Random) -> tuple[str, dict]:
+    kind = rng.randrange(9)
+    p, year, month = person(rng), rng.choice(YEARS), rng.choice(MONTHS).title()
+    if kind == 0:
+        office = rng.choice(OFFICES)
+        state = rng.choice(STATES).title()
+        return f"Will {p} win the {year} {state} {office} election?", dict(kind=kind, p=p, year=year, office=office, state=state)
+    if kind == 1:
+        role = rng.choice(ROLES)
+        return f"Will Trump nominate {p} as {role.title()}?", dict(kind=kind, p=p, role=role)
+    if kind == 2:
+        return f"Will {p} leave the Trump Cabinet before {month} {year}?", dict(kind=kind, p=p, month=month, year=year)
+    if kind == 3:
+        coin = rng.choice(COINS)
+        price = rng.choice([1, 2, 5, 10, 50, 100, 150, 200]) * 1000
+        return f"Will {coin.title()} reach ${price:,} by {month} 31?", dict(kind=kind, coin=coin, price=price, month=month)
+    if kind == 4:
+        league, trophy = rng.choice(list(LEAGUES.items()))
+        team = f"{surname(rng)} {rng.choice(TEAMS)}".title()
+        return f"Will the {team} win the {year} {league.upper()} {trophy.title()}?", dict(kind=kind, team=team, year=year, trophy=trophy, league=league)
+    if kind == 5:
+        a, b = rng.sample(COUNTRIES, 2)
+        return f"{a.title()} x {b.title()} ceasefire agreed by {month} {year}?", dict(kind=kind, a=a, b=b, month=month, year=year)
+    if kind == 6:
+        country = rng.choice(COUNTRIES).title()
+        return f"Will Trump visit {country} in {year}?", dict(kind=kind, country=country, year=year)
+    if kind == 7:
+        company = rng.choice(COMPANIES + [surname(rng) for _ in range(3)]).title()
+        n = rng.choice([1, 2, 3, 4, 5])
+        return f"Will {company} be the largest company in the world by market cap on {month} {n}?", dict(kind=kind, company=company, month=month)
+    return f"Will {p} be the {year} Republican presidential nominee?", dict(kind=kind, p=p, year=year)
+
+
+def kalshi_paraphrase(rng: random.Random, f: dict) -> str:
+    """A Kalshi-style rewording of a Polymarket title's facts."""
+    kind = f["kind"]
+    if kind == 0:
+        return rng.choice([
+            f"{f['p']} wins the {f['state']} {f['office']} race in {f['year']}?",
+            f"Who will win the {f['year']} {f['state']} {f['office']} election? {f['p']}",
+        ])
+    if kind == 1:
+        return rng.choice([f"Trump nominates {f['p']} for {f['role']}?", f"Who will Trump nominate as {f['role']}? {f['p']}"])
+    if kind == 2:
+        return rng.choice([f"{f['p']} out of the Cabinet before {f['month']}?", f"Will {f['p']} leave Trump's Cabinet?"])
+    if kind == 3:
+        return f"{f['coin'].title()} price above {f['price']} on {f['month']} 31, {rng.choice(YEARS)}?"
+    if kind == 4:
+        return rng.choice([f"{f['team']} win the {f['trophy']}?", f"{f['year']} {f['league'].upper()} champion: {f['team']}"])
+    if kind == 5:
+        return f"Ceasefire between {f['a'].title()} and {f['b'].title()} before {f['month']}?"
+    if kind == 6:
+        return f"Trump visits {f['country']} before {f['year']}?"
+    if kind == 7:
+        return f"Largest company by market cap on {f['month']}: {f['company']}?"
+    return f"Who will be the Republican nominee for President in {f['year']}? {f['p']}"
+
+
+def build_corpus(n_poly: int, n_kalshi: int, seed: int) -> tuple[list, list]:
+    rng = random.Random(seed)
+    poly, facts = [], []
+    for i in range(n_poly):
+        title, f = poly_title(rng)
+        facts.append(f)
+        slug = "-".join(cross_venue.normalize(title).split())
+        poly.append(market_features(POLYMARKET, f"{slug}-{i}", f"poly-event-{i % 4000}", title))
+
+    kalshi = []
+    for i in range(n_kalshi):
+        # ~80% paraphrases of some Polymarket title, the rest unrelated titles
+        if rng.random() < 0.8:
+            title = kalshi_paraphrase(rng, facts[rng.randrange(n_poly)])
+        else:
+            title = kalshi_paraphrase(rng, poly_title(rng)[1])
+        kalshi.append(market_features(KALSHI, f"KX{i:06d}", f"KXEVENT{i % 1500}", title))
+    return poly, kalshi
+
+
+def legacy_match(probes: list, candidates: list) -> tuple[dict, int]:
+    """The pre-LSH matcher: score every pair sharing one entity."""
+    index = {POLYMARKET: defaultdict(list), KALSHI: defaultdict(list)}
+    for c in candidates:
+        for word in c.entities:
+            index[c.source][word].append(c)
+
+    pairs, scored = {}, 0
+    for probe in probes:
+        other = index[KALSHI if probe.source == POLYMARKET else POLYMARKET]
+        seen = {}
+        for word in probe.entities:
+            for cand in other.get(word, ()):
+                seen[cand.market_id] = cand
+        for cand in seen.values():
+            poly, kalshi = (probe, cand) if probe.source == POLYMARKET else (cand, probe)
+            key = (poly.market_id, kalshi.market_id)
+            if key in pairs:
+                continue
+            scored += 1
+            similarity = cross_venue.calculate_similarity(poly.title, kalshi.title)
+            if similarity < cross_venue.MIN_MARKET_SIMILARITY:
+                continue
+            if poly.slug_entities and kalshi.slug_entities:
+                shared = poly.slug_entities & kalshi.slug_entities
+                if not shared:
+                    continue
+                if len(shared) / len(poly.slug_entities | kalshi.slug_entities) < 0.35:
+                    continue
+            pairs[key] = round(similarity, 4)
+    return pairs, scored
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--poly", type=int, default=20000, help="Polymarket titles")
+    parser.add_argument("--kalshi", type=int, default=5000, help="Kalshi titles")
+    parser.add_argument("--seed", type=int, default=42, help="Corpus seed")
+    parser.add_argument("--skip-legacy", action="store_true", help="Only time the LSH matcher")
+    args = parser.parse_args()
+
+    poly, kalshi = build_corpus(args.poly, args.kalshi, args.seed)
+    markets = poly + kalshi
+    print(f"Corpus: {len(poly)} Polymarket x {len(kalshi)} Kalshi titles")
+
+    # Count verifier calls without touching the matcher
+    calls = 0
+    scorer = cross_venue.calculate_similarity
+
+    def counting(a: str, b: str) -> float:
+        nonlocal calls
+        calls += 1
+        return scorer(a, b)
+
+    cross_venue.calculate_similarity = counting
+    start = time.perf_counter()
+    lsh_pairs = cross_venue.match_markets(kalshi, markets)
+    lsh_s = time.perf_counter() - start
+    cross_venue.calculate_similarity = scorer
+    print(f"     lsh: {lsh_s:7.2f}s, {calls:>10,} similarity calls, {len(lsh_pairs):,} pairs")
+
+    if args.skip_legacy:
+        return
+
+    start = time.perf_counter()
+    legacy_pairs, scored = legacy_match(kalshi, markets)
+    legacy_s = time.perf_counter() - start
+    print(f"  legacy: {legacy_s:7.2f}s, {scored:>10,} similarity calls, {len(legacy_pairs):,} pairs")
+    print(f" speedup: {legacy_s / lsh_s:.1f}x\n")
+
+    for floor in (cross_venue.MIN_MARKET_SIMILARITY, API_MIN_MATCH_SCORE, 0.6):
+        expected = {k for k, v in legacy_pairs.items() if v >= floor}
+        found = {k for k in expected if k in lsh_pairs}
+        recall = len(found) / len(expected) if expected else 1.0
+        print(f"recall @ similarity >= {floor:.2f}: {recall:.2%} ({len(found):,}/{len(expected):,})")
+
+    # The arbitrage scan keeps one opportunity per subject, so what matters
+    # most is that every market's best counterpart survives
+    for side, name in ((1, "Kalshi"), (0, "Polymarket")):
+        best_legacy, best_lsh = defaultdict(float), defaultdict(float)
+        for pairs, best in ((legacy_pairs, best_legacy), (lsh_pairs, best_lsh)):
+            for key, similarity in pairs.items():
+                best[key[side]] = max(best[key[side]], similarity)
+        hits = sum(1 for market, similarity in best_legacy.items() if best_lsh[market] >= similarity)
+        print(f"best-match recall per {name} market: {hits / max(len(best_legacy), 1):.2%} "
+              f"({hits:,}/{len(best_legacy):,})")
+
+    extra = set(lsh_pairs) - set(legacy_pairs)
+    print(f"pairs not in legacy (prefix-only overlaps): {len(extra)}")
+
+if __name__ == "__main__":
+    main()
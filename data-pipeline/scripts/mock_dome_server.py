@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Dome API price endpoints.
+
+Emulates:
+- GET /{polymarket,kalshi}/market-price/{id}       single price
+- GET /{polymarket,kalshi}/market-prices?ids=a,b   batch contract used by
+                                                   DomeClient.fetch_market_prices
+
+Every request (single or batch) counts once against a per-second quota;
+requests over the quota get 429 + Retry-After, like the real API.
+
+Usage:
+    python scripts/mock_dome_server.py --port 8089 --quota 100
+    python scripts/mock_dome_server.py --no-batch   # batch endpoint returns 404
+
+Imported by scripts/benchmark_rate_limiter.py and scripts/benchmark_price_fetch.py.
+"""
+import argparse
+import asyncio
+import time
+import zlib
+
+from aiohttp import web
+
+
+class MockDomeServer:
+    """Tiny Dome stand-in enforcing a per-second request quota."""
+
+    def __init__(
+        self,
+        quota_qps: int = 100,
+        latency_ms: float = 20.0,
+        batch_enabled: bool = True,
+        max_batch: int = 100,
+    ):
+        self.quota_qps = quota_qps
+        self.latency = latency_ms / 1000
+        self.batch_enabled = batch_enabled
+        self.max_batch = max_batch
+        self.window_start = time.monotonic()
+        self.window_count = 0
+        self.reset_counters()
+
+    def reset_counters(self) -> None:
+        self.served = 0
+        self.rejected = 0
+        self.ids_served = 0
+
+    @staticmethod
+    def price_for(market_id: str) -> dict:
+        """Deterministic price payload for an ID (same shape as /market-price)."""
+        price = (zlib.crc32(market_id.encode()) % 99 + 1) / 100
+        return {"price": price, "at_time": int(time.time())}
+
+    def _over_quota(self) -> bool:
+        now = time.monotonic()
+        if now - self.window_start >= 1.0:
+            self.window_start = now
+            self.window_count = 0
+        self.window_count += 1
+        if self.window_count > self.quota_qps:
+            self.rejected += 1
+            return True
+        return False
+
+    def _rate_limited(self) -> web.Response:
+        return web.json_response(
+            {"error": "rate limited"}, status=429, headers={"Retry-After": "1"}
+        )
+
+    async def market_price(self, request: web.Request) -> web.Response:
+        if self._over_quota():
+            return self._rate_limited()
+        await asyncio.sleep(self.latency)
+        self.served += 1
+        self.ids_served += 1
+        return web.json_response(self.price_for(request.match_info["id"]))
+
+    async def market_prices(self, request: web.Request) -> web.Response:
+        if not self.batch_enabled:
+            return web.json_response({"error": "not found"}, status=404)
+        ids = [i for i in request.query.get("ids", "").split(",") if i]
+        if len(ids) > self.max_batch:
+            return web.json_response(
+                {"error": f"at most {self.max_batch} ids per request"}, status=400
+            )
+        if self._over_quota():
+            return self._rate_limited()
+        await asyncio.sleep(self.latency)
+        self.served += 1
+        self.ids_served += len(ids)
+        return web.json_response(
+            {"prices": [{"id": i, **self.price_for(i)} for i in ids]}
+        )
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/{prefix}/market-price/{id}", self.market_price)
+        app.router.add_get("/{prefix}/market-prices", self.market_prices)
+        return app
+
+    async def start(self, port: int = 0) -> tuple[web.AppRunner, str]:
+        """Start on 127.0.0.1 (port 0 = any free port). Returns (runner, base_url)."""
+        runner = web.AppRunner(self.make_app(), access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return runner, f"http://127.0.0.1:{port}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local Dome API price stand-in")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--quota", type=int, default=100, help="Requests per second")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--no-batch", action="store_true", help="Disable /market-prices")
+    args = parser.parse_args()
+
+    server = MockDomeServer(args.quota, args.latency_ms, batch_enabled=not args.no_batch)
+    print(f"Mock Dome server on http://127.0.0.1:{args.port} (quota {args.quota} QPS)")
+    web.run_app(server.make_app(), host="127.0.0.1", port=args.port, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
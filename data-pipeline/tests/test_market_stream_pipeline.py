@@ -0,0 +1,161 @@
+"""Tests for MarketStreamPipeline with in-memory API pages and writers."""
+import asyncio
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+
+from predictions_ingest.ingestion.orchestrator import (
+    IngestionResult,
+    LoadType,
+    MarketStreamPipeline,
+)
+from predictions_ingest.models import DataSource, Market
+
+
+class FakeBronzeWriter:
+    def __init__(self, fail_on_call: int = 0):
+        self.pages: list[list[dict]] = []
+        self.fail_on_call = fail_on_call
+
+    async def write_batch(self, records, source, endpoint, run_id):
+        await asyncio.sleep(0)
+        if self.fail_on_call and len(self.pages) + 1 == self.fail_on_call:
+            raise RuntimeError("bronze write failed")
+        self.pages.append(records)
+        return len(records), 0
+
+
+class FakeSilverWriter:
+    def __init__(self):
+        self.markets: list[Market] = []
+
+    async def upsert_markets(self, markets):
+        await asyncio.sleep(0)
+        self.markets.extend(markets)
+        return len(markets), 0
+
+
+class FakePages:
+    """API page iterator that counts how far the pipeline has pulled it."""
+
+    def __init__(self, pages: int, page_size: int = 3):
+        self.pages = pages
+        self.page_size = page_size
+        self.yielded = 0
+
+    async def __aiter__(self):
+        for p in range(self.pages):
+            await asyncio.sleep(0)
+            self.yielded += 1
+            yield [
+                {"id": f"m{p}-{i}", "volume": p * self.page_size + i, "active": i != 0}
+                for i in range(self.page_size)
+            ]
+
+
+def normalize(raw: dict) -> Market:
+    return Market(
+        source=DataSource.POLYMARKET,
+        source_market_id=raw["id"],
+        title=raw["id"],
+        is_active=raw["active"],
+        volume_24h=Decimal(raw["volume"]),
+    )
+
+
+def make_result() -> IngestionResult:
+    return IngestionResult(
+        source=DataSource.POLYMARKET,
+        load_type=LoadType.DELTA,
+        run_id="test-run",
+        started_at=datetime.now(UTC),
+    )
+
+
+def make_pipeline(bronze=None, silver=None, price_stage=None, **kwargs) -> MarketStreamPipeline:
+    return MarketStreamPipeline(
+        normalize=normalize,
+        bronze_writer=bronze or FakeBronzeWriter(),
+        silver_writer=silver or FakeSilverWriter(),
+        source=DataSource.POLYMARKET,
+        endpoint="/markets",
+        run_id="test-run",
+        price_stage=price_stage,
+        **kwargs,
+    )
+
+
+async def test_streams_every_page_through_all_stages():
+    bronze, silver = FakeBronzeWriter(), FakeSilverWriter()
+    priced: list[str] = []
+
+    async def price_stage(markets):
+        priced.extend(m.source_market_id for m in markets)
+        return len(markets), len(markets)
+
+    pipeline = make_pipeline(bronze, silver, price_stage, keep_top_n=3, queue_depth=2)
+    result = make_result()
+    top = await asyncio.wait_for(pipeline.run(FakePages(10), result), timeout=5)
+
+    assert len(bronze.pages) == 10
+    assert len(silver.markets) == 30
+    assert (result.markets_fetched, result.bronze_records, result.markets_upserted) == (30, 30, 30)
+    # Inactive markets (index 0 of each page) are not priced or kept
+    assert sorted(priced) == sorted(f"m{p}-{i}" for p in range(10) for i in (1, 2))
+    assert result.prices_updated == 20
+    assert pipeline.first_price_after_s is not None
+    assert [m.source_market_id for m in top] == ["m9-2", "m9-1", "m8-2"]
+
+
+async def test_stage_failure_propagates_and_stops_the_stream():
+    bronze = FakeBronzeWriter(fail_on_call=3)
+    pages = FakePages(50)
+
+    with pytest.raises(RuntimeError, match="bronze write failed"):
+        await asyncio.wait_for(make_pipeline(bronze, queue_depth=4).run(pages, make_result()), timeout=5)
+
+    assert len(bronze.pages) == 2
+    assert pages.yielded < 50
+
+
+async def test_failure_with_full_queue_does_not_hang():
+    # Bronze fails only after the fetch stage has filled its queue and is
+    # blocked on put(); cancelling it must not push an end-of-stream sentinel
+    class SlowFailingBronzeWriter(FakeBronzeWriter):
+        async def write_batch(self, records, source, endpoint, run_id):
+            await asyncio.sleep(0.05)
+            raise RuntimeError("bronze write failed")
+
+    pages = FakePages(20)
+    pipeline = make_pipeline(SlowFailingBronzeWriter(), queue_depth=4)
+
+    with pytest.raises(RuntimeError, match="bronze write failed"):
+        await asyncio.wait_for(pipeline.run(pages, make_result()), timeout=5)
+    assert pages.yielded == 6  # One page in bronze, four queued, one blocked
+
+
+async def test_back_pressure_bounds_pages_in_flight():
+    release = asyncio.Event()
+    priced = 0
+
+    async def slow_price_stage(markets):
+        nonlocal priced
+        await release.wait()
+        priced += len(markets)
+        return len(markets), len(markets)
+
+    depth = 2
+    pages = FakePages(100, page_size=2)
+    pipeline = make_pipeline(price_stage=slow_price_stage, queue_depth=depth, price_chunk_size=1)
+    run = asyncio.create_task(pipeline.run(pages, make_result()))
+
+    await asyncio.sleep(0.1)
+    # Three bounded queues plus one page held by each of the four stages
+    assert pages.yielded <= 3 * depth + 4
+    assert not run.done()
+
+    release.set()
+    await asyncio.wait_for(run, timeout=5)
+    assert pages.yielded == 100
+    assert priced == 100
@@ -0,0 +1,41 @@
+"""Tests for the shared reservation-based RateLimiter."""
+import pytest
+from structlog.testing import capture_logs
+
+from predictions_ingest.clients.base import RateLimiter
+
+
+@pytest.fixture(autouse=True)
+def _fresh_budgets():
+    RateLimiter.reset_shared()
+    yield
+    RateLimiter.reset_shared()
+
+
+def test_shared_returns_one_bucket_per_budget():
+    first = RateLimiter.shared("dome", 50, 20)
+    assert RateLimiter.shared("dome", 50, 20) is first
+    assert RateLimiter.shared("limitless", 5) is not first
+
+
+def test_shared_warns_when_limits_differ():
+    first = RateLimiter.shared("dome", 50, 20)
+    with capture_logs() as logs:
+        again = RateLimiter.shared("dome", 10)
+    assert again is first
+    assert (first.max_rate, first.capacity) == (50, 20)
+    assert [log["budget"] for log in logs if log["log_level"] == "warning"] == ["dome"]
+
+
+def test_shared_same_limits_do_not_warn():
+    RateLimiter.shared("dome", 50)
+    with capture_logs() as logs:
+        RateLimiter.shared("dome", 50, 100)
+    assert not logs
+
+
+def test_reservations_are_spaced_by_rate():
+    limiter = RateLimiter(rate=10, capacity=1)
+    waits = [limiter.reserve() for _ in range(4)]
+    assert waits[0] == 0
+    assert waits[1:] == pytest.approx([0.1, 0.2, 0.3], abs=0.01)
@@ -0,0 +1,163 @@
+"""Tests for RequestCoalescer and the Dome multi-ID price lookups built on it."""
+import asyncio
+
+import httpx
+import pytest
+
+from predictions_ingest.clients.base import RateLimiter, RequestCoalescer
+from predictions_ingest.clients.dome import DomeClient
+from predictions_ingest.config import get_settings
+from predictions_ingest.models import DataSource
+
+
+class FakeUpstream:
+    """Records calls and answers lookups with the key's length."""
+
+    def __init__(self, fail_many: bool = False, fail_keys: frozenset = frozenset()):
+        self.one_calls: list[str] = []
+        self.many_calls: list[list[str]] = []
+        self.fail_many = fail_many
+        self.fail_keys = fail_keys
+
+    async def fetch_one(self, key: str):
+        self.one_calls.append(key)
+        await asyncio.sleep(0)
+        if key in self.fail_keys:
+            raise ValueError(f"bad key {key}")
+        return len(key)
+
+    async def fetch_many(self, keys: list[str]):
+        self.many_calls.append(list(keys))
+        await asyncio.sleep(0)
+        if self.fail_many:
+            raise RuntimeError("batch endpoint down")
+        return {key: len(key) for key in keys if key != "missing"}
+
+
+async def test_concurrent_lookups_share_one_batch():
+    upstream = FakeUpstream()
+    coalescer = RequestCoalescer(upstream.fetch_one, upstream.fetch_many, window_seconds=0.01)
+
+    keys = ["a", "bb", "a", "ccc", "missing", "bb"]
+    results = await asyncio.gather(*(coalescer.get(key) for key in keys))
+
+    assert results == [1, 2, 1, 3, None, 2]
+    assert upstream.many_calls == [["a", "bb", "ccc", "missing"]]
+    assert upstream.one_calls == []
+    assert coalescer.get_metrics() == {"lookups": 6, "coalesced": 2, "upstream_requests": 1}
+
+
+async def test_max_batch_splits_batches():
+    upstream = FakeUpstream()
+    coalescer = RequestCoalescer(upstream.fetch_one, upstream.fetch_many, window_seconds=0.01, max_batch=2)
+
+    results = await asyncio.gather(*(coalescer.get(key) for key in ["a", "bb", "ccc", "dddd", "e"]))
+
+    assert results == [1, 2, 3, 4, 1]
+    assert upstream.many_calls == [["a", "bb"], ["ccc", "dddd"]]
+    assert upstream.one_calls == ["e"]
+
+
+async def test_failed_batch_falls_back_to_single_lookups():
+    upstream = FakeUpstream(fail_many=True)
+    coalescer = RequestCoalescer(upstream.fetch_one, upstream.fetch_many, window_seconds=0.01)
+
+    results = await asyncio.gather(*(coalescer.get(key) for key in ["a", "bb", "ccc"]))
+
+    assert results == [1, 2, 3]
+    assert len(upstream.many_calls) == 1
+    assert sorted(upstream.one_calls) == ["a", "bb", "ccc"]
+
+
+async def test_errors_fan_out_to_every_waiter_of_the_key():
+    upstream = FakeUpstream(fail_keys=frozenset({"bad"}))
+    coalescer = RequestCoalescer(upstream.fetch_one, window_seconds=0.01)
+
+    results = await asyncio.gather(
+        coalescer.get("bad"), coalescer.get("ok"), coalescer.get("bad"),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], ValueError) and results[2] is results[0]
+    assert results[1] == 2
+    assert upstream.one_calls == ["bad", "ok"]
+
+    # Nothing is cached: the next lookup goes upstream again
+    assert await coalescer.get("ok") == 2
+    assert upstream.one_calls == ["bad", "ok", "ok"]
+
+
+async def test_disable_batching_uses_single_lookups():
+    upstream = FakeUpstream()
+    coalescer = RequestCoalescer(upstream.fetch_one, upstream.fetch_many, window_seconds=0.01)
+    coalescer.disable_batching()
+
+    assert await asyncio.gather(coalescer.get("a"), coalescer.get("bb")) == [1, 2]
+    assert not coalescer.batching_enabled
+    assert upstream.many_calls == []
+
+
+# =============================================================================
+# DomeClient.fetch_market_prices
+# =============================================================================
+
+@pytest.fixture
+def dome_settings(monkeypatch):
+    monkeypatch.setenv("DOME_API_KEY", "test-key")
+    monkeypatch.setenv("DOME_PRICE_BATCH_ENABLED", "true")
+    get_settings.cache_clear()
+    RateLimiter.reset_shared()
+    yield
+    get_settings.cache_clear()
+    RateLimiter.reset_shared()
+
+
+def dome_client(handler) -> DomeClient:
+    client = DomeClient(DataSource.POLYMARKET, rate_limit_rps=10_000)
+    client._client = httpx.AsyncClient(
+        base_url=DomeClient.BASE_URL,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+@pytest.mark.parametrize("status", [404, 405, 501])
+async def test_unsupported_batch_endpoint_falls_back(dome_settings, status):
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path.endswith("/market-prices"):
+            return httpx.Response(status, json={"error": "not supported"})
+        token = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"id": token, "price": 0.5})
+
+    client = dome_client(handler)
+    try:
+        prices = await asyncio.gather(client.get_market_price("t1"), client.get_market_price("t2"))
+        assert [p["id"] for p in prices] == ["t1", "t2"]
+        # One batch attempt (501 is not retried), then per-market requests for good
+        assert requests.count("/v1/polymarket/market-prices") == 1
+        assert client.price_batch_size == 1
+        await client.get_market_price("t3")
+        assert requests.count("/v1/polymarket/market-prices") == 1
+    finally:
+        await client.close()
+
+
+async def test_batch_endpoint_answers_many_ids(dome_settings):
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        ids = request.url.params["ids"].split(",")
+        return httpx.Response(200, json={"prices": [{"id": i, "price": 0.25} for i in ids if i != "gone"]})
+
+    client = dome_client(handler)
+    try:
+        prices = await client.fetch_market_prices_batch(["t1", "t2", "gone"])
+        assert [p["id"] for p in prices] == ["t1", "t2"]
+        assert len(requests) == 1
+        assert requests[0].url.params["ids"] == "t1,t2,gone"
+    finally:
+        await client.close()